@@ -28,8 +28,12 @@ from shared.response import (
 
 # Import existing admin handlers
 from auth.admin_handlers import route_admin_request
+from auth.audit import flush_audit_on_exit
+from shared.log import log_requests
 
 
+@flush_audit_on_exit
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for admin endpoints.
@@ -12,12 +12,14 @@ Endpoints for:
 import os
 import json
 import time
+import uuid
 from typing import Dict, Any, Optional
 from decimal import Decimal
 
 import boto3
 from botocore.exceptions import ClientError
 
+from .audit import audit_sink
 from .user_management import (
     create_user, get_user, list_users, update_user, delete_user,
     create_group, get_group, list_groups, update_group, delete_group,
@@ -45,16 +47,13 @@ def _get_dynamodb():
 
 
 def _audit_log(actor_email: str, action: str, target: Dict, result: str, details: Dict = None):
-    """Record audit log entry."""
+    """Record audit log entry (buffered, flushed at the end of the request)."""
     try:
-        dynamodb = _get_dynamodb()
-        table = dynamodb.Table(AUDIT_TABLE)
-
         timestamp = int(time.time())
 
-        table.put_item(Item={
+        audit_sink().record(AUDIT_TABLE, {
             'pk': f'USER#{actor_email}',
-            'sk': f'TS#{timestamp}#{action}',
+            'sk': f'TS#{timestamp}#{action}#{uuid.uuid4().hex[:8]}',
             'gsi1pk': f'ACTION#{action}',
             'gsi1sk': f'TS#{timestamp}',
             'timestamp': timestamp,
@@ -0,0 +1,208 @@
+"""
+Buffered audit sink for Dashborion.
+
+Audit records are queued in memory for the duration of an invocation and
+written in bulk when the request completes, instead of one synchronous
+PutItem per admin mutation or permission decision.
+
+Sink modes (AUDIT_SINK_MODE):
+- dynamodb (default): BatchWriteItem into the audit table, 25 items per call,
+  unprocessed items retried with exponential backoff; a batch that fails is
+  logged and the remaining batches are still written
+- memory: keep records in a local in-memory queue (local dev, tests)
+
+Usage:
+    from auth.audit import audit_sink, flush_audit_on_exit
+
+    audit_sink().record(AUDIT_TABLE, item)
+
+    @flush_audit_on_exit
+    def handler(event, context):
+        ...
+"""
+
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import boto3
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+
+
+# DynamoDB BatchWriteItem accepts at most 25 put requests per call
+DYNAMODB_BATCH_SIZE = 25
+# Flush early when the buffer grows past this size (bounds memory for bulk ops)
+MAX_BUFFERED_RECORDS = 500
+# Attempts for unprocessed items before giving up
+MAX_RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY_SECONDS = 0.05
+
+
+class InMemoryAuditQueue:
+    """Local audit sink (dev server, tests): records are kept in memory."""
+
+    def __init__(self):
+        self.messages: List[Dict[str, Any]] = []
+
+    def send(self, table_name: str, item: Dict[str, Any]) -> None:
+        self.messages.append({'table': table_name, 'item': item})
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Return and clear all queued messages."""
+        messages, self.messages = self.messages, []
+        return messages
+
+
+class AuditSink:
+    """
+    Buffers audit records and flushes them in batches.
+
+    Records are plain Python dicts (DynamoDB resource format). Recording never
+    raises: audit failures are logged and must not break the audited action.
+    """
+
+    def __init__(self, mode: Optional[str] = None, local_queue: Optional[InMemoryAuditQueue] = None):
+        self.mode = (mode or os.environ.get('AUDIT_SINK_MODE', 'dynamodb')).lower()
+        self.local_queue = local_queue or InMemoryAuditQueue()
+        self._buffer: List[Tuple[str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        self._serializer = TypeSerializer()
+        self._dynamodb_client = None
+
+    # -------------------------------------------------------------------------
+    # Client (lazy initialized, LocalStack aware)
+    # -------------------------------------------------------------------------
+
+    def _get_dynamodb_client(self):
+        if self._dynamodb_client is None:
+            self._dynamodb_client = self._create_dynamodb_client()
+        return self._dynamodb_client
+
+    def _create_dynamodb_client(self):
+        localstack_endpoint = os.environ.get('LOCALSTACK_ENDPOINT')
+        if localstack_endpoint:
+            return boto3.client(
+                'dynamodb',
+                endpoint_url=localstack_endpoint,
+                region_name=os.environ.get('AWS_DEFAULT_REGION', 'eu-west-3'),
+                aws_access_key_id='test',
+                aws_secret_access_key='test'
+            )
+        return boto3.client('dynamodb')
+
+    # -------------------------------------------------------------------------
+    # Buffering
+    # -------------------------------------------------------------------------
+
+    def record(self, table_name: str, item: Dict[str, Any]) -> None:
+        """Queue an audit item for the given table."""
+        with self._lock:
+            self._buffer.append((table_name, item))
+            should_flush = len(self._buffer) >= MAX_BUFFERED_RECORDS
+        if should_flush:
+            self.flush()
+
+    def pending(self) -> int:
+        """Number of buffered records not yet flushed."""
+        with self._lock:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """
+        Write all buffered records to the configured sink.
+
+        Returns:
+            Number of records successfully written
+        """
+        with self._lock:
+            records, self._buffer = self._buffer, []
+        if not records:
+            return 0
+
+        try:
+            if self.mode == 'memory':
+                for table_name, item in records:
+                    self.local_queue.send(table_name, item)
+                return len(records)
+            return self._flush_to_dynamodb(records)
+        except Exception as e:
+            print(f"Audit flush error ({len(records)} records dropped): {e}")
+            return 0
+
+    def _flush_to_dynamodb(self, records: List[Tuple[str, Dict[str, Any]]]) -> int:
+        client = self._get_dynamodb_client()
+        requests = [
+            (table_name, {'PutRequest': {'Item': self._serialize(item)}})
+            for table_name, item in records
+        ]
+
+        written = 0
+        for start in range(0, len(requests), DYNAMODB_BATCH_SIZE):
+            request_items: Dict[str, List[Dict]] = {}
+            for table_name, request in requests[start:start + DYNAMODB_BATCH_SIZE]:
+                request_items.setdefault(table_name, []).append(request)
+            batch_count = sum(len(v) for v in request_items.values())
+
+            for attempt in range(MAX_RETRY_ATTEMPTS):
+                try:
+                    response = client.batch_write_item(RequestItems=request_items)
+                except ClientError as e:
+                    code = e.response.get('Error', {}).get('Code', '')
+                    if code not in ('ProvisionedThroughputExceededException', 'ThrottlingException'):
+                        # Drop this batch only; the remaining batches are still written
+                        print(f"Audit flush error ({batch_count} records dropped): {e}")
+                        break
+                    response = {'UnprocessedItems': request_items}
+
+                unprocessed = response.get('UnprocessedItems') or {}
+                remaining = sum(len(v) for v in unprocessed.values())
+                written += batch_count - remaining
+                if not remaining:
+                    break
+                request_items, batch_count = unprocessed, remaining
+                time.sleep(RETRY_BASE_DELAY_SECONDS * (2 ** attempt))
+            else:
+                print(f"Audit flush: {batch_count} items unprocessed after {MAX_RETRY_ATTEMPTS} attempts")
+
+        return written
+
+    def _serialize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: self._serializer.serialize(value) for key, value in item.items()}
+
+
+# Process-wide sink (lazy initialized, reused across warm invocations)
+_sink: Optional[AuditSink] = None
+
+
+def audit_sink() -> AuditSink:
+    """Get the process-wide audit sink."""
+    global _sink
+    if _sink is None:
+        _sink = AuditSink()
+    return _sink
+
+
+def flush_audit() -> int:
+    """Flush buffered audit records (no-op when nothing was recorded)."""
+    if _sink is None:
+        return 0
+    return _sink.flush()
+
+
+def flush_audit_on_exit(func: Callable) -> Callable:
+    """
+    Decorator for Lambda handlers: flush the audit buffer before returning.
+
+    The flush must happen before the handler returns, since Lambda may freeze
+    the execution environment as soon as the response is sent.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            flush_audit()
+    return wrapper
@@ -35,8 +35,12 @@ from .handlers import (
     handle_auth_me,
     handle_auth_whoami,
 )
+from auth.audit import flush_audit_on_exit
+from shared.log import log_requests
 
 
+@flush_audit_on_exit
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for auth endpoints.
@@ -11,6 +11,7 @@ import boto3
 from botocore.exceptions import ClientError
 
 from .models import AuthContext, Permission, DashborionRole
+from .audit import audit_sink
 
 # Role to actions mapping
 ROLE_PERMISSIONS: Dict[DashborionRole, List[str]] = {
@@ -200,6 +201,9 @@ def log_audit_event(
     """
     Log an audit event to DynamoDB.
 
+    The record is buffered by the audit sink and written in bulk at the end
+    of the request (see auth.audit.flush_audit_on_exit).
+
     Args:
         auth: Authentication context
         action: Action performed
@@ -218,33 +222,28 @@ def log_audit_event(
     ttl = timestamp + (90 * 24 * 60 * 60)  # 90 days retention
 
     try:
-        client = _get_dynamodb_client()
-
         item = {
-            'pk': {'S': f'USER#{auth.email}'},
-            'sk': {'S': f'TS#{timestamp}#{action}#{uuid.uuid4().hex[:8]}'},
-            'gsi1pk': {'S': f'PROJECT#{project}'},
-            'gsi1sk': {'S': f'ENV#{environment}#{timestamp}'},
-            'userId': {'S': auth.user_id},
-            'email': {'S': auth.email},
-            'timestamp': {'N': str(timestamp)},
-            'action': {'S': action},
-            'project': {'S': project},
-            'environment': {'S': environment},
-            'resource': {'S': resource},
-            'result': {'S': result},
-            'sessionId': {'S': auth.session_id},
-            'mfaVerified': {'BOOL': auth.mfa_verified},
-            'ttl': {'N': str(ttl)},
+            'pk': f'USER#{auth.email}',
+            'sk': f'TS#{timestamp}#{action}#{uuid.uuid4().hex[:8]}',
+            'gsi1pk': f'PROJECT#{project}',
+            'gsi1sk': f'ENV#{environment}#{timestamp}',
+            'userId': auth.user_id,
+            'email': auth.email,
+            'timestamp': timestamp,
+            'action': action,
+            'project': project,
+            'environment': environment,
+            'resource': resource,
+            'result': result,
+            'sessionId': auth.session_id,
+            'mfaVerified': auth.mfa_verified,
+            'ttl': ttl,
         }
 
         if details:
-            item['details'] = {'S': json.dumps(details)}
+            item['details'] = json.dumps(details)
 
-        client.put_item(
-            TableName=table_name,
-            Item=item
-        )
+        audit_sink().record(table_name, item)
 
-    except ClientError as e:
+    except Exception as e:
         print(f"Failed to log audit event: {e}")
@@ -13,20 +13,28 @@ Headers expected from client:
 - X-Amz-Iam-Request-Body: base64-encoded request body
 - X-Amz-Iam-Request-Headers: base64-encoded JSON headers
 
+Verified identities are cached per signature for the validity window of the
+signed request, so a CLI reusing the same proof across many calls only pays
+one STS round trip. STS calls go over a pooled keep-alive connection.
+
 References:
 - https://developer.hashicorp.com/vault/docs/auth/aws
 - https://ahermosilla.com/cloud/2020/11/17/leveraging-aws-signed-requests.html
 """
 
 import base64
+import calendar
+import hashlib
 import json
 import os
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
+from typing import Dict, Any, Optional, Set, Tuple
+
+import urllib3
 
 
 @dataclass
@@ -50,6 +58,111 @@ IDENTITY_CENTER_ARN_PATTERN = re.compile(
 # Email pattern
 EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
+# STS rejects signed requests whose X-Amz-Date is more than 15 minutes old,
+# so a verified identity can never be reused beyond that window.
+SIGNATURE_VALIDITY_SECONDS = 15 * 60
+
+# How long a verified proof is trusted (capped by the signature validity window)
+IDENTITY_CACHE_TTL_SECONDS = int(os.environ.get('SIGV4_STS_CACHE_TTL', '300'))
+
+# Verified identities: signature digest -> (identity, expires_at)
+_identity_cache: Dict[str, Tuple['STSCallerIdentity', float]] = {}
+# Identity ARN -> signature digests, for invalidation by identity
+_identity_index: Dict[str, Set[str]] = {}
+_identity_lock = threading.Lock()
+
+# Keep-alive connection pool for STS (lazy initialized, reused across invocations)
+_sts_pool: Optional[urllib3.PoolManager] = None
+
+
+def _get_sts_pool() -> urllib3.PoolManager:
+    """Get or create the pooled HTTP client used to reach STS."""
+    global _sts_pool
+    if _sts_pool is None:
+        _sts_pool = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=10,
+            timeout=urllib3.Timeout(connect=2.0, read=5.0),
+            retries=False,
+        )
+    return _sts_pool
+
+
+def _signature_cache_key(signed_headers: Dict[str, list]) -> Optional[str]:
+    """Build the cache key from the request signature (Authorization header)."""
+    for key, values in signed_headers.items():
+        if key.lower() == 'authorization' and values:
+            return hashlib.sha256(values[0].encode('utf-8')).hexdigest()
+    return None
+
+
+def _signature_expiry(signed_headers: Dict[str, list]) -> Optional[float]:
+    """
+    Compute until when a verified proof may be served from the cache, from its
+    X-Amz-Date header. Older proofs are not rejected here, they are verified
+    again by STS (which enforces its own validity window).
+    """
+    for key, values in signed_headers.items():
+        if key.lower() == 'x-amz-date' and values:
+            try:
+                signed_at = calendar.timegm(time.strptime(values[0], '%Y%m%dT%H%M%SZ'))
+            except ValueError:
+                return None
+            ttl = min(IDENTITY_CACHE_TTL_SECONDS, SIGNATURE_VALIDITY_SECONDS)
+            return signed_at + ttl
+    return None
+
+
+def _get_cached_identity(cache_key: str) -> Optional['STSCallerIdentity']:
+    with _identity_lock:
+        entry = _identity_cache.get(cache_key)
+        if not entry:
+            return None
+        identity, expires_at = entry
+        if time.time() >= expires_at:
+            _identity_cache.pop(cache_key, None)
+            keys = _identity_index.get(identity.arn)
+            if keys:
+                keys.discard(cache_key)
+            return None
+        return identity
+
+
+def _cache_identity(cache_key: str, identity: 'STSCallerIdentity', expires_at: float) -> None:
+    now = time.time()
+    with _identity_lock:
+        # Opportunistically drop expired entries so the cache stays bounded
+        for key in [k for k, (_, exp) in _identity_cache.items() if exp <= now]:
+            expired_identity, _ = _identity_cache.pop(key)
+            keys = _identity_index.get(expired_identity.arn)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    _identity_index.pop(expired_identity.arn, None)
+        _identity_cache[cache_key] = (identity, expires_at)
+        _identity_index.setdefault(identity.arn, set()).add(cache_key)
+
+
+def invalidate_cached_identity(arn: str) -> int:
+    """
+    Drop all cached proofs for an identity ARN.
+
+    Returns:
+        Number of cache entries removed
+    """
+    with _identity_lock:
+        keys = _identity_index.pop(arn, set())
+        for key in keys:
+            _identity_cache.pop(key, None)
+        return len(keys)
+
+
+def clear_identity_cache():
+    """Clear the verified identity cache."""
+    with _identity_lock:
+        _identity_cache.clear()
+        _identity_index.clear()
+
 
 def validate_sigv4_sts_auth(headers: Dict[str, str]) -> Optional[STSCallerIdentity]:
     """
@@ -102,10 +215,22 @@ def validate_sigv4_sts_auth(headers: Dict[str, str]) -> Optional[STSCallerIdenti
                 print(f"[SigV4-STS] Server ID mismatch: {server_id_header} != {expected_server_id}")
                 return None
 
+        # Reuse a previous verification of the same signed request
+        # (past the cache TTL, the proof is a cache miss and goes to STS)
+        cache_key = _signature_cache_key(signed_headers)
+        expires_at = _signature_expiry(signed_headers)
+        cacheable = bool(cache_key and expires_at and time.time() < expires_at)
+        if cacheable:
+            cached = _get_cached_identity(cache_key)
+            if cached:
+                return cached
+
         # Forward request to STS
         identity = forward_to_sts(url, method, body, signed_headers)
         if identity:
             print(f"[SigV4-STS] Verified identity: {identity.arn}")
+            if cacheable:
+                _cache_identity(cache_key, identity, expires_at)
         return identity
 
     except Exception as e:
@@ -132,30 +257,32 @@ def forward_to_sts(
         STSCallerIdentity if successful, None otherwise
     """
     try:
-        # Build request
-        req = Request(url, data=body.encode('utf-8'), method=method)
-
-        # Add headers (convert from Go-style to standard)
+        # Convert headers from Go-style (values as lists) to standard
+        request_headers = {}
         for key, values in signed_headers.items():
-            # Skip Host header - urllib sets it automatically
+            # Skip Host header - set from the URL by the connection pool
             if key.lower() == 'host':
                 continue
             # Use first value from list
-            value = values[0] if values else ''
-            req.add_header(key, value)
+            request_headers[key] = values[0] if values else ''
+
+        # Forward to STS over the pooled keep-alive connection
+        response = _get_sts_pool().request(
+            method,
+            url,
+            body=body.encode('utf-8'),
+            headers=request_headers,
+        )
+        response_body = response.data.decode('utf-8')
 
-        # Forward to STS
-        with urlopen(req, timeout=10) as response:
-            response_body = response.read().decode('utf-8')
+        if response.status != 200:
+            print(f"[SigV4-STS] STS returned {response.status}: {response_body[:500]}")
+            return None
 
         # Parse XML response
         return parse_sts_response(response_body)
 
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8') if e.fp else ''
-        print(f"[SigV4-STS] STS returned {e.code}: {error_body[:500]}")
-        return None
-    except URLError as e:
+    except urllib3.exceptions.HTTPError as e:
         print(f"[SigV4-STS] Failed to connect to STS: {e}")
         return None
     except Exception as e:
@@ -9,12 +9,14 @@ import os
 import time
 import hashlib
 import secrets
+import uuid
 from typing import Dict, List, Optional, Any, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
 
 from .models import User, Group, Permission, DashborionRole
+from .audit import audit_sink
 
 # Table names from environment
 USERS_TABLE = os.environ.get('USERS_TABLE_NAME', 'dashborion-users')
@@ -79,16 +81,13 @@ def _verify_password(password: str, password_hash: str) -> bool:
 
 
 def _audit_log(actor_email: str, action: str, target: Dict, result: str, details: Dict = None):
-    """Record audit log entry"""
+    """Record audit log entry (buffered, flushed at the end of the request)"""
     try:
-        dynamodb = _get_dynamodb()
-        table = dynamodb.Table(AUDIT_TABLE)
-
         timestamp = int(time.time())
 
-        table.put_item(Item={
+        audit_sink().record(AUDIT_TABLE, {
             'pk': f'USER#{actor_email}',
-            'sk': f'TS#{timestamp}#{action}',
+            'sk': f'TS#{timestamp}#{action}#{uuid.uuid4().hex[:8]}',
             'gsi1pk': f'ACTION#{action}',
             'gsi1sk': f'TS#{timestamp}',
             'timestamp': timestamp,
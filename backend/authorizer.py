@@ -19,9 +19,12 @@ Permission checks are delegated to individual Lambda handlers via
 the @require_permission decorators in shared/rbac.py.
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 
 # Import auth modules
 from auth.device_flow import validate_token
@@ -32,6 +35,14 @@ from auth.service_auth import validate_service_auth
 from auth.user_management import get_user, get_user_effective_permissions
 
 
+# SigV4 user lookups cached per email (user record + effective permissions).
+# Permission or status changes take effect after at most this many seconds.
+SIGV4_USER_CACHE_TTL_SECONDS = int(os.environ.get('SIGV4_USER_CACHE_TTL', '60'))
+# Least recently used emails are evicted beyond this many entries
+SIGV4_USER_CACHE_MAX_ENTRIES = int(os.environ.get('SIGV4_USER_CACHE_MAX_ENTRIES', '1024'))
+_sigv4_user_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda Authorizer handler.
@@ -200,7 +211,8 @@ def authenticate_sigv4_user(email: str) -> Optional[Dict[str, Any]]:
     """
     Authenticate a user identified by SigV4.
 
-    Looks up user in DynamoDB and returns permissions.
+    Looks up user in DynamoDB and returns permissions. Successful lookups
+    are cached for SIGV4_USER_CACHE_TTL seconds.
 
     Args:
         email: Email extracted from Identity Center session name
@@ -208,10 +220,36 @@ def authenticate_sigv4_user(email: str) -> Optional[Dict[str, Any]]:
     Returns:
         Auth result dict or None if user not found/disabled
     """
-    from auth.models import Permission, DashborionRole
-
     email = email.lower()
 
+    now = time.time()
+    cached = _sigv4_user_cache.get(email)
+    if cached and now < cached[1]:
+        _sigv4_user_cache.move_to_end(email)
+        # Callers annotate the result (auth_method), never hand out the cached dict
+        return copy.deepcopy(cached[0])
+
+    result = _lookup_sigv4_user(email)
+    if result:
+        _cache_sigv4_user(email, result, now)
+        return copy.deepcopy(result)
+
+    _sigv4_user_cache.pop(email, None)
+    return None
+
+
+def _cache_sigv4_user(email: str, result: Dict[str, Any], now: float) -> None:
+    """Cache a lookup, dropping expired entries, then the least recently used."""
+    for key in [k for k, (_, expires_at) in _sigv4_user_cache.items() if expires_at <= now]:
+        del _sigv4_user_cache[key]
+    _sigv4_user_cache[email] = (result, now + SIGV4_USER_CACHE_TTL_SECONDS)
+    _sigv4_user_cache.move_to_end(email)
+    while len(_sigv4_user_cache) > SIGV4_USER_CACHE_MAX_ENTRIES:
+        _sigv4_user_cache.popitem(last=False)
+
+
+def _lookup_sigv4_user(email: str) -> Optional[Dict[str, Any]]:
+    """Look up a SigV4 user and its effective permissions in DynamoDB."""
     # Get user from DynamoDB
     user = get_user(email)
 
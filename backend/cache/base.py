@@ -2,7 +2,7 @@
 Cache interfaces for Dashborion backend.
 """
 
-from typing import Any, Iterable, Optional, Protocol
+from typing import Any, Dict, Iterable, Optional, Protocol
 
 
 class CacheBackend(Protocol):
@@ -14,3 +14,12 @@ class CacheBackend(Protocol):
 
     def invalidate_prefix(self, pk: str, sk_prefix: str) -> int:
         ...
+
+    def invalidate_tags(self, pk: str, tags: Iterable[str]) -> int:
+        ...
+
+    def increment(self, pk: str, sk: str, amount: int, ttl_seconds: int) -> None:
+        ...
+
+    def counters(self, pk: str, sk_prefix: str) -> Dict[str, int]:
+        ...
@@ -0,0 +1,145 @@
+"""
+Payload codec for DynamoDB items (cache table, EKS state table).
+
+Items store their value in a `payload` attribute. Encoded items (`codec`
+attribute) hold zlib-compressed JSON in a Binary attribute; values whose
+compressed size exceeds one item are split into chunk items written under
+`{sk}#chunk#{set}#{index}` next to the head item, which records the chunk
+set and count. Readers fetch the head and its chunks with one Query
+(paginated) and ignore chunks of other sets, so a reader never mixes two
+writes; superseded chunks expire with their TTL.
+
+Formats:
+- no `codec`: plain item, `payload` is a JSON string (cache table) or a
+  map (EKS state table); small values are still written this way
+- `codec: "zlib-json/1"`: `payload` is zlib(JSON); with `chunks: N`, the
+  head holds part 0 and the chunk items parts 1..N-1
+
+Usage:
+    write_item(table, {'pk': pk, 'sk': sk, 'ttl': ttl}, value)
+    item = read_item(table, pk, sk)     # item['payload'] decoded
+"""
+
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, List, Optional
+
+CODEC = "zlib-json/1"
+CODEC_ATTR = "codec"
+
+# Values smaller than this (serialized) are stored as plain JSON strings
+COMPRESS_MIN_BYTES = 1024
+COMPRESSION_LEVEL = 6
+# Binary bytes per item, leaving room for keys and attributes under the 400 KB limit
+CHUNK_BYTES = 350 * 1024
+# Largest value accepted (about the Lambda response size limit)
+MAX_CHUNKS = 16
+
+
+def _chunk_prefix(sk: str) -> str:
+    return f"{sk}#chunk#"
+
+
+def _chunk_sk(sk: str, chunk_set: str, index: int) -> str:
+    return f"{_chunk_prefix(sk)}{chunk_set}#{index:04d}"
+
+
+def _as_bytes(value: Any) -> bytes:
+    # boto3 returns Binary attributes wrapped in boto3.dynamodb.types.Binary
+    return bytes(getattr(value, "value", value))
+
+
+def is_encoded(item: Dict[str, Any]) -> bool:
+    return item.get(CODEC_ATTR) == CODEC
+
+
+def encode_items(head: Dict[str, Any], value: Any) -> List[Dict[str, Any]]:
+    """
+    Items to write for `value`: chunk items first, the head item last.
+
+    `head` holds the key and metadata attributes (pk, sk, ttl, ...), copied
+    to the chunk items.
+    """
+    serialized = json.dumps(value, default=str)
+    if len(serialized) < COMPRESS_MIN_BYTES:
+        return [{**head, "payload": serialized}]
+
+    compressed = zlib.compress(serialized.encode("utf-8"), COMPRESSION_LEVEL)
+    parts = [compressed[i:i + CHUNK_BYTES] for i in range(0, len(compressed), CHUNK_BYTES)]
+    if len(parts) > MAX_CHUNKS:
+        raise ValueError(f"Payload too large to store: {len(compressed)} bytes compressed")
+
+    item = {**head, CODEC_ATTR: CODEC, "payload": parts[0]}
+    if len(parts) == 1:
+        return [item]
+
+    chunk_set = hashlib.sha256(compressed).hexdigest()[:8]
+    item.update({"chunks": len(parts), "chunkSet": chunk_set})
+    chunks = [
+        {**head, "sk": _chunk_sk(head["sk"], chunk_set, index), "payload": part}
+        for index, part in enumerate(parts[1:], start=1)
+    ]
+    return chunks + [item]
+
+
+def decode_payload(item: Dict[str, Any], chunk_items: Optional[List[Dict[str, Any]]] = None) -> Any:
+    """
+    Value of a head item (plain items: the raw `payload` attribute).
+
+    Raises ValueError when chunks of the head's set are missing.
+    """
+    if not is_encoded(item):
+        return item.get("payload")
+
+    data = _as_bytes(item["payload"])
+    count = int(item.get("chunks") or 1)
+    if count > 1:
+        prefix = _chunk_prefix(item["sk"]) + f"{item['chunkSet']}#"
+        parts = {
+            chunk["sk"]: _as_bytes(chunk["payload"])
+            for chunk in chunk_items or ()
+            if chunk["sk"].startswith(prefix)
+        }
+        try:
+            data += b"".join(parts[_chunk_sk(item["sk"], item["chunkSet"], index)] for index in range(1, count))
+        except KeyError:
+            raise ValueError(f"Missing chunks for {item['pk']}/{item['sk']}")
+    return json.loads(zlib.decompress(data))
+
+
+def write_item(table, head: Dict[str, Any], value: Any) -> None:
+    """Encode `value` and put its items (chunks before the head)."""
+    for item in encode_items(head, value):
+        table.put_item(Item=item)
+
+
+def read_item(table, pk: str, sk: str) -> Optional[Dict[str, Any]]:
+    """
+    Head item of `pk`/`sk` with its payload decoded, None when absent or
+    incomplete. Head and chunks come from one Query over `sk` .. `sk#chunk#~`.
+    """
+    from boto3.dynamodb.conditions import Key
+
+    condition = Key("pk").eq(pk) & Key("sk").between(sk, _chunk_prefix(sk) + "~")
+    items: List[Dict[str, Any]] = []
+    kwargs: Dict[str, Any] = {"KeyConditionExpression": condition}
+    while True:
+        response = table.query(**kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            break
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    head = next((item for item in items if item["sk"] == sk), None)
+    if head is None:
+        return None
+    chunk_prefix = _chunk_prefix(sk)
+    try:
+        payload = decode_payload(head, [item for item in items if item["sk"].startswith(chunk_prefix)])
+    except (ValueError, zlib.error) as e:
+        print(f"Undecodable item {pk}/{sk}: {e}")
+        return None
+    item = {key: value for key, value in head.items() if key not in ("chunks", "chunkSet")}
+    item["payload"] = payload
+    return item
@@ -0,0 +1,196 @@
+"""
+Versioned list responses and deltas for polled resources.
+
+Every versioned payload carries a `version` (content hash of the payload,
+volatile keys such as `timestamp` excluded) also sent as the `ETag`.
+Clients that poll can:
+
+- send `If-None-Match: "<version>"` and get a 304 when nothing changed
+- send `?since=<version>` and get only what changed since that version:
+
+    {
+      "version": "<new>", "since": "<old>", "delta": true,
+      "changed": {<top-level key>: <new value>, ...},
+      "removedKeys": [<top-level key>, ...],
+      "collections": {
+        "<key>": {"added": [...], "updated": [...], "removed": [<id>, ...]}
+      }
+    }
+
+Collections are top-level lists of items identified by `namespace/name`,
+`name` or `id` (added/updated carry whole items, removed their ids; clients
+keep their own ordering) and top-level dicts (added/updated are
+`{key: value}` maps, removed their keys). Anything else that changed is
+sent whole under `changed`.
+
+The previous payload is read back from the cache table, where each served
+version is kept as a snapshot for SNAPSHOT_TTL_SECONDS. An unknown or
+expired `since` (or no cache table) gets the full payload.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from shared.response import etag_matches, get_header, get_query_param, json_response, not_modified_response
+
+from .shared import cache_pk, cache_sk, get_cache_backend, should_cache
+
+# Payload keys left out of the version (they change on every fetch)
+VOLATILE_KEYS = frozenset({'timestamp'})
+
+# How long a served version can be used as `since`
+SNAPSHOT_TTL_SECONDS = 900
+
+# Snapshots this process already stored -> write time (monotonic). Unchanged
+# payloads are rewritten once their snapshot is half way to expiry.
+_MAX_STORED = 512
+_REWRITE_AFTER_SECONDS = SNAPSHOT_TTL_SECONDS / 2
+_stored: "OrderedDict[str, float]" = OrderedDict()
+
+
+def payload_version(data: Any) -> str:
+    """Content hash of a payload (volatile top-level keys excluded)."""
+    if isinstance(data, dict):
+        data = {key: value for key, value in data.items() if key not in VOLATILE_KEYS}
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def _item_id(item: Any) -> Optional[str]:
+    if not isinstance(item, dict):
+        return None
+    name = item.get('name')
+    if name is not None:
+        namespace = item.get('namespace')
+        return f"{namespace}/{name}" if namespace else str(name)
+    item_id = item.get('id')
+    return str(item_id) if item_id is not None else None
+
+
+def _index(items: List[Any]) -> Optional[Dict[str, Any]]:
+    """Items by id, None when some item has no (unique) id."""
+    index = {}
+    for item in items:
+        item_id = _item_id(item)
+        if item_id is None or item_id in index:
+            return None
+        index[item_id] = item
+    return index
+
+
+def _diff(previous: Dict[str, Any], current: Dict[str, Any]) -> Tuple[Any, Any, List[str]]:
+    added = {key: value for key, value in current.items() if key not in previous}
+    updated = {key: value for key, value in current.items() if key in previous and previous[key] != value}
+    removed = [key for key in previous if key not in current]
+    return added, updated, removed
+
+
+def compute_delta(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Changes from one payload to the next (see module docstring)."""
+    changed: Dict[str, Any] = {}
+    collections: Dict[str, Any] = {}
+
+    for key, value in current.items():
+        old = previous.get(key)
+        if key in previous and old == value:
+            continue
+        if isinstance(value, list) and isinstance(old, list):
+            old_index, new_index = _index(old), _index(value)
+            if old_index is not None and new_index is not None:
+                added, updated, removed = _diff(old_index, new_index)
+                collections[key] = {
+                    'added': list(added.values()),
+                    'updated': list(updated.values()),
+                    'removed': removed,
+                }
+                continue
+        elif isinstance(value, dict) and isinstance(old, dict):
+            added, updated, removed = _diff(old, value)
+            collections[key] = {'added': added, 'updated': updated, 'removed': removed}
+            continue
+        changed[key] = value
+
+    delta: Dict[str, Any] = {'changed': changed, 'collections': collections}
+    removed_keys = [key for key in previous if key not in current]
+    if removed_keys:
+        delta['removedKeys'] = removed_keys
+    return delta
+
+
+def _snapshot_sk(resource: str, params: Dict[str, Any], version: str) -> str:
+    return f"{cache_sk(resource, params)}#snapshot#{version}"
+
+
+def _store_snapshot(cache, pk: str, sk: str, data: Any) -> None:
+    key = f"{pk}/{sk}"
+    now = time.monotonic()
+    stored_at = _stored.get(key)
+    if stored_at is not None and now - stored_at < _REWRITE_AFTER_SECONDS:
+        _stored.move_to_end(key)
+        return
+    try:
+        cache.set(pk, sk, data, SNAPSHOT_TTL_SECONDS)
+    except Exception as e:
+        print(f"Snapshot write failed for {pk}/{sk}: {e}")
+        return
+    _stored[key] = now
+    _stored.move_to_end(key)
+    if len(_stored) > _MAX_STORED:
+        _stored.popitem(last=False)
+
+
+def _load_snapshot(cache, pk: str, sk: str) -> Optional[Dict[str, Any]]:
+    try:
+        snapshot = cache.get(pk, sk)
+    except Exception as e:
+        print(f"Snapshot read failed for {pk}/{sk}: {e}")
+        return None
+    return snapshot if isinstance(snapshot, dict) else None
+
+
+def versioned_response(
+    event: Dict[str, Any],
+    project: str,
+    env: str,
+    resource: str,
+    params: Dict[str, Any],
+    data: Any,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Response for a polled resource: 304 on a matching `If-None-Match`,
+    a delta for `?since=<version>`, otherwise the full payload with its
+    version. `params` are the resource's cache params (same digest as
+    fetch_with_cache), so snapshots are per query.
+    """
+    if not isinstance(data, dict) or not should_cache(data):
+        return json_response(200, data, headers=headers)
+
+    version = payload_version(data)
+    etag = f'"{version}"'
+    response_headers = {**(headers or {}), 'ETag': etag}
+
+    if etag_matches(get_header(event, 'if-none-match'), etag):
+        return not_modified_response(response_headers)
+
+    since = get_query_param(event, 'since')
+    if since == version:
+        return not_modified_response(response_headers)
+
+    cache = get_cache_backend()
+    if cache is not None:
+        pk = cache_pk(project, env)
+        _store_snapshot(cache, pk, _snapshot_sk(resource, params, version), data)
+        previous = _load_snapshot(cache, pk, _snapshot_sk(resource, params, since)) if since else None
+        if previous is not None:
+            delta = compute_delta(previous, data)
+            return json_response(
+                200,
+                {'version': version, 'since': since, 'delta': True, **delta},
+                headers={**response_headers, 'X-Delta': 'true'},
+            )
+
+    return json_response(200, {**data, 'version': version}, headers=response_headers)
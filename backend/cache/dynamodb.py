@@ -1,17 +1,30 @@
 """
 DynamoDB-backed cache implementation.
+
+Values go through cache.codec: compressed above a small size and chunked
+across sort keys when larger than one item. Tagged entries are indexed
+(`tag#{tag}#{sk}` items) for invalidate_tags.
 """
 
 import json
 import os
 import time
 from datetime import datetime
-from typing import Any, Iterable, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 import boto3
 from boto3.dynamodb.conditions import Key
 
 from .base import CacheBackend
+from .codec import is_encoded, read_item, write_item
+
+# Tag index items: `tag#{tag}#{entry sk}` -> entry sk, in the entry's partition
+TAG_INDEX_TTL_SECONDS = 86400
+_MAX_INDEXED = 4096
+
+
+def _tag_sk(tag: str, sk: str = "") -> str:
+    return f"tag#{tag}#{sk}"
 
 
 class DynamoDBCache(CacheBackend):
@@ -20,17 +33,18 @@ class DynamoDBCache(CacheBackend):
         if not self.table_name:
             raise ValueError("CACHE_TABLE_NAME environment variable is not set")
         self._table = boto3.resource("dynamodb").Table(self.table_name)
+        # (pk, tag, sk) -> time until which the tag index item needs no rewrite
+        self._indexed: Dict[Tuple[str, str, str], float] = {}
 
     def get(self, pk: str, sk: str) -> Optional[Any]:
-        response = self._table.get_item(Key={"pk": pk, "sk": sk})
-        item = response.get("Item")
+        item = read_item(self._table, pk, sk)
         if not item:
             return None
         ttl = item.get("ttl")
         if ttl and ttl < int(time.time()):
             return None
         payload = item.get("payload")
-        if isinstance(payload, str):
+        if isinstance(payload, str) and not is_encoded(item):
             try:
                 return json.loads(payload)
             except json.JSONDecodeError:
@@ -39,25 +53,87 @@ class DynamoDBCache(CacheBackend):
 
     def set(self, pk: str, sk: str, value: Any, ttl_seconds: int, tags: Optional[Iterable[str]] = None) -> None:
         ttl = int(time.time()) + int(ttl_seconds)
-        item = {
+        head = {
             "pk": pk,
             "sk": sk,
-            "payload": json.dumps(value, default=str),
             "ttl": ttl,
             "updatedAt": datetime.utcnow().isoformat() + "Z",
         }
         if tags:
-            item["tags"] = list(tags)
-        self._table.put_item(Item=item)
+            head["tags"] = list(tags)
+        write_item(self._table, head, value)
+        if tags:
+            self._index_tags(pk, sk, tags)
+
+    def _index_tags(self, pk: str, sk: str, tags: Iterable[str]) -> None:
+        """
+        Write the tag -> key index items of an entry. They outlive the
+        entry (an invalidated key is usually stored again under the same
+        sort key) and are rewritten by this process at half their TTL.
+        """
+        now = time.time()
+        if len(self._indexed) > _MAX_INDEXED:
+            self._indexed.clear()
+        for tag in tags:
+            if self._indexed.get((pk, tag, sk), 0) > now:
+                continue
+            self._table.put_item(Item={
+                "pk": pk,
+                "sk": _tag_sk(tag, sk),
+                "key": sk,
+                "ttl": int(now) + TAG_INDEX_TTL_SECONDS,
+            })
+            self._indexed[(pk, tag, sk)] = now + TAG_INDEX_TTL_SECONDS / 2
+
+    def _query_keys(self, pk: str, sk_prefix: str, attribute: str = "key") -> Iterator[Dict[str, Any]]:
+        """Sort key (and one attribute) of every item under a prefix, all pages."""
+        kwargs: Dict[str, Any] = {
+            "KeyConditionExpression": Key("pk").eq(pk) & Key("sk").begins_with(sk_prefix),
+            "ProjectionExpression": "sk, #attr",
+            "ExpressionAttributeNames": {"#attr": attribute},
+        }
+        while True:
+            response = self._table.query(**kwargs)
+            yield from response.get("Items", [])
+            if "LastEvaluatedKey" not in response:
+                return
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _delete(self, pk: str, sort_keys: Iterable[str]) -> None:
+        # batch_writer sends batches of 25 and retries unprocessed items
+        with self._table.batch_writer() as batch:
+            for sk in sort_keys:
+                batch.delete_item(Key={"pk": pk, "sk": sk})
 
     def invalidate_prefix(self, pk: str, sk_prefix: str) -> int:
-        response = self._table.query(
-            KeyConditionExpression=Key("pk").eq(pk) & Key("sk").begins_with(sk_prefix)
+        sort_keys = [item["sk"] for item in self._query_keys(pk, sk_prefix)]
+        if sort_keys:
+            self._delete(pk, sort_keys)
+        return len(sort_keys)
+
+    def invalidate_tags(self, pk: str, tags: Iterable[str]) -> int:
+        """Delete the entries indexed under any of `tags` (index items are kept)."""
+        sort_keys = {
+            item["key"]
+            for tag in tags
+            for item in self._query_keys(pk, _tag_sk(tag))
+        }
+        if sort_keys:
+            self._delete(pk, sort_keys)
+        return len(sort_keys)
+
+    def increment(self, pk: str, sk: str, amount: int, ttl_seconds: int) -> None:
+        """Add `amount` to the counter item `pk`/`sk` (created on first use)."""
+        self._table.update_item(
+            Key={"pk": pk, "sk": sk},
+            UpdateExpression="ADD #count :amount SET #ttl = :ttl",
+            ExpressionAttributeNames={"#count": "count", "#ttl": "ttl"},
+            ExpressionAttributeValues={":amount": amount, ":ttl": int(time.time()) + int(ttl_seconds)},
         )
-        items = response.get("Items", [])
-        if not items:
-            return 0
-        with self._table.batch_writer() as batch:
-            for item in items:
-                batch.delete_item(Key={"pk": item["pk"], "sk": item["sk"]})
-        return len(items)
+
+    def counters(self, pk: str, sk_prefix: str) -> Dict[str, int]:
+        """Counter values under a sort key prefix, by sort key."""
+        return {
+            item["sk"]: int(item.get("count", 0))
+            for item in self._query_keys(pk, sk_prefix, attribute="count")
+        }
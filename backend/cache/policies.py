@@ -4,16 +4,28 @@ Cache policies and TTLs for infrastructure resources.
 
 RESOURCE_TTLS_SECONDS = {
     "cloudfront": 120,
-    "alb": 60,
+    # Per-account alias/tag index: kept for a day, rebuilt from the listing
+    # once older than cloudfront-index-refresh
+    "cloudfront-index": 86400,
+    "cloudfront-index-refresh": 300,
+    # Composite ALB view: bounded by its most volatile part (target health)
+    "alb": 15,
+    # Listener rules and target group definitions change on deployments only
+    "alb-rules": 600,
+    "alb-target-health": 15,
     "rds": 120,
     "redis": 120,
     "s3": 300,
     "network": 300,
     "workloads": 30,
     "efs": 300,
+    # ARNs matching an environment's discovery tags (RDS, ElastiCache, EFS)
+    "tagged-resources": 300,
     "routing": 300,
     "enis": 120,
     "security-group": 300,
+    # Bounded by the ENI index it is evaluated over
+    "reachability": 120,
     "nodes": 30,
     "k8s-services": 60,
     "ingresses": 60,
@@ -24,3 +36,24 @@ RESOURCE_TTLS_SECONDS = {
 
 def get_ttl(resource: str, default: int = 60) -> int:
     return RESOURCE_TTLS_SECONDS.get(resource, default)
+
+
+# Cache tags ({env}: environment). Entries are tagged per resource when
+# stored; mutating actions invalidate the tags they affect
+# (cache.shared.invalidate_tags).
+SERVICES_TAG = "services:{env}"      # deploy / scale actions
+RDS_TAG = "rds:{env}"                # RDS start / stop
+CLOUDFRONT_TAG = "cloudfront:{env}"  # CloudFront invalidations
+
+RESOURCE_TAGS = {
+    "workloads": (SERVICES_TAG,),
+    "alb": (SERVICES_TAG,),
+    "alb-target-health": (SERVICES_TAG,),
+    "nodes": (SERVICES_TAG,),
+    "rds": (RDS_TAG,),
+    "cloudfront": (CLOUDFRONT_TAG,),
+}
+
+
+def get_tags(resource: str, env: str) -> tuple:
+    return tuple(tag.format(env=env) for tag in RESOURCE_TAGS.get(resource, ()))
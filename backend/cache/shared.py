@@ -0,0 +1,144 @@
+"""
+Shared cache access for handlers and providers.
+
+Entries live in the cache table under `CACHE#{project}#{env}` with a
+`{resource}#{params digest}` sort key; TTLs come from cache.policies.
+
+Entries are tagged per resource (cache.policies.RESOURCE_TAGS); mutating
+actions drop the entries they make stale with invalidate_tags.
+
+Providers use the same helper for sub-results that change at a different
+rate than the resource they belong to (e.g. ALB rules vs target health).
+A `?force=true` request bypasses those nested entries too (see refresh_scope).
+"""
+
+import contextlib
+import contextvars
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from .base import CacheBackend
+from .policies import get_tags, get_ttl
+
+
+_force_refresh: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    'dashborion_cache_force_refresh', default=False
+)
+
+
+@lru_cache(maxsize=1)
+def get_cache_backend() -> Optional[CacheBackend]:
+    """Process-wide cache backend, None when no cache table is configured."""
+    if not os.environ.get("CACHE_TABLE_NAME"):
+        return None
+    from .dynamodb import DynamoDBCache
+    return DynamoDBCache()
+
+
+def cache_pk(project: str, env: str) -> str:
+    return f"CACHE#{project}#{env}"
+
+
+def cache_sk(resource: str, params: Dict[str, Any]) -> str:
+    payload = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+    return f"{resource}#{digest}"
+
+
+def should_cache(payload: Any) -> bool:
+    if isinstance(payload, dict):
+        if payload.get("error"):
+            return False
+        if len(payload) == 1:
+            value = next(iter(payload.values()))
+            if isinstance(value, dict) and value.get("error"):
+                return False
+    return True
+
+
+@contextlib.contextmanager
+def refresh_scope(force_refresh: bool) -> Iterator[None]:
+    """Bypass cached entries (nested provider caches included) within the block."""
+    token = _force_refresh.set(force_refresh or _force_refresh.get())
+    try:
+        yield
+    finally:
+        _force_refresh.reset(token)
+
+
+def refresh_requested() -> bool:
+    """Whether the current request asked to bypass cached entries."""
+    return _force_refresh.get()
+
+
+def fetch_with_cache(
+    resource: str,
+    project: str,
+    env: str,
+    params: Dict[str, Any],
+    fetch_fn: Callable[[], Any],
+    force_refresh: bool = False,
+    ttl_seconds: Optional[int] = None,
+    cacheable: Callable[[Any], bool] = should_cache,
+    tags: Optional[Iterable[str]] = None,
+) -> Tuple[Any, str]:
+    """
+    Return (data, cache status) for a resource, fetching and storing on miss.
+
+    The entry is tagged with `tags` (default: the resource's policy tags).
+
+    Cache status is "hit", "miss" or "bypass" (no cache table configured).
+    Storing is best effort: a failed write is logged and the data returned.
+    """
+    with refresh_scope(force_refresh):
+        cache = get_cache_backend()
+        if cache is None:
+            return fetch_fn(), "bypass"
+
+        pk = cache_pk(project, env)
+        sk = cache_sk(resource, params)
+        if not _force_refresh.get():
+            # Reads are counted to prioritize the cache warmer (forced
+            # refreshes, the warmer's included, are not)
+            from .stats import record_access
+            record_access(project, env, resource)
+            cached = cache.get(pk, sk)
+            if cached is not None:
+                return cached, "hit"
+
+        data = fetch_fn()
+        if cacheable(data):
+            try:
+                cache.set(
+                    pk,
+                    sk,
+                    data,
+                    ttl_seconds or get_ttl(resource),
+                    tags=get_tags(resource, env) if tags is None else tags,
+                )
+            except Exception as e:
+                print(f"Cache write failed for {pk}/{sk}: {e}")
+        return data, "miss"
+
+
+def invalidate_tags(project: str, env: str, tags: Iterable[str]) -> int:
+    """
+    Drop the cached entries of a project environment carrying any of `tags`
+    (`{env}` placeholders, as in cache.policies, are filled in).
+
+    Best effort: a failure is logged and the entries expire with their TTL.
+    Returns the number of keys invalidated.
+    """
+    cache = get_cache_backend()
+    if cache is None:
+        return 0
+    pk = cache_pk(project, env)
+    tags = [tag.format(env=env) for tag in tags]
+    try:
+        return cache.invalidate_tags(pk, tags)
+    except Exception as e:
+        print(f"Cache invalidation failed for {pk} {tags}: {e}")
+        return 0
@@ -0,0 +1,71 @@
+"""
+Access frequency of cached resources.
+
+fetch_with_cache counts reads per project, environment and resource in
+process; counts are flushed to the cache table at most once per
+FLUSH_INTERVAL_SECONDS as daily counters (`stats#access#{resource}#{day}`,
+kept STATS_TTL_DAYS). The cache warmer orders its refreshes by these
+counts (see warmer.handler).
+"""
+
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Tuple
+
+from .shared import cache_pk, get_cache_backend
+
+FLUSH_INTERVAL_SECONDS = 60
+STATS_TTL_DAYS = 7
+_PREFIX = "stats#access#"
+
+_lock = threading.Lock()
+_pending: "Counter[Tuple[str, str, str]]" = Counter()
+_last_flush = time.monotonic()
+
+
+def _day(offset: int = 0) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+def record_access(project: str, env: str, resource: str) -> None:
+    """Count one read of a resource (flushed periodically)."""
+    global _last_flush
+    with _lock:
+        _pending[(project, env, resource)] += 1
+        if time.monotonic() - _last_flush < FLUSH_INTERVAL_SECONDS:
+            return
+        _last_flush = time.monotonic()
+    flush_access_counts()
+
+
+def flush_access_counts() -> None:
+    """Write pending counts to the cache table (best effort)."""
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+    cache = get_cache_backend()
+    if cache is None or not pending:
+        return
+    day = _day()
+    for (project, env, resource), count in pending.items():
+        pk = cache_pk(project, env)
+        try:
+            cache.increment(pk, f"{_PREFIX}{resource}#{day}", count, STATS_TTL_DAYS * 86400)
+        except Exception as e:
+            print(f"Access count write failed for {pk}/{resource}: {e}")
+
+
+def access_counts(project: str, env: str, days: int = STATS_TTL_DAYS) -> Dict[str, int]:
+    """Reads per resource of a project environment over the last `days` days."""
+    cache = get_cache_backend()
+    if cache is None:
+        return {}
+    oldest = _day(days - 1)
+    totals: Counter = Counter()
+    for sk, count in cache.counters(cache_pk(project, env), _PREFIX).items():
+        resource, _, day = sk[len(_PREFIX):].rpartition("#")
+        if day >= oldest:
+            totals[resource] += count
+    return dict(totals)
@@ -27,6 +27,7 @@ from shared.response import (
 )
 from app_config import get_config
 from providers.comparison import DynamoDBComparisonProvider, ComparisonOrchestratorProvider
+from shared.log import log_requests
 
 
 def _get_comparison_keys(project: str, source_env: str, dest_env: str, config) -> Tuple[str, str, str]:
@@ -131,6 +132,7 @@ def _get_available_pairs(project: str, config) -> List[Dict[str, Any]]:
     return pairs
 
 
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for comparison endpoints.
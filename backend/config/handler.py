@@ -31,6 +31,7 @@ from shared.response import (
     get_path,
     get_body,
 )
+from shared.log import log_requests
 
 # Table name from environment
 CONFIG_TABLE = os.environ.get('CONFIG_TABLE_NAME', 'dashborion-config')
@@ -74,6 +75,7 @@ def _decimal_to_native(obj):
 # Main Handler
 # =============================================================================
 
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Main Lambda handler for config registry endpoints."""
     method = get_method(event)
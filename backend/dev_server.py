@@ -13,6 +13,7 @@ Or via pnpm from project root:
     pnpm backend:dev
 """
 
+import base64
 import json
 import os
 import sys
@@ -101,6 +102,9 @@ def lambda_response_to_flask(lambda_response):
     status_code = lambda_response.get('statusCode', 200)
     headers = lambda_response.get('headers', {})
     body = lambda_response.get('body', '')
+    if lambda_response.get('isBase64Encoded'):
+        # Compressed bodies (see shared.response.finalize_response)
+        body = base64.b64decode(body)
 
     # Create Flask response
     response = make_response(body, status_code)
@@ -123,7 +127,7 @@ def api_handler(path):
     if request.method == 'OPTIONS':
         response = make_response('', 200)
         response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type,Authorization,X-SSO-User-Email'
+        response.headers['Access-Control-Allow-Headers'] = 'Content-Type,Authorization,X-SSO-User-Email,If-None-Match'
         response.headers['Access-Control-Allow-Methods'] = 'GET,POST,PUT,DELETE,PATCH,OPTIONS'
         return response
 
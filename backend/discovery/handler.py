@@ -8,6 +8,9 @@ Endpoints:
 - GET /api/config/discovery/{accountId}/{resourceType}
 - GET /api/config/discovery/{accountId}/{resourceType}?vpc=vpc-xxx
 - GET /api/config/discovery/{accountId}/{resourceType}?tags=key:value
+- GET /api/config/discovery/{accountId}/ecs-services?cluster=name (all clusters when omitted)
+- POST /api/config/discovery/{accountId}/bulk (starts a bulk discovery job)
+- GET /api/config/discovery/jobs/{jobId}?exclude=vpc,eks
 
 Resource types: vpc, route53, eks, ecs, rds, documentdb, elasticache, efs, alb, sg, s3
 """
@@ -24,6 +27,7 @@ from shared.rbac import get_auth_context, is_global_admin
 from shared.response import (
     json_response,
     error_response,
+    get_body,
     get_method,
     get_path,
 )
@@ -45,6 +49,8 @@ from .providers import (
     discover_security_groups,
     discover_s3_buckets,
 )
+from shared.log import log_requests
+from .jobs import JOB_EVENT_KEY, create_job, get_job, run_job, start_job
 
 # Table name from environment
 CONFIG_TABLE = os.environ.get('CONFIG_TABLE_NAME', 'dashborion-config')
@@ -142,8 +148,14 @@ def parse_tags_param(tags_param: str) -> Dict[str, str]:
     return tags
 
 
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Main Lambda handler for discovery endpoints."""
+    # Asynchronous bulk discovery worker (self-invocation, see jobs.start_job)
+    if event.get(JOB_EVENT_KEY):
+        run_job(event[JOB_EVENT_KEY])
+        return {'jobId': event[JOB_EVENT_KEY].get('jobId')}
+
     method = get_method(event)
     path = get_path(event)
     auth = get_auth_context(event)
@@ -161,7 +173,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     query_params = event.get('queryStringParameters') or {}
 
     try:
-        return route_request(path, method, path_params, query_params)
+        return route_request(path, method, path_params, query_params, get_body(event))
     except Exception as e:
         print(f"Error in discovery handler: {e}")
         import traceback
@@ -169,7 +181,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return error_response('internal_error', str(e), 500)
 
 
-def route_request(path: str, method: str, path_params: Dict, query_params: Dict) -> Dict:
+def route_request(path: str, method: str, path_params: Dict, query_params: Dict, body: Optional[Dict] = None) -> Dict:
     """Route request to appropriate handler."""
 
     # Direct role test - test any roleArn without saving
@@ -187,6 +199,17 @@ def route_request(path: str, method: str, path_params: Dict, query_params: Dict)
         if method == 'GET':
             return handle_test_connection(account_id)
 
+    # Bulk discovery job status
+    # GET /api/config/discovery/jobs/{jobId}
+    match = re.match(r'^/api/config/discovery/jobs/([^/]+)$', path)
+    if match and method == 'GET':
+        return handle_get_job(path_params.get('jobId') or match.group(1), query_params)
+
+    # Bulk discovery job
+    # POST /api/config/discovery/{accountId}/bulk
+    if re.match(r'^/api/config/discovery/[^/]+/bulk$', path) and method == 'POST':
+        return handle_bulk_discover(path_params.get('accountId'), body or {})
+
     # Resource discovery endpoint
     # GET /api/config/discovery/{accountId}/{resourceType}
     if re.match(r'^/api/config/discovery/[^/]+/[^/]+$', path):
@@ -263,11 +286,9 @@ def handle_discover(account_id: str, resource_type: str, query_params: Dict) ->
             vpc_id = query_params.get('vpc')
             resources = discover_security_groups(role_arn, region, vpc_id)
         elif resource_type == 'ecs-services':
-            # ECS services require cluster name
+            # ECS services of one cluster, or of every cluster when none is given
             cluster = query_params.get('cluster')
-            if not cluster:
-                return error_response('bad_request', 'cluster query parameter is required for ecs-services', 400)
-            resources = discover_ecs_services(role_arn, region, cluster)
+            resources = discover_ecs_services(role_arn, region, cluster or None)
         elif resource_type == 'eks-namespaces':
             # EKS namespaces require cluster name
             cluster = query_params.get('cluster')
@@ -310,3 +331,58 @@ def handle_discover(account_id: str, resource_type: str, query_params: Dict) ->
             f'Failed to discover {resource_type}: {str(e)}',
             500
         )
+
+
+def handle_bulk_discover(account_id: str, body: Dict) -> Dict:
+    """
+    Start a bulk discovery job: every requested type discovered concurrently
+    with a single role assumption, results recorded as each type completes.
+
+    POST /api/config/discovery/{accountId}/bulk
+    Body: {"types": ["vpc", "eks", ...], "region": "eu-west-3"} (both optional)
+    """
+    types = body.get('types') or list(DISCOVERY_FUNCTIONS.keys())
+    if not isinstance(types, list):
+        return error_response('bad_request', 'types must be a list of resource types', 400)
+    unknown = [t for t in types if t not in DISCOVERY_FUNCTIONS]
+    if unknown:
+        return error_response(
+            'bad_request',
+            f'Unknown resource types: {", ".join(map(str, unknown))}. Valid types: {", ".join(DISCOVERY_FUNCTIONS)}',
+            400
+        )
+    types = list(dict.fromkeys(types))
+
+    account = get_aws_account(account_id)
+    if not account:
+        return error_response('not_found', f'AWS account {account_id} not found in config', 404)
+
+    role_arn = account.get('readRoleArn')
+    if not role_arn:
+        return error_response('bad_request', f'AWS account {account_id} has no readRoleArn configured', 400)
+
+    region = body.get('region') or account.get('defaultRegion', 'eu-central-1')
+
+    job = create_job(account_id, role_arn, region, types)
+    start_job(job)
+    return json_response(202, {
+        'jobId': job['jobId'],
+        'accountId': account_id,
+        'region': region,
+        'types': types,
+        'statusUrl': f"/api/config/discovery/jobs/{job['jobId']}",
+    })
+
+
+def handle_get_job(job_id: str, query_params: Dict) -> Dict:
+    """
+    Get bulk discovery job progress and completed results.
+
+    GET /api/config/discovery/jobs/{jobId}?exclude=vpc,eks
+    (exclude: types whose resources the client already received)
+    """
+    exclude = [t.strip() for t in query_params.get('exclude', '').split(',') if t.strip()]
+    job = get_job(job_id, exclude)
+    if not job:
+        return error_response('not_found', f'Discovery job {job_id} not found or expired', 404)
+    return json_response(200, job)
@@ -0,0 +1,166 @@
+"""
+Bulk discovery jobs.
+
+Onboarding an account needs every resource type (VPCs, Route53, EKS, ECS,
+RDS, ...). A bulk job assumes the account's discovery role once, runs the
+discovery functions concurrently, and records each type's result as soon as
+it completes, so the Admin UI can poll the job and render types as they
+arrive instead of issuing a dozen sequential requests.
+
+In Lambda the job runs in an asynchronous invocation of the discovery
+function (the API request returns immediately); elsewhere (dev server) it
+runs in a background thread. Job state lives in the cache table for an hour,
+or in process memory when no cache table is configured.
+
+Usage:
+    job = create_job(account_id, role_arn, region, types)
+    start_job(job)
+    ...
+    get_job(job['jobId'])
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import boto3
+
+from cache.shared import get_cache_backend
+from utils.concurrency import map_concurrent
+from utils.eks import assume_role_credentials
+
+from .providers import DISCOVERY_FUNCTIONS
+
+
+JOB_TTL_SECONDS = 3600
+
+# Event key of the asynchronous worker invocation
+JOB_EVENT_KEY = 'discoveryJob'
+
+# Process-local job state (no cache table configured)
+_local_jobs: Dict[str, Dict[str, Any]] = {}
+_local_lock = threading.Lock()
+
+
+def _job_pk(job_id: str) -> str:
+    return f"DISCOVERY_JOB#{job_id}"
+
+
+def _save(job_id: str, sk: str, value: Dict[str, Any]) -> None:
+    cache = get_cache_backend()
+    if cache is None:
+        with _local_lock:
+            _local_jobs.setdefault(job_id, {})[sk] = value
+        return
+    cache.set(_job_pk(job_id), sk, value, JOB_TTL_SECONDS)
+
+
+def _load(job_id: str, sk: str) -> Optional[Dict[str, Any]]:
+    cache = get_cache_backend()
+    if cache is None:
+        with _local_lock:
+            return _local_jobs.get(job_id, {}).get(sk)
+    return cache.get(_job_pk(job_id), sk)
+
+
+def _save_type(job_id: str, resource_type: str, state: Dict[str, Any]) -> None:
+    try:
+        _save(job_id, f"type#{resource_type}", state)
+    except Exception as e:
+        # e.g. result over the item size limit: keep the job progressing
+        print(f"Failed to store {resource_type} result of discovery job {job_id}: {e}")
+        _save(job_id, f"type#{resource_type}", {
+            'status': 'error',
+            'count': state.get('count'),
+            'durationMs': state.get('durationMs'),
+            'error': f'Failed to store result: {e}',
+        })
+
+
+def create_job(account_id: str, role_arn: str, region: str, types: List[str]) -> Dict[str, Any]:
+    job = {
+        'jobId': uuid.uuid4().hex,
+        'accountId': account_id,
+        'roleArn': role_arn,
+        'region': region,
+        'types': types,
+        'createdAt': time.time(),
+    }
+    _save(job['jobId'], 'meta', job)
+    return job
+
+
+def run_job(job: Dict[str, Any]) -> None:
+    """Discover every type of the job concurrently, recording each result on completion."""
+    job_id = job['jobId']
+    try:
+        # Assume the role once; every discovery client reuses the credentials
+        assume_role_credentials(job['roleArn'])
+    except Exception as e:
+        for resource_type in job['types']:
+            _save_type(job_id, resource_type, {'status': 'error', 'error': f'Role assumption failed: {e}'})
+        return
+
+    def discover(resource_type: str) -> None:
+        _save_type(job_id, resource_type, {'status': 'running'})
+        start = time.perf_counter()
+        try:
+            resources = DISCOVERY_FUNCTIONS[resource_type](job['roleArn'], job['region'])
+            state = {'status': 'done', 'count': len(resources), 'resources': resources}
+        except Exception as e:
+            print(f"Bulk discovery error for {resource_type} in account {job['accountId']}: {e}")
+            state = {'status': 'error', 'error': str(e)}
+        state['durationMs'] = round((time.perf_counter() - start) * 1000)
+        _save_type(job_id, resource_type, state)
+
+    map_concurrent(discover, job['types'], account_id=job['accountId'], max_workers=len(job['types']))
+
+
+def start_job(job: Dict[str, Any]) -> None:
+    """Run the job asynchronously: Lambda async self-invocation, else a thread."""
+    function_name = os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
+    if function_name:
+        boto3.client('lambda').invoke(
+            FunctionName=function_name,
+            InvocationType='Event',
+            Payload=json.dumps({JOB_EVENT_KEY: job}).encode('utf-8'),
+        )
+        return
+    threading.Thread(target=run_job, args=(job,), daemon=True).start()
+
+
+def get_job(job_id: str, exclude: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Job progress and the results of completed types.
+
+    Args:
+        job_id: Job ID
+        exclude: Types whose resources the caller already has (status only)
+    """
+    job = _load(job_id, 'meta')
+    if not job:
+        return None
+
+    exclude = set(exclude or [])
+    types = {}
+    results = {}
+    for resource_type in job['types']:
+        state = dict(_load(job_id, f"type#{resource_type}") or {'status': 'pending'})
+        resources = state.pop('resources', None)
+        types[resource_type] = state
+        if resources is not None and resource_type not in exclude:
+            results[resource_type] = resources
+
+    finished = sum(1 for state in types.values() if state['status'] in ('done', 'error'))
+    return {
+        'jobId': job_id,
+        'accountId': job['accountId'],
+        'region': job['region'],
+        'status': 'complete' if finished == len(types) else 'running',
+        'progress': {'completed': finished, 'total': len(types)},
+        'types': types,
+        'results': results,
+    }
@@ -5,14 +5,26 @@ Each function discovers resources of a specific type in a target AWS account
 using cross-account role assumption.
 """
 
+import hashlib
+import json
+import threading
+import time
 from typing import Dict, List, Any, Optional
 import boto3
 
+from cache.shared import get_cache_backend
+from shared.instrumentation import instrument_client
+from utils.concurrency import map_concurrent
+from utils.eks import assume_role_credentials, get_k8s_connection
+
 
 def get_cross_account_client(service: str, role_arn: str, region: str):
     """
     Get boto3 client with cross-account role assumption.
 
+    The role is assumed once and its credentials shared by every client
+    (see utils.eks.assume_role_credentials).
+
     Args:
         service: AWS service name (e.g., 'ec2', 'eks')
         role_arn: ARN of the role to assume
@@ -21,20 +33,14 @@ def get_cross_account_client(service: str, role_arn: str, region: str):
     Returns:
         boto3 client for the specified service in the target account
     """
-    sts = boto3.client('sts')
-    assumed = sts.assume_role(
-        RoleArn=role_arn,
-        RoleSessionName='dashborion-discovery'
-    )
-
-    credentials = assumed['Credentials']
-    return boto3.client(
+    credentials = assume_role_credentials(role_arn)
+    return instrument_client(boto3.client(
         service,
         region_name=region,
         aws_access_key_id=credentials['AccessKeyId'],
         aws_secret_access_key=credentials['SecretAccessKey'],
         aws_session_token=credentials['SessionToken']
-    )
+    ))
 
 
 def discover_vpcs(role_arn: str, region: str) -> List[Dict[str, Any]]:
@@ -124,83 +130,21 @@ def discover_eks_clusters(role_arn: str, region: str) -> List[Dict[str, Any]]:
     return sorted(clusters, key=lambda x: x['name'])
 
 
+def _get_k8s_connection(role_arn: str, region: str, cluster_name: str):
+    """Shared EKS connection, tokens signed with the discovery role's credentials."""
+    return get_k8s_connection(role_arn, region, cluster_name, lambda: assume_role_credentials(role_arn))
+
+
 def discover_eks_namespaces(role_arn: str, region: str, cluster_name: str) -> List[Dict[str, Any]]:
     """
     Discover Kubernetes namespaces in an EKS cluster.
     Requires kubernetes client and proper IAM/K8s RBAC permissions.
     """
     try:
-        from kubernetes import client as k8s_client
-        from kubernetes.client import Configuration
+        v1 = _get_k8s_connection(role_arn, region, cluster_name).core
     except ImportError:
         return [{'error': 'kubernetes package not installed'}]
 
-    # Get EKS cluster info and auth token
-    eks = get_cross_account_client('eks', role_arn, region)
-    cluster_info = eks.describe_cluster(name=cluster_name)['cluster']
-
-    # Get authentication token
-    sts = boto3.client('sts')
-    assumed = sts.assume_role(RoleArn=role_arn, RoleSessionName='eks-discovery')
-    credentials = assumed['Credentials']
-
-    # Create STS client with assumed credentials for token
-    sts_assumed = boto3.client(
-        'sts',
-        aws_access_key_id=credentials['AccessKeyId'],
-        aws_secret_access_key=credentials['SecretAccessKey'],
-        aws_session_token=credentials['SessionToken'],
-        region_name=region
-    )
-
-    # Get bearer token
-    token = sts_assumed.get_caller_identity()  # This won't work directly, need presigned URL
-    # Simplified: use boto3's get_token approach
-    import base64
-    from botocore.signers import RequestSigner
-
-    session = boto3.Session(
-        aws_access_key_id=credentials['AccessKeyId'],
-        aws_secret_access_key=credentials['SecretAccessKey'],
-        aws_session_token=credentials['SessionToken'],
-        region_name=region
-    )
-    sts_client = session.client('sts', region_name=region)
-    service_id = sts_client.meta.service_model.service_id
-
-    signer = RequestSigner(
-        service_id,
-        region,
-        'sts',
-        'v4',
-        session.get_credentials(),
-        session.events
-    )
-
-    params = {
-        'method': 'GET',
-        'url': f'https://sts.{region}.amazonaws.com/?Action=GetCallerIdentity&Version=2011-06-15',
-        'body': {},
-        'headers': {'x-k8s-aws-id': cluster_name},
-        'context': {}
-    }
-
-    signed_url = signer.generate_presigned_url(params, region_name=region, expires_in=60, operation_name='')
-    token = 'k8s-aws-v1.' + base64.urlsafe_b64encode(signed_url.encode('utf-8')).decode('utf-8').rstrip('=')
-
-    # Configure K8s client
-    configuration = Configuration()
-    configuration.host = cluster_info['endpoint']
-    configuration.verify_ssl = True
-    configuration.ssl_ca_cert = None  # Would need to write CA to temp file
-    configuration.api_key = {'authorization': f'Bearer {token}'}
-
-    # For simplicity, disable SSL verification (not recommended for production)
-    configuration.verify_ssl = False
-
-    api_client = k8s_client.ApiClient(configuration)
-    v1 = k8s_client.CoreV1Api(api_client)
-
     namespaces = []
     try:
         ns_list = v1.list_namespace()
@@ -223,60 +167,10 @@ def discover_eks_workloads(role_arn: str, region: str, cluster_name: str, namesp
     Returns a simplified list for service selection.
     """
     try:
-        from kubernetes import client as k8s_client
-        from kubernetes.client import Configuration
+        apps = _get_k8s_connection(role_arn, region, cluster_name).apps
     except ImportError:
         return [{'error': 'kubernetes package not installed'}]
 
-    eks = get_cross_account_client('eks', role_arn, region)
-    cluster_info = eks.describe_cluster(name=cluster_name)['cluster']
-
-    sts = boto3.client('sts')
-    assumed = sts.assume_role(RoleArn=role_arn, RoleSessionName='eks-discovery')
-    credentials = assumed['Credentials']
-
-    import base64
-    from botocore.signers import RequestSigner
-
-    session = boto3.Session(
-        aws_access_key_id=credentials['AccessKeyId'],
-        aws_secret_access_key=credentials['SecretAccessKey'],
-        aws_session_token=credentials['SessionToken'],
-        region_name=region
-    )
-    sts_client = session.client('sts', region_name=region)
-    service_id = sts_client.meta.service_model.service_id
-
-    signer = RequestSigner(
-        service_id,
-        region,
-        'sts',
-        'v4',
-        session.get_credentials(),
-        session.events
-    )
-
-    params = {
-        'method': 'GET',
-        'url': f'https://sts.{region}.amazonaws.com/?Action=GetCallerIdentity&Version=2011-06-15',
-        'body': {},
-        'headers': {'x-k8s-aws-id': cluster_name},
-        'context': {}
-    }
-
-    signed_url = signer.generate_presigned_url(params, region_name=region, expires_in=60, operation_name='')
-    token = 'k8s-aws-v1.' + base64.urlsafe_b64encode(signed_url.encode('utf-8')).decode('utf-8').rstrip('=')
-
-    configuration = Configuration()
-    configuration.host = cluster_info['endpoint']
-    configuration.verify_ssl = True
-    configuration.ssl_ca_cert = None
-    configuration.api_key = {'authorization': f'Bearer {token}'}
-    configuration.verify_ssl = False
-
-    api_client = k8s_client.ApiClient(configuration)
-    apps = k8s_client.AppsV1Api(api_client)
-
     workloads = []
     try:
         deployments = apps.list_namespaced_deployment(namespace)
@@ -309,65 +203,179 @@ def discover_eks_workloads(role_arn: str, region: str, cluster_name: str, namesp
     return sorted(workloads, key=lambda x: x['name'])
 
 
+# ECS API limits per describe call
+_ECS_DESCRIBE_CLUSTERS_BATCH = 100
+_ECS_DESCRIBE_SERVICES_BATCH = 10
+
+# Discovered services per cluster: (account, region, cluster ARN) -> {'fingerprint', 'services'}
+_ECS_SERVICES_TTL_SECONDS = 900
+_ecs_services_memo: Dict[tuple, Dict[str, Any]] = {}
+_ecs_services_lock = threading.Lock()
+
+
+def _account_of(role_arn: str) -> str:
+    """Account ID of a role ARN (arn:aws:iam::123456789012:role/name)."""
+    parts = role_arn.split(':')
+    return parts[4] if len(parts) > 4 else ''
+
+
+def _describe_ecs_clusters(ecs, cluster_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Describe the given clusters (all clusters when None), 100 per call."""
+    if cluster_names is None:
+        cluster_names = []
+        for page in ecs.get_paginator('list_clusters').paginate():
+            cluster_names.extend(page.get('clusterArns', []))
+
+    clusters = []
+    for i in range(0, len(cluster_names), _ECS_DESCRIBE_CLUSTERS_BATCH):
+        batch = cluster_names[i:i + _ECS_DESCRIBE_CLUSTERS_BATCH]
+        details = ecs.describe_clusters(clusters=batch, include=['TAGS'])
+        clusters.extend(details.get('clusters', []))
+    return clusters
+
+
+def _ecs_cluster_fingerprint(cluster: Dict[str, Any], service_arns: List[str]) -> str:
+    """
+    ETag-like hash of a cluster's service set and task counters: a service
+    added, removed or scaled changes it.
+
+    Deployments aren't part of it (they are only visible through
+    describe_services, which the fingerprint exists to skip): a redeploy that
+    completes between two discoveries with the same task counts keeps the
+    fingerprint, so the cached taskDefinition can lag by up to
+    _ECS_SERVICES_TTL_SECONDS.
+    """
+    payload = json.dumps({
+        'services': sorted(service_arns),
+        'status': cluster.get('status'),
+        'activeServicesCount': cluster.get('activeServicesCount'),
+        'runningTasksCount': cluster.get('runningTasksCount'),
+        'pendingTasksCount': cluster.get('pendingTasksCount'),
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _load_cluster_services(key: tuple) -> Optional[Dict[str, Any]]:
+    with _ecs_services_lock:
+        entry = _ecs_services_memo.get(key)
+    if entry and entry['expiresAt'] > time.time():
+        return entry
+    cache = get_cache_backend()
+    if cache is None:
+        return None
+    try:
+        return cache.get(f"DISCOVERY#{key[0]}#{key[1]}", f"ecs-services#{key[2]}")
+    except Exception as e:
+        print(f"Failed to read cached ECS services for {key[2]}: {e}")
+        return None
+
+
+def _store_cluster_services(key: tuple, fingerprint: str, services: List[Dict[str, Any]]) -> None:
+    entry = {'fingerprint': fingerprint, 'services': services, 'expiresAt': time.time() + _ECS_SERVICES_TTL_SECONDS}
+    with _ecs_services_lock:
+        _ecs_services_memo[key] = entry
+    cache = get_cache_backend()
+    if cache is None:
+        return
+    try:
+        cache.set(f"DISCOVERY#{key[0]}#{key[1]}", f"ecs-services#{key[2]}", entry, _ECS_SERVICES_TTL_SECONDS)
+    except Exception as e:
+        print(f"Failed to cache ECS services for {key[2]}: {e}")
+
+
+def _summarize_ecs_service(svc: Dict[str, Any], cluster_name: str) -> Dict[str, Any]:
+    return {
+        'id': svc['serviceName'],
+        'name': svc['serviceName'],
+        'arn': svc['serviceArn'],
+        'cluster': cluster_name,
+        'status': svc.get('status'),
+        'desiredCount': svc.get('desiredCount', 0),
+        'runningCount': svc.get('runningCount', 0),
+        'launchType': svc.get('launchType'),
+        'taskDefinition': svc.get('taskDefinition', '').split('/')[-1],
+    }
+
+
+def _discover_cluster_services(ecs, account_id: str, region: str, cluster: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Services of one cluster: every list_services page, then describe_services
+    in concurrent batches of 10 - skipped when the cluster's fingerprint
+    matches the cached result.
+    """
+    cluster_arn = cluster['clusterArn']
+    cluster_name = cluster['clusterName']
+
+    service_arns = []
+    for page in ecs.get_paginator('list_services').paginate(cluster=cluster_arn):
+        service_arns.extend(page.get('serviceArns', []))
+
+    key = (account_id, region, cluster_arn)
+    fingerprint = _ecs_cluster_fingerprint(cluster, service_arns)
+    cached = _load_cluster_services(key)
+    if cached and cached.get('fingerprint') == fingerprint:
+        return cached['services']
+
+    batches = [
+        service_arns[i:i + _ECS_DESCRIBE_SERVICES_BATCH]
+        for i in range(0, len(service_arns), _ECS_DESCRIBE_SERVICES_BATCH)
+    ]
+    described = map_concurrent(
+        lambda batch: ecs.describe_services(cluster=cluster_arn, services=batch).get('services', []),
+        batches,
+        account_id=account_id,
+    )
+    services = [_summarize_ecs_service(svc, cluster_name) for batch in described for svc in batch]
+
+    _store_cluster_services(key, fingerprint, services)
+    return services
+
+
 def discover_ecs_clusters(role_arn: str, region: str) -> List[Dict[str, Any]]:
     """
     Discover ECS clusters in the target account.
     """
     ecs = get_cross_account_client('ecs', role_arn, region)
-    response = ecs.list_clusters()
 
     clusters = []
-    cluster_arns = response.get('clusterArns', [])
-
-    if cluster_arns:
-        details = ecs.describe_clusters(clusters=cluster_arns, include=['TAGS'])
-        for cluster in details.get('clusters', []):
-            clusters.append({
-                'id': cluster['clusterName'],
-                'name': cluster['clusterName'],
-                'arn': cluster['clusterArn'],
-                'status': cluster.get('status'),
-                'runningTasksCount': cluster.get('runningTasksCount', 0),
-                'pendingTasksCount': cluster.get('pendingTasksCount', 0),
-                'activeServicesCount': cluster.get('activeServicesCount', 0),
-                'registeredContainerInstancesCount': cluster.get('registeredContainerInstancesCount', 0),
-                'tags': {t['key']: t['value'] for t in cluster.get('tags', [])},
-            })
+    for cluster in _describe_ecs_clusters(ecs):
+        clusters.append({
+            'id': cluster['clusterName'],
+            'name': cluster['clusterName'],
+            'arn': cluster['clusterArn'],
+            'status': cluster.get('status'),
+            'runningTasksCount': cluster.get('runningTasksCount', 0),
+            'pendingTasksCount': cluster.get('pendingTasksCount', 0),
+            'activeServicesCount': cluster.get('activeServicesCount', 0),
+            'registeredContainerInstancesCount': cluster.get('registeredContainerInstancesCount', 0),
+            'tags': {t['key']: t['value'] for t in cluster.get('tags', [])},
+        })
 
     return sorted(clusters, key=lambda x: x['name'])
 
 
-def discover_ecs_services(role_arn: str, region: str, cluster_name: str) -> List[Dict[str, Any]]:
+def discover_ecs_services(role_arn: str, region: str, cluster_name: Optional[str] = None) -> List[Dict[str, Any]]:
     """
-    Discover ECS services in a specific cluster.
+    Discover ECS services in a specific cluster, or in every cluster
+    (fanned out concurrently) when no cluster is given.
+
+    Clusters whose services and task counters are unchanged since the last
+    discovery are served from cache instead of being described again (task
+    definitions may then be up to 15 minutes stale, see
+    _ecs_cluster_fingerprint).
     """
     ecs = get_cross_account_client('ecs', role_arn, region)
+    account_id = _account_of(role_arn)
 
-    services = []
-    paginator = ecs.get_paginator('list_services')
-
-    service_arns = []
-    for page in paginator.paginate(cluster=cluster_name):
-        service_arns.extend(page.get('serviceArns', []))
-
-    if service_arns:
-        # Describe services in batches of 10 (API limit)
-        for i in range(0, len(service_arns), 10):
-            batch = service_arns[i:i+10]
-            details = ecs.describe_services(cluster=cluster_name, services=batch)
-            for svc in details.get('services', []):
-                services.append({
-                    'id': svc['serviceName'],
-                    'name': svc['serviceName'],
-                    'arn': svc['serviceArn'],
-                    'status': svc.get('status'),
-                    'desiredCount': svc.get('desiredCount', 0),
-                    'runningCount': svc.get('runningCount', 0),
-                    'launchType': svc.get('launchType'),
-                    'taskDefinition': svc.get('taskDefinition', '').split('/')[-1],
-                })
+    clusters = _describe_ecs_clusters(ecs, [cluster_name] if cluster_name else None)
+    per_cluster = map_concurrent(
+        lambda cluster: _discover_cluster_services(ecs, account_id, region, cluster),
+        clusters,
+        account_id=account_id,
+    )
 
-    return sorted(services, key=lambda x: x['name'])
+    services = [svc for cluster_services in per_cluster for svc in cluster_services]
+    return sorted(services, key=lambda x: (x['cluster'], x['name']))
 
 
 def discover_rds_clusters(role_arn: str, region: str) -> List[Dict[str, Any]]:
@@ -27,8 +27,10 @@ from shared.response import (
 from app_config import get_config
 from providers import ProviderFactory
 from utils.aws import get_cross_account_client
+from shared.log import log_requests
 
 
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for events endpoints.
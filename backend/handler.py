@@ -33,18 +33,24 @@ from providers.base import ProviderFactory
 from auth.middleware import authorize_request
 from auth.permissions import check_permission, log_audit_event
 from auth.models import ForbiddenError
-
-# Import providers to register them
-from providers.ci.codepipeline import CodePipelineProvider
-from providers.ci.github_actions import GitHubActionsProvider
-from providers.orchestrator.ecs import ECSProvider
-from providers.orchestrator.eks import EKSProvider
-from providers.events.combined import CombinedEventsProvider
-from providers.infrastructure.rds import RDSProvider
-from providers.infrastructure.cloudfront import CloudFrontProvider
-from providers.infrastructure.network import VPCProvider
-from providers.infrastructure.alb import ALBProvider
-from providers.infrastructure.elasticache import ElastiCacheProvider
+from auth.audit import flush_audit_on_exit
+from shared.log import log_requests
+from cache.delta import versioned_response
+from cache.policies import CLOUDFRONT_TAG, RDS_TAG, SERVICES_TAG
+from cache.shared import invalidate_tags
+from shared.formatting import (
+    format_image,
+    format_k8s_list,
+    format_pipeline,
+    format_pipeline_summary,
+    format_service,
+    format_service_details,
+    format_service_summary,
+    service_summary_fields,
+)
+from providers.serialization import parse_fields, wants
+
+# Providers are registered by dotted path in providers.base and imported on first use
 from providers.aggregators.infrastructure import InfrastructureAggregator
 
 # Auth handlers
@@ -261,9 +267,10 @@ def get_orchestrator_for_env(project: str, env: str):
     return ProviderFactory.get_orchestrator_provider(config, project, env)
 
 
+@flush_audit_on_exit
+@log_requests
 def lambda_handler(event, context):
     """Main Lambda handler"""
-    print(f"Event: {json.dumps(event)}")
 
     # Handle API Gateway v2 (HTTP API)
     path = event.get('rawPath', event.get('path', '/'))
@@ -272,8 +279,9 @@ def lambda_handler(event, context):
     headers = {
         'Content-Type': 'application/json',
         'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Headers': 'Content-Type,Authorization,X-SSO-User-Email',
-        'Access-Control-Allow-Methods': 'GET,POST,OPTIONS'
+        'Access-Control-Allow-Headers': 'Content-Type,Authorization,X-SSO-User-Email,If-None-Match',
+        'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+        'Access-Control-Expose-Headers': 'ETag,X-Cache,X-Delta'
     }
 
     # Handle CORS preflight
@@ -432,6 +440,11 @@ def lambda_handler(event, context):
         else:
             result = {'error': f'Unknown path: {path}'}
 
+        # Versioned endpoints return a complete response (ETag, 304, delta)
+        if isinstance(result, dict) and 'statusCode' in result:
+            result['headers'] = {**headers, **result['headers']}
+            return result
+
         status_code = 400 if result and 'error' in result else 200
 
         return {
@@ -494,6 +507,8 @@ def route_project_request(project, resource, parts, method, body, event,
                           config, ci, orchestrator, events_provider, database, cdn, infrastructure, user_email):
     """Route project-scoped requests"""
     query_params = event.get('queryStringParameters') or {}
+    # ?fields=a,b: sparse fieldsets, also passed to providers to skip the calls behind other fields
+    fields = parse_fields(query_params.get('fields'))
 
     # -------------------------------------------------------------
     # SERVICES ENDPOINTS: /api/{project}/services/...
@@ -509,18 +524,18 @@ def route_project_request(project, resource, parts, method, body, event,
             }
             for env_name, env_config in project_config.environments.items():
                 try:
-                    services = orchestrator.get_services(env_name)
+                    services = orchestrator.get_services(env_name, fields=service_summary_fields(fields))
                     result['environments'][env_name] = {
                         'accountId': env_config.account_id,
                         'services': {
-                            svc_name: _format_service_summary(svc)
+                            svc_name: format_service_summary(svc, fields)
                             for svc_name, svc in services.items()
                             if not isinstance(svc, dict) or 'error' not in svc
                         }
                     }
                 except Exception as e:
                     result['environments'][env_name] = {'error': str(e)}
-            return result
+            return versioned_response(event, project, '*', 'services', {'fields': fields}, result)
 
         elif len(parts) == 5:
             # /api/{project}/services/{env}
@@ -529,25 +544,25 @@ def route_project_request(project, resource, parts, method, body, event,
             if not env_config:
                 return {'error': f'Unknown environment: {env} for project {project}'}
 
-            services = orchestrator.get_services(env)
-            return {
+            services = orchestrator.get_services(env, fields=service_summary_fields(fields))
+            return versioned_response(event, project, env, 'services', {'fields': fields}, {
                 'project': project,
                 'environment': env,
                 'accountId': env_config.account_id,
                 'services': {
-                    svc_name: _format_service_summary(svc)
+                    svc_name: format_service_summary(svc, fields)
                     for svc_name, svc in services.items()
                     if not isinstance(svc, dict) or 'error' not in svc
                 },
                 'timestamp': datetime.utcnow().isoformat()
-            }
+            })
 
         elif len(parts) >= 6:
             # /api/{project}/services/{env}/{service}
             env = parts[4]
             service = parts[5]
-            svc = orchestrator.get_service(env, service)
-            return _format_service(svc)
+            svc = orchestrator.get_service(env, service, fields=fields)
+            return format_service(svc, fields)
 
     # -------------------------------------------------------------
     # DETAILS ENDPOINT: /api/{project}/details/{env}/{service}
@@ -557,7 +572,7 @@ def route_project_request(project, resource, parts, method, body, event,
             env = parts[4]
             service = parts[5]
             details = orchestrator.get_service_details(env, service)
-            return _format_service_details(details)
+            return format_service_details(details)
         return {'error': 'Invalid path. Use /api/{project}/details/{env}/{service}'}
 
     # -------------------------------------------------------------
@@ -571,12 +586,12 @@ def route_project_request(project, resource, parts, method, body, event,
 
             if pipeline_type == 'build':
                 pipeline = ci.get_build_pipeline(service)
-                return _format_pipeline(pipeline)
+                return format_pipeline(pipeline)
             else:
                 if not env:
                     return {'error': 'Environment required for deploy pipeline'}
                 pipeline = ci.get_deploy_pipeline(env, service)
-                return _format_pipeline(pipeline)
+                return format_pipeline(pipeline)
         return {'error': 'Invalid path'}
 
     # -------------------------------------------------------------
@@ -589,7 +604,7 @@ def route_project_request(project, resource, parts, method, body, event,
             return {
                 'project': project,
                 'repositoryName': config.get_ecr_repo(project, service),
-                'images': [_format_image(img) for img in images]
+                'images': [format_image(img) for img in images]
             }
         return {'error': 'Invalid path'}
 
@@ -635,6 +650,18 @@ def route_project_request(project, resource, parts, method, body, event,
                     sg_id = parts[6]
                     return infrastructure.get_security_group(env, sg_id)
 
+                elif sub_resource == 'reachability':
+                    # /api/{project}/infrastructure/{env}/reachability
+                    port_str = query_params.get('port')
+                    return infrastructure.get_reachability(
+                        env,
+                        query_params.get('source'),
+                        query_params.get('target'),
+                        query_params.get('protocol') or 'tcp',
+                        int(port_str) if port_str and port_str.isdigit() else None,
+                        query_params.get('vpcId'),
+                    )
+
             # /api/{project}/infrastructure/{env} - main infrastructure info
             discovery_tags = None
             discovery_tags_str = query_params.get('discoveryTags', '')
@@ -682,7 +709,8 @@ def route_project_request(project, resource, parts, method, body, event,
                 env,
                 services=services_list,
                 infra_config=infra_config,
-                resources=resources_list
+                resources=resources_list,
+                fields=fields
             )
 
         return {'error': 'Invalid path. Use /api/{project}/infrastructure/{env}'}
@@ -766,61 +794,63 @@ def route_project_request(project, resource, parts, method, body, event,
 
             namespace = query_params.get('namespace')
             selector = query_params.get('selector')
+            # List responses are versioned (ETag / If-None-Match / ?since= deltas)
+            list_params = {'namespace': namespace, 'selector': selector, 'fields': fields}
 
             if k8s_resource == 'pods':
                 # GET /api/{project}/k8s/{env}/pods?namespace=x&selector=y
                 pods = orchestrator.get_pods(env, namespace=namespace, selector=selector)
-                return {
+                return versioned_response(event, project, env, 'k8s-pods', list_params, {
                     'project': project,
                     'environment': env,
-                    'pods': [_format_k8s_pod(p) for p in pods]
-                }
+                    'pods': format_k8s_list('pods', pods, fields)
+                })
 
             elif k8s_resource == 'services':
                 # GET /api/{project}/k8s/{env}/services?namespace=x
                 services = orchestrator.get_k8s_services(env, namespace=namespace)
-                return {
+                return versioned_response(event, project, env, 'k8s-services', list_params, {
                     'project': project,
                     'environment': env,
-                    'services': [_format_k8s_service(s) for s in services]
-                }
+                    'services': format_k8s_list('services', services, fields)
+                })
 
             elif k8s_resource == 'deployments':
                 # GET /api/{project}/k8s/{env}/deployments?namespace=x
                 deployments = orchestrator.get_deployments(env, namespace=namespace)
-                return {
+                return versioned_response(event, project, env, 'k8s-deployments', list_params, {
                     'project': project,
                     'environment': env,
-                    'deployments': [_format_k8s_deployment(d) for d in deployments]
-                }
+                    'deployments': format_k8s_list('deployments', deployments, fields)
+                })
 
             elif k8s_resource == 'ingresses':
                 # GET /api/{project}/k8s/{env}/ingresses?namespace=x
                 ingresses = orchestrator.get_ingresses(env, namespace=namespace)
-                return {
+                return versioned_response(event, project, env, 'k8s-ingresses', list_params, {
                     'project': project,
                     'environment': env,
-                    'ingresses': [_format_k8s_ingress(i) for i in ingresses]
-                }
+                    'ingresses': format_k8s_list('ingresses', ingresses, fields)
+                })
 
             elif k8s_resource == 'nodes':
                 # GET /api/{project}/k8s/{env}/nodes
-                include_metrics = query_params.get('metrics', 'true').lower() == 'true'
+                include_metrics = query_params.get('metrics', 'true').lower() == 'true' and wants(fields, 'usage')
                 nodes = orchestrator.get_nodes(env, include_metrics=include_metrics)
-                return {
+                return versioned_response(event, project, env, 'k8s-nodes', {**list_params, 'metrics': include_metrics}, {
                     'project': project,
                     'environment': env,
-                    'nodes': [_format_k8s_node(n) for n in nodes]
-                }
+                    'nodes': format_k8s_list('nodes', nodes, fields)
+                })
 
             elif k8s_resource == 'namespaces':
                 # GET /api/{project}/k8s/{env}/namespaces
                 namespaces = orchestrator.get_namespaces(env)
-                return {
+                return versioned_response(event, project, env, 'k8s-namespaces', list_params, {
                     'project': project,
                     'environment': env,
                     'namespaces': namespaces
-                }
+                })
 
             elif k8s_resource == 'logs' and resource_name:
                 # GET /api/{project}/k8s/{env}/logs/{pod}?namespace=x&container=y&tail=100
@@ -869,7 +899,7 @@ def route_project_request(project, resource, parts, method, body, event,
         pipelines = ci.list_pipelines(prefix=prefix, pipeline_type=pipeline_type)
         return {
             'project': project,
-            'pipelines': [_format_pipeline_summary(p) for p in pipelines]
+            'pipelines': [format_pipeline_summary(p) for p in pipelines]
         }
 
     # -------------------------------------------------------------
@@ -1020,14 +1050,17 @@ def route_project_request(project, resource, parts, method, body, event,
             if action_type == 'reload':
                 result = orchestrator.force_deployment(env, service, user_email)
                 log_audit_event(auth, 'restart', project, env, service, 'success')
+                invalidate_tags(project, env, [SERVICES_TAG])
                 return result
             elif action_type == 'latest':
                 result = ci.trigger_deploy(env, service, user_email)
                 log_audit_event(auth, 'deploy', project, env, service, 'success')
+                invalidate_tags(project, env, [SERVICES_TAG])
                 return result
             elif action_type == 'stop':
                 result = orchestrator.scale_service(env, service, 0, user_email)
                 log_audit_event(auth, 'scale', project, env, service, 'success', {'desiredCount': 0})
+                invalidate_tags(project, env, [SERVICES_TAG])
                 return result
             elif action_type == 'start':
                 desired_count = int(body.get('desiredCount', 1))
@@ -1035,6 +1068,7 @@ def route_project_request(project, resource, parts, method, body, event,
                     return {'error': 'desiredCount must be between 1 and 10'}
                 result = orchestrator.scale_service(env, service, desired_count, user_email)
                 log_audit_event(auth, 'scale', project, env, service, 'success', {'desiredCount': desired_count})
+                invalidate_tags(project, env, [SERVICES_TAG])
                 return result
             else:
                 return {'error': f'Unknown action: {action_type}'}
@@ -1054,10 +1088,12 @@ def route_project_request(project, resource, parts, method, body, event,
             elif action_type == 'stop':
                 result = database.stop_database(env, user_email)
                 log_audit_event(auth, 'rds-control', project, env, 'rds', 'success', {'action': 'stop'})
+                invalidate_tags(project, env, [RDS_TAG])
                 return result
             elif action_type == 'start':
                 result = database.start_database(env, user_email)
                 log_audit_event(auth, 'rds-control', project, env, 'rds', 'success', {'action': 'start'})
+                invalidate_tags(project, env, [RDS_TAG])
                 return result
             else:
                 return {'error': 'Use stop or start for RDS action'}
@@ -1081,6 +1117,7 @@ def route_project_request(project, resource, parts, method, body, event,
                     return {'error': 'distributionId is required'}
                 result = cdn.invalidate_cache(env, distribution_id, paths, user_email)
                 log_audit_event(auth, 'invalidate', project, env, distribution_id, 'success', {'paths': paths})
+                invalidate_tags(project, env, [CLOUDFRONT_TAG])
                 return result
             else:
                 return {'error': 'Use invalidate for CloudFront action'}
@@ -1457,260 +1494,6 @@ def _get_comparison_pair_config(project: str, source_env: str, dest_env: str, co
     }
 
 
-# =============================================================================
-# FORMATTING HELPERS
-# =============================================================================
-
-def _format_service_summary(svc):
-    """Format service for summary list"""
-    if hasattr(svc, 'status'):
-        return {
-            'status': svc.status,
-            'health': 'HEALTHY' if svc.running_count == svc.desired_count else 'UNHEALTHY',
-            'runningCount': svc.running_count,
-            'desiredCount': svc.desired_count,
-            'taskDefinition': svc.task_definition.get('revision') if svc.task_definition else None,
-            'image': svc.task_definition.get('image', '').split(':')[-1] if svc.task_definition else None
-        }
-    return svc
-
-
-def _format_service(svc):
-    """Format service for detailed view"""
-    if hasattr(svc, 'status'):
-        return {
-            'environment': svc.environment,
-            'service': svc.service,
-            'serviceName': svc.name,
-            'clusterName': svc.cluster_name,
-            'status': svc.status,
-            'desiredCount': svc.desired_count,
-            'runningCount': svc.running_count,
-            'pendingCount': svc.pending_count,
-            'taskDefinition': svc.task_definition,
-            'tasks': [_format_task(t) for t in svc.tasks],
-            'deployments': [_format_deployment(d) for d in svc.deployments],
-            'consoleUrl': svc.console_url,
-            'accountId': svc.account_id
-        }
-    return svc
-
-
-def _format_service_details(details):
-    """Format service details"""
-    base = _format_service(details)
-    if hasattr(details, 'environment_variables'):
-        base.update({
-            'currentTaskDefinition': details.task_definition,
-            'latestTaskDefinition': details.latest_task_definition,
-            'environmentVariables': details.environment_variables,
-            'secrets': details.secrets,
-            'recentLogs': details.recent_logs,
-            'ecsEvents': details.ecs_events,
-            'deploymentState': details.deployment_state,
-            'isRollingBack': details.is_rolling_back,
-            'consoleUrls': details.console_urls
-        })
-    return base
-
-
-def _format_task(task):
-    """Format task/pod"""
-    return {
-        'taskId': task.task_id,
-        'status': task.status,
-        'desiredStatus': task.desired_status,
-        'health': task.health,
-        'revision': task.revision,
-        'isLatest': task.is_latest,
-        'az': task.az,
-        'subnetId': task.subnet_id,
-        'cpu': task.cpu,
-        'memory': task.memory,
-        'startedAt': task.started_at.isoformat() if task.started_at else None
-    }
-
-
-def _format_deployment(dep):
-    """Format deployment"""
-    return {
-        'status': dep.status,
-        'taskDefinition': dep.task_definition,
-        'revision': dep.revision,
-        'desiredCount': dep.desired_count,
-        'runningCount': dep.running_count,
-        'pendingCount': dep.pending_count,
-        'rolloutState': dep.rollout_state,
-        'createdAt': dep.created_at.isoformat() if dep.created_at else None,
-        'updatedAt': dep.updated_at.isoformat() if dep.updated_at else None
-    }
-
-
-def _format_pipeline(pipeline):
-    """Format pipeline"""
-    if isinstance(pipeline, dict) and 'error' in pipeline:
-        return pipeline
-    return {
-        'pipelineName': pipeline.name,
-        'pipelineType': pipeline.pipeline_type,
-        'service': pipeline.service,
-        'environment': pipeline.environment,
-        'version': pipeline.version,
-        'stages': [{'name': s.name, 'status': s.status} for s in pipeline.stages],
-        'lastExecution': _format_execution(pipeline.last_execution) if pipeline.last_execution else None,
-        'executions': [_format_execution(e) for e in pipeline.executions],
-        'buildLogs': pipeline.build_logs,
-        'consoleUrl': pipeline.console_url
-    }
-
-
-def _format_execution(exec):
-    """Format pipeline execution"""
-    return {
-        'executionId': exec.execution_id,
-        'status': exec.status,
-        'startTime': exec.started_at.isoformat() if exec.started_at else None,
-        'lastUpdateTime': exec.finished_at.isoformat() if exec.finished_at else None,
-        'duration': exec.duration_seconds,
-        'commit': exec.commit_sha,
-        'commitMessage': exec.commit_message,
-        'commitAuthor': exec.commit_author,
-        'commitUrl': exec.commit_url,
-        'consoleUrl': exec.console_url,
-        'trigger': exec.trigger_type
-    }
-
-
-def _format_image(img):
-    """Format container image"""
-    return {
-        'digest': img.digest,
-        'tags': img.tags,
-        'pushedAt': img.pushed_at.isoformat() if img.pushed_at else None,
-        'sizeBytes': img.size_bytes,
-        'sizeMB': img.size_mb
-    }
-
-
-# =============================================================================
-# KUBERNETES FORMATTING HELPERS
-# =============================================================================
-
-def _format_k8s_pod(pod):
-    """Format K8s pod for API response"""
-    if isinstance(pod, dict):
-        return pod
-    return {
-        'name': pod.name,
-        'namespace': pod.namespace,
-        'status': pod.status,
-        'ready': pod.ready,
-        'restarts': pod.restarts,
-        'age': pod.age,
-        'ip': pod.ip,
-        'node': pod.node,
-        'containers': pod.containers if hasattr(pod, 'containers') else []
-    }
-
-
-def _format_k8s_service(svc):
-    """Format K8s service for API response"""
-    if isinstance(svc, dict):
-        return svc
-    return {
-        'name': svc.name,
-        'namespace': svc.namespace,
-        'type': svc.service_type,
-        'clusterIP': svc.cluster_ip,
-        'externalIP': svc.external_ip,
-        'ports': svc.ports,
-        'selector': svc.selector,
-        'labels': svc.labels
-    }
-
-
-def _format_k8s_deployment(deploy):
-    """Format K8s deployment for API response"""
-    if isinstance(deploy, dict):
-        return deploy
-    return {
-        'name': deploy.name,
-        'namespace': deploy.namespace,
-        'ready': deploy.ready,
-        'available': deploy.available,
-        'upToDate': deploy.up_to_date,
-        'age': deploy.age,
-        'image': deploy.image if hasattr(deploy, 'image') else None
-    }
-
-
-def _format_k8s_ingress(ing):
-    """Format K8s ingress for API response"""
-    if isinstance(ing, dict):
-        return ing
-    return {
-        'name': ing.name,
-        'namespace': ing.namespace,
-        'ingressClass': ing.ingress_class,
-        'hosts': [r.host for r in ing.rules] if ing.rules else [],
-        'address': ing.load_balancer_hostname or ing.load_balancer_ip,
-        'rules': [
-            {
-                'host': r.host,
-                'path': r.path,
-                'pathType': r.path_type,
-                'serviceName': r.service_name,
-                'servicePort': r.service_port
-            }
-            for r in ing.rules
-        ] if ing.rules else [],
-        'tls': ing.tls,
-        'annotations': ing.annotations
-    }
-
-
-def _format_k8s_node(node):
-    """Format K8s node for API response"""
-    if isinstance(node, dict):
-        return node
-    return {
-        'name': node.name,
-        'status': node.status,
-        'instanceType': node.instance_type,
-        'instanceTypeDisplay': node.instance_type_display,
-        'zone': node.zone,
-        'region': node.region,
-        'nodegroup': node.nodegroup,
-        'capacity': {
-            'cpu': node.capacity_cpu,
-            'memory': node.capacity_memory
-        },
-        'allocatable': {
-            'cpu': node.allocatable_cpu,
-            'memory': node.allocatable_memory
-        },
-        'usage': {
-            'cpu': node.usage_cpu,
-            'memory': node.usage_memory
-        } if node.usage_cpu or node.usage_memory else None,
-        'subnetId': node.subnet_id,
-        'instanceId': node.instance_id
-    }
-
-
-def _format_pipeline_summary(pipeline):
-    """Format pipeline for list view"""
-    if isinstance(pipeline, dict):
-        return pipeline
-    return {
-        'name': pipeline.name,
-        'type': pipeline.pipeline_type,
-        'service': pipeline.service,
-        'status': pipeline.last_execution.status if pipeline.last_execution else 'unknown',
-        'lastRun': pipeline.last_execution.started_at.isoformat() if pipeline.last_execution and pipeline.last_execution.started_at else None
-    }
-
-
 def _get_diagram_templates():
     """Get available diagram templates"""
     return [
@@ -9,7 +9,10 @@ import json
 import time
 from typing import Dict, Any
 
+from shared.log import log_requests
 
+
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Health check handler.
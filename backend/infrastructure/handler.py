@@ -15,6 +15,7 @@ Handles all infrastructure-related endpoints:
 - GET /api/{project}/infrastructure/{env}/routing - Routing details
 - GET /api/{project}/infrastructure/{env}/enis - ENIs list
 - GET /api/{project}/infrastructure/{env}/security-group/{sg_id} - SG details
+- GET /api/{project}/infrastructure/{env}/reachability - SG reachability between endpoints
 - GET /api/{project}/infrastructure/{env}/nodes - EKS nodes list
 - GET /api/{project}/infrastructure/{env}/k8s-services - K8s services list
 - GET /api/{project}/infrastructure/{env}/ingresses - K8s ingresses list
@@ -22,13 +23,14 @@ Handles all infrastructure-related endpoints:
 - POST /api/{project}/actions/rds/{env}/{action} - RDS actions (admin only)
 - POST /api/{project}/actions/cloudfront/{env}/invalidate - CloudFront invalidation
 
+Resource and Kubernetes list endpoints are versioned: the payload carries a
+`version` (also the ETag); `If-None-Match` gets a 304 and `?since=<version>`
+a delta of what changed (see cache.delta).
+
 All endpoints require authentication and appropriate permissions.
 """
 
-import hashlib
-import json
 import traceback
-from functools import lru_cache
 from typing import Dict, Any
 
 from shared.rbac import (
@@ -47,57 +49,14 @@ from shared.response import (
 from app_config import get_config
 from providers import ProviderFactory
 from providers.aggregators.infrastructure import InfrastructureAggregator
+from providers.orchestrator.capacity import CapacityFrame
+from providers.serialization import parse_fields, select_keys, wants
 from auth.user_management import _audit_log
-from cache.dynamodb import DynamoDBCache
-from cache.policies import get_ttl
-
-
-@lru_cache(maxsize=1)
-def _get_cache_backend() -> DynamoDBCache:
-    return DynamoDBCache()
-
-
-def _cache_pk(project: str, env: str) -> str:
-    return f"CACHE#{project}#{env}"
-
-
-def _cache_sk(resource: str, params: Dict[str, Any]) -> str:
-    payload = json.dumps(params, sort_keys=True, default=str)
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
-    return f"{resource}#{digest}"
-
-
-def _should_cache(payload: Any) -> bool:
-    if isinstance(payload, dict):
-        if payload.get("error"):
-            return False
-        if len(payload) == 1:
-            value = next(iter(payload.values()))
-            if isinstance(value, dict) and value.get("error"):
-                return False
-    return True
-
-
-def _fetch_with_cache(
-    resource: str,
-    project: str,
-    env: str,
-    params: Dict[str, Any],
-    fetch_fn,
-    force_refresh: bool = False,
-):
-    cache = _get_cache_backend()
-    pk = _cache_pk(project, env)
-    sk = _cache_sk(resource, params)
-    if not force_refresh:
-        cached = cache.get(pk, sk)
-        if cached is not None:
-            return cached, "hit"
-
-    data = fetch_fn()
-    if _should_cache(data):
-        cache.set(pk, sk, data, get_ttl(resource))
-    return data, "miss"
+from auth.audit import flush_audit_on_exit
+from cache.delta import versioned_response
+from cache.policies import CLOUDFRONT_TAG, RDS_TAG
+from cache.shared import fetch_with_cache, invalidate_tags
+from shared.log import log_requests
 
 
 def _parse_infra_params(env_config, project_config) -> Dict[str, Any]:
@@ -120,6 +79,8 @@ def _resolve_resource_filters(infra_config, resource: str) -> Dict[str, Any]:
     return {"ids": ids, "tags": tags}
 
 
+@flush_audit_on_exit
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for infrastructure endpoints.
@@ -189,6 +150,7 @@ def handle_infrastructure(event, auth, project: str, parts: list, config) -> Dic
 
         if sub_resource in {'meta', 'cloudfront', 'alb', 'rds', 'redis', 's3', 'workloads', 'efs', 'network'}:
             return handle_infrastructure_resource(
+                event,
                 infrastructure,
                 project,
                 env,
@@ -219,7 +181,7 @@ def handle_infrastructure(event, auth, project: str, parts: list, config) -> Dic
                     discovery_tags=discovery_tags
                 )
 
-            data, cache_status = _fetch_with_cache(
+            data, cache_status = fetch_with_cache(
                 "routing",
                 project,
                 env,
@@ -243,7 +205,7 @@ def handle_infrastructure(event, auth, project: str, parts: list, config) -> Dic
             def fetch():
                 return infrastructure.get_enis(env, vpc_id, subnet_id, search_ip)
 
-            data, cache_status = _fetch_with_cache(
+            data, cache_status = fetch_with_cache(
                 "enis",
                 project,
                 env,
@@ -261,7 +223,7 @@ def handle_infrastructure(event, auth, project: str, parts: list, config) -> Dic
             def fetch():
                 return infrastructure.get_security_group(env, sg_id)
 
-            data, cache_status = _fetch_with_cache(
+            data, cache_status = fetch_with_cache(
                 "security-group",
                 project,
                 env,
@@ -271,21 +233,53 @@ def handle_infrastructure(event, auth, project: str, parts: list, config) -> Dic
             )
             return json_response(200, data, headers={"X-Cache": cache_status})
 
+        elif sub_resource == 'reachability':
+            # /api/{project}/infrastructure/{env}/reachability
+            source = query_params.get('source')
+            target = query_params.get('target')
+            protocol = query_params.get('protocol') or 'tcp'
+            port_str = query_params.get('port')
+            vpc_id = query_params.get('vpcId')
+            try:
+                port = int(port_str) if port_str else None
+            except ValueError:
+                return error_response('bad_request', f'Invalid port: {port_str}', 400)
+            params = {
+                "source": source,
+                "target": target,
+                "protocol": protocol,
+                "port": port,
+                "vpcId": vpc_id,
+            }
+
+            def fetch():
+                return infrastructure.get_reachability(env, source, target, protocol, port, vpc_id)
+
+            data, cache_status = fetch_with_cache(
+                "reachability",
+                project,
+                env,
+                params,
+                fetch,
+                force_refresh
+            )
+            return json_response(200, data, headers={"X-Cache": cache_status})
+
         elif sub_resource == 'nodes':
             # /api/{project}/infrastructure/{env}/nodes
-            return handle_eks_nodes(config, project, env, query_params, force_refresh)
+            return handle_eks_nodes(event, config, project, env, query_params, force_refresh)
 
         elif sub_resource == 'k8s-services':
             # /api/{project}/infrastructure/{env}/k8s-services
-            return handle_eks_services(config, project, env, query_params, force_refresh)
+            return handle_eks_services(event, config, project, env, query_params, force_refresh)
 
         elif sub_resource == 'ingresses':
             # /api/{project}/infrastructure/{env}/ingresses
-            return handle_eks_ingresses(config, project, env, query_params, force_refresh)
+            return handle_eks_ingresses(event, config, project, env, query_params, force_refresh)
 
         elif sub_resource == 'namespaces':
             # /api/{project}/infrastructure/{env}/namespaces
-            return handle_eks_namespaces(config, project, env, force_refresh)
+            return handle_eks_namespaces(event, config, project, env, force_refresh)
 
         return error_response('not_found', f'Unknown sub-resource: {sub_resource}', 404)
 
@@ -307,6 +301,7 @@ def handle_infrastructure(event, auth, project: str, parts: list, config) -> Dic
 
 
 def handle_infrastructure_resource(
+    event,
     infrastructure: InfrastructureAggregator,
     project: str,
     env: str,
@@ -349,7 +344,7 @@ def handle_infrastructure_resource(
             }
         return {resource: result.get(resource)}
 
-    data, cache_status = _fetch_with_cache(
+    data, cache_status = fetch_with_cache(
         resource,
         project,
         env,
@@ -357,10 +352,10 @@ def handle_infrastructure_resource(
         fetch,
         force_refresh
     )
-    return json_response(200, data, headers={"X-Cache": cache_status})
+    return versioned_response(event, project, env, resource, params, data, headers={"X-Cache": cache_status})
 
 
-def handle_eks_nodes(config, project: str, env: str, query_params: dict, force_refresh: bool) -> Dict[str, Any]:
+def handle_eks_nodes(event, config, project: str, env: str, query_params: dict, force_refresh: bool) -> Dict[str, Any]:
     """
     Handle /api/{project}/infrastructure/{env}/nodes endpoint
 
@@ -370,6 +365,9 @@ def handle_eks_nodes(config, project: str, env: str, query_params: dict, force_r
         includeMetrics: bool (default: true) - Include CPU/memory metrics
         includePods: bool (default: false) - Include pods running on each node
         namespace: str (optional) - Filter pods by namespace
+        since: str (optional) - Version held by the client; returns a delta
+        fields: str (optional) - Node keys to return (e.g. "name,status,zone");
+            metrics and pods are only fetched when their keys are requested
     """
     try:
         orchestrator = ProviderFactory.get_orchestrator_provider(config, project)
@@ -378,14 +376,17 @@ def handle_eks_nodes(config, project: str, env: str, query_params: dict, force_r
         if not hasattr(orchestrator, 'get_nodes'):
             return error_response('not_supported', 'Nodes endpoint only supported for EKS', 400)
 
-        include_metrics = query_params.get('includeMetrics', 'true').lower() == 'true'
-        include_pods = query_params.get('includePods', 'false').lower() == 'true'
+        fields = parse_fields(query_params.get('fields'))
+        include_metrics = (query_params.get('includeMetrics', 'true').lower() == 'true'
+                           and wants(fields, 'usage', 'utilizationPercent'))
+        include_pods = query_params.get('includePods', 'false').lower() == 'true' and wants(fields, 'pods')
         namespace = query_params.get('namespace')
 
         params = {
             "includeMetrics": include_metrics,
             "includePods": include_pods,
             "namespace": namespace,
+            "fields": fields,
         }
 
         def fetch():
@@ -396,86 +397,14 @@ def handle_eks_nodes(config, project: str, env: str, query_params: dict, force_r
                 namespace=namespace
             )
 
-            # Helper to parse K8s resource quantities for summary
-            def parse_cpu(cpu_str):
-                """Parse CPU string to millicores (int)"""
-                if not cpu_str:
-                    return 0
-                if cpu_str.endswith('n'):
-                    return int(cpu_str[:-1]) // 1000000
-                elif cpu_str.endswith('m'):
-                    return int(cpu_str[:-1])
-                else:
-                    return int(cpu_str) * 1000
-
-            def parse_memory(mem_str):
-                """Parse memory string to bytes (int)"""
-                if not mem_str:
-                    return 0
-                if mem_str.endswith('Ki'):
-                    return int(mem_str[:-2]) * 1024
-                elif mem_str.endswith('Mi'):
-                    return int(mem_str[:-2]) * 1024 * 1024
-                elif mem_str.endswith('Gi'):
-                    return int(mem_str[:-2]) * 1024 * 1024 * 1024
-                elif mem_str.endswith('Ti'):
-                    return int(mem_str[:-2]) * 1024 * 1024 * 1024 * 1024
-                else:
-                    return int(mem_str)
-
-            def format_memory(bytes_val):
-                """Format bytes to human readable"""
-                if bytes_val >= 1024 * 1024 * 1024:
-                    return f"{bytes_val // (1024 * 1024 * 1024)}Gi"
-                elif bytes_val >= 1024 * 1024:
-                    return f"{bytes_val // (1024 * 1024)}Mi"
-                else:
-                    return f"{bytes_val // 1024}Ki"
-
-            # Calculate summary
-            nodes_by_zone = {}
-            nodes_by_nodegroup = {}
-            total_capacity_cpu = 0
-            total_capacity_memory = 0
-            total_capacity_pods = 0
-            total_allocatable_cpu = 0
-            total_allocatable_memory = 0
-            total_allocatable_pods = 0
-            total_usage_cpu = 0
-            total_usage_memory = 0
-            total_pod_count = 0
-            ready_nodes = 0
-
-            for node in nodes:
-                # Count by zone
-                zone = node.zone or 'unknown'
-                nodes_by_zone[zone] = nodes_by_zone.get(zone, 0) + 1
-
-                # Count by nodegroup
-                nodegroup = node.nodegroup or 'unknown'
-                nodes_by_nodegroup[nodegroup] = nodes_by_nodegroup.get(nodegroup, 0) + 1
-
-                # Sum capacities
-                total_capacity_cpu += parse_cpu(node.capacity_cpu)
-                total_capacity_memory += parse_memory(node.capacity_memory)
-                total_capacity_pods += node.capacity_pods or 0
-                total_allocatable_cpu += parse_cpu(node.allocatable_cpu)
-                total_allocatable_memory += parse_memory(node.allocatable_memory)
-                total_allocatable_pods += node.allocatable_pods or 0
-                total_usage_cpu += parse_cpu(node.usage_cpu)
-                total_usage_memory += parse_memory(node.usage_memory)
-                total_pod_count += node.pod_count
-
-                if node.status == 'Ready':
-                    ready_nodes += 1
-
-            # Calculate utilization percentages
-            cpu_utilization = (total_usage_cpu / total_allocatable_cpu * 100) if total_allocatable_cpu > 0 else 0
-            memory_utilization = (total_usage_memory / total_allocatable_memory * 100) if total_allocatable_memory > 0 else 0
+            # Parse quantities once into columns; totals, rollups and per-node
+            # utilization are computed from them
+            frame = CapacityFrame.from_nodes(nodes)
+            node_utilization = frame.node_utilization()
 
             # Convert dataclasses to dicts for JSON serialization
             nodes_data = []
-            for node in nodes:
+            for node, utilization in zip(nodes, node_utilization):
                 node_dict = {
                     'name': node.name,
                     'instanceType': node.instance_type,
@@ -504,17 +433,7 @@ def handle_eks_nodes(config, project: str, env: str, query_params: dict, force_r
                     'labels': node.labels
                 }
 
-                # Calculate node utilization
-                node_alloc_cpu = parse_cpu(node.allocatable_cpu)
-                node_usage_cpu = parse_cpu(node.usage_cpu)
-                node_alloc_mem = parse_memory(node.allocatable_memory)
-                node_usage_mem = parse_memory(node.usage_memory)
-
-                node_dict['utilizationPercent'] = {
-                    'cpu': round(node_usage_cpu / node_alloc_cpu * 100, 1) if node_alloc_cpu > 0 else 0,
-                    'memory': round(node_usage_mem / node_alloc_mem * 100, 1) if node_alloc_mem > 0 else 0,
-                    'pods': round(node.pod_count / node.allocatable_pods * 100, 1) if node.allocatable_pods else 0
-                }
+                node_dict['utilizationPercent'] = utilization
 
                 # Include pods if requested
                 if include_pods and node.pods:
@@ -538,41 +457,16 @@ def handle_eks_nodes(config, project: str, env: str, query_params: dict, force_r
                         for pod in node.pods
                     ]
 
-                nodes_data.append(node_dict)
+                nodes_data.append(select_keys(node_dict, fields))
 
             return {
                 'environment': env,
                 'count': len(nodes),
-                'summary': {
-                    'totalNodes': len(nodes),
-                    'readyNodes': ready_nodes,
-                    'nodesByZone': nodes_by_zone,
-                    'nodesByNodegroup': nodes_by_nodegroup,
-                    'totalCapacity': {
-                        'cpu': f"{total_capacity_cpu}m",
-                        'memory': format_memory(total_capacity_memory),
-                        'pods': total_capacity_pods
-                    },
-                    'totalAllocatable': {
-                        'cpu': f"{total_allocatable_cpu}m",
-                        'memory': format_memory(total_allocatable_memory),
-                        'pods': total_allocatable_pods
-                    },
-                    'totalUsage': {
-                        'cpu': f"{total_usage_cpu}m",
-                        'memory': format_memory(total_usage_memory),
-                        'pods': total_pod_count
-                    },
-                    'utilizationPercent': {
-                        'cpu': round(cpu_utilization, 1),
-                        'memory': round(memory_utilization, 1),
-                        'pods': round(total_pod_count / total_allocatable_pods * 100, 1) if total_allocatable_pods > 0 else 0
-                    }
-                },
+                'summary': frame.summary(),
                 'nodes': nodes_data
             }
 
-        data, cache_status = _fetch_with_cache(
+        data, cache_status = fetch_with_cache(
             "nodes",
             project,
             env,
@@ -580,7 +474,7 @@ def handle_eks_nodes(config, project: str, env: str, query_params: dict, force_r
             fetch,
             force_refresh
         )
-        return json_response(200, data, headers={"X-Cache": cache_status})
+        return versioned_response(event, project, env, "nodes", params, data, headers={"X-Cache": cache_status})
 
     except Exception as e:
         print(f"ERROR in handle_eks_nodes: {e}")
@@ -588,7 +482,7 @@ def handle_eks_nodes(config, project: str, env: str, query_params: dict, force_r
         return error_response('error', str(e), 500)
 
 
-def handle_eks_services(config, project: str, env: str, query_params: dict, force_refresh: bool) -> Dict[str, Any]:
+def handle_eks_services(event, config, project: str, env: str, query_params: dict, force_refresh: bool) -> Dict[str, Any]:
     """
     Handle /api/{project}/infrastructure/{env}/k8s-services endpoint
 
@@ -630,7 +524,7 @@ def handle_eks_services(config, project: str, env: str, query_params: dict, forc
                 ]
             }
 
-        data, cache_status = _fetch_with_cache(
+        data, cache_status = fetch_with_cache(
             "k8s-services",
             project,
             env,
@@ -638,13 +532,13 @@ def handle_eks_services(config, project: str, env: str, query_params: dict, forc
             fetch,
             force_refresh
         )
-        return json_response(200, data, headers={"X-Cache": cache_status})
+        return versioned_response(event, project, env, "k8s-services", params, data, headers={"X-Cache": cache_status})
 
     except Exception as e:
         return error_response('error', str(e), 500)
 
 
-def handle_eks_ingresses(config, project: str, env: str, query_params: dict, force_refresh: bool) -> Dict[str, Any]:
+def handle_eks_ingresses(event, config, project: str, env: str, query_params: dict, force_refresh: bool) -> Dict[str, Any]:
     """
     Handle /api/{project}/infrastructure/{env}/ingresses endpoint
 
@@ -693,7 +587,7 @@ def handle_eks_ingresses(config, project: str, env: str, query_params: dict, for
                 ]
             }
 
-        data, cache_status = _fetch_with_cache(
+        data, cache_status = fetch_with_cache(
             "ingresses",
             project,
             env,
@@ -701,13 +595,13 @@ def handle_eks_ingresses(config, project: str, env: str, query_params: dict, for
             fetch,
             force_refresh
         )
-        return json_response(200, data, headers={"X-Cache": cache_status})
+        return versioned_response(event, project, env, "ingresses", params, data, headers={"X-Cache": cache_status})
 
     except Exception as e:
         return error_response('error', str(e), 500)
 
 
-def handle_eks_namespaces(config, project: str, env: str, force_refresh: bool) -> Dict[str, Any]:
+def handle_eks_namespaces(event, config, project: str, env: str, force_refresh: bool) -> Dict[str, Any]:
     """
     Handle /api/{project}/infrastructure/{env}/namespaces endpoint
 
@@ -727,7 +621,7 @@ def handle_eks_namespaces(config, project: str, env: str, force_refresh: bool) -
                 'namespaces': namespaces
             }
 
-        data, cache_status = _fetch_with_cache(
+        data, cache_status = fetch_with_cache(
             "namespaces",
             project,
             env,
@@ -735,7 +629,7 @@ def handle_eks_namespaces(config, project: str, env: str, force_refresh: bool) -
             fetch,
             force_refresh
         )
-        return json_response(200, data, headers={"X-Cache": cache_status})
+        return versioned_response(event, project, env, "namespaces", {}, data, headers={"X-Cache": cache_status})
 
     except Exception as e:
         return error_response('error', str(e), 500)
@@ -790,6 +684,9 @@ def handle_rds_actions(event, auth, project: str, parts: list, config) -> Dict[s
             'env': env,
         }, 'success')
 
+        # Cached RDS views show the new state on the next read
+        invalidate_tags(project, env, [RDS_TAG])
+
         return json_response(200, result)
 
     except Exception as e:
@@ -859,6 +756,8 @@ def handle_cloudfront_actions(event, auth, project: str, parts: list, config) ->
             'distributionId': distribution_id,
         }, 'success')
 
+        invalidate_tags(project, env, [CLOUDFRONT_TAG])
+
         return json_response(200, result)
 
     except Exception as e:
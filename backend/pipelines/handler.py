@@ -3,6 +3,7 @@ Pipelines Lambda Handler.
 
 Handles all CI/CD pipeline-related endpoints:
 - GET /api/{project}/pipelines/build/{service} - Build pipeline info
+- GET /api/{project}/pipelines/{type}?services=a,b&env=x - Pipelines of several services
 - GET /api/{project}/pipelines/deploy/{service}/{env} - Deploy pipeline info
 - GET /api/{project}/images/{service} - ECR images
 - POST /api/{project}/actions/build/{service} - Trigger build
@@ -11,6 +12,7 @@ All endpoints require authentication and appropriate permissions.
 """
 
 import json
+import os
 from typing import Dict, Any
 
 from shared.rbac import (
@@ -26,11 +28,20 @@ from shared.response import (
     get_body,
     get_query_params,
 )
+from shared.formatting import format_image, format_pipeline
 from app_config import get_config
 from providers import ProviderFactory
 from auth.user_management import _audit_log
+from auth.audit import flush_audit_on_exit
+from shared.log import log_requests
+from utils.concurrency import map_concurrent
 
+# Most services a single ?services= batch may ask for
+MAX_BATCH_SERVICES = int(os.environ.get('PIPELINES_MAX_BATCH_SERVICES', '50'))
 
+
+@flush_audit_on_exit
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for pipelines endpoints.
@@ -79,6 +90,8 @@ def handle_pipelines(event, auth, project: str, parts: list, config) -> Dict[str
     Path: /api/{project}/pipelines/{type}/{service}/{env?}
     Index:  0     1         2        3       4       5
     """
+    if len(parts) == 4:
+        return handle_pipelines_batch(event, auth, project, parts[3], config)
     if len(parts) < 5:
         return error_response('invalid_path', 'Use /api/{project}/pipelines/{type}/{service}/{env?}', 400)
 
@@ -108,6 +121,63 @@ def handle_pipelines(event, auth, project: str, parts: list, config) -> Dict[str
         return error_response('invalid_type', f'Unknown pipeline type: {pipeline_type}', 400)
 
 
+def handle_pipelines_batch(event, auth, project: str, pipeline_type: str, config) -> Dict[str, Any]:
+    """
+    Handle /api/{project}/pipelines/{type}?services=a,b&env=x
+
+    Pipelines of several services (default: the environment's services, or
+    every service of the project for builds), looked up concurrently.
+    Returns {"pipelines": {service: pipeline}}; a failed lookup gives
+    {"error": ...} for its service. An explicit `services=` list is limited
+    to MAX_BATCH_SERVICES names.
+    """
+    if pipeline_type not in ('build', 'deploy'):
+        return error_response('invalid_type', f'Unknown pipeline type: {pipeline_type}', 400)
+
+    query_params = get_query_params(event)
+    env = query_params.get('env')
+    if pipeline_type == 'deploy' and not env:
+        return error_response('validation_error', 'Environment required for deploy pipelines', 400)
+
+    permission_env = env if env else '*'
+    if not check_permission(auth, Action.READ, project, permission_env):
+        return error_response('forbidden', f'Permission denied: read on {project}/{permission_env}', 403)
+
+    services = list(dict.fromkeys(s.strip() for s in (query_params.get('services') or '').split(',') if s.strip()))
+    if len(services) > MAX_BATCH_SERVICES:
+        return error_response(
+            'validation_error',
+            f'Too many services: {len(services)} (at most {MAX_BATCH_SERVICES} per request)',
+            400
+        )
+    if not services:
+        if env:
+            env_config = config.get_environment(project, env)
+            if not env_config:
+                return error_response('not_found', f'Unknown environment: {env} for project {project}', 404)
+            services = list(env_config.services or [])
+        else:
+            project_config = config.get_project(project)
+            services = list(dict.fromkeys(
+                service
+                for env_config in (project_config.environments or {}).values()
+                for service in (env_config.services or [])
+            ))
+
+    def lookup(service: str):
+        ci = ProviderFactory.get_ci_provider_for_service(config, project, service, pipeline_type)
+        if not ci:
+            return service, {'error': f'CI/CD provider not configured for {service} {pipeline_type}'}
+        try:
+            if pipeline_type == 'build':
+                return service, format_pipeline(ci.get_build_pipeline(service))
+            return service, format_pipeline(ci.get_deploy_pipeline(env, service))
+        except Exception as e:
+            return service, {'error': str(e)}
+
+    return json_response(200, {'pipelines': dict(map_concurrent(lookup, services))})
+
+
 def handle_images(event, auth, project: str, parts: list, config) -> Dict[str, Any]:
     """
     Handle /api/{project}/images/{service} endpoint
@@ -195,57 +265,6 @@ def handle_build_action(event, auth, project: str, parts: list, config) -> Dict[
         return error_response('action_failed', str(e), 500)
 
 
-# =============================================================================
-# Formatting Functions
-# =============================================================================
-
-def format_pipeline(pipeline) -> Dict[str, Any]:
-    """Format pipeline"""
-    if isinstance(pipeline, dict) and 'error' in pipeline:
-        return pipeline
-
-    return {
-        'pipelineName': pipeline.name,
-        'pipelineType': pipeline.pipeline_type,
-        'service': pipeline.service,
-        'environment': pipeline.environment,
-        'version': pipeline.version,
-        'stages': [{'name': s.name, 'status': s.status} for s in pipeline.stages],
-        'lastExecution': format_execution(pipeline.last_execution) if pipeline.last_execution else None,
-        'executions': [format_execution(e) for e in pipeline.executions],
-        'buildLogs': pipeline.build_logs,
-        'consoleUrl': pipeline.console_url
-    }
-
-
-def format_execution(exec) -> Dict[str, Any]:
-    """Format pipeline execution"""
-    return {
-        'executionId': exec.execution_id,
-        'status': exec.status,
-        'startTime': exec.started_at.isoformat() if exec.started_at else None,
-        'lastUpdateTime': exec.finished_at.isoformat() if exec.finished_at else None,
-        'duration': exec.duration_seconds,
-        'commit': exec.commit_sha,
-        'commitMessage': exec.commit_message,
-        'commitAuthor': exec.commit_author,
-        'commitUrl': exec.commit_url,
-        'consoleUrl': exec.console_url,
-        'trigger': exec.trigger_type
-    }
-
-
-def format_image(img) -> Dict[str, Any]:
-    """Format container image"""
-    return {
-        'digest': img.digest,
-        'tags': img.tags,
-        'pushedAt': img.pushed_at.isoformat() if img.pushed_at else None,
-        'sizeBytes': img.size_bytes,
-        'sizeMB': img.size_mb
-    }
-
-
 # =============================================================================
 # Jenkins Discovery and History Handlers
 # =============================================================================
@@ -2,7 +2,9 @@
 Provider abstraction layer for the Operations Dashboard.
 Supports multiple CI/CD systems and container orchestrators.
 
-Auto-registers all provider implementations on import.
+Built-in providers are registered with ProviderFactory by dotted path (see
+providers/base.py) and imported on first use. Provider classes are still
+importable from this package; they are loaded lazily on attribute access.
 """
 
 from .base import (
@@ -11,30 +13,33 @@ from .base import (
     EventsProvider,
     DatabaseProvider,
     CDNProvider,
-    ProviderFactory
+    ProviderFactory,
+    lazy_provider_getattr,
 )
 
-# Import providers to register them with ProviderFactory
-# CI Providers
-from .ci.codepipeline import CodePipelineProvider
-from .ci.github_actions import GitHubActionsProvider
-from .ci.jenkins import JenkinsProvider
-from .ci.argocd import ArgoCDProvider
+# Provider class -> defining module (resolved lazily, see __getattr__)
+_LAZY_PROVIDERS = {
+    # CI Providers
+    'CodePipelineProvider': '.ci.codepipeline',
+    'GitHubActionsProvider': '.ci.github_actions',
+    'JenkinsProvider': '.ci.jenkins',
+    'ArgoCDProvider': '.ci.argocd',
+    # Orchestrator Providers
+    'ECSProvider': '.orchestrator.ecs',
+    'EKSProvider': '.orchestrator.eks',
+    'EKSDynamoProvider': '.orchestrator.eks_dynamo',
+    # Events Provider
+    'CombinedEventsProvider': '.events.combined',
+    # Infrastructure Providers (for aggregator)
+    'RDSProvider': '.infrastructure.rds',
+    'CloudFrontProvider': '.infrastructure.cloudfront',
+    'VPCProvider': '.infrastructure.network',
+    'ALBProvider': '.infrastructure.alb',
+    'ElastiCacheProvider': '.infrastructure.elasticache',
+}
 
-# Orchestrator Providers
-from .orchestrator.ecs import ECSProvider
-from .orchestrator.eks import EKSProvider
-from .orchestrator.eks_dynamo import EKSDynamoProvider
+__getattr__ = lazy_provider_getattr(__name__, _LAZY_PROVIDERS)
 
-# Events Provider
-from .events.combined import CombinedEventsProvider
-
-# Infrastructure Providers (for aggregator)
-from .infrastructure.rds import RDSProvider
-from .infrastructure.cloudfront import CloudFrontProvider
-from .infrastructure.network import VPCProvider
-from .infrastructure.alb import ALBProvider
-from .infrastructure.elasticache import ElastiCacheProvider
 
 __all__ = [
     'CIProvider',
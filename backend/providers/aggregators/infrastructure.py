@@ -2,11 +2,28 @@
 Infrastructure Aggregator - combines all infrastructure providers for the topology view.
 """
 
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
 from app_config import DashboardConfig, InfrastructureConfig
 from utils.aws import get_cross_account_client, build_sso_console_url
 from providers.base import ProviderFactory
+from providers.infrastructure.tag_discovery import get_tagged_resources
+from providers.serialization import select_keys
+
+
+# Response key -> resource fetched to fill it (`fields` projection)
+INFRASTRUCTURE_FIELD_RESOURCES = {
+    'cloudfront': 'cloudfront',
+    'alb': 'alb',
+    's3Buckets': 's3',
+    'workloads': 'workloads',
+    'services': 'workloads',
+    'rds': 'rds',
+    'redis': 'redis',
+    'efs': 'efs',
+    'network': 'network',
+}
 
 
 class InfrastructureAggregator:
@@ -20,12 +37,28 @@ class InfrastructureAggregator:
         self.project = project
         self.region = config.region
 
-        # Get individual providers
-        self.network_provider = ProviderFactory.get_network_provider(config, project)
-        self.loadbalancer_provider = ProviderFactory.get_loadbalancer_provider(config, project)
-        self.cdn_provider = ProviderFactory.get_cdn_provider(config, project)
-        self.database_provider = ProviderFactory.get_database_provider(config, project)
-        self.cache_provider = ProviderFactory.get_cache_provider(config, project)
+    # Individual providers are created on first use, so a request for one
+    # resource type does not import every infrastructure provider module.
+
+    @cached_property
+    def network_provider(self):
+        return ProviderFactory.get_network_provider(self.config, self.project)
+
+    @cached_property
+    def loadbalancer_provider(self):
+        return ProviderFactory.get_loadbalancer_provider(self.config, self.project)
+
+    @cached_property
+    def cdn_provider(self):
+        return ProviderFactory.get_cdn_provider(self.config, self.project)
+
+    @cached_property
+    def database_provider(self):
+        return ProviderFactory.get_database_provider(self.config, self.project)
+
+    @cached_property
+    def cache_provider(self):
+        return ProviderFactory.get_cache_provider(self.config, self.project)
 
     def _resolve_resource_filters(self, infra_config: Optional[InfrastructureConfig], resource: str) -> Dict[str, Optional[object]]:
         if not infra_config:
@@ -76,14 +109,20 @@ class InfrastructureAggregator:
 
     def get_infrastructure(self, env: str, services: list = None,
                            infra_config: Optional[InfrastructureConfig] = None,
-                           resources: Optional[List[str]] = None) -> dict:
+                           resources: Optional[List[str]] = None,
+                           fields: Optional[Tuple[str, ...]] = None) -> dict:
         """Get infrastructure topology for an environment (CloudFront, ALB, S3, ECS services, RDS, Redis, Network)
 
         Args:
             env: Environment name (staging, preprod, production)
             services: List of service names to look for
             infra_config: InfrastructureConfig with resource filters
+            resources: Resources to fetch (default: all)
+            fields: Response keys to return; only the resources behind them are fetched
         """
+        if fields is not None and resources is None:
+            resources = sorted({INFRASTRUCTURE_FIELD_RESOURCES[key] for key in fields
+                                if key in INFRASTRUCTURE_FIELD_RESOURCES})
         env_config = self.config.get_environment(self.project, env)
         if not env_config:
             return {'error': f'Unknown environment: {env}'}
@@ -110,7 +149,7 @@ class InfrastructureAggregator:
         # Determine orchestrator type
         orchestrator_type = getattr(self.config.orchestrator, 'type', 'ecs') if self.config.orchestrator else 'ecs'
 
-        resource_set = set(resources) if resources else None
+        resource_set = set(resources) if resources is not None else None
 
         def should_fetch(name: str) -> bool:
             return resource_set is None or name in resource_set
@@ -154,7 +193,7 @@ class InfrastructureAggregator:
         # For EKS: Get Ingress to find ALB hostname
         ingress_hostname = None
         ingresses = []
-        if orchestrator_type == 'eks':
+        if orchestrator_type == 'eks' and should_fetch('alb'):
             try:
                 orchestrator = ProviderFactory.get_orchestrator_provider(self.config, self.project)
                 if hasattr(orchestrator, 'get_ingresses'):
@@ -365,7 +404,7 @@ class InfrastructureAggregator:
         if should_fetch('workloads'):
             result['services'] = result['workloads']
 
-        return result
+        return select_keys(result, fields)
 
     def _normalize_workloads_from_services(self, services_data: dict, account_id: str) -> dict:
         """Normalize Service dataclass objects to unified workload format.
@@ -484,29 +523,26 @@ class InfrastructureAggregator:
             return None
 
         try:
-            filesystems = efs.describe_file_systems()
-            for fs in filesystems.get('FileSystems', []):
-                fs_id = fs['FileSystemId']
-                fs_name = fs.get('Name', fs_id)
-
-                if ids and fs_id not in ids:
-                    continue
+            if discovery_tags:
+                # Tags are resolved account-wide in one query (shared, cached tag discovery)
+                tagged = get_tagged_resources(self.config, self.project, env, discovery_tags)
+                candidate_ids = tagged.ids('elasticfilesystem:file-system')
+                if ids:
+                    candidate_ids = [fs_id for fs_id in candidate_ids if fs_id in ids]
+            else:
+                candidate_ids = list(ids)
 
-                # Get EFS tags
+            for candidate_id in candidate_ids:
                 try:
-                    tag_response = efs.describe_tags(FileSystemId=fs_id)
-                    fs_tags = tag_response.get('Tags', [])
-                except Exception:
-                    fs_tags = []
-
-                # Check if discovery_tags match
-                from providers.infrastructure.elasticache import matches_discovery_tags
-                tags_match = matches_discovery_tags(fs_tags, discovery_tags) if discovery_tags else True
-
-                if tags_match:
+                    filesystems = efs.describe_file_systems(FileSystemId=candidate_id)
+                except Exception as e:
+                    print(f"Failed to describe EFS {candidate_id}: {e}")
+                    continue
+                for fs in filesystems.get('FileSystems', []):
+                    fs_id = fs['FileSystemId']
                     return {
                         'fileSystemId': fs_id,
-                        'name': fs_name,
+                        'name': fs.get('Name', fs_id),
                         'lifeCycleState': fs['LifeCycleState'],
                         'sizeInBytes': fs.get('SizeInBytes', {}).get('Value', 0),
                         'performanceMode': fs.get('PerformanceMode', 'generalPurpose'),
@@ -567,6 +603,22 @@ class InfrastructureAggregator:
             return self.network_provider.get_enis(env, vpc_id, subnet_id, search_ip)
         return {'error': 'Network provider not available'}
 
+    def get_reachability(self, env: str, source: str = None, target: str = None,
+                         protocol: str = 'tcp', port: int = None, vpc_id: str = None) -> dict:
+        """Get security group reachability between endpoints (SG, ENI or IP)
+
+        Args:
+            env: Environment name
+            source: Optional source endpoint (default: every workload)
+            target: Optional target endpoint (default: every datastore)
+            protocol: Protocol name or number (default: tcp)
+            port: Optional port to evaluate
+            vpc_id: Optional VPC ID (default: environment VPC)
+        """
+        if self.network_provider:
+            return self.network_provider.get_reachability(env, source, target, protocol, port, vpc_id)
+        return {'error': 'Network provider not available'}
+
     def get_security_group(self, env: str, sg_id: str) -> dict:
         """Get detailed Security Group information including rules
 
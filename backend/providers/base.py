@@ -3,17 +3,20 @@ Base interfaces for CI/CD and Orchestrator providers.
 All provider implementations must inherit from these abstract classes.
 """
 
+import importlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 
 
 # =============================================================================
 # DATA CLASSES - Common data structures returned by providers
 # =============================================================================
+# Slotted dataclasses (no per-instance __dict__); API formatting lives in
+# shared.formatting
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStage:
     """Pipeline stage information"""
     name: str
@@ -23,7 +26,7 @@ class PipelineStage:
     logs_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineExecution:
     """Pipeline execution information"""
     execution_id: str
@@ -39,7 +42,7 @@ class PipelineExecution:
     trigger_type: Optional[str] = None  # webhook, manual, scheduled
 
 
-@dataclass
+@dataclass(slots=True)
 class Pipeline:
     """Pipeline information"""
     name: str
@@ -54,7 +57,7 @@ class Pipeline:
     build_logs: Optional[List[dict]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerImage:
     """Container image information"""
     digest: str
@@ -64,7 +67,7 @@ class ContainerImage:
     size_mb: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceTask:
     """Container task/pod information"""
     task_id: str
@@ -82,7 +85,7 @@ class ServiceTask:
     stopped_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sNodePod:
     """Pod running on a Kubernetes node"""
     name: str
@@ -97,7 +100,7 @@ class K8sNodePod:
     usage_memory: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sNode:
     """Kubernetes node information"""
     name: str
@@ -122,7 +125,7 @@ class K8sNode:
     pods: List['K8sNodePod'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sService:
     """Kubernetes Service information"""
     name: str
@@ -135,7 +138,7 @@ class K8sService:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sIngressRule:
     """Kubernetes Ingress rule"""
     host: str
@@ -145,7 +148,7 @@ class K8sIngressRule:
     service_port: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sIngress:
     """Kubernetes Ingress information"""
     name: str
@@ -159,7 +162,7 @@ class K8sIngress:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sPod:
     """Kubernetes Pod information"""
     name: str
@@ -175,7 +178,7 @@ class K8sPod:
     annotations: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sDeployment:
     """Kubernetes Deployment information"""
     name: str
@@ -190,7 +193,7 @@ class K8sDeployment:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sPersistentVolume:
     """Kubernetes PersistentVolume information"""
     name: str
@@ -206,7 +209,7 @@ class K8sPersistentVolume:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class K8sPersistentVolumeClaim:
     """Kubernetes PersistentVolumeClaim information"""
     name: str
@@ -220,7 +223,7 @@ class K8sPersistentVolumeClaim:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceDeployment:
     """Service deployment information"""
     deployment_id: str
@@ -236,7 +239,7 @@ class ServiceDeployment:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDefinitionDiff:
     """Diff between two task definitions/revisions"""
     from_revision: str
@@ -244,7 +247,7 @@ class TaskDefinitionDiff:
     changes: List[Dict[str, str]]  # [{'field': 'image', 'label': 'Image', 'from': 'v1', 'to': 'v2'}]
 
 
-@dataclass
+@dataclass(slots=True)
 class Service:
     """Container service information"""
     name: str
@@ -264,7 +267,7 @@ class Service:
     selector: Dict[str, str] = field(default_factory=dict)  # K8s selector for grouping services
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceDetails(Service):
     """Detailed service information with logs and env vars"""
     environment_variables: List[Dict[str, str]] = field(default_factory=list)
@@ -278,7 +281,7 @@ class ServiceDetails(Service):
     latest_task_definition: Optional[dict] = None  # Most recent task def in family
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Timeline event"""
     id: str
@@ -346,13 +349,19 @@ class OrchestratorProvider(ABC):
     """
 
     @abstractmethod
-    def get_services(self, env: str) -> Dict[str, Service]:
-        """Get all services for an environment"""
+    def get_services(self, env: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Service]:
+        """Get all services for an environment (see get_service for `fields`)"""
         pass
 
     @abstractmethod
-    def get_service(self, env: str, service: str) -> Service:
-        """Get service information"""
+    def get_service(self, env: str, service: str, fields: Optional[Tuple[str, ...]] = None) -> Service:
+        """
+        Get service information.
+
+        `fields` (Service JSON keys, None: all) lets the provider skip the
+        calls behind fields that are not needed (e.g. tasks); those fields
+        keep their defaults.
+        """
         pass
 
     @abstractmethod
@@ -551,7 +560,7 @@ class DynamicOrchestratorProxy:
             from providers.base import ProviderFactory
             if provider_type not in ProviderFactory._orchestrator_providers:
                 raise ValueError(f"Unknown orchestrator type: {provider_type}")
-            provider_class = ProviderFactory._orchestrator_providers[provider_type]
+            provider_class = ProviderFactory._resolve(ProviderFactory._orchestrator_providers, provider_type)
             self._provider_cache[provider_type] = provider_class(self.config, self.project)
 
         return self._provider_cache[provider_type]
@@ -572,9 +581,33 @@ class DynamicOrchestratorProxy:
 # PROVIDER FACTORY
 # =============================================================================
 
+ProviderRef = Union[type, str]
+
+
+def lazy_provider_getattr(package: str, providers: Dict[str, str]) -> Callable[[str], type]:
+    """
+    Module `__getattr__` for a provider package: provider classes are
+    imported on first attribute access instead of with the package.
+
+    Args:
+        package: Package name (`__name__`), anchor of the relative module paths
+        providers: Class name -> defining module ('.ecs')
+    """
+    def __getattr__(name: str) -> type:
+        module_path = providers.get(name)
+        if module_path is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(module_path, package), name)
+    return __getattr__
+
+
 class ProviderFactory:
     """
     Factory for creating provider instances based on configuration.
+
+    Providers can be registered either as a class or as a dotted path
+    ('package.module.ClassName'). Dotted paths are imported on first use,
+    so a Lambda only pays the import cost of the providers it actually serves.
     """
 
     _ci_providers = {}
@@ -586,28 +619,38 @@ class ProviderFactory:
     _loadbalancer_providers = {}
     _cache_providers = {}
 
+    @staticmethod
+    def _resolve(registry: Dict[str, ProviderRef], provider_type: str) -> type:
+        """Return the provider class for a type, importing it on first use."""
+        provider = registry[provider_type]
+        if isinstance(provider, str):
+            module_path, _, class_name = provider.rpartition('.')
+            provider = getattr(importlib.import_module(module_path), class_name)
+            registry[provider_type] = provider
+        return provider
+
     @classmethod
-    def register_ci_provider(cls, provider_type: str, provider_class: type):
+    def register_ci_provider(cls, provider_type: str, provider_class: ProviderRef):
         """Register a CI provider implementation"""
         cls._ci_providers[provider_type] = provider_class
 
     @classmethod
-    def register_orchestrator_provider(cls, provider_type: str, provider_class: type):
+    def register_orchestrator_provider(cls, provider_type: str, provider_class: ProviderRef):
         """Register an orchestrator provider implementation"""
         cls._orchestrator_providers[provider_type] = provider_class
 
     @classmethod
-    def register_events_provider(cls, provider_type: str, provider_class: type):
+    def register_events_provider(cls, provider_type: str, provider_class: ProviderRef):
         """Register an events provider implementation"""
         cls._events_providers[provider_type] = provider_class
 
     @classmethod
-    def register_database_provider(cls, provider_type: str, provider_class: type):
+    def register_database_provider(cls, provider_type: str, provider_class: ProviderRef):
         """Register a database provider implementation"""
         cls._database_providers[provider_type] = provider_class
 
     @classmethod
-    def register_cdn_provider(cls, provider_type: str, provider_class: type):
+    def register_cdn_provider(cls, provider_type: str, provider_class: ProviderRef):
         """Register a CDN provider implementation"""
         cls._cdn_providers[provider_type] = provider_class
 
@@ -620,7 +663,7 @@ class ProviderFactory:
             return None
         if provider_type not in cls._ci_providers:
             raise ValueError(f"Unknown CI provider type: {provider_type}")
-        return cls._ci_providers[provider_type](config, project)
+        return cls._resolve(cls._ci_providers, provider_type)(config, project)
 
     @classmethod
     def get_ci_provider_for_service(
@@ -652,7 +695,7 @@ class ProviderFactory:
                 if type_config.get('enabled', False):
                     provider_type = type_config.get('provider')
                     if provider_type and provider_type in cls._ci_providers:
-                        return cls._ci_providers[provider_type](config, project)
+                        return cls._resolve(cls._ci_providers, provider_type)(config, project)
 
         # Fallback to global CI provider
         return cls.get_ci_provider(config, project)
@@ -686,7 +729,7 @@ class ProviderFactory:
 
         if provider_type not in cls._orchestrator_providers:
             raise ValueError(f"Unknown orchestrator type: {provider_type}")
-        return cls._orchestrator_providers[provider_type](config, project)
+        return cls._resolve(cls._orchestrator_providers, provider_type)(config, project)
 
     @classmethod
     def get_dynamic_orchestrator(cls, config, project: str) -> DynamicOrchestratorProxy:
@@ -715,7 +758,7 @@ class ProviderFactory:
             provider_type = 'combined'
         if provider_type not in cls._events_providers:
             raise ValueError(f"No events provider registered")
-        return cls._events_providers[provider_type](config, project)
+        return cls._resolve(cls._events_providers, provider_type)(config, project)
 
     @classmethod
     def get_database_provider(cls, config, project: str) -> Optional[DatabaseProvider]:
@@ -723,7 +766,7 @@ class ProviderFactory:
         provider_type = getattr(config, 'database_provider_type', 'rds')
         if provider_type not in cls._database_providers:
             return None
-        return cls._database_providers[provider_type](config, project)
+        return cls._resolve(cls._database_providers, provider_type)(config, project)
 
     @classmethod
     def get_cdn_provider(cls, config, project: str) -> Optional[CDNProvider]:
@@ -731,20 +774,20 @@ class ProviderFactory:
         provider_type = getattr(config, 'cdn_provider_type', 'cloudfront')
         if provider_type not in cls._cdn_providers:
             return None
-        return cls._cdn_providers[provider_type](config, project)
+        return cls._resolve(cls._cdn_providers, provider_type)(config, project)
 
     @classmethod
-    def register_network_provider(cls, provider_type: str, provider_class: type):
+    def register_network_provider(cls, provider_type: str, provider_class: ProviderRef):
         """Register a network provider implementation"""
         cls._network_providers[provider_type] = provider_class
 
     @classmethod
-    def register_loadbalancer_provider(cls, provider_type: str, provider_class: type):
+    def register_loadbalancer_provider(cls, provider_type: str, provider_class: ProviderRef):
         """Register a load balancer provider implementation"""
         cls._loadbalancer_providers[provider_type] = provider_class
 
     @classmethod
-    def register_cache_provider(cls, provider_type: str, provider_class: type):
+    def register_cache_provider(cls, provider_type: str, provider_class: ProviderRef):
         """Register a cache provider implementation"""
         cls._cache_providers[provider_type] = provider_class
 
@@ -754,7 +797,7 @@ class ProviderFactory:
         provider_type = getattr(config, 'network_provider_type', 'vpc')
         if provider_type not in cls._network_providers:
             return None
-        return cls._network_providers[provider_type](config, project)
+        return cls._resolve(cls._network_providers, provider_type)(config, project)
 
     @classmethod
     def get_loadbalancer_provider(cls, config, project: str) -> Optional['LoadBalancerProvider']:
@@ -762,7 +805,7 @@ class ProviderFactory:
         provider_type = getattr(config, 'loadbalancer_provider_type', 'alb')
         if provider_type not in cls._loadbalancer_providers:
             return None
-        return cls._loadbalancer_providers[provider_type](config, project)
+        return cls._resolve(cls._loadbalancer_providers, provider_type)(config, project)
 
     @classmethod
     def get_cache_provider(cls, config, project: str) -> Optional['CacheProvider']:
@@ -770,4 +813,30 @@ class ProviderFactory:
         provider_type = getattr(config, 'cache_provider_type', 'elasticache')
         if provider_type not in cls._cache_providers:
             return None
-        return cls._cache_providers[provider_type](config, project)
+        return cls._resolve(cls._cache_providers, provider_type)(config, project)
+
+
+# =============================================================================
+# BUILT-IN PROVIDERS (imported on first use)
+# =============================================================================
+
+# CI Providers
+ProviderFactory.register_ci_provider('codepipeline', 'providers.ci.codepipeline.CodePipelineProvider')
+ProviderFactory.register_ci_provider('github_actions', 'providers.ci.github_actions.GitHubActionsProvider')
+ProviderFactory.register_ci_provider('jenkins', 'providers.ci.jenkins.JenkinsProvider')
+ProviderFactory.register_ci_provider('argocd', 'providers.ci.argocd.ArgoCDProvider')
+
+# Orchestrator Providers
+ProviderFactory.register_orchestrator_provider('ecs', 'providers.orchestrator.ecs.ECSProvider')
+ProviderFactory.register_orchestrator_provider('eks', 'providers.orchestrator.eks.EKSProvider')
+ProviderFactory.register_orchestrator_provider('eks-cached', 'providers.orchestrator.eks_dynamo.EKSDynamoProvider')
+
+# Events Provider
+ProviderFactory.register_events_provider('combined', 'providers.events.combined.CombinedEventsProvider')
+
+# Infrastructure Providers
+ProviderFactory.register_database_provider('rds', 'providers.infrastructure.rds.RDSProvider')
+ProviderFactory.register_cdn_provider('cloudfront', 'providers.infrastructure.cloudfront.CloudFrontProvider')
+ProviderFactory.register_network_provider('vpc', 'providers.infrastructure.network.VPCProvider')
+ProviderFactory.register_loadbalancer_provider('alb', 'providers.infrastructure.alb.ALBProvider')
+ProviderFactory.register_cache_provider('elasticache', 'providers.infrastructure.elasticache.ElastiCacheProvider')
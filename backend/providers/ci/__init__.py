@@ -1,11 +1,21 @@
 """
 CI/CD Provider implementations.
+
+Providers are loaded lazily on attribute access so that importing one CI
+provider module does not import all of them.
 """
 
-from .codepipeline import CodePipelineProvider
-from .github_actions import GitHubActionsProvider
-from .jenkins import JenkinsProvider
-from .argocd import ArgoCDProvider
+from providers.base import lazy_provider_getattr
+
+_LAZY_PROVIDERS = {
+    'CodePipelineProvider': '.codepipeline',
+    'GitHubActionsProvider': '.github_actions',
+    'JenkinsProvider': '.jenkins',
+    'ArgoCDProvider': '.argocd',
+}
+
+__getattr__ = lazy_provider_getattr(__name__, _LAZY_PROVIDERS)
+
 
 __all__ = [
     'CodePipelineProvider',
@@ -7,7 +7,6 @@ Used for deploy pipelines - ArgoCD is a CD (Continuous Delivery) tool, not CI.
 
 import os
 import json
-import requests
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
@@ -20,6 +19,7 @@ from providers.base import (
     ProviderFactory
 )
 from app_config import DashboardConfig
+from utils.http import HttpError, get_http_client
 
 
 class ArgoCDProvider(CIProvider):
@@ -42,9 +42,6 @@ class ArgoCDProvider(CIProvider):
         self._argocd_token = None
         self._token_secret_name = os.environ.get('ARGOCD_TOKEN_SECRET', '')
 
-        # Session for connection reuse
-        self._session = None
-
     def _get_argocd_token(self) -> str:
         """Get ArgoCD API token from Secrets Manager"""
         if self._argocd_token:
@@ -70,38 +67,33 @@ class ArgoCDProvider(CIProvider):
 
         return self._argocd_token or ''
 
-    def _get_session(self) -> requests.Session:
-        """Get authenticated requests session"""
-        if self._session is None:
-            self._session = requests.Session()
-            token = self._get_argocd_token()
-            if token:
-                self._session.headers['Authorization'] = f'Bearer {token}'
-            self._session.headers['Content-Type'] = 'application/json'
-            self._session.timeout = 30
-        return self._session
-
     def _argocd_api_call(self, path: str, method: str = 'GET', **kwargs) -> Optional[Dict]:
         """Make an ArgoCD API call"""
         if not self.argocd_url:
             return None
 
-        url = f"{self.argocd_url}/api/v1/{path.lstrip('/')}"
-        session = self._get_session()
+        if method not in ('GET', 'POST'):
+            return None
 
-        try:
-            if method == 'GET':
-                response = session.get(url, **kwargs)
-            elif method == 'POST':
-                response = session.post(url, **kwargs)
-            else:
-                return None
+        token = self._get_argocd_token()
+        headers = {'Content-Type': 'application/json'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
 
+        try:
+            response = get_http_client(f"{self.argocd_url}/api/v1").request(
+                method,
+                path,
+                headers=headers,
+                json_body=kwargs.pop('json', None),
+                timeout=30,
+                **kwargs
+            )
             response.raise_for_status()
             return response.json()
 
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
+        except HttpError as e:
+            if e.status_code == 404:
                 return None
             print(f"ArgoCD API error: {e}")
             return None
@@ -3,8 +3,7 @@ GitHub Actions CI/CD Provider implementation.
 """
 
 import json
-import urllib.request
-import urllib.error
+import os
 from datetime import datetime
 from typing import List, Optional
 
@@ -17,6 +16,12 @@ from providers.base import (
     ProviderFactory
 )
 from app_config import DashboardConfig
+from utils.http import get_http_client
+
+# GitHub Enterprise Server: https://<host>/api/v3
+GITHUB_API_URL = os.environ.get('GITHUB_API_URL', 'https://api.github.com')
+# Workflow definitions change rarely; served from memory this long
+WORKFLOWS_CACHE_TTL_SECONDS = 300
 
 
 class GitHubActionsProvider(CIProvider):
@@ -55,10 +60,12 @@ class GitHubActionsProvider(CIProvider):
             service=service
         )
 
-    def _api_request(self, endpoint: str, method: str = 'GET', data: dict = None) -> dict:
-        """Make GitHub API request"""
+    def _api_request(self, endpoint: str, method: str = 'GET', data: dict = None, cache_ttl: float = 0) -> dict:
+        """
+        Make GitHub API request (pooled; GETs are revalidated with ETags,
+        which don't count against the rate limit when unchanged)
+        """
         token = self._get_token()
-        url = f"https://api.github.com{endpoint}"
 
         headers = {
             'Authorization': f'token {token}',
@@ -66,15 +73,17 @@ class GitHubActionsProvider(CIProvider):
             'User-Agent': 'Dashboard-API'
         }
 
-        req_data = json.dumps(data).encode() if data else None
-        request = urllib.request.Request(url, data=req_data, headers=headers, method=method)
+        response = get_http_client(GITHUB_API_URL).request(
+            method, endpoint, headers=headers, json_body=data, timeout=10, cache_ttl=cache_ttl
+        )
+        if not response.ok:
+            raise Exception(f"GitHub API error {response.status_code}: {response.text}")
+        return response.json()
 
-        try:
-            with urllib.request.urlopen(request, timeout=10) as response:
-                return json.loads(response.read().decode())
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else str(e)
-            raise Exception(f"GitHub API error {e.code}: {error_body}")
+    def _list_workflows(self, repo: str) -> dict:
+        return self._api_request(
+            f"/repos/{self.github_owner}/{repo}/actions/workflows", cache_ttl=WORKFLOWS_CACHE_TTL_SECONDS
+        )
 
     def get_build_pipeline(self, service: str) -> Pipeline:
         """Get build workflow information for a service"""
@@ -82,7 +91,7 @@ class GitHubActionsProvider(CIProvider):
 
         try:
             # Get workflows for the repo
-            workflows = self._api_request(f"/repos/{self.github_owner}/{repo}/actions/workflows")
+            workflows = self._list_workflows(repo)
 
             # Find build workflow (commonly named 'build', 'ci', or 'docker')
             build_workflow = None
@@ -157,7 +166,7 @@ class GitHubActionsProvider(CIProvider):
         repo = self._get_repo_name(service)
 
         try:
-            workflows = self._api_request(f"/repos/{self.github_owner}/{repo}/actions/workflows")
+            workflows = self._list_workflows(repo)
 
             # Find deploy workflow (commonly named 'deploy', 'cd', or includes env name)
             deploy_workflow = None
@@ -258,7 +267,7 @@ class GitHubActionsProvider(CIProvider):
 
         try:
             # Get workflows to find build workflow
-            workflows = self._api_request(f"/repos/{self.github_owner}/{repo}/actions/workflows")
+            workflows = self._list_workflows(repo)
 
             build_workflow = None
             for wf in workflows.get('workflows', []):
@@ -301,7 +310,7 @@ class GitHubActionsProvider(CIProvider):
         repo = self._get_repo_name(service)
 
         try:
-            workflows = self._api_request(f"/repos/{self.github_owner}/{repo}/actions/workflows")
+            workflows = self._list_workflows(repo)
 
             deploy_workflow = None
             for wf in workflows.get('workflows', []):
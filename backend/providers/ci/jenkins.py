@@ -7,7 +7,6 @@ Supports triggering builds for services configured with Jenkins.
 
 import os
 import json
-import requests
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from urllib.parse import quote
@@ -21,6 +20,7 @@ from providers.base import (
     ProviderFactory
 )
 from app_config import DashboardConfig
+from utils.http import HttpError, get_http_client
 
 
 class JenkinsProvider(CIProvider):
@@ -48,9 +48,6 @@ class JenkinsProvider(CIProvider):
         # Get token secret name from config, global settings, or env var fallback
         self._token_secret_name = self._resolve_token_secret_name()
 
-        # Session for connection reuse
-        self._session = None
-
     @classmethod
     def from_provider_config(cls, config: DashboardConfig, provider_config: Dict[str, Any]) -> 'JenkinsProvider':
         """
@@ -74,7 +71,6 @@ class JenkinsProvider(CIProvider):
         instance._jenkins_token = provider_config.get('token') or ''
         instance._credentials_loaded = True
         instance._token_secret_name = None
-        instance._session = None
 
         return instance
 
@@ -182,32 +178,26 @@ class JenkinsProvider(CIProvider):
 
         return self._jenkins_token or ''
 
-    def _get_session(self) -> requests.Session:
-        """Get authenticated requests session"""
-        if self._session is None:
-            self._session = requests.Session()
-            if self.jenkins_user and self._get_jenkins_token():
-                self._session.auth = (self.jenkins_user, self._get_jenkins_token())
-            self._session.headers['Content-Type'] = 'application/json'
-            self._session.timeout = 30
-        return self._session
-
     def _jenkins_api_call(self, path: str, method: str = 'GET', **kwargs) -> Optional[Dict]:
         """Make a Jenkins API call"""
         if not self.jenkins_url:
             return None
 
-        url = f"{self.jenkins_url}/{path.lstrip('/')}"
-        session = self._get_session()
+        if method not in ('GET', 'POST'):
+            return None
 
-        try:
-            if method == 'GET':
-                response = session.get(url, **kwargs)
-            elif method == 'POST':
-                response = session.post(url, **kwargs)
-            else:
-                return None
+        token = self._get_jenkins_token()
+        auth = (self.jenkins_user, token) if self.jenkins_user and token else None
 
+        try:
+            response = get_http_client(self.jenkins_url).request(
+                method,
+                path,
+                headers={'Content-Type': 'application/json'},
+                auth=auth,
+                timeout=30,
+                **kwargs
+            )
             response.raise_for_status()
 
             # Return JSON for API calls, text for logs
@@ -215,8 +205,8 @@ class JenkinsProvider(CIProvider):
                 return response.json()
             return {'text': response.text}
 
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
+        except HttpError as e:
+            if e.status_code == 404:
                 return None
             print(f"Jenkins API error: {e}")
             return None
@@ -1,9 +1,17 @@
 # Infrastructure providers (RDS, CloudFront, Network, ALB, ElastiCache)
-from .rds import RDSProvider
-from .cloudfront import CloudFrontProvider
-from .network import VPCProvider
-from .alb import ALBProvider
-from .elasticache import ElastiCacheProvider
+# Loaded lazily on attribute access.
+from providers.base import lazy_provider_getattr
+
+_LAZY_PROVIDERS = {
+    'RDSProvider': '.rds',
+    'CloudFrontProvider': '.cloudfront',
+    'VPCProvider': '.network',
+    'ALBProvider': '.alb',
+    'ElastiCacheProvider': '.elasticache',
+}
+
+__getattr__ = lazy_provider_getattr(__name__, _LAZY_PROVIDERS)
+
 
 __all__ = [
     'RDSProvider',
@@ -7,12 +7,123 @@ Supports:
 - Ingress-based discovery for EKS (AWS Load Balancer Controller)
 """
 
-from typing import List, Optional, Dict
+import re
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 from providers.base import LoadBalancerProvider, ProviderFactory
 from app_config import DashboardConfig
+from cache.shared import fetch_with_cache
 from utils.aws import get_cross_account_client, build_sso_console_url
+from utils.concurrency import map_concurrent, run_concurrent
+
+
+_NAME_TOKEN_SPLIT = re.compile(r'[^a-z0-9]+')
+
+
+def _name_tokens(name: str) -> Tuple[str, ...]:
+    return tuple(t for t in _NAME_TOKEN_SPLIT.split(name.lower()) if t)
+
+
+def _build_service_index(services: List[str]) -> Dict[str, List[Tuple[Tuple[str, ...], str]]]:
+    """
+    Map the first name token of each service to (tokens, service) candidates.
+
+    Target group names are matched token by token (`myproj-stg-backend-tg`
+    -> backend), longest service name first, so `api-admin` wins over `api`.
+    """
+    index: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+    for svc in services:
+        tokens = _name_tokens(svc)
+        if tokens:
+            index.setdefault(tokens[0], []).append((tokens, svc))
+    for candidates in index.values():
+        candidates.sort(key=lambda c: len(c[0]), reverse=True)
+    return index
+
+
+def _match_service(tg_name: str, index: Dict[str, List[Tuple[Tuple[str, ...], str]]]) -> Optional[str]:
+    """Service owning a target group, by token match against the service index"""
+    tokens = _name_tokens(tg_name)
+    for i, token in enumerate(tokens):
+        for svc_tokens, svc in index.get(token, ()):
+            if tokens[i:i + len(svc_tokens)] == svc_tokens:
+                return svc
+    return None
+
+
+def _match_target_groups(target_groups: List[dict], services: List[str]) -> List[Tuple[dict, str]]:
+    """
+    (target group, service) pairs of the target groups belonging to `services`.
+
+    Token match first; the target groups it leaves unmatched then get a
+    substring match (longest service name first), for names the tokens miss:
+    service name joined to other text without a separator, or names
+    truncated by AWS to 32 characters.
+    """
+    index = _build_service_index(services)
+    matched: Dict[int, str] = {}
+    unmatched = []
+    for i, tg in enumerate(target_groups):
+        service_name = _match_service(tg['name'], index)
+        if service_name is None:
+            unmatched.append(i)
+        else:
+            matched[i] = service_name
+
+    if unmatched:
+        by_length = sorted(((svc.lower(), svc) for svc in services), key=lambda s: len(s[0]), reverse=True)
+        for i in unmatched:
+            name = target_groups[i]['name'].lower()
+            service_name = next((svc for lowered, svc in by_length if lowered in name), None)
+            if service_name is not None:
+                matched[i] = service_name
+
+    return [(tg, matched[i]) for i, tg in enumerate(target_groups) if i in matched]
+
+
+def _describe_all(call: Callable, result_key: str, **kwargs) -> List[dict]:
+    """Follow Marker/NextMarker pagination of an ELBv2 describe call"""
+    items = []
+    while True:
+        response = call(**kwargs)
+        items.extend(response.get(result_key, []))
+        marker = response.get('NextMarker')
+        if not marker:
+            return items
+        kwargs['Marker'] = marker
+
+
+def _format_rule(rule: dict) -> dict:
+    conditions = []
+    for cond in rule.get('Conditions', []):
+        if cond.get('HostHeaderConfig'):
+            conditions.extend(cond['HostHeaderConfig'].get('Values', []))
+        elif cond.get('PathPatternConfig'):
+            conditions.extend(cond['PathPatternConfig'].get('Values', []))
+
+    target_group_arn = None
+    for action in rule.get('Actions', []):
+        if action['Type'] == 'forward':
+            target_group_arn = action.get('TargetGroupArn')
+
+    return {
+        'priority': rule['Priority'],
+        'conditions': conditions,
+        'targetGroupArn': target_group_arn
+    }
+
+
+def _summarize_health(targets: List[dict]) -> dict:
+    healthy_count = sum(1 for t in targets if t['TargetHealth']['State'] == 'healthy')
+    unhealthy_count = sum(1 for t in targets if t['TargetHealth']['State'] == 'unhealthy')
+    total = len(targets)
+    return {
+        'healthy': healthy_count,
+        'unhealthy': unhealthy_count,
+        'total': total,
+        'status': 'healthy' if healthy_count == total and total > 0 else 'unhealthy' if unhealthy_count > 0 else 'unknown'
+    }
 
 
 class ALBProvider(LoadBalancerProvider):
@@ -23,6 +134,10 @@ class ALBProvider(LoadBalancerProvider):
     1. If alb_arns provided, use them
     2. If discovery_tags provided, find ALB by tags
     3. If ingress_hostname provided (EKS), find ALB by DNS name from Ingress
+
+    Listeners, rules and target health are fetched concurrently (bounded per
+    account). Rules/target groups and target health are cached separately
+    (alb-rules and alb-target-health TTLs).
     """
 
     def __init__(self, config: DashboardConfig, project: str):
@@ -96,6 +211,64 @@ class ALBProvider(LoadBalancerProvider):
             print(f"DNS-based ALB discovery failed: {e}")
             return None
 
+    def _get_layout(self, env: str, elbv2, account_id: str, alb_arn: str) -> dict:
+        """Listeners, 443 listener rules and target groups of an ALB (cached, alb-rules TTL)"""
+        def fetch():
+            listeners, target_groups = run_concurrent(
+                lambda: _describe_all(elbv2.describe_listeners, 'Listeners', LoadBalancerArn=alb_arn),
+                lambda: _describe_all(elbv2.describe_target_groups, 'TargetGroups', LoadBalancerArn=alb_arn),
+                account_id=account_id,
+            )
+            https_listeners = [l['ListenerArn'] for l in listeners if l['Port'] == 443]
+            rule_sets = map_concurrent(
+                lambda arn: _describe_all(elbv2.describe_rules, 'Rules', ListenerArn=arn),
+                https_listeners,
+                account_id=account_id,
+            )
+            return {
+                'listeners': [
+                    {'arn': l['ListenerArn'], 'port': l['Port'], 'protocol': l['Protocol']}
+                    for l in listeners
+                ],
+                'rules': [
+                    _format_rule(rule)
+                    for rules in rule_sets
+                    for rule in rules
+                    if not rule['IsDefault']
+                ],
+                'targetGroups': [
+                    {
+                        'name': tg['TargetGroupName'],
+                        'arn': tg['TargetGroupArn'],
+                        'port': tg['Port'],
+                        'protocol': tg['Protocol'],
+                        'targetType': tg.get('TargetType', 'instance'),
+                        'healthCheckPath': tg.get('HealthCheckPath', '/'),
+                    }
+                    for tg in target_groups
+                ],
+            }
+
+        layout, _ = fetch_with_cache('alb-rules', self.project, env, {'albArn': alb_arn}, fetch)
+        return layout
+
+    def _get_target_health(self, env: str, elbv2, account_id: str, alb_arn: str, tg_arns: List[str]) -> Dict[str, dict]:
+        """Health summary per target group ARN (cached, alb-target-health TTL)"""
+        if not tg_arns:
+            return {}
+
+        def fetch():
+            descriptions = map_concurrent(
+                lambda arn: elbv2.describe_target_health(TargetGroupArn=arn).get('TargetHealthDescriptions', []),
+                tg_arns,
+                account_id=account_id,
+            )
+            return {arn: _summarize_health(targets) for arn, targets in zip(tg_arns, descriptions)}
+
+        params = {'albArn': alb_arn, 'targetGroups': sorted(tg_arns)}
+        health, _ = fetch_with_cache('alb-target-health', self.project, env, params, fetch)
+        return health
+
     def get_load_balancer(
         self,
         env: str,
@@ -172,77 +345,27 @@ class ALBProvider(LoadBalancerProvider):
                 )
             }
 
-            # Listeners
-            listeners = elbv2.describe_listeners(LoadBalancerArn=alb_arn)
-            for listener in listeners.get('Listeners', []):
-                listener_arn = listener['ListenerArn']
-                alb_info['listeners'].append({
-                    'arn': listener_arn,
-                    'port': listener['Port'],
-                    'protocol': listener['Protocol']
-                })
+            layout = self._get_layout(env, elbv2, account_id, alb_arn)
+            alb_info['listeners'] = layout['listeners']
+            alb_info['rules'] = layout['rules']
+
+            # Target Groups - keep those belonging to our services when filtering
+            if services:
+                # Skip target groups that don't match any of our services if filtering
+                target_groups = _match_target_groups(layout['targetGroups'], services)
+            else:
+                target_groups = [(tg, None) for tg in layout['targetGroups']]
 
-                if listener['Port'] == 443:
-                    rules = elbv2.describe_rules(ListenerArn=listener_arn)
-                    for rule in rules.get('Rules', []):
-                        if rule['IsDefault']:
-                            continue
-                        conditions = []
-                        for cond in rule.get('Conditions', []):
-                            if cond.get('HostHeaderConfig'):
-                                conditions.extend(cond['HostHeaderConfig'].get('Values', []))
-                            elif cond.get('PathPatternConfig'):
-                                conditions.extend(cond['PathPatternConfig'].get('Values', []))
-
-                        target_group_arn = None
-                        for action in rule.get('Actions', []):
-                            if action['Type'] == 'forward':
-                                target_group_arn = action.get('TargetGroupArn')
-
-                        alb_info['rules'].append({
-                            'priority': rule['Priority'],
-                            'conditions': conditions,
-                            'targetGroupArn': target_group_arn
-                        })
-
-            # Target Groups - get all for this ALB
-            tgs = elbv2.describe_target_groups(LoadBalancerArn=alb_arn)
-            services_to_match = services if services else None
-
-            for tg in tgs.get('TargetGroups', []):
-                tg_arn = tg['TargetGroupArn']
-                tg_name = tg['TargetGroupName']
-
-                # Detect which service this target group belongs to
-                service_name = None
-                if services_to_match:
-                    for svc in services_to_match:
-                        if svc in tg_name.lower():
-                            service_name = svc
-                            break
-                    # Skip target groups that don't match any of our services if filtering
-                    if service_name is None:
-                        continue
-
-                health = elbv2.describe_target_health(TargetGroupArn=tg_arn)
-                healthy_count = sum(1 for t in health.get('TargetHealthDescriptions', []) if t['TargetHealth']['State'] == 'healthy')
-                unhealthy_count = sum(1 for t in health.get('TargetHealthDescriptions', []) if t['TargetHealth']['State'] == 'unhealthy')
-                total = len(health.get('TargetHealthDescriptions', []))
+            health_by_arn = self._get_target_health(
+                env, elbv2, account_id, alb_arn, [tg['arn'] for tg, _ in target_groups]
+            )
 
+            for tg, service_name in target_groups:
+                tg_arn = tg['arn']
                 alb_info['targetGroups'].append({
-                    'name': tg_name,
-                    'arn': tg_arn,
-                    'port': tg['Port'],
-                    'protocol': tg['Protocol'],
-                    'targetType': tg.get('TargetType', 'instance'),
-                    'healthCheckPath': tg.get('HealthCheckPath', '/'),
+                    **tg,
                     'service': service_name,
-                    'health': {
-                        'healthy': healthy_count,
-                        'unhealthy': unhealthy_count,
-                        'total': total,
-                        'status': 'healthy' if healthy_count == total and total > 0 else 'unhealthy' if unhealthy_count > 0 else 'unknown'
-                    },
+                    'health': health_by_arn.get(tg_arn) or _summarize_health([]),
                     'consoleUrl': build_sso_console_url(
                         self.config.sso_portal_url, account_id,
                         f"https://{region}.console.aws.amazon.com/ec2/home?region={region}#TargetGroup:targetGroupArn={quote(tg_arn, safe='')}"
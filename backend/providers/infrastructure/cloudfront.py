@@ -5,15 +5,18 @@ Supports:
 - Explicit distribution IDs
 - Tag-based discovery
 - Domain alias filtering
+
+Discovery uses a cached per-account alias/tag index (see cloudfront_index).
 """
 
 import time
 from urllib.parse import quote
-from typing import List, Optional, Dict
+from typing import List, Dict
 
 from providers.base import CDNProvider, ProviderFactory
 from app_config import DashboardConfig
 from utils.aws import get_cross_account_client, get_action_client, build_sso_console_url
+from providers.infrastructure.cloudfront_index import CloudFrontIndex, load_index, save_index
 
 
 class CloudFrontProvider(CDNProvider):
@@ -24,6 +27,9 @@ class CloudFrontProvider(CDNProvider):
     1. If distribution_ids provided, use them
     2. If discovery_tags provided, find distributions by tags
     3. If domain_patterns provided, match aliases
+
+    Tag and alias lookups go through the per-account CloudFrontIndex instead
+    of listing distributions on every request.
     """
 
     def __init__(self, config: DashboardConfig, project: str):
@@ -52,48 +58,15 @@ class CloudFrontProvider(CDNProvider):
             project=self.project, env=env
         )
 
-    def _find_distribution_by_tags(self, env: str, discovery_tags: Dict[str, str]) -> List[str]:
-        """Find CloudFront distribution IDs by tags (returns all matching)"""
-        if not discovery_tags:
-            return []
-
+    def _get_index(self, env: str, cloudfront) -> CloudFrontIndex:
+        """Alias/tag index of the environment's account (see cloudfront_index)"""
+        env_config = self.config.get_environment(self.project, env)
         try:
             tagging = self._get_resourcegroupstaggingapi_client(env)
-
-            # Build tag filters
-            tag_filters = [{'Key': k, 'Values': [v]} for k, v in discovery_tags.items()]
-
-            response = tagging.get_resources(
-                ResourceTypeFilters=['cloudfront:distribution'],
-                TagFilters=tag_filters
-            )
-
-            # Return all matching distribution IDs
-            dist_ids = []
-            for resource in response.get('ResourceTagMappingList', []):
-                arn = resource['ResourceARN']
-                # ARN format: arn:aws:cloudfront::account:distribution/DIST_ID
-                dist_id = arn.split('/')[-1]
-                dist_ids.append(dist_id)
-
-            return dist_ids
         except Exception as e:
-            print(f"Tag-based CloudFront discovery failed: {e}")
-            return []
-
-    def _find_distribution_by_domain(self, env: str, cloudfront, domain_patterns: List[str]) -> Optional[dict]:
-        """Find CloudFront distribution by domain aliases"""
-        try:
-            distributions = cloudfront.list_distributions()
-            for dist in distributions.get('DistributionList', {}).get('Items', []):
-                aliases = dist.get('Aliases', {}).get('Items', [])
-                for pattern in domain_patterns:
-                    if any(pattern in alias for alias in aliases):
-                        return dist
-            return None
-        except Exception as e:
-            print(f"Domain-based CloudFront discovery failed: {e}")
-            return None
+            print(f"Tagging client unavailable, CloudFront index built without tags: {e}")
+            tagging = None
+        return load_index(env_config.account_id, cloudfront, tagging)
 
     def get_distribution(
         self,
@@ -120,6 +93,7 @@ class CloudFrontProvider(CDNProvider):
 
         try:
             cloudfront = self._get_cloudfront_client(env)
+            index = self._get_index(env, cloudfront)
             dist_ids = []
             discovery_method = None
 
@@ -130,23 +104,23 @@ class CloudFrontProvider(CDNProvider):
 
             # 2. Try tag-based discovery (returns all matching)
             if not dist_ids and discovery_tags:
-                dist_ids = self._find_distribution_by_tags(env, discovery_tags)
+                dist_ids = index.find_by_tags(discovery_tags)
                 if dist_ids:
                     discovery_method = 'tags'
 
             # 3. Try domain patterns (single distribution)
             if not dist_ids and domain_patterns:
-                dist = self._find_distribution_by_domain(env, cloudfront, domain_patterns)
-                if dist:
-                    dist_ids = [dist['Id']]
+                dist_id = index.find_by_alias_patterns(domain_patterns)
+                if dist_id:
+                    dist_ids = [dist_id]
                     discovery_method = 'domain'
 
             if not dist_ids:
                 return None
 
-            # Fetch all distributions in one call
-            distributions_list = cloudfront.list_distributions()
-            all_dists = {d['Id']: d for d in distributions_list.get('DistributionList', {}).get('Items', [])}
+            # Config details (cache behaviors, WAF) are read once per distribution version
+            if index.ensure_details(cloudfront, dist_ids):
+                save_index(index)
 
             # Build result for each distribution
             results = []
@@ -155,23 +129,24 @@ class CloudFrontProvider(CDNProvider):
             statuses = set()
 
             for dist_id in dist_ids:
-                dist = all_dists.get(dist_id)
+                dist = index.get(dist_id)
                 if not dist:
                     continue
 
-                aliases = dist.get('Aliases', {}).get('Items', [])
+                aliases = dist['aliases']
                 all_aliases.extend(aliases)
-                statuses.add(dist['Status'])
+                statuses.add(dist['status'])
+                detail = dist.get('detail') or {}
 
                 dist_result = {
                     'id': dist_id,
-                    'domainName': dist['DomainName'],
+                    'domainName': dist['domainName'],
                     'aliases': aliases,
-                    'status': dist['Status'],
-                    'enabled': dist['Enabled'],
+                    'status': dist['status'],
+                    'enabled': dist['enabled'],
                     'origins': [],
-                    'cacheBehaviors': [],
-                    'webAclId': None,
+                    'cacheBehaviors': list(detail.get('cacheBehaviors', [])),
+                    'webAclId': detail.get('webAclId'),
                     'consoleUrl': build_sso_console_url(
                         self.config.sso_portal_url,
                         env_config.account_id,
@@ -180,53 +155,18 @@ class CloudFrontProvider(CDNProvider):
                 }
 
                 # Get origins
-                for origin in dist.get('Origins', {}).get('Items', []):
-                    origin_domain = origin['DomainName']
+                for origin in dist['origins']:
+                    origin_domain = origin['domainName']
                     origin_type = 'alb' if 'elb.amazonaws.com' in origin_domain else 's3' if 's3.' in origin_domain else 'custom'
                     origin_info = {
-                        'id': origin['Id'],
+                        'id': origin['id'],
                         'domainName': origin_domain,
                         'type': origin_type,
-                        'path': origin.get('OriginPath', '')
+                        'path': origin['path']
                     }
                     dist_result['origins'].append(origin_info)
                     all_origins.append(origin_info)
 
-                # Get full distribution config for more details
-                try:
-                    dist_config = cloudfront.get_distribution(Id=dist_id)
-                    dist_detail = dist_config.get('Distribution', {}).get('DistributionConfig', {})
-
-                    # WAF Web ACL
-                    web_acl = dist_detail.get('WebACLId', '')
-                    if web_acl:
-                        dist_result['webAclId'] = web_acl
-
-                    # Default cache behavior
-                    default_behavior = dist_detail.get('DefaultCacheBehavior', {})
-                    if default_behavior:
-                        dist_result['cacheBehaviors'].append({
-                            'pathPattern': 'Default (*)',
-                            'targetOriginId': default_behavior.get('TargetOriginId'),
-                            'viewerProtocolPolicy': default_behavior.get('ViewerProtocolPolicy'),
-                            'defaultTTL': default_behavior.get('DefaultTTL', 0),
-                            'compress': default_behavior.get('Compress', False),
-                            'lambdaEdge': len(default_behavior.get('LambdaFunctionAssociations', {}).get('Items', [])) > 0
-                        })
-
-                    # Additional cache behaviors
-                    for behavior in dist_detail.get('CacheBehaviors', {}).get('Items', []):
-                        dist_result['cacheBehaviors'].append({
-                            'pathPattern': behavior.get('PathPattern'),
-                            'targetOriginId': behavior.get('TargetOriginId'),
-                            'viewerProtocolPolicy': behavior.get('ViewerProtocolPolicy'),
-                            'defaultTTL': behavior.get('DefaultTTL', 0),
-                            'compress': behavior.get('Compress', False),
-                            'lambdaEdge': len(behavior.get('LambdaFunctionAssociations', {}).get('Items', [])) > 0
-                        })
-                except:
-                    pass
-
                 results.append(dist_result)
 
             # Single distribution: return directly (backward compatible)
@@ -0,0 +1,272 @@
+"""
+Per-account CloudFront index: alias -> distribution and tag -> distributions.
+
+Built from a fully paginated `list_distributions` walk (Marker/NextMarker)
+plus a paginated Resource Groups Tagging API listing, and persisted in the
+cache table (`cloudfront-index` TTL). Once older than the
+`cloudfront-index-refresh` interval it is rebuilt: CloudFront has no
+changed-since listing, so every refresh walks all the listing pages again.
+Only the distribution configs (cache behaviors, WAF) carry over: they are
+kept alongside the ETag they were read at and re-read only for
+distributions whose LastModifiedTime changed.
+
+Usage:
+    index = load_index(account_id, cloudfront, tagging)
+    index.find_by_tags({'Environment': 'stg'})
+    index.find_by_alias_patterns(['fr', 'back'])
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from cache.policies import get_ttl
+from cache.shared import get_cache_backend, refresh_requested
+from utils.concurrency import map_concurrent
+
+
+INDEX_VERSION = 1
+
+
+def _index_key(account_id: str) -> Dict[str, str]:
+    return {'pk': f"ACCOUNT#{account_id}", 'sk': 'cloudfront-index'}
+
+
+def _summarize(dist: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the list_distributions fields the provider uses (bounds item size)."""
+    return {
+        'id': dist['Id'],
+        'arn': dist.get('ARN'),
+        'domainName': dist['DomainName'],
+        'aliases': dist.get('Aliases', {}).get('Items', []),
+        'status': dist['Status'],
+        'enabled': dist['Enabled'],
+        'lastModified': str(dist.get('LastModifiedTime', '')),
+        'origins': [
+            {
+                'id': origin['Id'],
+                'domainName': origin['DomainName'],
+                'path': origin.get('OriginPath', ''),
+            }
+            for origin in dist.get('Origins', {}).get('Items', [])
+        ],
+    }
+
+
+def _tag_key(key: str, value: str) -> str:
+    return f"{key}={value}"
+
+
+class CloudFrontIndex:
+    """Alias and tag lookups over an account's distributions (dictionary hits)."""
+
+    def __init__(self, account_id: str, distributions: Dict[str, Dict[str, Any]],
+                 tags: Dict[str, List[str]], refreshed_at: float):
+        self.account_id = account_id
+        self.distributions = distributions
+        self.tags = tags
+        self.refreshed_at = refreshed_at
+        self._build_lookups()
+
+    def _build_lookups(self) -> None:
+        # alias -> id, and every leading label sequence of an alias -> ids
+        # ('fr.stg.example.com' is reachable as 'fr', 'fr.stg', ...)
+        self.aliases: Dict[str, str] = {}
+        self.alias_prefixes: Dict[str, List[str]] = {}
+        for dist_id, dist in self.distributions.items():
+            for alias in dist['aliases']:
+                alias = alias.lower()
+                self.aliases[alias] = dist_id
+                labels = alias.split('.')
+                for i in range(1, len(labels) + 1):
+                    ids = self.alias_prefixes.setdefault('.'.join(labels[:i]), [])
+                    if dist_id not in ids:
+                        ids.append(dist_id)
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def get(self, dist_id: str) -> Optional[Dict[str, Any]]:
+        return self.distributions.get(dist_id)
+
+    def find_by_alias(self, alias: str) -> Optional[str]:
+        return self.aliases.get(alias.lower())
+
+    def find_by_alias_patterns(self, patterns: Iterable[str]) -> Optional[str]:
+        """First distribution with an alias matching one of the domain patterns."""
+        patterns = [p.lower() for p in patterns if p]
+        for pattern in patterns:
+            ids = self.alias_prefixes.get(pattern)
+            if ids:
+                return ids[0]
+        # Patterns that aren't a leading label sequence (e.g. 'stg.example')
+        for pattern in patterns:
+            for alias, dist_id in self.aliases.items():
+                if pattern in alias:
+                    return dist_id
+        return None
+
+    def find_by_tags(self, tags: Dict[str, str]) -> List[str]:
+        """Distributions carrying all the given tags."""
+        matches: Optional[set] = None
+        for key, value in tags.items():
+            ids = set(self.tags.get(_tag_key(key, value), []))
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return []
+        return sorted(matches or [])
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            'version': INDEX_VERSION,
+            'accountId': self.account_id,
+            'refreshedAt': self.refreshed_at,
+            'distributions': self.distributions,
+            'tags': self.tags,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> Optional['CloudFrontIndex']:
+        if not isinstance(payload, dict) or payload.get('version') != INDEX_VERSION:
+            return None
+        return cls(
+            payload['accountId'],
+            payload.get('distributions', {}),
+            payload.get('tags', {}),
+            payload.get('refreshedAt', 0),
+        )
+
+    def is_stale(self) -> bool:
+        return time.time() - self.refreshed_at > get_ttl('cloudfront-index-refresh')
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, account_id: str, cloudfront, tagging,
+              previous: Optional['CloudFrontIndex'] = None) -> 'CloudFrontIndex':
+        """
+        Build the index from the CloudFront and tagging APIs.
+
+        Config details read for a previous version of a distribution are kept
+        when its LastModifiedTime is unchanged.
+        """
+        distributions = {}
+        kwargs: Dict[str, Any] = {}
+        while True:
+            page = cloudfront.list_distributions(**kwargs).get('DistributionList', {})
+            for dist in page.get('Items', []):
+                summary = _summarize(dist)
+                known = previous.get(summary['id']) if previous else None
+                if known and known.get('lastModified') == summary['lastModified'] and 'detail' in known:
+                    summary['detail'] = known['detail']
+                    summary['etag'] = known.get('etag')
+                distributions[summary['id']] = summary
+            if not page.get('IsTruncated'):
+                break
+            kwargs['Marker'] = page['NextMarker']
+
+        tags: Dict[str, List[str]] = {}
+        if tagging is not None:
+            try:
+                paginator = tagging.get_paginator('get_resources')
+                for page in paginator.paginate(ResourceTypeFilters=['cloudfront:distribution']):
+                    for resource in page.get('ResourceTagMappingList', []):
+                        # ARN format: arn:aws:cloudfront::account:distribution/DIST_ID
+                        dist_id = resource['ResourceARN'].split('/')[-1]
+                        for tag in resource.get('Tags', []):
+                            tags.setdefault(_tag_key(tag['Key'], tag['Value']), []).append(dist_id)
+            except Exception as e:
+                print(f"Tag-based CloudFront discovery failed: {e}")
+                if previous is not None:
+                    tags = previous.tags
+
+        return cls(account_id, distributions, tags, time.time())
+
+    def ensure_details(self, cloudfront, dist_ids: List[str]) -> bool:
+        """
+        Read the config (cache behaviors, WAF) of distributions that have none
+        for their current version. Returns True when the index changed.
+        """
+        missing = [d for d in dist_ids if d in self.distributions and 'detail' not in self.distributions[d]]
+        if not missing:
+            return False
+
+        def fetch(dist_id: str):
+            try:
+                response = cloudfront.get_distribution(Id=dist_id)
+            except Exception as e:
+                print(f"CloudFront get_distribution failed for {dist_id}: {e}")
+                return dist_id, None, None
+            config = response.get('Distribution', {}).get('DistributionConfig', {})
+            return dist_id, response.get('ETag'), _extract_detail(config)
+
+        changed = False
+        for dist_id, etag, detail in map_concurrent(fetch, missing, account_id=self.account_id):
+            if detail is not None:
+                self.distributions[dist_id]['detail'] = detail
+                self.distributions[dist_id]['etag'] = etag
+                changed = True
+        return changed
+
+
+def _behavior(behavior: Dict[str, Any], path_pattern: str) -> Dict[str, Any]:
+    return {
+        'pathPattern': path_pattern,
+        'targetOriginId': behavior.get('TargetOriginId'),
+        'viewerProtocolPolicy': behavior.get('ViewerProtocolPolicy'),
+        'defaultTTL': behavior.get('DefaultTTL', 0),
+        'compress': behavior.get('Compress', False),
+        'lambdaEdge': len(behavior.get('LambdaFunctionAssociations', {}).get('Items', [])) > 0
+    }
+
+
+def _extract_detail(config: Dict[str, Any]) -> Dict[str, Any]:
+    behaviors = []
+    default_behavior = config.get('DefaultCacheBehavior', {})
+    if default_behavior:
+        behaviors.append(_behavior(default_behavior, 'Default (*)'))
+    for behavior in config.get('CacheBehaviors', {}).get('Items', []):
+        behaviors.append(_behavior(behavior, behavior.get('PathPattern')))
+    return {
+        'webAclId': config.get('WebACLId') or None,
+        'cacheBehaviors': behaviors,
+    }
+
+
+def save_index(index: CloudFrontIndex) -> None:
+    cache = get_cache_backend()
+    if cache is None:
+        return
+    key = _index_key(index.account_id)
+    try:
+        cache.set(key['pk'], key['sk'], index.to_payload(), get_ttl('cloudfront-index'))
+    except Exception as e:
+        print(f"Failed to persist CloudFront index for {index.account_id}: {e}")
+
+
+def load_index(account_id: str, cloudfront, tagging) -> CloudFrontIndex:
+    """
+    Get the account's index from the cache table, building or refreshing it
+    when missing, stale, or when the request forces a refresh.
+    """
+    cache = get_cache_backend()
+    key = _index_key(account_id)
+    index = None
+    if cache is not None:
+        try:
+            index = CloudFrontIndex.from_payload(cache.get(key['pk'], key['sk']))
+        except Exception as e:
+            print(f"Failed to load CloudFront index for {account_id}: {e}")
+
+    if index is not None and not index.is_stale() and not refresh_requested():
+        return index
+
+    index = CloudFrontIndex.build(account_id, cloudfront, tagging, previous=index)
+    save_index(index)
+    return index
@@ -2,11 +2,12 @@
 AWS ElastiCache Provider implementation.
 """
 
-from typing import List
+from typing import List, Optional
 
 from providers.base import CacheProvider, ProviderFactory
 from app_config import DashboardConfig
 from utils.aws import get_cross_account_client, build_sso_console_url
+from providers.infrastructure.tag_discovery import get_tagged_resources
 
 
 def matches_discovery_tags(resource_tags: list, discovery_tags: dict) -> bool:
@@ -81,99 +82,113 @@ class ElastiCacheProvider(CacheProvider):
             return None
 
         try:
-            clusters = elasticache.describe_cache_clusters(ShowCacheNodeInfo=True)
-            for cluster in clusters.get('CacheClusters', []):
-                cluster_id = cluster['CacheClusterId']
-                if cluster_ids and cluster_id not in cluster_ids:
-                    continue
+            cluster = self._find_cluster(env, elasticache, discovery_tags, cluster_ids)
+            if not cluster:
+                return None
 
-                # Get ElastiCache tags and check if they match discovery_tags
-                try:
-                    cluster_arn = cluster['ARN']
-                    tag_response = elasticache.list_tags_for_resource(ResourceName=cluster_arn)
-                    cache_tags = tag_response.get('TagList', [])
-                except Exception:
-                    cache_tags = []
-
-                if cluster_ids:
-                    tags_match = True
-                else:
-                    tags_match = matches_discovery_tags(cache_tags, discovery_tags)
-                    if not tags_match:
-                        continue
-
-                # Get replication group info if available
-                repl_group_id = cluster.get('ReplicationGroupId')
-                repl_group_info = None
-                if repl_group_id:
-                    try:
-                        repl_groups = elasticache.describe_replication_groups(ReplicationGroupId=repl_group_id)
-                        if repl_groups.get('ReplicationGroups'):
-                            repl_group_info = repl_groups['ReplicationGroups'][0]
-                    except:
-                        pass
-
-                cache_nodes = cluster.get('CacheNodes', [])
-                endpoint = None
-                if repl_group_info and repl_group_info.get('ConfigurationEndpoint'):
-                    endpoint = repl_group_info['ConfigurationEndpoint']
-                elif repl_group_info and repl_group_info.get('NodeGroups'):
-                    endpoint = repl_group_info['NodeGroups'][0].get('PrimaryEndpoint')
-                elif cache_nodes:
-                    endpoint = cache_nodes[0].get('Endpoint')
-
-                nodes_by_az = {}
-                for node in cache_nodes:
-                    az = node.get('CustomerAvailabilityZone') or cluster.get('PreferredAvailabilityZone')
-                    if az:
-                        if az not in nodes_by_az:
-                            nodes_by_az[az] = []
-                        nodes_by_az[az].append({
-                            'id': node.get('CacheNodeId'),
-                            'status': node.get('CacheNodeStatus'),
-                            'endpoint': node.get('Endpoint', {}).get('Address')
-                        })
-
-                multi_az = False
-                if repl_group_info:
-                    multi_az = repl_group_info.get('MultiAZ', 'disabled') == 'enabled'
-                    if not multi_az and len(nodes_by_az) > 1:
-                        multi_az = True
-
-                return {
-                    'clusterId': cluster_id,
-                    'replicationGroupId': repl_group_id,
-                    'engine': cluster['Engine'],
-                    'engineVersion': cluster['EngineVersion'],
-                    'cacheNodeType': cluster['CacheNodeType'],
-                    'status': cluster['CacheClusterStatus'],
-                    'numCacheNodes': cluster.get('NumCacheNodes', 0),
-                    'multiAz': multi_az,
-                    'nodesByAz': nodes_by_az,
-                    'endpoint': {
-                        'address': endpoint.get('Address') if endpoint else None,
-                        'port': endpoint.get('Port') if endpoint else None
-                    } if endpoint else None,
-                    'preferredAvailabilityZone': cluster.get('PreferredAvailabilityZone'),
-                    'snapshotRetentionLimit': cluster.get('SnapshotRetentionLimit', 0),
-                    'snapshotWindow': cluster.get('SnapshotWindow'),
-                    'maintenanceWindow': cluster.get('PreferredMaintenanceWindow'),
-                    'transitEncryption': cluster.get('TransitEncryptionEnabled', False),
-                    'atRestEncryption': cluster.get('AtRestEncryptionEnabled', False),
-                    'authTokenEnabled': cluster.get('AuthTokenEnabled', False),
-                    'securityGroups': [sg['SecurityGroupId'] for sg in cluster.get('SecurityGroups', [])],
-                    'parameterGroup': cluster.get('CacheParameterGroup', {}).get('CacheParameterGroupName'),
-                    'consoleUrl': build_sso_console_url(
-                        self.config.sso_portal_url, account_id,
-                        f"https://{self.region}.console.aws.amazon.com/elasticache/home?region={self.region}#/redis/{cluster_id}"
-                    )
-                }
+            cluster_id = cluster['CacheClusterId']
 
-            return None
+            # Get replication group info if available
+            repl_group_id = cluster.get('ReplicationGroupId')
+            repl_group_info = None
+            if repl_group_id:
+                try:
+                    repl_groups = elasticache.describe_replication_groups(ReplicationGroupId=repl_group_id)
+                    if repl_groups.get('ReplicationGroups'):
+                        repl_group_info = repl_groups['ReplicationGroups'][0]
+                except:
+                    pass
+
+            cache_nodes = cluster.get('CacheNodes', [])
+            endpoint = None
+            if repl_group_info and repl_group_info.get('ConfigurationEndpoint'):
+                endpoint = repl_group_info['ConfigurationEndpoint']
+            elif repl_group_info and repl_group_info.get('NodeGroups'):
+                endpoint = repl_group_info['NodeGroups'][0].get('PrimaryEndpoint')
+            elif cache_nodes:
+                endpoint = cache_nodes[0].get('Endpoint')
+
+            nodes_by_az = {}
+            for node in cache_nodes:
+                az = node.get('CustomerAvailabilityZone') or cluster.get('PreferredAvailabilityZone')
+                if az:
+                    if az not in nodes_by_az:
+                        nodes_by_az[az] = []
+                    nodes_by_az[az].append({
+                        'id': node.get('CacheNodeId'),
+                        'status': node.get('CacheNodeStatus'),
+                        'endpoint': node.get('Endpoint', {}).get('Address')
+                    })
+
+            multi_az = False
+            if repl_group_info:
+                multi_az = repl_group_info.get('MultiAZ', 'disabled') == 'enabled'
+                if not multi_az and len(nodes_by_az) > 1:
+                    multi_az = True
+
+            return {
+                'clusterId': cluster_id,
+                'replicationGroupId': repl_group_id,
+                'engine': cluster['Engine'],
+                'engineVersion': cluster['EngineVersion'],
+                'cacheNodeType': cluster['CacheNodeType'],
+                'status': cluster['CacheClusterStatus'],
+                'numCacheNodes': cluster.get('NumCacheNodes', 0),
+                'multiAz': multi_az,
+                'nodesByAz': nodes_by_az,
+                'endpoint': {
+                    'address': endpoint.get('Address') if endpoint else None,
+                    'port': endpoint.get('Port') if endpoint else None
+                } if endpoint else None,
+                'preferredAvailabilityZone': cluster.get('PreferredAvailabilityZone'),
+                'snapshotRetentionLimit': cluster.get('SnapshotRetentionLimit', 0),
+                'snapshotWindow': cluster.get('SnapshotWindow'),
+                'maintenanceWindow': cluster.get('PreferredMaintenanceWindow'),
+                'transitEncryption': cluster.get('TransitEncryptionEnabled', False),
+                'atRestEncryption': cluster.get('AtRestEncryptionEnabled', False),
+                'authTokenEnabled': cluster.get('AuthTokenEnabled', False),
+                'securityGroups': [sg['SecurityGroupId'] for sg in cluster.get('SecurityGroups', [])],
+                'parameterGroup': cluster.get('CacheParameterGroup', {}).get('CacheParameterGroupName'),
+                'consoleUrl': build_sso_console_url(
+                    self.config.sso_portal_url, account_id,
+                    f"https://{self.region}.console.aws.amazon.com/elasticache/home?region={self.region}#/redis/{cluster_id}"
+                )
+            }
 
         except Exception as e:
             return {'error': str(e)}
 
+    def _find_cluster(self, env: str, elasticache, discovery_tags: dict = None,
+                      cluster_ids: List[str] = None) -> Optional[dict]:
+        """First cache cluster matching explicit IDs, else the discovery tags"""
+        if cluster_ids:
+            paginator = elasticache.get_paginator('describe_cache_clusters')
+            for page in paginator.paginate(ShowCacheNodeInfo=True):
+                for cluster in page.get('CacheClusters', []):
+                    if cluster['CacheClusterId'] in cluster_ids:
+                        return cluster
+            return None
+
+        # Tags are resolved account-wide in one query (shared, cached tag discovery)
+        tagged = get_tagged_resources(self.config, self.project, env, discovery_tags)
+        candidate_ids = tagged.ids('elasticache:cluster')
+        if not candidate_ids:
+            # Tags set on the replication group only: use its member clusters
+            for group_id in tagged.ids('elasticache:replicationgroup'):
+                groups = elasticache.describe_replication_groups(ReplicationGroupId=group_id)
+                for group in groups.get('ReplicationGroups', []):
+                    candidate_ids.extend(group.get('MemberClusters', []))
+
+        for cluster_id in candidate_ids:
+            try:
+                clusters = elasticache.describe_cache_clusters(CacheClusterId=cluster_id, ShowCacheNodeInfo=True)
+            except Exception as e:
+                print(f"Failed to describe cache cluster {cluster_id}: {e}")
+                continue
+            if clusters.get('CacheClusters'):
+                return clusters['CacheClusters'][0]
+        return None
+
 
 # Register the provider
 ProviderFactory.register_cache_provider('elasticache', ElastiCacheProvider)
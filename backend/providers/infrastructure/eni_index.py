@@ -0,0 +1,285 @@
+"""
+Per-VPC ENI index: exact IP, prefix and CIDR lookups.
+
+Built from a fully paginated `describe_network_interfaces` walk of the VPC.
+Each ENI is summarized once at build time (name, addresses, security groups,
+what it is attached to), then indexed three ways:
+
+- exact IP -> ENI (private, secondary and public addresses)
+- IP strings sorted lexicographically, for prefix queries ("10.0.37.")
+- IP integers sorted numerically, for CIDR queries ("10.0.32.0/20")
+
+The summaries are cached under the `enis` TTL (process memory first, then the
+cache table) and the lookups rebuilt on load, so "what owns 10.0.37.12?"
+is a dictionary hit instead of a describe of every interface in the VPC.
+
+Usage:
+    index = load_eni_index(ec2, account_id, region, project, env, vpc_id)
+    index.search('10.0.37.12')
+"""
+
+import bisect
+import ipaddress
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from cache.policies import get_ttl
+from cache.shared import fetch_with_cache, refresh_requested
+
+
+INDEX_VERSION = 1
+
+
+def parse_eni_attachment(eni: dict) -> dict:
+    """Parse ENI attachment to determine what it's attached to"""
+    attachment = eni.get('Attachment', {})
+    description = eni.get('Description', '')
+    interface_type = eni.get('InterfaceType', 'interface')
+    requester_id = eni.get('RequesterId', '')
+
+    result = {
+        'type': 'unknown',
+        'instanceId': attachment.get('InstanceId'),
+        'status': attachment.get('Status'),
+        'deleteOnTermination': attachment.get('DeleteOnTermination', False)
+    }
+
+    # ECS Task - detect by ARN pattern "arn:aws:ecs:...:attachment/..."
+    if 'arn:aws:ecs:' in description and ':attachment/' in description:
+        result['type'] = 'ecs-task'
+        # Extract attachment ID from ARN
+        result['attachmentId'] = description.split(':attachment/')[-1]
+
+    # ECS Task - older format or interface_type based
+    elif 'ECS' in description or interface_type == 'ecs':
+        result['type'] = 'ecs-task'
+        if 'ecs:task' in description.lower():
+            parts = description.split('/')
+            if len(parts) >= 2:
+                result['cluster'] = parts[-2]
+                result['taskId'] = parts[-1]
+
+    # CloudFront managed ENI
+    elif interface_type == 'cloudfront_managed' or 'CloudFront' in description:
+        result['type'] = 'cloudfront'
+
+    # Lambda
+    elif 'Lambda' in description or 'AWS Lambda' in requester_id:
+        result['type'] = 'lambda'
+        # Extract function name if possible
+        if ':function:' in description:
+            try:
+                result['functionName'] = description.split(':function:')[1].split(':')[0]
+            except IndexError:
+                pass
+
+    # RDS
+    elif 'RDSNetworkInterface' in description or 'rds' in requester_id.lower():
+        result['type'] = 'rds'
+
+    # ElastiCache
+    elif 'ElastiCache' in description or 'elasticache' in requester_id.lower():
+        result['type'] = 'elasticache'
+
+    # EFS mount target
+    elif 'EFS mount target' in description:
+        result['type'] = 'efs'
+
+    # NAT Gateway
+    elif interface_type == 'nat_gateway' or 'NAT Gateway' in description:
+        result['type'] = 'nat-gateway'
+
+    # VPC Endpoint
+    elif interface_type == 'vpc_endpoint' or 'VPC Endpoint' in description:
+        result['type'] = 'vpc-endpoint'
+
+    # ALB/NLB
+    elif 'ELB' in description or 'elb' in requester_id.lower():
+        result['type'] = 'load-balancer'
+        if 'app/' in description:
+            result['loadBalancerType'] = 'application'
+        elif 'net/' in description:
+            result['loadBalancerType'] = 'network'
+
+    # EC2 Instance
+    elif attachment.get('InstanceId'):
+        result['type'] = 'ec2-instance'
+
+    # Gateway Load Balancer Endpoint
+    elif interface_type == 'gateway_load_balancer_endpoint':
+        result['type'] = 'gwlb-endpoint'
+
+    # Interface VPC Endpoint
+    elif interface_type == 'interface':
+        # Check if it's a VPC Endpoint by description
+        if 'vpce-' in description.lower():
+            result['type'] = 'vpc-endpoint'
+
+    return result
+
+
+def summarize_eni(eni: dict) -> dict:
+    """ENI as listed by the network views (without console URL)."""
+    private_ips = [addr.get('PrivateIpAddress') for addr in eni.get('PrivateIpAddresses', []) if addr.get('PrivateIpAddress')]
+    public_ips = [
+        addr['Association']['PublicIp'] for addr in eni.get('PrivateIpAddresses', [])
+        if addr.get('Association', {}).get('PublicIp')
+    ]
+    return {
+        'id': eni['NetworkInterfaceId'],
+        'name': next((t['Value'] for t in eni.get('TagSet', []) if t['Key'] == 'Name'), ''),
+        'description': eni.get('Description', ''),
+        'privateIp': eni.get('PrivateIpAddress', ''),
+        'privateIps': private_ips,
+        'publicIp': eni.get('Association', {}).get('PublicIp'),
+        'publicIps': public_ips,
+        'ipv6Ips': [addr['Ipv6Address'] for addr in eni.get('Ipv6Addresses', []) if addr.get('Ipv6Address')],
+        'subnetId': eni.get('SubnetId'),
+        'az': eni.get('AvailabilityZone'),
+        'status': eni.get('Status'),
+        'type': eni.get('InterfaceType', 'interface'),
+        'attachment': parse_eni_attachment(eni),
+        'securityGroups': [
+            {'id': sg['GroupId'], 'name': sg['GroupName']}
+            for sg in eni.get('Groups', [])
+        ],
+    }
+
+
+def _ip_key(ip: str) -> Optional[Tuple[int, int]]:
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+    return address.version, int(address)
+
+
+class EniIndex:
+    """ENIs of one VPC with exact, prefix and CIDR IP lookups."""
+
+    def __init__(self, vpc_id: str, enis: List[dict], built_at: float):
+        self.vpc_id = vpc_id
+        self.enis: Dict[str, dict] = {eni['id']: eni for eni in enis}
+        self.built_at = built_at
+        self._build_lookups()
+
+    def _build_lookups(self) -> None:
+        self.by_ip: Dict[str, List[str]] = {}
+        self.by_subnet: Dict[str, List[str]] = {}
+        self.by_security_group: Dict[str, List[str]] = {}
+        for eni_id, eni in self.enis.items():
+            addresses = eni['privateIps'] + eni['publicIps'] + eni['ipv6Ips']
+            if eni.get('publicIp'):
+                addresses.append(eni['publicIp'])
+            for ip in addresses:
+                ids = self.by_ip.setdefault(ip, [])
+                if eni_id not in ids:
+                    ids.append(eni_id)
+            if eni.get('subnetId'):
+                self.by_subnet.setdefault(eni['subnetId'], []).append(eni_id)
+            for group in eni['securityGroups']:
+                self.by_security_group.setdefault(group['id'], []).append(eni_id)
+
+        # Sorted views of the address space (each address once)
+        self._ips_text: List[str] = sorted(self.by_ip)
+        numeric = sorted((key, ip) for ip in self.by_ip for key in [_ip_key(ip)] if key)
+        self._ips_numeric: List[Tuple[int, int]] = [key for key, _ in numeric]
+        self._ips_numeric_text: List[str] = [ip for _, ip in numeric]
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def _owners(self, ips: List[str]) -> List[str]:
+        seen = {}
+        for ip in ips:
+            for eni_id in self.by_ip.get(ip, []):
+                seen.setdefault(eni_id, None)
+        return list(seen)
+
+    def find_ip(self, ip: str) -> List[str]:
+        """ENIs holding exactly this address."""
+        return list(self.by_ip.get(ip, []))
+
+    def find_prefix(self, prefix: str) -> List[str]:
+        """ENIs with an address starting with the given text ('10.0.3' matches 10.0.3.x and 10.0.30.x)."""
+        start = bisect.bisect_left(self._ips_text, prefix)
+        end = bisect.bisect_left(self._ips_text, prefix + '\U0010ffff', lo=start)
+        return self._owners(self._ips_text[start:end])
+
+    def find_cidr(self, cidr: str) -> List[str]:
+        """ENIs with an address inside the network."""
+        network = ipaddress.ip_network(cidr, strict=False)
+        low = (network.version, int(network.network_address))
+        high = (network.version, int(network.broadcast_address))
+        start = bisect.bisect_left(self._ips_numeric, low)
+        end = bisect.bisect_right(self._ips_numeric, high, lo=start)
+        return self._owners(self._ips_numeric_text[start:end])
+
+    def search(self, query: str) -> List[str]:
+        """ENI ids matching an exact IP, a CIDR or an address prefix."""
+        query = query.strip()
+        if '/' in query:
+            return self.find_cidr(query)
+        if query in self.by_ip:
+            return self.find_ip(query)
+        return self.find_prefix(query)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            'version': INDEX_VERSION,
+            'vpcId': self.vpc_id,
+            'builtAt': self.built_at,
+            'enis': list(self.enis.values()),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> Optional['EniIndex']:
+        if not isinstance(payload, dict) or payload.get('version') != INDEX_VERSION:
+            return None
+        return cls(payload['vpcId'], payload.get('enis', []), payload.get('builtAt', 0))
+
+    @classmethod
+    def build(cls, ec2, vpc_id: str) -> 'EniIndex':
+        """Index every ENI of the VPC (all describe_network_interfaces pages)."""
+        paginator = ec2.get_paginator('describe_network_interfaces')
+        enis = []
+        for page in paginator.paginate(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]):
+            enis.extend(summarize_eni(eni) for eni in page.get('NetworkInterfaces', []))
+        return cls(vpc_id, enis, time.time())
+
+
+# Process-wide indexes: (account, region, vpc) -> (expires_at, index)
+_indexes: Dict[Tuple[str, str, str], Tuple[float, EniIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def load_eni_index(ec2, account_id: str, region: str, project: str, env: str, vpc_id: str) -> EniIndex:
+    """
+    Get the VPC's ENI index from process memory or the cache table, building
+    it on miss, on expiry (enis TTL) or when the request forces a refresh.
+    """
+    key = (account_id, region, vpc_id)
+    if not refresh_requested():
+        with _indexes_lock:
+            entry = _indexes.get(key)
+        if entry and entry[0] > time.time():
+            return entry[1]
+
+    ttl = get_ttl('enis')
+    payload, _ = fetch_with_cache(
+        'eni-index', project, env,
+        {'accountId': account_id, 'region': region, 'vpcId': vpc_id},
+        lambda: EniIndex.build(ec2, vpc_id).to_payload(),
+        ttl_seconds=ttl,
+    )
+    index = EniIndex.from_payload(payload) or EniIndex.build(ec2, vpc_id)
+
+    with _indexes_lock:
+        _indexes[key] = (index.built_at + ttl, index)
+    return index
@@ -7,6 +7,9 @@ from typing import List, Optional
 from providers.base import NetworkProvider, ProviderFactory
 from app_config import DashboardConfig
 from utils.aws import get_cross_account_client, build_sso_console_url
+from providers.infrastructure.eni_index import load_eni_index
+from providers.infrastructure.reachability import DATASTORE_TYPES, WORKLOAD_TYPES, get_engine
+from providers.infrastructure.vpc_snapshot import VpcSnapshot, load_vpc_snapshot, tag_value
 
 
 class VPCProvider(NetworkProvider):
@@ -72,31 +75,27 @@ class VPCProvider(NetworkProvider):
             print(f"Tag-based VPC discovery failed: {e}")
             return None
 
-    def _resolve_vpc(self, ec2, env: str, vpc_id: str = None, discovery_tags: dict = None) -> tuple:
-        """Resolve VPC using multiple strategies
+    def _load_snapshot(self, env: str, ec2, vpc_id: str, vpc: dict = None) -> VpcSnapshot:
+        """Get the cached (routing TTL) snapshot of a VPC"""
+        env_config = self.config.get_environment(self.project, env)
+        return load_vpc_snapshot(
+            ec2, env_config.account_id, env_config.region, self.project, env, vpc_id, vpc=vpc
+        )
+
+    def _resolve_snapshot(self, ec2, env: str, vpc_id: str = None, discovery_tags: dict = None) -> Optional[VpcSnapshot]:
+        """Resolve the VPC using multiple strategies and return its snapshot
 
         Priority:
         1. Direct vpc_id (from EKS cluster)
         2. Tag-based discovery (discovery_tags)
 
         Returns:
-            Tuple of (vpc_dict, vpc_id, vpc_name) or (None, None, None) if not found
+            VpcSnapshot, or None if no VPC was found
         """
-        vpc = None
-        vpc_name = None
-
         # Strategy 1: Direct VPC ID (typically from EKS cluster)
         if vpc_id:
             try:
-                vpcs = ec2.describe_vpcs(VpcIds=[vpc_id])
-                if vpcs.get('Vpcs'):
-                    vpc = vpcs['Vpcs'][0]
-                    vpc_name = vpc_id  # Default to ID
-                    for tag in vpc.get('Tags', []):
-                        if tag['Key'] == 'Name':
-                            vpc_name = tag['Value']
-                            break
-                    return vpc, vpc_id, vpc_name
+                return self._load_snapshot(env, ec2, vpc_id)
             except Exception as e:
                 print(f"VPC lookup by ID failed: {e}")
 
@@ -104,15 +103,25 @@ class VPCProvider(NetworkProvider):
         if discovery_tags:
             vpc = self._find_vpc_by_tags(ec2, discovery_tags)
             if vpc:
-                vpc_id = vpc['VpcId']
-                vpc_name = vpc_id
-                for tag in vpc.get('Tags', []):
-                    if tag['Key'] == 'Name':
-                        vpc_name = tag['Value']
-                        break
-                return vpc, vpc_id, vpc_name
+                return self._load_snapshot(env, ec2, vpc['VpcId'], vpc=vpc)
+
+        return None
+
+    def _resolve_env_snapshot(self, ec2, env: str) -> Optional[VpcSnapshot]:
+        """Snapshot of the environment's configured VPC (network ids, then tags)"""
+        env_config = self.config.get_environment(self.project, env)
+        infra = getattr(env_config, 'infrastructure', None)
+        if not infra:
+            return None
+        network_cfg = (infra.resources or {}).get('network')
+        vpc_id = network_cfg.ids[0] if network_cfg and network_cfg.ids else None
+        tags = network_cfg.tags if network_cfg and network_cfg.tags else infra.default_tags or None
+        return self._resolve_snapshot(ec2, env, vpc_id, tags)
 
-        return None, None, None
+    def _find_vpc_id_by_name(self, ec2, env: str) -> Optional[str]:
+        """VPC named {project}-{env} (Name tag)"""
+        vpcs = ec2.describe_vpcs(Filters=[{'Name': 'tag:Name', 'Values': [f"{self.project}-{env}"]}])
+        return vpcs['Vpcs'][0]['VpcId'] if vpcs.get('Vpcs') else None
 
     def get_network_info(self, env: str, vpc_id: str = None, discovery_tags: dict = None) -> dict:
         """Get VPC and basic network info (subnets, NAT gateways, connectivity summary)
@@ -130,18 +139,20 @@ class VPCProvider(NetworkProvider):
         ec2 = self._get_ec2_client(env)
 
         # Resolve VPC using multi-strategy approach
-        vpc, vpc_id, vpc_name = self._resolve_vpc(ec2, env, vpc_id, discovery_tags)
-
-        if not vpc:
+        snapshot = self._resolve_snapshot(ec2, env, vpc_id, discovery_tags)
+        if not snapshot:
             return None
 
-        # Get subnets
-        subnets_response = ec2.describe_subnets(
-            Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]
-        )
+        error = snapshot.collection_error('subnets', 'natGateways')
+        if error:
+            return {'error': error}
+
+        vpc = snapshot.vpc
+        vpc_id = snapshot.vpc_id
+        vpc_name = snapshot.vpc_name
 
         subnets_by_az = {}
-        for subnet in subnets_response.get('Subnets', []):
+        for subnet in snapshot.subnets.values():
             az = subnet['AvailabilityZone']
             subnet_name = ''
             subnet_type = 'unknown'
@@ -167,12 +178,11 @@ class VPCProvider(NetworkProvider):
             })
 
         # NAT Gateways
-        nat_gateways = ec2.describe_nat_gateways(
-            Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}, {'Name': 'state', 'Values': ['available']}]
-        )
-
         nat_info = []
-        for nat in nat_gateways.get('NatGateways', []):
+        for nat in snapshot.nat_gateways.values():
+            if nat['State'] != 'available':
+                continue
+
             # Extract public IP from NatGatewayAddresses
             public_ip = None
             for addr in nat.get('NatGatewayAddresses', []):
@@ -202,7 +212,7 @@ class VPCProvider(NetworkProvider):
             })
 
         # Get connectivity summary (lightweight - just counts)
-        connectivity_summary = self._get_connectivity_summary(ec2, vpc_id)
+        connectivity_summary = self._get_connectivity_summary(snapshot)
 
         return {
             'vpcId': vpc_id,
@@ -219,61 +229,22 @@ class VPCProvider(NetworkProvider):
             )
         }
 
-    def _get_connectivity_summary(self, ec2, vpc_id: str) -> dict:
+    def _get_connectivity_summary(self, snapshot: VpcSnapshot) -> dict:
         """Get lightweight connectivity summary (counts only, for main view)"""
-        try:
-            # Count VPC Peerings
-            peerings = ec2.describe_vpc_peering_connections(
-                Filters=[
-                    {'Name': 'status-code', 'Values': ['active']},
-                ]
-            )
-            # Filter for peerings involving this VPC
-            vpc_peerings = [p for p in peerings.get('VpcPeeringConnections', [])
-                          if p.get('AccepterVpcInfo', {}).get('VpcId') == vpc_id
-                          or p.get('RequesterVpcInfo', {}).get('VpcId') == vpc_id]
-
-            # Count VPN Connections
-            vpn_connections = []
-            try:
-                vpn_gateways = ec2.describe_vpn_gateways(
-                    Filters=[{'Name': 'attachment.vpc-id', 'Values': [vpc_id]},
-                             {'Name': 'state', 'Values': ['available']}]
-                )
-                if vpn_gateways.get('VpnGateways'):
-                    vpn_conns = ec2.describe_vpn_connections(
-                        Filters=[{'Name': 'state', 'Values': ['available']}]
-                    )
-                    vpn_connections = [v for v in vpn_conns.get('VpnConnections', [])
-                                      if v.get('VpnGatewayId') in [vg['VpnGatewayId'] for vg in vpn_gateways['VpnGateways']]]
-            except Exception:
-                pass
-
-            # Count Transit Gateway Attachments
-            tgw_attachments = []
-            try:
-                tgw_response = ec2.describe_transit_gateway_vpc_attachments(
-                    Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]},
-                             {'Name': 'state', 'Values': ['available']}]
-                )
-                tgw_attachments = tgw_response.get('TransitGatewayVpcAttachments', [])
-            except Exception:
-                pass
-
-            # Check Internet Gateway
-            igw_response = ec2.describe_internet_gateways(
-                Filters=[{'Name': 'attachment.vpc-id', 'Values': [vpc_id]}]
-            )
-            has_igw = len(igw_response.get('InternetGateways', [])) > 0
-
-            return {
-                'hasInternetGateway': has_igw,
-                'vpcPeeringCount': len(vpc_peerings),
-                'vpnConnectionCount': len(vpn_connections),
-                'transitGatewayCount': len(tgw_attachments)
-            }
-        except Exception as e:
-            return {'error': str(e)}
+        error = snapshot.collection_error('vpcPeerings', 'internetGateways')
+        if error:
+            return {'error': error}
+
+        tgw_attachments = [
+            att for att in snapshot.transit_gateway_attachments.values()
+            if att.get('State') == 'available'
+        ]
+        return {
+            'hasInternetGateway': len(snapshot.internet_gateways) > 0,
+            'vpcPeeringCount': len(snapshot.peerings_of_vpc()),
+            'vpnConnectionCount': len(snapshot.vpn_connections_of_vpc()),
+            'transitGatewayCount': len(tgw_attachments)
+        }
 
     def get_enis(self, env: str, vpc_id: str = None, subnet_id: str = None, search_ip: str = None) -> dict:
         """
@@ -290,67 +261,29 @@ class VPCProvider(NetworkProvider):
         try:
             # Get VPC ID if not provided
             if not vpc_id:
-                vpc_name = f"{self.project}-{env}"
-                vpcs = ec2.describe_vpcs(Filters=[{'Name': 'tag:Name', 'Values': [vpc_name]}])
-                if not vpcs.get('Vpcs'):
-                    return {'error': f'VPC {vpc_name} not found'}
-                vpc_id = vpcs['Vpcs'][0]['VpcId']
+                vpc_id = self._find_vpc_id_by_name(ec2, env)
+                if not vpc_id:
+                    return {'error': f'VPC {self.project}-{env} not found'}
 
-            # Build filters
-            filters = [{'Name': 'vpc-id', 'Values': [vpc_id]}]
-            if subnet_id:
-                filters.append({'Name': 'subnet-id', 'Values': [subnet_id]})
+            index = load_eni_index(ec2, account_id, env_config.region, self.project, env, vpc_id)
 
-            # Fetch ENIs
-            enis_response = ec2.describe_network_interfaces(Filters=filters)
+            if search_ip:
+                eni_ids = index.search(search_ip)
+            elif subnet_id:
+                eni_ids = index.by_subnet.get(subnet_id, [])
+            else:
+                eni_ids = list(index.enis)
 
             enis = []
-            for eni in enis_response.get('NetworkInterfaces', []):
-                # Extract primary private IP
-                private_ip = eni.get('PrivateIpAddress', '')
-
-                # Get all private IPs
-                private_ips = [addr.get('PrivateIpAddress') for addr in eni.get('PrivateIpAddresses', [])]
-
-                # Search filter by IP
-                if search_ip:
-                    match = any(search_ip in ip for ip in private_ips if ip)
-                    if not match:
-                        continue
-
-                # Determine attachment type and details
-                attachment = eni.get('Attachment', {})
-                attachment_info = self._parse_eni_attachment(eni, attachment)
-
-                # Extract name from tags
-                eni_name = ''
-                for tag in eni.get('TagSet', []):
-                    if tag['Key'] == 'Name':
-                        eni_name = tag['Value']
-                        break
-
-                # Get description (often contains attachment info)
-                description = eni.get('Description', '')
-
+            for eni_id in eni_ids:
+                eni = index.enis[eni_id]
+                if subnet_id and eni.get('subnetId') != subnet_id:
+                    continue
                 enis.append({
-                    'id': eni['NetworkInterfaceId'],
-                    'name': eni_name,
-                    'description': description,
-                    'privateIp': private_ip,
-                    'privateIps': private_ips,
-                    'publicIp': eni.get('Association', {}).get('PublicIp'),
-                    'subnetId': eni.get('SubnetId'),
-                    'az': eni.get('AvailabilityZone'),
-                    'status': eni.get('Status'),
-                    'type': eni.get('InterfaceType', 'interface'),
-                    'attachment': attachment_info,
-                    'securityGroups': [
-                        {'id': sg['GroupId'], 'name': sg['GroupName']}
-                        for sg in eni.get('Groups', [])
-                    ],
+                    **eni,
                     'consoleUrl': build_sso_console_url(
                         self.config.sso_portal_url, account_id,
-                        f"https://{self.region}.console.aws.amazon.com/ec2/v2/home?region={self.region}#NetworkInterface:networkInterfaceId={eni['NetworkInterfaceId']}"
+                        f"https://{self.region}.console.aws.amazon.com/ec2/v2/home?region={self.region}#NetworkInterface:networkInterfaceId={eni_id}"
                     )
                 })
 
@@ -368,88 +301,61 @@ class VPCProvider(NetworkProvider):
         except Exception as e:
             return {'error': str(e)}
 
-    def _parse_eni_attachment(self, eni: dict, attachment: dict) -> dict:
-        """Parse ENI attachment to determine what it's attached to"""
-        description = eni.get('Description', '')
-        interface_type = eni.get('InterfaceType', 'interface')
-        requester_id = eni.get('RequesterId', '')
+    def get_reachability(self, env: str, source: str = None, target: str = None,
+                         protocol: str = 'tcp', port: int = None, vpc_id: str = None) -> dict:
+        """
+        Security group reachability between endpoints of the environment VPC.
 
-        result = {
-            'type': 'unknown',
-            'instanceId': attachment.get('InstanceId'),
-            'status': attachment.get('Status'),
-            'deleteOnTermination': attachment.get('DeleteOnTermination', False)
-        }
+        Endpoints are security group IDs, ENI IDs or IP addresses. With both
+        source and target, returns the verdict and the rules allowing each side.
+        Otherwise evaluates every workload -> datastore pair (ECS tasks, EC2
+        instances, Lambdas -> RDS, ElastiCache, EFS), restricted to the given
+        source or target when one is set.
+        """
+        env_config = self.config.get_environment(self.project, env)
+        if not env_config:
+            return {'error': f'Unknown environment: {env}'}
 
-        # ECS Task - detect by ARN pattern "arn:aws:ecs:...:attachment/..."
-        if 'arn:aws:ecs:' in description and ':attachment/' in description:
-            result['type'] = 'ecs-task'
-            # Extract attachment ID from ARN
-            if ':attachment/' in description:
-                result['attachmentId'] = description.split(':attachment/')[-1]
-
-        # ECS Task - older format or interface_type based
-        elif 'ECS' in description or interface_type == 'ecs':
-            result['type'] = 'ecs-task'
-            if 'ecs:task' in description.lower():
-                parts = description.split('/')
-                if len(parts) >= 2:
-                    result['cluster'] = parts[-2] if len(parts) >= 2 else None
-                    result['taskId'] = parts[-1] if parts else None
-
-        # CloudFront managed ENI
-        elif interface_type == 'cloudfront_managed' or 'CloudFront' in description:
-            result['type'] = 'cloudfront'
-
-        # Lambda
-        elif 'Lambda' in description or 'AWS Lambda' in requester_id:
-            result['type'] = 'lambda'
-            # Extract function name if possible
-            if ':function:' in description:
-                try:
-                    result['functionName'] = description.split(':function:')[1].split(':')[0]
-                except IndexError:
-                    pass
-
-        # RDS
-        elif 'RDSNetworkInterface' in description or 'rds' in requester_id.lower():
-            result['type'] = 'rds'
-
-        # ElastiCache
-        elif 'ElastiCache' in description or 'elasticache' in requester_id.lower():
-            result['type'] = 'elasticache'
-
-        # NAT Gateway
-        elif interface_type == 'nat_gateway' or 'NAT Gateway' in description:
-            result['type'] = 'nat-gateway'
-
-        # VPC Endpoint
-        elif interface_type == 'vpc_endpoint' or 'VPC Endpoint' in description:
-            result['type'] = 'vpc-endpoint'
-
-        # ALB/NLB
-        elif 'ELB' in description or 'elb' in requester_id.lower():
-            result['type'] = 'load-balancer'
-            if 'app/' in description:
-                result['loadBalancerType'] = 'application'
-            elif 'net/' in description:
-                result['loadBalancerType'] = 'network'
-
-        # EC2 Instance
-        elif attachment.get('InstanceId'):
-            result['type'] = 'ec2-instance'
-
-        # Gateway Load Balancer Endpoint
-        elif interface_type == 'gateway_load_balancer_endpoint':
-            result['type'] = 'gwlb-endpoint'
-
-        # Interface VPC Endpoint
-        elif interface_type == 'interface':
-            # Check if it's a VPC Endpoint by description
-            if 'vpce-' in description.lower():
-                result['type'] = 'vpc-endpoint'
+        ec2 = self._get_ec2_client(env)
 
-        return result
+        try:
+            if vpc_id:
+                snapshot = self._load_snapshot(env, ec2, vpc_id)
+            else:
+                snapshot = self._resolve_env_snapshot(ec2, env)
+                if not snapshot:
+                    vpc_id = self._find_vpc_id_by_name(ec2, env)
+                    if not vpc_id:
+                        return {'error': f'VPC {self.project}-{env} not found'}
+                    snapshot = self._load_snapshot(env, ec2, vpc_id)
+
+            error = snapshot.collection_error('securityGroups')
+            if error:
+                return {'error': error}
+
+            index = load_eni_index(ec2, env_config.account_id, env_config.region, self.project, env, snapshot.vpc_id)
+            engine = get_engine(snapshot.vpc_id, snapshot.security_groups, index.enis,
+                                snapshot.fetched_at, index.built_at)
+
+            if source and target:
+                return {
+                    'vpcId': snapshot.vpc_id,
+                    **engine.check(engine.endpoint(source), engine.endpoint(target), protocol, port),
+                }
+
+            sources = [engine.endpoint(source)] if source else engine.endpoints_of_types(WORKLOAD_TYPES)
+            targets = [engine.endpoint(target)] if target else engine.endpoints_of_types(DATASTORE_TYPES)
+            return {
+                'vpcId': snapshot.vpc_id,
+                'protocol': protocol if port is not None else None,
+                'port': port,
+                'sources': [endpoint.to_dict() for endpoint in sources],
+                'targets': [endpoint.to_dict() for endpoint in targets],
+                'pairs': engine.all_pairs(sources, targets, protocol if port is not None else None, port),
+            }
+
+        except Exception as e:
+            return {'error': str(e)}
 
     def get_routing_details(self, env: str, service_security_groups: List[str] = None,
                             vpc_id: str = None, discovery_tags: dict = None) -> dict:
@@ -469,10 +375,11 @@ class VPCProvider(NetworkProvider):
         ec2 = self._get_ec2_client(env)
 
         # Resolve VPC using multi-strategy approach
-        vpc, vpc_id, vpc_name = self._resolve_vpc(ec2, env, vpc_id, discovery_tags)
-        if not vpc:
+        snapshot = self._resolve_snapshot(ec2, env, vpc_id, discovery_tags)
+        if not snapshot:
             return {'error': f'VPC not found for {self.project}-{env}'}
 
+        vpc_id = snapshot.vpc_id
         result = {
             'vpcId': vpc_id,
             'routing': {},
@@ -482,12 +389,13 @@ class VPCProvider(NetworkProvider):
 
         # ===== ROUTING =====
         try:
-            # Get Internet Gateway
-            igw_response = ec2.describe_internet_gateways(
-                Filters=[{'Name': 'attachment.vpc-id', 'Values': [vpc_id]}]
-            )
-            if igw_response.get('InternetGateways'):
-                igw = igw_response['InternetGateways'][0]
+            error = snapshot.collection_error('internetGateways', 'routeTables', 'vpcEndpoints')
+            if error:
+                raise RuntimeError(error)
+
+            # Internet Gateway
+            if snapshot.internet_gateways:
+                igw = next(iter(snapshot.internet_gateways.values()))
                 igw_name = next((t['Value'] for t in igw.get('Tags', []) if t['Key'] == 'Name'), '')
                 result['routing']['internetGateway'] = {
                     'id': igw['InternetGatewayId'],
@@ -499,12 +407,9 @@ class VPCProvider(NetworkProvider):
                     )
                 }
 
-            # Get Route Tables
-            rt_response = ec2.describe_route_tables(
-                Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]
-            )
+            # Route Tables
             route_tables = []
-            for rt in rt_response.get('RouteTables', []):
+            for rt in snapshot.route_tables.values():
                 rt_name = next((t['Value'] for t in rt.get('Tags', []) if t['Key'] == 'Name'), '')
 
                 # Get subnet associations
@@ -571,12 +476,9 @@ class VPCProvider(NetworkProvider):
 
             result['routing']['routeTables'] = route_tables
 
-            # Get VPC Endpoints
-            endpoints_response = ec2.describe_vpc_endpoints(
-                Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]
-            )
+            # VPC Endpoints
             vpc_endpoints = []
-            for ep in endpoints_response.get('VpcEndpoints', []):
+            for ep in snapshot.vpc_endpoints.values():
                 ep_name = next((t['Value'] for t in ep.get('Tags', []) if t['Key'] == 'Name'), '')
                 service_name = ep.get('ServiceName', '')
 
@@ -622,19 +524,16 @@ class VPCProvider(NetworkProvider):
 
         # ===== CONNECTIVITY (VPC Peering, VPN, TGW) =====
         try:
-            # VPC Peering Connections
-            peerings = ec2.describe_vpc_peering_connections(
-                Filters=[{'Name': 'status-code', 'Values': ['active']}]
-            )
+            error = snapshot.collection_error('vpcPeerings')
+            if error:
+                raise RuntimeError(error)
+
+            # VPC Peering Connections involving this VPC
             vpc_peerings = []
-            for p in peerings.get('VpcPeeringConnections', []):
+            for p in snapshot.peerings_of_vpc():
                 accepter = p.get('AccepterVpcInfo', {})
                 requester = p.get('RequesterVpcInfo', {})
 
-                # Check if this VPC is involved
-                if accepter.get('VpcId') != vpc_id and requester.get('VpcId') != vpc_id:
-                    continue
-
                 # Determine peer VPC info
                 peer_vpc = accepter if requester.get('VpcId') == vpc_id else requester
                 p_name = next((t['Value'] for t in p.get('Tags', []) if t['Key'] == 'Name'), '')
@@ -657,72 +556,50 @@ class VPCProvider(NetworkProvider):
 
             result['connectivity']['vpcPeerings'] = vpc_peerings
 
-            # VPN Connections
+            # VPN Connections (on this VPC's VPN gateways)
             vpn_connections = []
-            try:
-                vpn_gateways = ec2.describe_vpn_gateways(
-                    Filters=[{'Name': 'attachment.vpc-id', 'Values': [vpc_id]},
-                             {'Name': 'state', 'Values': ['available']}]
-                )
-                if vpn_gateways.get('VpnGateways'):
-                    vgw_ids = [vg['VpnGatewayId'] for vg in vpn_gateways['VpnGateways']]
-                    vpn_conns = ec2.describe_vpn_connections(
-                        Filters=[{'Name': 'state', 'Values': ['available']}]
+            for vpn in snapshot.vpn_connections_of_vpc():
+                vpn_name = next((t['Value'] for t in vpn.get('Tags', []) if t['Key'] == 'Name'), '')
+                tunnels = []
+                for tun in vpn.get('VgwTelemetry', []):
+                    tunnels.append({
+                        'status': tun.get('Status'),
+                        'statusMessage': tun.get('StatusMessage'),
+                        'outsideIpAddress': tun.get('OutsideIpAddress'),
+                        'lastStatusChange': tun.get('LastStatusChange')
+                    })
+
+                vpn_connections.append({
+                    'id': vpn['VpnConnectionId'],
+                    'name': vpn_name,
+                    'state': vpn['State'],
+                    'vpnGatewayId': vpn['VpnGatewayId'],
+                    'customerGatewayId': vpn.get('CustomerGatewayId'),
+                    'tunnels': tunnels,
+                    'consoleUrl': build_sso_console_url(
+                        self.config.sso_portal_url, account_id,
+                        f"https://{self.region}.console.aws.amazon.com/vpc/home?region={self.region}#VpnConnectionDetails:vpnConnectionId={vpn['VpnConnectionId']}"
                     )
-                    for vpn in vpn_conns.get('VpnConnections', []):
-                        if vpn.get('VpnGatewayId') not in vgw_ids:
-                            continue
-
-                        vpn_name = next((t['Value'] for t in vpn.get('Tags', []) if t['Key'] == 'Name'), '')
-                        tunnels = []
-                        for tun in vpn.get('VgwTelemetry', []):
-                            tunnels.append({
-                                'status': tun.get('Status'),
-                                'statusMessage': tun.get('StatusMessage'),
-                                'outsideIpAddress': tun.get('OutsideIpAddress'),
-                                'lastStatusChange': tun.get('LastStatusChange').isoformat() if tun.get('LastStatusChange') else None
-                            })
-
-                        vpn_connections.append({
-                            'id': vpn['VpnConnectionId'],
-                            'name': vpn_name,
-                            'state': vpn['State'],
-                            'vpnGatewayId': vpn['VpnGatewayId'],
-                            'customerGatewayId': vpn.get('CustomerGatewayId'),
-                            'tunnels': tunnels,
-                            'consoleUrl': build_sso_console_url(
-                                self.config.sso_portal_url, account_id,
-                                f"https://{self.region}.console.aws.amazon.com/vpc/home?region={self.region}#VpnConnectionDetails:vpnConnectionId={vpn['VpnConnectionId']}"
-                            )
-                        })
-            except Exception:
-                pass
+                })
 
             result['connectivity']['vpnConnections'] = vpn_connections
 
             # Transit Gateway Attachments
             tgw_attachments = []
-            try:
-                tgw_response = ec2.describe_transit_gateway_vpc_attachments(
-                    Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]},
-                             {'Name': 'state', 'Values': ['available', 'pending']}]
-                )
-                for att in tgw_response.get('TransitGatewayVpcAttachments', []):
-                    att_name = next((t['Value'] for t in att.get('Tags', []) if t['Key'] == 'Name'), '')
-                    tgw_attachments.append({
-                        'id': att['TransitGatewayAttachmentId'],
-                        'name': att_name,
-                        'transitGatewayId': att['TransitGatewayId'],
-                        'transitGatewayOwnerId': att.get('TransitGatewayOwnerId'),
-                        'state': att['State'],
-                        'subnetIds': att.get('SubnetIds', []),
-                        'consoleUrl': build_sso_console_url(
-                            self.config.sso_portal_url, account_id,
-                            f"https://{self.region}.console.aws.amazon.com/vpc/home?region={self.region}#TransitGatewayAttachmentDetails:transitGatewayAttachmentId={att['TransitGatewayAttachmentId']}"
-                        )
-                    })
-            except Exception:
-                pass
+            for att in snapshot.transit_gateway_attachments.values():
+                att_name = next((t['Value'] for t in att.get('Tags', []) if t['Key'] == 'Name'), '')
+                tgw_attachments.append({
+                    'id': att['TransitGatewayAttachmentId'],
+                    'name': att_name,
+                    'transitGatewayId': att['TransitGatewayId'],
+                    'transitGatewayOwnerId': att.get('TransitGatewayOwnerId'),
+                    'state': att['State'],
+                    'subnetIds': att.get('SubnetIds', []),
+                    'consoleUrl': build_sso_console_url(
+                        self.config.sso_portal_url, account_id,
+                        f"https://{self.region}.console.aws.amazon.com/vpc/home?region={self.region}#TransitGatewayAttachmentDetails:transitGatewayAttachmentId={att['TransitGatewayAttachmentId']}"
+                    )
+                })
 
             result['connectivity']['transitGatewayAttachments'] = tgw_attachments
 
@@ -731,15 +608,21 @@ class VPCProvider(NetworkProvider):
 
         # ===== SECURITY (Security Groups & NACLs) =====
         try:
-            # Get Security Groups - only those associated with services if provided
-            sg_filter = [{'Name': 'vpc-id', 'Values': [vpc_id]}]
+            error = snapshot.collection_error('securityGroups', 'networkAcls')
+            if error:
+                raise RuntimeError(error)
+
+            # Security Groups - only those associated with services if provided
             if service_security_groups:
-                sg_filter.append({'Name': 'group-id', 'Values': service_security_groups})
+                vpc_security_groups = [
+                    snapshot.security_groups[sg_id] for sg_id in service_security_groups
+                    if sg_id in snapshot.security_groups
+                ]
+            else:
+                vpc_security_groups = list(snapshot.security_groups.values())
 
-            sg_response = ec2.describe_security_groups(Filters=sg_filter)
             security_groups = []
-
-            for sg in sg_response.get('SecurityGroups', []):
+            for sg in vpc_security_groups:
                 # Parse inbound rules
                 inbound_rules = []
                 for rule in sg.get('IpPermissions', []):
@@ -817,12 +700,9 @@ class VPCProvider(NetworkProvider):
 
             result['security']['securityGroups'] = security_groups
 
-            # Get NACLs
-            nacl_response = ec2.describe_network_acls(
-                Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]
-            )
+            # NACLs
             nacls = []
-            for nacl in nacl_response.get('NetworkAcls', []):
+            for nacl in snapshot.network_acls.values():
                 nacl_name = next((t['Value'] for t in nacl.get('Tags', []) if t['Key'] == 'Name'), '')
 
                 # Get subnet associations
@@ -874,81 +754,99 @@ class VPCProvider(NetworkProvider):
         ec2 = self._get_ec2_client(env)
 
         try:
-            response = ec2.describe_security_groups(GroupIds=[sg_id])
-            if not response.get('SecurityGroups'):
-                return {'error': f'Security Group {sg_id} not found'}
-
-            sg = response['SecurityGroups'][0]
-
-            # Get name from tags
-            sg_name = sg.get('GroupName', '')
-            for tag in sg.get('Tags', []):
-                if tag['Key'] == 'Name':
-                    sg_name = tag['Value']
-                    break
+            # Answer from the environment VPC's snapshot when the group lives there
+            known_groups = {}
+            snapshot = None
+            try:
+                snapshot = self._resolve_env_snapshot(ec2, env)
+            except Exception as e:
+                print(f"VPC snapshot unavailable for {env}: {e}")
+            if snapshot and not snapshot.collection_error('securityGroups'):
+                known_groups = snapshot.security_groups
 
-            # Parse inbound rules
-            inbound_rules = []
-            for rule in sg.get('IpPermissions', []):
-                rule_info = self._parse_sg_rule(rule, 'inbound', account_id)
-                inbound_rules.extend(rule_info)
-
-            # Parse outbound rules
-            outbound_rules = []
-            for rule in sg.get('IpPermissionsEgress', []):
-                rule_info = self._parse_sg_rule(rule, 'outbound', account_id)
-                outbound_rules.extend(rule_info)
-
-            # Collect all referenced SG IDs to resolve their names
-            all_rules = inbound_rules + outbound_rules
-            sg_ids_to_resolve = set()
-            for r in all_rules:
-                if r.get('sourceType') == 'security-group' and r.get('sourceSgId'):
-                    sg_ids_to_resolve.add(r['sourceSgId'])
-
-            # Batch lookup SG names
-            sg_names_map = {}
-            if sg_ids_to_resolve:
-                try:
-                    sg_response = ec2.describe_security_groups(GroupIds=list(sg_ids_to_resolve))
-                    for ref_sg in sg_response.get('SecurityGroups', []):
-                        ref_sg_id = ref_sg['GroupId']
-                        # Get name from tags or use GroupName
-                        ref_name = ref_sg.get('GroupName', ref_sg_id)
-                        for tag in ref_sg.get('Tags', []):
-                            if tag['Key'] == 'Name':
-                                ref_name = tag['Value']
-                                break
-                        sg_names_map[ref_sg_id] = ref_name
-                except Exception:
-                    pass  # If we can't resolve, just use IDs
-
-            # Enrich rules with SG names
-            for r in all_rules:
-                if r.get('sourceType') == 'security-group' and r.get('sourceSgId'):
-                    sg_ref_id = r['sourceSgId']
-                    if sg_ref_id in sg_names_map:
-                        r['sourceSgName'] = sg_names_map[sg_ref_id]
-                    else:
-                        r['sourceSgName'] = sg_ref_id  # Fallback to ID
+            sg = known_groups.get(sg_id)
+            if not sg:
+                response = ec2.describe_security_groups(GroupIds=[sg_id])
+                if not response.get('SecurityGroups'):
+                    return {'error': f'Security Group {sg_id} not found'}
+                sg = response['SecurityGroups'][0]
 
-            return {
-                'id': sg['GroupId'],
-                'name': sg_name,
-                'groupName': sg.get('GroupName'),
-                'description': sg.get('Description', ''),
-                'vpcId': sg.get('VpcId'),
-                'inboundRules': inbound_rules,
-                'outboundRules': outbound_rules,
-                'consoleUrl': build_sso_console_url(
-                    self.config.sso_portal_url, account_id,
-                    f"https://{self.region}.console.aws.amazon.com/ec2/v2/home?region={self.region}#SecurityGroup:groupId={sg_id}"
-                )
-            }
+            return self._format_security_group(ec2, sg, account_id, known_groups)
 
         except Exception as e:
             return {'error': str(e)}
 
+    def _format_security_group(self, ec2, sg: dict, account_id: str, known_groups: dict) -> dict:
+        """Render a security group with its rules, resolving referenced group names
+
+        Referenced groups found in known_groups (the VPC snapshot) are named from
+        there; only the others are described.
+        """
+        sg_id = sg['GroupId']
+
+        # Get name from tags
+        sg_name = sg.get('GroupName', '')
+        for tag in sg.get('Tags', []):
+            if tag['Key'] == 'Name':
+                sg_name = tag['Value']
+                break
+
+        # Parse inbound rules
+        inbound_rules = []
+        for rule in sg.get('IpPermissions', []):
+            rule_info = self._parse_sg_rule(rule, 'inbound', account_id)
+            inbound_rules.extend(rule_info)
+
+        # Parse outbound rules
+        outbound_rules = []
+        for rule in sg.get('IpPermissionsEgress', []):
+            rule_info = self._parse_sg_rule(rule, 'outbound', account_id)
+            outbound_rules.extend(rule_info)
+
+        # Collect all referenced SG IDs to resolve their names
+        all_rules = inbound_rules + outbound_rules
+        sg_ids_to_resolve = set()
+        for r in all_rules:
+            if r.get('sourceType') == 'security-group' and r.get('sourceSgId'):
+                sg_ids_to_resolve.add(r['sourceSgId'])
+
+        referenced_groups = [known_groups[ref_id] for ref_id in sg_ids_to_resolve if ref_id in known_groups]
+        unknown_ids = [ref_id for ref_id in sg_ids_to_resolve if ref_id not in known_groups]
+        if unknown_ids:
+            try:
+                sg_response = ec2.describe_security_groups(GroupIds=unknown_ids)
+                referenced_groups.extend(sg_response.get('SecurityGroups', []))
+            except Exception:
+                pass  # If we can't resolve, just use IDs
+
+        # SG names (from tags or GroupName)
+        sg_names_map = {}
+        for ref_sg in referenced_groups:
+            sg_names_map[ref_sg['GroupId']] = tag_value(ref_sg, default=ref_sg.get('GroupName', ref_sg['GroupId']))
+
+        # Enrich rules with SG names
+        for r in all_rules:
+            if r.get('sourceType') == 'security-group' and r.get('sourceSgId'):
+                sg_ref_id = r['sourceSgId']
+                if sg_ref_id in sg_names_map:
+                    r['sourceSgName'] = sg_names_map[sg_ref_id]
+                else:
+                    r['sourceSgName'] = sg_ref_id  # Fallback to ID
+
+        return {
+            'id': sg_id,
+            'name': sg_name,
+            'groupName': sg.get('GroupName'),
+            'description': sg.get('Description', ''),
+            'vpcId': sg.get('VpcId'),
+            'inboundRules': inbound_rules,
+            'outboundRules': outbound_rules,
+            'consoleUrl': build_sso_console_url(
+                self.config.sso_portal_url, account_id,
+                f"https://{self.region}.console.aws.amazon.com/ec2/v2/home?region={self.region}#SecurityGroup:groupId={sg_id}"
+            )
+        }
+
     def _parse_sg_rule(self, rule: dict, direction: str, account_id: str = None) -> list:
         """Parse a security group rule into readable format"""
         results = []
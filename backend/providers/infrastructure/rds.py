@@ -12,6 +12,7 @@ from typing import Optional, Dict, List
 from providers.base import DatabaseProvider, ProviderFactory
 from app_config import DashboardConfig
 from utils.aws import get_cross_account_client, get_action_client, build_sso_console_url
+from providers.infrastructure.tag_discovery import get_tagged_resources
 
 
 class RDSProvider(DatabaseProvider):
@@ -38,34 +39,15 @@ class RDSProvider(DatabaseProvider):
             project=self.project, env=env
         )
 
-    def _get_resourcegroupstaggingapi_client(self, env: str):
-        """Get Resource Groups Tagging API client for tag-based discovery"""
-        env_config = self.config.get_environment(self.project, env)
-        if not env_config:
-            raise ValueError(f"Unknown environment: {env}")
-        return get_cross_account_client(
-            'resourcegroupstaggingapi', env_config.account_id, env_config.region,
-            project=self.project, env=env
-        )
-
     def _find_by_tags(self, env: str, discovery_tags: Dict[str, str], resource_type: str) -> Optional[str]:
-        """Find RDS resource ARN by tags"""
+        """Find RDS resource ARN by tags (shared, cached tag discovery)"""
         if not discovery_tags:
             return None
 
         try:
-            tagging = self._get_resourcegroupstaggingapi_client(env)
-            tag_filters = [{'Key': k, 'Values': [v]} for k, v in discovery_tags.items()]
-
-            response = tagging.get_resources(
-                ResourceTypeFilters=[f'rds:{resource_type}'],
-                TagFilters=tag_filters
-            )
-
-            for resource in response.get('ResourceTagMappingList', []):
-                return resource['ResourceARN']
-
-            return None
+            tagged = get_tagged_resources(self.config, self.project, env, discovery_tags)
+            arns = tagged.arns_of(f'rds:{resource_type}')
+            return arns[0] if arns else None
         except Exception as e:
             print(f"Tag-based RDS discovery failed: {e}")
             return None
@@ -134,22 +116,31 @@ class RDSProvider(DatabaseProvider):
 
             # If we found a cluster, return cluster info
             if cluster:
-                # Get instance details for the cluster
+                # Get instance details for the cluster (one call for all members)
+                members_by_id = {}
+                try:
+                    paginator = rds.get_paginator('describe_db_instances')
+                    for page in paginator.paginate(
+                        Filters=[{'Name': 'db-cluster-id', 'Values': [cluster['DBClusterIdentifier']]}]
+                    ):
+                        for inst in page.get('DBInstances', []):
+                            members_by_id[inst['DBInstanceIdentifier']] = inst
+                except Exception as e:
+                    print(f"Failed to describe RDS cluster members: {e}")
+
                 instances = []
                 for member in cluster.get('DBClusterMembers', []):
                     instance_id = member['DBInstanceIdentifier']
-                    try:
-                        inst_response = rds.describe_db_instances(DBInstanceIdentifier=instance_id)
-                        if inst_response.get('DBInstances'):
-                            inst = inst_response['DBInstances'][0]
-                            instances.append({
-                                'identifier': instance_id,
-                                'instanceClass': inst['DBInstanceClass'],
-                                'status': inst['DBInstanceStatus'],
-                                'isWriter': member.get('IsClusterWriter', False),
-                                'availabilityZone': inst.get('AvailabilityZone')
-                            })
-                    except:
+                    inst = members_by_id.get(instance_id)
+                    if inst:
+                        instances.append({
+                            'identifier': instance_id,
+                            'instanceClass': inst['DBInstanceClass'],
+                            'status': inst['DBInstanceStatus'],
+                            'isWriter': member.get('IsClusterWriter', False),
+                            'availabilityZone': inst.get('AvailabilityZone')
+                        })
+                    else:
                         instances.append({
                             'identifier': instance_id,
                             'isWriter': member.get('IsClusterWriter', False)
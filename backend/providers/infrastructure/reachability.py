@@ -0,0 +1,488 @@
+"""
+Security group reachability engine.
+
+Compiles a VPC's security groups (from the VPC snapshot) and ENI memberships
+(from the ENI index) into a graph answering "can A reach B on port P?":
+
+- every rule's port range is compiled into per-protocol interval sets
+- ingress/egress rules referencing another group are merged per
+  (group, peer group) into one permission set
+- CIDR rules are kept as numeric address ranges and matched against the
+  peer's addresses
+
+Traffic from A to B is allowed when one of B's groups admits A (by group
+reference or by one of A's addresses) and one of A's groups lets the traffic
+out towards B. Groups are stateful, so return traffic isn't evaluated.
+Endpoints without security groups (external addresses) don't restrict their
+side. Network ACLs, route tables and managed prefix lists are not evaluated
+(prefix-list rules are reported as unresolved).
+
+Usage:
+    engine = ReachabilityEngine(snapshot.security_groups, index.enis)
+    engine.check(engine.endpoint('sg-app'), engine.endpoint('sg-db'), 'tcp', 5432)
+"""
+
+import bisect
+import ipaddress
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+PORT_MAX = 65535
+
+_PROTOCOL_NUMBERS = {'all': '-1', 'tcp': '6', 'udp': '17', 'icmp': '1', 'icmpv6': '58'}
+_PROTOCOL_NAMES = {'-1': 'all', '6': 'tcp', '17': 'udp', '1': 'icmp', '58': 'icmpv6'}
+
+# ENI attachment types on each side of the default all-pairs query
+WORKLOAD_TYPES = ('ecs-task', 'ec2-instance', 'lambda')
+DATASTORE_TYPES = ('rds', 'elasticache', 'efs')
+
+
+def normalize_protocol(protocol: Any) -> str:
+    """Protocol as an EC2 protocol number string ('tcp' -> '6', 'all' -> '-1')."""
+    protocol = str(protocol).lower()
+    return _PROTOCOL_NUMBERS.get(protocol, protocol)
+
+
+def protocol_name(protocol: str) -> str:
+    return _PROTOCOL_NAMES.get(protocol, protocol)
+
+
+# =============================================================================
+# Port interval sets
+# =============================================================================
+
+Ranges = List[Tuple[int, int]]
+
+
+def merge_ranges(ranges: Iterable[Tuple[int, int]]) -> Ranges:
+    """Sorted, disjoint, non-adjacent ranges covering the input."""
+    merged: Ranges = []
+    for low, high in sorted(ranges):
+        if merged and low <= merged[-1][1] + 1:
+            if high > merged[-1][1]:
+                merged[-1] = (merged[-1][0], high)
+        else:
+            merged.append((low, high))
+    return merged
+
+
+def intersect_ranges(a: Ranges, b: Ranges) -> Ranges:
+    result: Ranges = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        low = max(a[i][0], b[j][0])
+        high = min(a[i][1], b[j][1])
+        if low <= high:
+            result.append((low, high))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def ranges_contain(ranges: Ranges, port: int) -> bool:
+    index = bisect.bisect_right(ranges, (port, PORT_MAX + 1)) - 1
+    return index >= 0 and ranges[index][0] <= port <= ranges[index][1]
+
+
+class Permissions:
+    """Allowed ports per protocol; the '-1' protocol allows everything."""
+
+    __slots__ = ('ranges',)
+
+    def __init__(self, ranges: Optional[Dict[str, Ranges]] = None):
+        self.ranges: Dict[str, Ranges] = ranges or {}
+
+    @classmethod
+    def everything(cls) -> 'Permissions':
+        return cls({'-1': [(0, PORT_MAX)]})
+
+    @classmethod
+    def from_rule(cls, rule: dict) -> 'Permissions':
+        """Permissions granted by one EC2 IpPermissions entry."""
+        protocol = normalize_protocol(rule.get('IpProtocol', '-1'))
+        if protocol == '-1':
+            return cls.everything()
+        low, high = rule.get('FromPort'), rule.get('ToPort')
+        # Missing ports, or -1 for ICMP types/codes, mean the whole range
+        if low is None or low < 0:
+            low = 0
+        if high is None or high < 0:
+            high = PORT_MAX
+        return cls({protocol: [(low, high)]})
+
+    @property
+    def allows_all(self) -> bool:
+        return '-1' in self.ranges
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges)
+
+    def union(self, other: 'Permissions') -> 'Permissions':
+        if self.allows_all or not other:
+            return self
+        if other.allows_all or not self:
+            return other
+        ranges = dict(self.ranges)
+        for protocol, other_ranges in other.ranges.items():
+            ranges[protocol] = merge_ranges(ranges.get(protocol, []) + other_ranges)
+        return Permissions(ranges)
+
+    def intersect(self, other: 'Permissions') -> 'Permissions':
+        if self.allows_all:
+            return other
+        if other.allows_all:
+            return self
+        ranges = {}
+        for protocol, own in self.ranges.items():
+            common = intersect_ranges(own, other.ranges.get(protocol, []))
+            if common:
+                ranges[protocol] = common
+        return Permissions(ranges)
+
+    def allows(self, protocol: str, port: Optional[int] = None) -> bool:
+        if self.allows_all:
+            return True
+        ranges = self.ranges.get(normalize_protocol(protocol))
+        if not ranges:
+            return False
+        return port is None or ranges_contain(ranges, port)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """[{'protocol': 'tcp', 'ports': ['443', '8000-8080']}, ...]"""
+        return [
+            {
+                'protocol': protocol_name(protocol),
+                'ports': [str(low) if low == high else f"{low}-{high}" for low, high in ranges],
+            }
+            for protocol, ranges in sorted(self.ranges.items())
+        ]
+
+
+def _union_all(permissions: Iterable[Permissions]) -> Permissions:
+    result = Permissions()
+    for item in permissions:
+        result = result.union(item)
+        if result.allows_all:
+            break
+    return result
+
+
+def _ip_key(ip: str) -> Optional[Tuple[int, int]]:
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+    return address.version, int(address)
+
+
+# =============================================================================
+# Compiled security groups
+# =============================================================================
+
+class Rule:
+    """One source/destination of a security group rule, compiled."""
+
+    __slots__ = ('direction', 'kind', 'value', 'permissions', 'version', 'low', 'high', 'description')
+
+    def __init__(self, direction: str, kind: str, value: str, permissions: Permissions,
+                 description: str = '', network=None):
+        self.direction = direction
+        self.kind = kind
+        self.value = value
+        self.permissions = permissions
+        self.description = description
+        self.version = network.version if network is not None else None
+        self.low = int(network.network_address) if network is not None else None
+        self.high = int(network.broadcast_address) if network is not None else None
+
+    def covers(self, ip_keys: List[Tuple[int, int]]) -> bool:
+        return any(
+            version == self.version and self.low <= value <= self.high
+            for version, value in ip_keys
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'direction': self.direction,
+            'type': self.kind,
+            'value': self.value,
+            'allowed': self.permissions.to_list(),
+            'description': self.description,
+        }
+
+
+class CompiledGroup:
+    """A security group's rules, merged per peer group and kept per CIDR."""
+
+    __slots__ = ('id', 'name', 'rules', 'ingress_groups', 'egress_groups', 'ingress_cidrs', 'egress_cidrs')
+
+    def __init__(self, sg: dict):
+        self.id: str = sg['GroupId']
+        self.name: str = sg.get('GroupName', self.id)
+        self.rules: List[Rule] = []
+        for direction, key in (('inbound', 'IpPermissions'), ('outbound', 'IpPermissionsEgress')):
+            for rule in sg.get(key, []):
+                self.rules.extend(self._compile_rule(direction, rule))
+
+        self.ingress_groups: Dict[str, Permissions] = {}
+        self.egress_groups: Dict[str, Permissions] = {}
+        self.ingress_cidrs: List[Rule] = []
+        self.egress_cidrs: List[Rule] = []
+        for rule in self.rules:
+            inbound = rule.direction == 'inbound'
+            if rule.kind == 'security-group':
+                groups = self.ingress_groups if inbound else self.egress_groups
+                groups[rule.value] = groups.get(rule.value, Permissions()).union(rule.permissions)
+            elif rule.kind == 'cidr':
+                (self.ingress_cidrs if inbound else self.egress_cidrs).append(rule)
+
+    @staticmethod
+    def _compile_rule(direction: str, rule: dict) -> List[Rule]:
+        permissions = Permissions.from_rule(rule)
+        compiled = []
+        for ip_range in rule.get('IpRanges', []):
+            compiled.append(Rule(direction, 'cidr', ip_range['CidrIp'], permissions,
+                                 ip_range.get('Description', ''), ipaddress.ip_network(ip_range['CidrIp'], strict=False)))
+        for ip_range in rule.get('Ipv6Ranges', []):
+            compiled.append(Rule(direction, 'cidr', ip_range['CidrIpv6'], permissions,
+                                 ip_range.get('Description', ''), ipaddress.ip_network(ip_range['CidrIpv6'], strict=False)))
+        for pair in rule.get('UserIdGroupPairs', []):
+            if pair.get('GroupId'):
+                compiled.append(Rule(direction, 'security-group', pair['GroupId'], permissions, pair.get('Description', '')))
+        for prefix in rule.get('PrefixListIds', []):
+            compiled.append(Rule(direction, 'prefix-list', prefix.get('PrefixListId', ''), permissions, prefix.get('Description', '')))
+        return compiled
+
+    def cidr_permissions(self, inbound: bool, ip_keys: List[Tuple[int, int]]) -> Permissions:
+        """Permissions of the CIDR rules covering one of the addresses."""
+        rules = self.ingress_cidrs if inbound else self.egress_cidrs
+        return _union_all(rule.permissions for rule in rules if rule.covers(ip_keys))
+
+
+class Endpoint:
+    """A reachability source or target: security groups plus addresses."""
+
+    __slots__ = ('id', 'name', 'kind', 'groups', 'ips', 'ip_keys', 'enis')
+
+    def __init__(self, endpoint_id: str, name: str, kind: str, groups: Iterable[str],
+                 ips: Iterable[str], enis: Iterable[str] = ()):
+        self.id = endpoint_id
+        self.name = name
+        self.kind = kind
+        self.groups = tuple(sorted(set(groups)))
+        self.ips = sorted(set(ips))
+        self.ip_keys = [key for key in map(_ip_key, self.ips) if key]
+        self.enis = list(enis)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'type': self.kind,
+            'securityGroups': list(self.groups),
+            'ips': self.ips,
+            'eniCount': len(self.enis),
+        }
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+class ReachabilityEngine:
+    """Pairwise and all-pairs security group reachability over one VPC."""
+
+    def __init__(self, security_groups: Dict[str, dict], enis: Dict[str, dict]):
+        self.groups: Dict[str, CompiledGroup] = {
+            sg_id: CompiledGroup(sg) for sg_id, sg in security_groups.items()
+        }
+        self.enis = enis
+        self.enis_by_group: Dict[str, List[str]] = {}
+        for eni_id, eni in enis.items():
+            for group in eni.get('securityGroups', []):
+                self.enis_by_group.setdefault(group['id'], []).append(eni_id)
+        self.ips: Dict[str, str] = {
+            ip: eni_id for eni_id, eni in enis.items() for ip in eni.get('privateIps', [])
+        }
+        # (group, inbound, endpoint) -> CIDR permissions; endpoints are immutable
+        self._cidr_memo: Dict[Tuple[str, bool, str], Permissions] = {}
+
+    @property
+    def rule_count(self) -> int:
+        return sum(len(group.rules) for group in self.groups.values())
+
+    def group_name(self, sg_id: str) -> str:
+        group = self.groups.get(sg_id)
+        return group.name if group else sg_id
+
+    # -------------------------------------------------------------------------
+    # Endpoints
+    # -------------------------------------------------------------------------
+
+    def _eni_endpoint(self, eni_id: str) -> Endpoint:
+        eni = self.enis[eni_id]
+        return Endpoint(
+            eni_id, eni.get('name') or eni.get('description') or eni_id,
+            eni.get('attachment', {}).get('type', 'unknown'),
+            [group['id'] for group in eni.get('securityGroups', [])],
+            eni.get('privateIps', []), [eni_id],
+        )
+
+    def endpoint(self, ref: str) -> Endpoint:
+        """Endpoint for a security group ID, an ENI ID or an IP address."""
+        ref = ref.strip()
+        if ref.startswith('sg-'):
+            eni_ids = self.enis_by_group.get(ref, [])
+            ips = [ip for eni_id in eni_ids for ip in self.enis[eni_id].get('privateIps', [])]
+            return Endpoint(ref, self.group_name(ref), 'security-group', [ref], ips, eni_ids)
+        if ref.startswith('eni-'):
+            if ref not in self.enis:
+                raise ValueError(f"ENI {ref} not found in VPC")
+            return self._eni_endpoint(ref)
+        if _ip_key(ref) is None:
+            raise ValueError(f"Unknown endpoint {ref} (expected a security group, ENI or IP address)")
+        if ref in self.ips:
+            return self._eni_endpoint(self.ips[ref])
+        # Address outside the VPC's ENIs: no security group of its own
+        return Endpoint(ref, ref, 'external', [], [ref])
+
+    def endpoints_of_types(self, types: Iterable[str]) -> List[Endpoint]:
+        """ENIs of the given attachment types, grouped by (type, security groups)."""
+        types = set(types)
+        grouped: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+        for eni_id, eni in self.enis.items():
+            kind = eni.get('attachment', {}).get('type')
+            if kind in types:
+                groups = tuple(sorted(group['id'] for group in eni.get('securityGroups', [])))
+                grouped.setdefault((kind, groups), []).append(eni_id)
+
+        endpoints = []
+        for (kind, groups), eni_ids in sorted(grouped.items()):
+            endpoints.append(Endpoint(
+                f"{kind}:{'+'.join(groups)}",
+                f"{kind} ({', '.join(self.group_name(g) for g in groups) or 'no security group'})",
+                kind, groups,
+                [ip for eni_id in eni_ids for ip in self.enis[eni_id].get('privateIps', [])],
+                eni_ids,
+            ))
+        return endpoints
+
+    # -------------------------------------------------------------------------
+    # Evaluation
+    # -------------------------------------------------------------------------
+
+    def _cidr_permissions(self, group: CompiledGroup, inbound: bool, peer: Endpoint) -> Permissions:
+        key = (group.id, inbound, peer.id)
+        permissions = self._cidr_memo.get(key)
+        if permissions is None:
+            permissions = self._cidr_memo[key] = group.cidr_permissions(inbound, peer.ip_keys)
+        return permissions
+
+    def _side(self, own: Endpoint, peer: Endpoint, inbound: bool) -> Permissions:
+        """What own's groups allow in from (inbound) or out to (outbound) peer."""
+        if not own.groups:
+            return Permissions.everything()
+        result = Permissions()
+        for group_id in own.groups:
+            group = self.groups.get(group_id)
+            if group is None:
+                continue
+            by_group = group.ingress_groups if inbound else group.egress_groups
+            for peer_group in peer.groups:
+                if peer_group in by_group:
+                    result = result.union(by_group[peer_group])
+            result = result.union(self._cidr_permissions(group, inbound, peer))
+            if result.allows_all:
+                break
+        return result
+
+    def allowed(self, source: Endpoint, target: Endpoint) -> Permissions:
+        """Protocols/ports on which source can open connections to target."""
+        # Ingress first: egress is commonly left open (AWS default allow-all)
+        ingress = self._side(target, source, inbound=True)
+        if not ingress:
+            return ingress
+        return ingress.intersect(self._side(source, target, inbound=False))
+
+    def _matching_rules(self, own: Endpoint, peer: Endpoint, inbound: bool,
+                        protocol: str, port: Optional[int]) -> List[Dict[str, Any]]:
+        direction = 'inbound' if inbound else 'outbound'
+        matches = []
+        for group_id in own.groups:
+            group = self.groups.get(group_id)
+            if group is None:
+                continue
+            for rule in group.rules:
+                if rule.direction != direction or not rule.permissions.allows(protocol, port):
+                    continue
+                if (rule.kind == 'security-group' and rule.value in peer.groups) or \
+                        (rule.kind == 'cidr' and rule.covers(peer.ip_keys)) or rule.kind == 'prefix-list':
+                    matches.append({'securityGroupId': group_id, 'resolved': rule.kind != 'prefix-list', **rule.to_dict()})
+        return matches
+
+    def check(self, source: Endpoint, target: Endpoint, protocol: str = 'tcp',
+              port: Optional[int] = None) -> Dict[str, Any]:
+        """Pairwise verdict with the rules that allow each side."""
+        allowed = self.allowed(source, target)
+        egress_rules = self._matching_rules(source, target, False, protocol, port)
+        ingress_rules = self._matching_rules(target, source, True, protocol, port)
+        return {
+            'source': source.to_dict(),
+            'target': target.to_dict(),
+            'protocol': protocol_name(normalize_protocol(protocol)),
+            'port': port,
+            'reachable': allowed.allows(protocol, port),
+            'allowed': allowed.to_list(),
+            'egress': {
+                'evaluated': bool(source.groups),
+                'rules': egress_rules,
+            },
+            'ingress': {
+                'evaluated': bool(target.groups),
+                'rules': ingress_rules,
+            },
+            # Prefix-list rules can't be matched without resolving the lists
+            'unresolvedRules': any(not r['resolved'] for r in egress_rules + ingress_rules),
+        }
+
+    def all_pairs(self, sources: List[Endpoint], targets: List[Endpoint],
+                  protocol: Optional[str] = None, port: Optional[int] = None,
+                  only_reachable: bool = False) -> List[Dict[str, Any]]:
+        """Allowed ports of every source -> target pair."""
+        pairs = []
+        for source in sources:
+            for target in targets:
+                if source.id == target.id:
+                    continue
+                allowed = self.allowed(source, target)
+                reachable = allowed.allows(protocol, port) if protocol else bool(allowed)
+                if only_reachable and not reachable:
+                    continue
+                pairs.append({
+                    'source': source.id,
+                    'target': target.id,
+                    'reachable': reachable,
+                    'allowed': allowed.to_list(),
+                })
+        return pairs
+
+
+# Process-wide engines: vpc -> (snapshot version, ENI index version, engine)
+_engines: Dict[str, Tuple[float, float, ReachabilityEngine]] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(vpc_id: str, security_groups: Dict[str, dict], enis: Dict[str, dict],
+               snapshot_at: float, enis_at: float) -> ReachabilityEngine:
+    """Engine compiled from the given snapshot and ENI index builds (reused while unchanged)."""
+    with _engines_lock:
+        entry = _engines.get(vpc_id)
+    if entry and entry[0] == snapshot_at and entry[1] == enis_at:
+        return entry[2]
+    engine = ReachabilityEngine(security_groups, enis)
+    with _engines_lock:
+        _engines[vpc_id] = (snapshot_at, enis_at, engine)
+    return engine
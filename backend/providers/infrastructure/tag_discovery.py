@@ -0,0 +1,113 @@
+"""
+Shared tag-based discovery for infrastructure providers.
+
+One paginated `tag:GetResources` query per account/region returns every
+resource carrying the environment's discovery tags, across all the resource
+types the providers discover by tag (RDS, ElastiCache, EFS). The ARN set is
+cached (`tagged-resources` TTL) and each provider then describes only the
+matching resources, instead of describing everything and fetching tags one
+resource at a time.
+
+Usage:
+    tagged = get_tagged_resources(config, project, env, discovery_tags)
+    for cluster_id in tagged.ids('rds:cluster'):
+        ...
+"""
+
+from typing import Dict, List, Optional
+
+from app_config import DashboardConfig
+from cache.shared import fetch_with_cache
+from utils.aws import get_cross_account_client
+
+
+# Resource types discovered by tag (tagging API ResourceTypeFilters syntax)
+TAGGED_RESOURCE_TYPES = [
+    'rds:cluster',
+    'rds:db',
+    'elasticache:cluster',
+    'elasticache:replicationgroup',
+    'elasticfilesystem:file-system',
+]
+
+
+def resource_type_of(arn: str) -> Optional[str]:
+    """
+    Tagging API resource type of an ARN.
+
+    arn:aws:rds:region:account:cluster:id -> rds:cluster
+    arn:aws:elasticfilesystem:region:account:file-system/fs-123 -> elasticfilesystem:file-system
+    """
+    parts = arn.split(':', 6)
+    if len(parts) < 6:
+        return None
+    resource = parts[5].split('/')[0]
+    return f"{parts[2]}:{resource}"
+
+
+def resource_id_of(arn: str) -> str:
+    """Last ARN segment: the resource identifier."""
+    return arn.split(':')[-1].split('/')[-1]
+
+
+class TaggedResources:
+    """ARNs matching a set of discovery tags, grouped by resource type."""
+
+    def __init__(self, arns: List[str]):
+        self.arns = arns
+        self._by_type: Dict[str, List[str]] = {}
+        for arn in arns:
+            self._by_type.setdefault(resource_type_of(arn), []).append(arn)
+
+    def arns_of(self, resource_type: str) -> List[str]:
+        """ARNs of one resource type, in tagging API order."""
+        return list(self._by_type.get(resource_type, []))
+
+    def ids(self, resource_type: str) -> List[str]:
+        """Identifiers of one resource type, in tagging API order."""
+        return [resource_id_of(arn) for arn in self._by_type.get(resource_type, [])]
+
+
+def _query_tagged_arns(tagging, discovery_tags: Dict[str, str]) -> List[str]:
+    paginator = tagging.get_paginator('get_resources')
+    arns = []
+    for page in paginator.paginate(
+        ResourceTypeFilters=TAGGED_RESOURCE_TYPES,
+        TagFilters=[{'Key': k, 'Values': [v]} for k, v in discovery_tags.items()],
+    ):
+        arns.extend(r['ResourceARN'] for r in page.get('ResourceTagMappingList', []))
+    return arns
+
+
+def get_tagged_resources(
+    config: DashboardConfig,
+    project: str,
+    env: str,
+    discovery_tags: Dict[str, str],
+) -> TaggedResources:
+    """
+    Resources of the environment's account/region carrying all discovery tags.
+
+    Raises on tagging API errors so callers can report discovery failures.
+    """
+    if not discovery_tags:
+        return TaggedResources([])
+
+    env_config = config.get_environment(project, env)
+    if not env_config:
+        raise ValueError(f"Unknown environment: {env}")
+
+    def fetch():
+        tagging = get_cross_account_client(
+            'resourcegroupstaggingapi', env_config.account_id, env_config.region,
+            project=project, env=env
+        )
+        return {'arns': _query_tagged_arns(tagging, discovery_tags)}
+
+    params = {
+        'accountId': env_config.account_id,
+        'region': env_config.region,
+        'tags': discovery_tags,
+    }
+    data, _ = fetch_with_cache('tagged-resources', project, env, params, fetch)
+    return TaggedResources(data.get('arns', []))
@@ -0,0 +1,245 @@
+"""
+VPC topology snapshot shared by the network views.
+
+All the EC2 collections describing one VPC (subnets, gateways, route tables,
+endpoints, peerings, VPN, transit gateway attachments, security groups,
+NACLs) are fetched concurrently and fully paginated,
+then kept as id-indexed maps. The snapshot is cached under the `routing` TTL
+(process memory first, then the cache table), so the network overview, the
+routing view and security group details all read the same data instead of
+each re-running their own chain of describes. Network interfaces change
+faster and are indexed separately (see eni_index).
+
+Usage:
+    snapshot = load_vpc_snapshot(ec2, account_id, region, project, env, vpc_id)
+    sg = snapshot.security_groups.get('sg-123')
+"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cache.policies import get_ttl
+from cache.shared import fetch_with_cache, refresh_requested
+from utils.concurrency import map_concurrent
+
+
+SNAPSHOT_VERSION = 2
+
+# Collection -> (describe operation, result key, id field, filters, required)
+# `{vpc_id}` in filter values is replaced by the snapshot's VPC ID.
+# Optional collections (VPN, transit gateway) are left empty on error, as
+# accounts commonly deny or don't use them.
+COLLECTIONS: Dict[str, Tuple[str, str, str, List[Dict[str, Any]], bool]] = {
+    'subnets': (
+        'describe_subnets', 'Subnets', 'SubnetId',
+        [{'Name': 'vpc-id', 'Values': ['{vpc_id}']}], True,
+    ),
+    'internetGateways': (
+        'describe_internet_gateways', 'InternetGateways', 'InternetGatewayId',
+        [{'Name': 'attachment.vpc-id', 'Values': ['{vpc_id}']}], True,
+    ),
+    'routeTables': (
+        'describe_route_tables', 'RouteTables', 'RouteTableId',
+        [{'Name': 'vpc-id', 'Values': ['{vpc_id}']}], True,
+    ),
+    'natGateways': (
+        'describe_nat_gateways', 'NatGateways', 'NatGatewayId',
+        [{'Name': 'vpc-id', 'Values': ['{vpc_id}']}], True,
+    ),
+    'vpcEndpoints': (
+        'describe_vpc_endpoints', 'VpcEndpoints', 'VpcEndpointId',
+        [{'Name': 'vpc-id', 'Values': ['{vpc_id}']}], True,
+    ),
+    'vpcPeerings': (
+        'describe_vpc_peering_connections', 'VpcPeeringConnections', 'VpcPeeringConnectionId',
+        [{'Name': 'status-code', 'Values': ['active']}], True,
+    ),
+    'vpnGateways': (
+        'describe_vpn_gateways', 'VpnGateways', 'VpnGatewayId',
+        [{'Name': 'attachment.vpc-id', 'Values': ['{vpc_id}']}, {'Name': 'state', 'Values': ['available']}], False,
+    ),
+    'vpnConnections': (
+        'describe_vpn_connections', 'VpnConnections', 'VpnConnectionId',
+        [{'Name': 'state', 'Values': ['available']}], False,
+    ),
+    'transitGatewayAttachments': (
+        'describe_transit_gateway_vpc_attachments', 'TransitGatewayVpcAttachments', 'TransitGatewayAttachmentId',
+        [{'Name': 'vpc-id', 'Values': ['{vpc_id}']}, {'Name': 'state', 'Values': ['available', 'pending']}], False,
+    ),
+    'securityGroups': (
+        'describe_security_groups', 'SecurityGroups', 'GroupId',
+        [{'Name': 'vpc-id', 'Values': ['{vpc_id}']}], True,
+    ),
+    'networkAcls': (
+        'describe_network_acls', 'NetworkAcls', 'NetworkAclId',
+        [{'Name': 'vpc-id', 'Values': ['{vpc_id}']}], True,
+    ),
+}
+
+
+# Operations whose filter parameter isn't named `Filters`
+_FILTER_PARAM = {'describe_nat_gateways': 'Filter'}
+
+
+def _json_safe(value: Any) -> Any:
+    """Datetimes to ISO strings, so fresh and cached snapshots look the same."""
+    return json.loads(json.dumps(
+        value,
+        default=lambda o: o.isoformat() if hasattr(o, 'isoformat') else str(o),
+    ))
+
+
+def _describe_all(ec2, operation: str, result_key: str, filters: List[Dict[str, Any]]) -> List[dict]:
+    kwargs = {_FILTER_PARAM.get(operation, 'Filters'): filters}
+    if ec2.can_paginate(operation):
+        items = []
+        for page in ec2.get_paginator(operation).paginate(**kwargs):
+            items.extend(page.get(result_key, []))
+        return items
+    return getattr(ec2, operation)(**kwargs).get(result_key, [])
+
+
+def tag_value(item: dict, key: str = 'Name', default: str = '') -> str:
+    return next((t['Value'] for t in item.get('Tags', item.get('TagSet', [])) if t['Key'] == key), default)
+
+
+class VpcSnapshot:
+    """
+    EC2 collections of one VPC, each an id -> item map (EC2 API shapes with
+    datetimes as ISO strings).
+    """
+
+    def __init__(self, payload: Dict[str, Any]):
+        self.vpc_id: str = payload['vpcId']
+        self.vpc: dict = payload['vpc']
+        self.fetched_at: float = payload.get('fetchedAt', 0)
+        self.errors: Dict[str, str] = payload.get('errors', {})
+        self.collections: Dict[str, Dict[str, dict]] = payload['collections']
+        self._payload = payload
+
+        self.subnets = self.collections['subnets']
+        self.internet_gateways = self.collections['internetGateways']
+        self.route_tables = self.collections['routeTables']
+        self.nat_gateways = self.collections['natGateways']
+        self.vpc_endpoints = self.collections['vpcEndpoints']
+        self.vpc_peerings = self.collections['vpcPeerings']
+        self.vpn_gateways = self.collections['vpnGateways']
+        self.vpn_connections = self.collections['vpnConnections']
+        self.transit_gateway_attachments = self.collections['transitGatewayAttachments']
+        self.security_groups = self.collections['securityGroups']
+        self.network_acls = self.collections['networkAcls']
+
+    @property
+    def vpc_name(self) -> str:
+        return tag_value(self.vpc, default=self.vpc_id)
+
+    def peerings_of_vpc(self) -> List[dict]:
+        """Active peering connections this VPC takes part in."""
+        return [
+            p for p in self.vpc_peerings.values()
+            if p.get('AccepterVpcInfo', {}).get('VpcId') == self.vpc_id
+            or p.get('RequesterVpcInfo', {}).get('VpcId') == self.vpc_id
+        ]
+
+    def vpn_connections_of_vpc(self) -> List[dict]:
+        """Available VPN connections terminating on this VPC's gateways."""
+        gateway_ids = set(self.vpn_gateways)
+        return [v for v in self.vpn_connections.values() if v.get('VpnGatewayId') in gateway_ids]
+
+    def collection_error(self, *names: str) -> Optional[str]:
+        """First fetch error among the given collections, if any."""
+        for name in names:
+            if name in self.errors:
+                return self.errors[name]
+        return None
+
+    def to_payload(self) -> Dict[str, Any]:
+        return self._payload
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def fetch(cls, ec2, vpc_id: str, account_id: Optional[str] = None,
+              vpc: Optional[dict] = None) -> 'VpcSnapshot':
+        """Fetch every collection of the VPC concurrently (per-account cap)."""
+        jobs: List[Tuple[str, Callable[[], Any]]] = []
+        if vpc is None:
+            jobs.append(('vpc', lambda: ec2.describe_vpcs(VpcIds=[vpc_id]).get('Vpcs', [])))
+        for name, (operation, result_key, _, filters, _) in COLLECTIONS.items():
+            resolved = [
+                {'Name': f['Name'], 'Values': [v.replace('{vpc_id}', vpc_id) for v in f['Values']]}
+                for f in filters
+            ]
+            jobs.append((name, lambda op=operation, key=result_key, flt=resolved: _describe_all(ec2, op, key, flt)))
+
+        def run(job):
+            name, call = job
+            try:
+                return name, call(), None
+            except Exception as e:
+                return name, None, str(e)
+
+        collections: Dict[str, Dict[str, dict]] = {}
+        errors: Dict[str, str] = {}
+        for name, items, error in map_concurrent(run, jobs, account_id=account_id, max_workers=len(jobs)):
+            if name == 'vpc':
+                if error or not items:
+                    raise ValueError(error or f'VPC {vpc_id} not found')
+                vpc = items[0]
+                continue
+            id_field, required = COLLECTIONS[name][2], COLLECTIONS[name][4]
+            if error and required:
+                errors[name] = error
+            collections[name] = {item[id_field]: item for item in (items or [])}
+
+        return cls(_json_safe({
+            'version': SNAPSHOT_VERSION,
+            'vpcId': vpc_id,
+            'vpc': vpc,
+            'fetchedAt': time.time(),
+            'errors': errors,
+            'collections': collections,
+        }))
+
+
+# Process-wide snapshots: (account, region, vpc) -> (expires_at, snapshot)
+_snapshots: Dict[Tuple[str, str, str], Tuple[float, VpcSnapshot]] = {}
+_snapshots_lock = threading.Lock()
+
+
+def load_vpc_snapshot(ec2, account_id: str, region: str, project: str, env: str,
+                      vpc_id: str, vpc: Optional[dict] = None) -> VpcSnapshot:
+    """
+    Get the VPC snapshot from process memory or the cache table, fetching it
+    on miss, on expiry (routing TTL) or when the request forces a refresh.
+    """
+    key = (account_id, region, vpc_id)
+    now = time.time()
+    if not refresh_requested():
+        with _snapshots_lock:
+            entry = _snapshots.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+    ttl = get_ttl('routing')
+    payload, _ = fetch_with_cache(
+        'vpc-snapshot', project, env,
+        {'accountId': account_id, 'region': region, 'vpcId': vpc_id},
+        lambda: VpcSnapshot.fetch(ec2, vpc_id, account_id, vpc=vpc).to_payload(),
+        ttl_seconds=ttl,
+        # Partial snapshots are served but not stored
+        cacheable=lambda data: not data.get('errors'),
+    )
+    if payload.get('version') != SNAPSHOT_VERSION:
+        payload = VpcSnapshot.fetch(ec2, vpc_id, account_id, vpc=vpc).to_payload()
+    snapshot = VpcSnapshot(payload)
+
+    if not snapshot.errors:
+        expires_at = snapshot.fetched_at + ttl
+        with _snapshots_lock:
+            _snapshots[key] = (expires_at, snapshot)
+    return snapshot
@@ -5,11 +5,20 @@ Available providers:
 - ECSProvider: AWS ECS orchestrator (Fargate/EC2)
 - EKSProvider: Direct Kubernetes API access (real-time, full operations)
 - EKSDynamoProvider: DynamoDB-cached EKS data (read-only, Step Functions refresh)
+
+Providers are loaded lazily on attribute access.
 """
 
-from .ecs import ECSProvider
-from .eks import EKSProvider
-from .eks_dynamo import EKSDynamoProvider
+from providers.base import lazy_provider_getattr
+
+_LAZY_PROVIDERS = {
+    'ECSProvider': '.ecs',
+    'EKSProvider': '.eks',
+    'EKSDynamoProvider': '.eks_dynamo',
+}
+
+__getattr__ = lazy_provider_getattr(__name__, _LAZY_PROVIDERS)
+
 
 __all__ = [
     'ECSProvider',
@@ -0,0 +1,322 @@
+"""
+Cluster capacity engine for Kubernetes node views.
+
+Kubernetes quantities ("250m", "1.5", "128Mi", "2G", "500u", "1e3") are
+parsed once (per distinct string of a column) into typed columns (stdlib
+`array`) for nodes and pods:
+
+- nodes: capacity / allocatable / usage CPU (millicores), memory (bytes) and
+  pods, ready flag, zone and nodegroup codes
+- pods: owning node, namespace and component codes, requested and used CPU
+  and memory
+
+Group keys are dictionary-encoded to integer codes; a group-by sorts the
+row indices by code once, after which each group is a contiguous slice and
+its sums run in C (`sum` over slices). Totals, per-node utilization and the
+zone / nodegroup / namespace / component rollups are passes over columns.
+
+Usage:
+    frame = CapacityFrame.from_nodes(nodes)   # K8sNode list (pods optional)
+    frame.summary()
+    frame.rollup('zone')
+"""
+
+import re
+from array import array
+from collections import Counter
+from itertools import accumulate, chain, repeat
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# Suffix -> multiplier (binary and decimal SI suffixes of resource.Quantity)
+_SUFFIXES = {
+    'Ki': 1024, 'Mi': 1024 ** 2, 'Gi': 1024 ** 3, 'Ti': 1024 ** 4, 'Pi': 1024 ** 5, 'Ei': 1024 ** 6,
+    'n': 1e-9, 'u': 1e-6, 'm': 1e-3, '': 1,
+    'k': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12, 'P': 1e15, 'E': 1e18,
+}
+_QUANTITY = re.compile(r'^([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)(Ki|Mi|Gi|Ti|Pi|Ei|n|u|m|k|M|G|T|P|E|)$')
+
+_parsed: Dict[str, float] = {}
+
+
+def parse_quantity(value: Any) -> float:
+    """Kubernetes quantity in base units (cores, bytes, count); 0 when empty or invalid."""
+    if value is None or value == '':
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    cached = _parsed.get(value)
+    if cached is not None:
+        return cached
+    match = _QUANTITY.match(value.strip())
+    result = float(match.group(1)) * _SUFFIXES[match.group(2)] if match else 0.0
+    if len(_parsed) < 65536:
+        _parsed[value] = result
+    return result
+
+
+def cpu_millicores(value: Any) -> float:
+    return parse_quantity(value) * 1000
+
+
+def memory_bytes(value: Any) -> float:
+    return parse_quantity(value)
+
+
+def format_cpu(millicores: float) -> str:
+    return f"{int(round(millicores))}m"
+
+
+def format_memory(bytes_val: float) -> str:
+    """Format bytes to human readable"""
+    bytes_val = int(bytes_val)
+    if bytes_val >= 1024 * 1024 * 1024:
+        return f"{bytes_val // (1024 * 1024 * 1024)}Gi"
+    elif bytes_val >= 1024 * 1024:
+        return f"{bytes_val // (1024 * 1024)}Mi"
+    else:
+        return f"{bytes_val // 1024}Ki"
+
+
+def _percent(part: float, whole: float) -> float:
+    return round(part / whole * 100, 1) if whole > 0 else 0
+
+
+def _quantity_column(values: Iterable[Any], convert) -> array:
+    """Column of parsed quantities: each distinct string is parsed once."""
+    values = list(values)
+    parsed = {value: convert(value) for value in set(values)}
+    return array('d', map(parsed.__getitem__, values))
+
+
+def _code_column(values: Iterable[Optional[str]]) -> Tuple[array, List[str]]:
+    """Dictionary-encode group keys to dense integer codes (first-seen order)."""
+    values = list(values)
+    index = {key: code for code, key in enumerate(dict.fromkeys(values))}
+    if any(not key for key in index):
+        # None / '' group under 'unknown'
+        values = [value or 'unknown' for value in values]
+        index = {key: code for code, key in enumerate(dict.fromkeys(values))}
+    return array('i', map(index.__getitem__, values)), list(index)
+
+
+class _Grouping:
+    """Rows ordered by group code: each group is one contiguous slice."""
+
+    def __init__(self, codes: array, groups: int):
+        self.counts = [0] * groups
+        for code, count in Counter(codes).items():
+            self.counts[code] = count
+        self.bounds = list(accumulate(self.counts, initial=0))
+        order = sorted(range(len(codes)), key=codes.__getitem__)
+        self._take = itemgetter(*order) if len(order) > 1 else (lambda values: tuple(values[i] for i in order))
+
+    def sums(self, values: array) -> List[float]:
+        ordered = self._take(values)
+        bounds = self.bounds
+        return [sum(ordered[bounds[i]:bounds[i + 1]]) for i in range(len(self.counts))]
+
+
+NODE_DIMENSIONS = ('zone', 'nodegroup')
+POD_DIMENSIONS = ('namespace', 'component')
+
+# Quantity columns (K8sNode / K8sNodePod attribute -> parser) and plain counts
+NODE_QUANTITIES = {
+    'capacity_cpu': cpu_millicores,
+    'capacity_memory': memory_bytes,
+    'allocatable_cpu': cpu_millicores,
+    'allocatable_memory': memory_bytes,
+    'usage_cpu': cpu_millicores,
+    'usage_memory': memory_bytes,
+}
+NODE_COUNTS = ('capacity_pods', 'allocatable_pods', 'pod_count')
+POD_QUANTITIES = {
+    'requests_cpu': cpu_millicores,
+    'requests_memory': memory_bytes,
+    'usage_cpu': cpu_millicores,
+    'usage_memory': memory_bytes,
+}
+
+
+class CapacityFrame:
+    """Columnar node and pod capacity data with vectorized rollups."""
+
+    def __init__(self, nodes: List[Any]):
+        nodes = list(nodes)
+        self._groupings: Dict[str, _Grouping] = {}
+        self.node_names: List[str] = [node.name for node in nodes]
+        self.node_ready = array('b', [node.status == 'Ready' for node in nodes])
+
+        # Columns are extracted in one pass (attrgetter) and transposed (zip)
+        node_fields = NODE_DIMENSIONS + tuple(NODE_QUANTITIES) + NODE_COUNTS
+        node_columns = dict(zip(node_fields, zip(*map(attrgetter(*node_fields), nodes)))) if nodes else {}
+        self.node_codes: Dict[str, array] = {}
+        self.node_keys: Dict[str, List[str]] = {}
+        for dim in NODE_DIMENSIONS:
+            self.node_codes[dim], self.node_keys[dim] = _code_column(node_columns.get(dim, ()))
+        self.nodes: Dict[str, array] = {}
+        for name, convert in NODE_QUANTITIES.items():
+            self.nodes[name] = _quantity_column(node_columns.get(name, ()), convert)
+        for name in NODE_COUNTS:
+            self.nodes[name] = array('d', (count or 0 for count in node_columns.get(name, ())))
+
+        # Pods flattened, with the row of their node
+        pods = list(chain.from_iterable(node.pods or () for node in nodes))
+        self.has_pods = bool(pods)
+        self.pod_node = array('i', chain.from_iterable(repeat(row, len(node.pods or ())) for row, node in enumerate(nodes)))
+        pod_fields = POD_DIMENSIONS + tuple(POD_QUANTITIES)
+        pod_columns = dict(zip(pod_fields, zip(*map(attrgetter(*pod_fields), pods)))) if pods else {}
+        self.pod_codes: Dict[str, array] = {}
+        self.pod_keys: Dict[str, List[str]] = {}
+        for dim in POD_DIMENSIONS:
+            self.pod_codes[dim], self.pod_keys[dim] = _code_column(pod_columns.get(dim, ()))
+        self.pods: Dict[str, array] = {
+            name: _quantity_column(pod_columns.get(name, ()), convert)
+            for name, convert in POD_QUANTITIES.items()
+        }
+
+        # Requests per node: pod requests grouped by node row
+        by_node = self._grouping('node', self.pod_node, len(nodes))
+        self.nodes['requests_cpu'] = array('d', by_node.sums(self.pods['requests_cpu']))
+        self.nodes['requests_memory'] = array('d', by_node.sums(self.pods['requests_memory']))
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Any]) -> 'CapacityFrame':
+        """Build from K8sNode objects (with their K8sNodePod lists, if fetched)."""
+        return cls(list(nodes))
+
+    def _grouping(self, name: str, codes: array, groups: int) -> _Grouping:
+        if name not in self._groupings:
+            self._groupings[name] = _Grouping(codes, groups)
+        return self._groupings[name]
+
+    # -------------------------------------------------------------------------
+    # Aggregation
+    # -------------------------------------------------------------------------
+
+    def totals(self) -> Dict[str, float]:
+        return {name: sum(values) for name, values in self.nodes.items()}
+
+    def group_counts(self, dimension: str) -> Dict[str, int]:
+        """Nodes (zone, nodegroup) or pods (namespace, component) per group."""
+        if dimension in NODE_DIMENSIONS:
+            codes, keys = self.node_codes[dimension], self.node_keys[dimension]
+        else:
+            codes, keys = self.pod_codes[dimension], self.pod_keys[dimension]
+        return dict(zip(keys, self._grouping(dimension, codes, len(keys)).counts))
+
+    def rollup(self, dimension: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Capacity rollup by a node dimension (zone, nodegroup) or a pod
+        dimension (namespace, component).
+        """
+        if dimension in NODE_DIMENSIONS:
+            keys = self.node_keys[dimension]
+            grouping = self._grouping(dimension, self.node_codes[dimension], len(keys))
+            ready = grouping.sums(self.node_ready)
+            sums = {name: grouping.sums(values) for name, values in self.nodes.items()}
+            return {
+                key: {
+                    'nodes': grouping.counts[i],
+                    'readyNodes': int(ready[i]),
+                    **self._capacity_view({name: values[i] for name, values in sums.items()}),
+                }
+                for i, key in enumerate(keys)
+            }
+
+        if dimension in POD_DIMENSIONS:
+            keys = self.pod_keys[dimension]
+            grouping = self._grouping(dimension, self.pod_codes[dimension], len(keys))
+            sums = {name: grouping.sums(values) for name, values in self.pods.items()}
+            return {
+                key: {
+                    'pods': grouping.counts[i],
+                    'requests': {
+                        'cpu': format_cpu(sums['requests_cpu'][i]),
+                        'memory': format_memory(sums['requests_memory'][i]),
+                    },
+                    'usage': {
+                        'cpu': format_cpu(sums['usage_cpu'][i]),
+                        'memory': format_memory(sums['usage_memory'][i]),
+                    },
+                }
+                for i, key in enumerate(keys)
+            }
+
+        raise ValueError(f"Unknown capacity dimension: {dimension}")
+
+    @staticmethod
+    def _capacity_view(sums: Dict[str, float]) -> Dict[str, Any]:
+        view = {
+            'capacity': {
+                'cpu': format_cpu(sums['capacity_cpu']),
+                'memory': format_memory(sums['capacity_memory']),
+                'pods': int(sums['capacity_pods']),
+            },
+            'allocatable': {
+                'cpu': format_cpu(sums['allocatable_cpu']),
+                'memory': format_memory(sums['allocatable_memory']),
+                'pods': int(sums['allocatable_pods']),
+            },
+            'usage': {
+                'cpu': format_cpu(sums['usage_cpu']),
+                'memory': format_memory(sums['usage_memory']),
+                'pods': int(sums['pod_count']),
+            },
+            'utilizationPercent': {
+                'cpu': _percent(sums['usage_cpu'], sums['allocatable_cpu']),
+                'memory': _percent(sums['usage_memory'], sums['allocatable_memory']),
+                'pods': _percent(sums['pod_count'], sums['allocatable_pods']),
+            },
+        }
+        if sums.get('requests_cpu') or sums.get('requests_memory'):
+            view['requests'] = {
+                'cpu': format_cpu(sums['requests_cpu']),
+                'memory': format_memory(sums['requests_memory']),
+            }
+            view['requestedPercent'] = {
+                'cpu': _percent(sums['requests_cpu'], sums['allocatable_cpu']),
+                'memory': _percent(sums['requests_memory'], sums['allocatable_memory']),
+            }
+        return view
+
+    def node_utilization(self) -> List[Dict[str, float]]:
+        """Per-node utilization percentages, in node order."""
+        columns = self.nodes
+        return [
+            {
+                'cpu': _percent(usage_cpu, alloc_cpu),
+                'memory': _percent(usage_memory, alloc_memory),
+                'pods': _percent(pod_count, alloc_pods),
+            }
+            for usage_cpu, alloc_cpu, usage_memory, alloc_memory, pod_count, alloc_pods in zip(
+                columns['usage_cpu'], columns['allocatable_cpu'],
+                columns['usage_memory'], columns['allocatable_memory'],
+                columns['pod_count'], columns['allocatable_pods'],
+            )
+        ]
+
+    def summary(self) -> Dict[str, Any]:
+        """Cluster summary (node views' `summary` payload) with rollups."""
+        totals = self.totals()
+        view = self._capacity_view(totals)
+        summary = {
+            'totalNodes': len(self.node_names),
+            'readyNodes': sum(self.node_ready),
+            'nodesByZone': self.group_counts('zone'),
+            'nodesByNodegroup': self.group_counts('nodegroup'),
+            'totalCapacity': view['capacity'],
+            'totalAllocatable': view['allocatable'],
+            'totalUsage': view['usage'],
+            'utilizationPercent': view['utilizationPercent'],
+            'byZone': self.rollup('zone'),
+            'byNodegroup': self.rollup('nodegroup'),
+        }
+        if 'requests' in view:
+            summary['totalRequests'] = view['requests']
+            summary['requestedPercent'] = view['requestedPercent']
+        if self.has_pods:
+            summary['byNamespace'] = self.rollup('namespace')
+            summary['byComponent'] = self.rollup('component')
+        return summary
@@ -3,7 +3,7 @@ AWS ECS Fargate Orchestrator Provider implementation.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from providers.base import (
     OrchestratorProvider,
@@ -16,6 +16,8 @@ from providers.base import (
 )
 from app_config import DashboardConfig
 from utils.aws import get_cross_account_client, get_action_client, build_sso_console_url
+from utils.concurrency import map_concurrent
+from providers.serialization import wants
 
 
 def matches_discovery_tags(resource_tags: list, discovery_tags: dict) -> bool:
@@ -103,7 +105,7 @@ class ECSProvider(OrchestratorProvider):
             cache[secret_arn] = secret_arn
             return secret_arn
 
-    def get_services(self, env: str) -> Dict[str, Service]:
+    def get_services(self, env: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Service]:
         """Get all services for an environment"""
         env_config = self.config.get_environment(self.project, env)
         if not env_config:
@@ -112,7 +114,7 @@ class ECSProvider(OrchestratorProvider):
         result = {}
         for service_name in env_config.services:
             try:
-                result[service_name] = self.get_service(env, service_name)
+                result[service_name] = self.get_service(env, service_name, fields)
             except Exception as e:
                 result[service_name] = Service(
                     name=self.config.get_service_name(self.project, env, service_name),
@@ -126,8 +128,8 @@ class ECSProvider(OrchestratorProvider):
 
         return result
 
-    def get_service(self, env: str, service: str) -> Service:
-        """Get service information"""
+    def get_service(self, env: str, service: str, fields: Optional[Tuple[str, ...]] = None) -> Service:
+        """Get service information (`fields`: see OrchestratorProvider.get_service)"""
         env_config = self.config.get_environment(self.project, env)
         if not env_config:
             raise ValueError(f"Unknown environment: {env}")
@@ -147,30 +149,34 @@ class ECSProvider(OrchestratorProvider):
 
         svc = services_response['services'][0]
 
-        # Get task definition
-        task_def = ecs.describe_task_definition(
-            taskDefinition=svc['taskDefinition']
-        )['taskDefinition']
-
-        # Get tasks
-        tasks = self._get_service_tasks(ecs, cluster_name, service_name, svc['taskDefinition'])
+        # Get tasks (list_tasks + describe_tasks)
+        tasks = []
+        if wants(fields, 'tasks'):
+            tasks = self._get_service_tasks(ecs, cluster_name, service_name, svc['taskDefinition'])
 
         # Get deployments
         deployments = self._format_deployments(svc['deployments'])
 
-        # Check for latest diff
-        latest_diff = self._get_latest_diff(ecs, task_def)
+        # Task definition, and diff with the latest revision of its family
+        task_def_info = None
+        latest_diff = None
+        if wants(fields, 'taskDefinition', 'latestDiff'):
+            task_def = ecs.describe_task_definition(
+                taskDefinition=svc['taskDefinition']
+            )['taskDefinition']
 
-        # Build task definition info
-        container = task_def['containerDefinitions'][0]
-        task_def_info = {
-            'family': task_def['family'],
-            'revision': task_def['revision'],
-            'cpu': int(task_def['cpu']),
-            'memory': int(task_def['memory']),
-            'image': container['image'],
-            'latestDiff': latest_diff
-        }
+            if wants(fields, 'latestDiff'):
+                latest_diff = self._get_latest_diff(ecs, task_def)
+
+            container = task_def['containerDefinitions'][0]
+            task_def_info = {
+                'family': task_def['family'],
+                'revision': task_def['revision'],
+                'cpu': int(task_def['cpu']),
+                'memory': int(task_def['memory']),
+                'image': container['image'],
+                'latestDiff': latest_diff
+            }
 
         console_url = build_sso_console_url(
             self.config.sso_portal_url,
@@ -1155,71 +1161,98 @@ class ECSProvider(OrchestratorProvider):
                 return alb_info
         return None
 
+    def _describe_services_batched(self, ecs, cluster_name: str, service_names: List[str], account_id: str) -> Dict[str, dict]:
+        """
+        Describe services 10 per call (API limit), batches in parallel.
+
+        Returns {service name: description or {'error': ...}}; services missing
+        from the cluster are absent.
+        """
+        batches = [service_names[i:i + 10] for i in range(0, len(service_names), 10)]
+
+        def describe(batch):
+            try:
+                return {
+                    s['serviceName']: s
+                    for s in ecs.describe_services(cluster=cluster_name, services=batch).get('services', [])
+                }
+            except Exception as e:
+                return {name: {'error': str(e)} for name in batch}
+
+        described = {}
+        for batch_result in map_concurrent(describe, batches, account_id=account_id):
+            described.update(batch_result)
+        return described
+
+    def _list_service_tasks(self, ecs, cluster_name: str, service_name: str) -> List[dict]:
+        """Running and pending tasks of a service (every list_tasks page, described 100 per call)"""
+        task_arns = []
+        paginator = ecs.get_paginator('list_tasks')
+        for status in ['RUNNING', 'PENDING']:
+            for page in paginator.paginate(cluster=cluster_name, serviceName=service_name, desiredStatus=status):
+                task_arns.extend(page.get('taskArns', []))
+
+        tasks = []
+        for i in range(0, len(task_arns), 100):
+            tasks.extend(ecs.describe_tasks(cluster=cluster_name, tasks=task_arns[i:i + 100])['tasks'])
+        return tasks
+
     def _get_services_for_infrastructure(self, ecs, env: str, cluster_name: str, account_id: str, services: list = None) -> dict:
         """Get ECS services with task details for infrastructure view"""
         env_config = self.config.get_environment(self.project, env)
-        services_result = {}
 
         # Use provided services list or fall back to env_config.services
         service_list = services or env_config.services
+        service_names = {
+            svc_name: self.config.get_service_name(self.project, env, svc_name)
+            for svc_name in service_list
+        }
+        described = self._describe_services_batched(ecs, cluster_name, list(dict.fromkeys(service_names.values())), account_id)
 
-        for svc_name in service_list:
+        def build(svc_name: str):
+            service_name = service_names[svc_name]
+            s = described.get(service_name)
+            if s is None:
+                return None
+            if 'error' in s:
+                return s
             try:
-                service_name = self.config.get_service_name(self.project, env, svc_name)
-                svc_response = ecs.describe_services(cluster=cluster_name, services=[service_name])
-
-                if not svc_response['services']:
-                    continue
-
-                s = svc_response['services'][0]
                 current_revision = s['taskDefinition'].split(':')[-1]
 
-                # Get all tasks
-                all_task_arns = []
-                for status in ['RUNNING', 'PENDING']:
-                    task_arns = ecs.list_tasks(
-                        cluster=cluster_name,
-                        serviceName=service_name,
-                        desiredStatus=status
-                    ).get('taskArns', [])
-                    all_task_arns.extend(task_arns)
-
                 tasks = []
                 tasks_by_az = {}
-                if all_task_arns:
-                    task_details = ecs.describe_tasks(cluster=cluster_name, tasks=all_task_arns)['tasks']
-                    for task in task_details:
-                        task_revision = task['taskDefinitionArn'].split(':')[-1]
-                        az = None
-                        subnet_id = None
-
-                        for attachment in task.get('attachments', []):
-                            if attachment.get('type') == 'ElasticNetworkInterface':
-                                for detail in attachment.get('details', []):
-                                    if detail.get('name') == 'subnetId':
-                                        subnet_id = detail.get('value')
-                                    elif detail.get('name') == 'availabilityZone':
-                                        az = detail.get('value')
-                        if not az:
-                            az = task.get('availabilityZone')
-
-                        task_info = {
-                            'taskId': task['taskArn'].split('/')[-1][:8],
-                            'fullId': task['taskArn'].split('/')[-1],
-                            'status': task['lastStatus'],
-                            'desiredStatus': task.get('desiredStatus', 'RUNNING'),
-                            'health': task.get('healthStatus', 'UNKNOWN'),
-                            'revision': task_revision,
-                            'isLatest': task_revision == current_revision,
-                            'az': az,
-                            'startedAt': task.get('startedAt', '').isoformat() if task.get('startedAt') else None
-                        }
-                        tasks.append(task_info)
-
-                        if az:
-                            if az not in tasks_by_az:
-                                tasks_by_az[az] = []
-                            tasks_by_az[az].append(task_info)
+                for task in self._list_service_tasks(ecs, cluster_name, service_name):
+                    task_revision = task['taskDefinitionArn'].split(':')[-1]
+                    az = None
+                    subnet_id = None
+
+                    for attachment in task.get('attachments', []):
+                        if attachment.get('type') == 'ElasticNetworkInterface':
+                            for detail in attachment.get('details', []):
+                                if detail.get('name') == 'subnetId':
+                                    subnet_id = detail.get('value')
+                                elif detail.get('name') == 'availabilityZone':
+                                    az = detail.get('value')
+                    if not az:
+                        az = task.get('availabilityZone')
+
+                    task_info = {
+                        'taskId': task['taskArn'].split('/')[-1][:8],
+                        'fullId': task['taskArn'].split('/')[-1],
+                        'status': task['lastStatus'],
+                        'desiredStatus': task.get('desiredStatus', 'RUNNING'),
+                        'health': task.get('healthStatus', 'UNKNOWN'),
+                        'revision': task_revision,
+                        'isLatest': task_revision == current_revision,
+                        'az': az,
+                        'startedAt': task.get('startedAt', '').isoformat() if task.get('startedAt') else None
+                    }
+                    tasks.append(task_info)
+
+                    if az:
+                        if az not in tasks_by_az:
+                            tasks_by_az[az] = []
+                        tasks_by_az[az].append(task_info)
 
                 # Deployments
                 deployments = [{
@@ -1236,7 +1269,7 @@ class ECSProvider(OrchestratorProvider):
 
                 is_rolling = len(deployments) > 1 or any(d['status'] == 'ACTIVE' for d in deployments if d['status'] != 'PRIMARY')
 
-                services_result[svc_name] = {
+                return {
                     'name': service_name,
                     'status': s['status'],
                     'runningCount': s['runningCount'],
@@ -1254,9 +1287,12 @@ class ECSProvider(OrchestratorProvider):
                     )
                 }
             except Exception as e:
-                services_result[svc_name] = {'error': str(e)}
+                return {'error': str(e)}
 
-        return services_result
+        # Task listing per service, in parallel
+        svc_names = list(service_names)
+        results = map_concurrent(build, svc_names, account_id=account_id)
+        return {svc_name: result for svc_name, result in zip(svc_names, results) if result is not None}
 
     def _get_rds_info(self, rds, env: str, account_id: str, discovery_tags: dict = None, databases: list = None) -> dict:
         """Get RDS database info (filtered by discovery_tags and database type)"""
@@ -3,10 +3,9 @@ AWS EKS Kubernetes Orchestrator Provider implementation.
 Uses Kubernetes API via boto3 EKS token and kubernetes client.
 """
 
-import base64
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from providers.base import (
     OrchestratorProvider,
@@ -26,7 +25,14 @@ from providers.base import (
 )
 from app_config import DashboardConfig
 from utils.aws import get_cross_account_client, get_action_client, build_sso_console_url
+from utils.eks import get_k8s_connection
+from providers.orchestrator.capacity import cpu_millicores, memory_bytes
+from providers.orchestrator.k8s_informer import get_informer, start_informers
+from providers.serialization import wants
 from utils.instance_specs import format_instance_type
+from shared.log import get_logger
+
+logger = get_logger(__name__)
 
 
 class EKSProvider(OrchestratorProvider):
@@ -54,46 +60,35 @@ class EKSProvider(OrchestratorProvider):
     def _get_k8s_client(self, env: str):
         """
         Get Kubernetes client for EKS cluster.
-        Uses EKS token for authentication.
+        Uses the process-wide EKS connection (cached endpoint/CA, refreshed token).
         """
-        print(f"[DEBUG] _get_k8s_client: env={env}")
+        logger.debug("_get_k8s_client: env=%s", env)
         if env in self._k8s_clients:
-            print(f"[DEBUG] _get_k8s_client: returning cached client for {env}")
+            logger.debug("_get_k8s_client: returning cached client for %s", env)
             return self._k8s_clients[env]
 
         try:
-            # Import kubernetes client - must be installed in Lambda layer
-            from kubernetes import client as k8s_client
-            from kubernetes.client import Configuration
-
             env_config = self.config.get_environment(self.project, env)
-            print(f"[DEBUG] _get_k8s_client: env_config={env_config}")
-            eks = self._get_eks_client(env)
+            logger.debug("_get_k8s_client: env_config=%s", env_config)
 
-            # Get cluster info - use env-specific cluster name from config
+            # Use env-specific cluster name from config
             cluster_name = env_config.cluster_name or self.config.get_cluster_name(self.project, env)
-            print(f"[DEBUG] _get_k8s_client: cluster_name={cluster_name}")
-            cluster_info = eks.describe_cluster(name=cluster_name)['cluster']
-            print(f"[DEBUG] _get_k8s_client: cluster endpoint={cluster_info['endpoint']}")
-
-            # Generate EKS token with assumed role credentials
-            # Store env name in env_config for token generation
-            env_config.env_name = env
-            token = self._get_eks_token(env_config, cluster_name, env_config.region)
-            print(f"[DEBUG] _get_k8s_client: token generated (length={len(token)})")
-
-            # Configure K8s client
-            configuration = Configuration()
-            configuration.host = cluster_info['endpoint']
-            configuration.verify_ssl = True
-            configuration.ssl_ca_cert = self._write_ca_cert(cluster_info['certificateAuthority']['data'])
-            configuration.api_key = {"authorization": f"Bearer {token}"}
-            print(f"[DEBUG] _get_k8s_client: K8s client configured, host={configuration.host}")
-
-            api_client = k8s_client.ApiClient(configuration)
+            logger.debug("_get_k8s_client: cluster_name=%s", cluster_name)
+
+            # Role whose credentials sign the EKS token
+            role_arn = self.config.get_read_role_arn_for_env(self.project, env, env_config.account_id)
+            if not role_arn:
+                role_arn = self.config.get_read_role_arn(env_config.account_id)
+            if not role_arn:
+                raise ValueError(f"No read role ARN configured for account {env_config.account_id}")
+
+            connection = get_k8s_connection(role_arn, env_config.region, cluster_name)
+            logger.debug("_get_k8s_client: K8s client configured, host=%s", connection.endpoint)
+
             self._k8s_clients[env] = {
-                'apps': k8s_client.AppsV1Api(api_client),
-                'core': k8s_client.CoreV1Api(api_client),
+                'apps': connection.apps,
+                'core': connection.core,
+                'connection': connection,
                 'cluster_name': cluster_name,
                 'namespace': env_config.namespace or self.config.orchestrator.default_namespace
             }
@@ -105,154 +100,23 @@ class EKSProvider(OrchestratorProvider):
         except Exception as e:
             raise RuntimeError(f"Failed to create K8s client: {e}")
 
-    def _get_eks_token(self, env_config, cluster_name: str, region: str) -> str:
-        """Generate EKS auth token using STS GetCallerIdentity presigned URL
-
-        This implements the same token generation as aws-iam-authenticator.
-        Uses STS presigned URL with x-k8s-aws-id header for cluster identification.
-        """
-        import boto3
-        import datetime
-        import hashlib
-        import hmac
-        import urllib.parse
-
-        print(f"[DEBUG] _get_eks_token: cluster_name={cluster_name}, region={region}, account_id={env_config.account_id}")
-
-        try:
-            # Get assumed role credentials for the target account
-            role_arn = self.config.get_read_role_arn_for_env(self.project, env_config.env_name, env_config.account_id)
-            print(f"[DEBUG] _get_eks_token: role_arn from env={role_arn}")
-            if not role_arn:
-                role_arn = self.config.get_read_role_arn(env_config.account_id)
-                print(f"[DEBUG] _get_eks_token: role_arn from account={role_arn}")
-
-            if not role_arn:
-                raise ValueError(f"No read role ARN configured for account {env_config.account_id}")
-
-            print(f"[DEBUG] _get_eks_token: assuming role {role_arn}")
-            # Assume role to get temporary credentials
-            sts = boto3.client('sts')
-            assumed = sts.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName='dashborion-eks-token'
-            )
-            creds = assumed['Credentials']
-            access_key = creds['AccessKeyId']
-            secret_key = creds['SecretAccessKey']
-            session_token = creds['SessionToken']
-            print(f"[DEBUG] _get_eks_token: role assumed successfully, access_key={access_key[:10]}...")
-
-            # SigV4 signing for presigned URL
-            method = 'GET'
-            service = 'sts'
-            host = f'sts.{region}.amazonaws.com'
-            endpoint = f'https://{host}/'
-
-            # Current time
-            t = datetime.datetime.utcnow()
-            amz_date = t.strftime('%Y%m%dT%H%M%SZ')
-            date_stamp = t.strftime('%Y%m%d')
-
-            # Canonical request components
-            canonical_uri = '/'
-            algorithm = 'AWS4-HMAC-SHA256'
-            credential_scope = f'{date_stamp}/{region}/{service}/aws4_request'
-
-            # Headers to sign - must include x-k8s-aws-id for EKS
-            headers_to_sign = {
-                'host': host,
-                'x-k8s-aws-id': cluster_name
-            }
-            signed_headers = ';'.join(sorted(headers_to_sign.keys()))
-            canonical_headers = ''.join(f'{k}:{v}\n' for k, v in sorted(headers_to_sign.items()))
-
-            # Build canonical querystring (alphabetically sorted, includes auth params except signature)
-            query_params = {
-                'Action': 'GetCallerIdentity',
-                'Version': '2011-06-15',
-                'X-Amz-Algorithm': algorithm,
-                'X-Amz-Credential': f'{access_key}/{credential_scope}',
-                'X-Amz-Date': amz_date,
-                'X-Amz-Expires': '60',
-                'X-Amz-Security-Token': session_token,
-                'X-Amz-SignedHeaders': signed_headers,
-            }
-            canonical_querystring = '&'.join(
-                f'{urllib.parse.quote(k, safe="")}={urllib.parse.quote(v, safe="")}'
-                for k, v in sorted(query_params.items())
-            )
-
-            # Payload hash must be SHA256 of empty string for EKS token generation
-            # This is different from S3 presigned URLs which use UNSIGNED-PAYLOAD
-            payload_hash = hashlib.sha256(b'').hexdigest()
-
-            # Build canonical request
-            canonical_request = f'{method}\n{canonical_uri}\n{canonical_querystring}\n{canonical_headers}\n{signed_headers}\n{payload_hash}'
-            canonical_request_hash = hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
-
-            # Create string to sign
-            string_to_sign = f'{algorithm}\n{amz_date}\n{credential_scope}\n{canonical_request_hash}'
-
-            # Calculate signature
-            def sign(key, msg):
-                return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
-
-            k_date = sign(('AWS4' + secret_key).encode('utf-8'), date_stamp)
-            k_region = sign(k_date, region)
-            k_service = sign(k_region, service)
-            k_signing = sign(k_service, 'aws4_request')
-            signature = hmac.new(k_signing, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
-
-            # Build presigned URL (same order as canonical querystring + signature at end)
-            presigned_url = f'{endpoint}?{canonical_querystring}&X-Amz-Signature={signature}'
-
-            # Encode as k8s-aws token format
-            token = 'k8s-aws-v1.' + base64.urlsafe_b64encode(
-                presigned_url.encode('utf-8')
-            ).decode('utf-8').rstrip('=')
-
-            return token
-
-        except Exception as e:
-            print(f"Error generating EKS token: {e}")
-            import traceback
-            traceback.print_exc()
-            raise ValueError(f"Failed to generate EKS token: {e}")
-
-    def _write_ca_cert(self, ca_data: str) -> str:
-        """Write CA cert to temp file and return path"""
-        import tempfile
-        import os
-
-        ca_cert = base64.b64decode(ca_data)
-
-        # Write to /tmp (Lambda writable directory)
-        cert_path = '/tmp/eks-ca.crt'
-        with open(cert_path, 'wb') as f:
-            f.write(ca_cert)
-
-        return cert_path
-
-    def get_services(self, env: str) -> Dict[str, Service]:
+    def get_services(self, env: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Service]:
         """Get all services (deployments) for an environment"""
-        print(f"[DEBUG] get_services: project={self.project}, env={env}")
+        logger.debug("get_services: project=%s, env=%s", self.project, env)
         env_config = self.config.get_environment(self.project, env)
         if not env_config:
-            print(f"[DEBUG] get_services: unknown environment {env}")
+            logger.debug("get_services: unknown environment %s", env)
             return {'error': f'Unknown environment: {env}'}
 
-        print(f"[DEBUG] get_services: services to fetch={env_config.services}")
+        logger.debug("get_services: services to fetch=%s", env_config.services)
         result = {}
         for service_name in env_config.services:
             try:
-                print(f"[DEBUG] get_services: fetching service {service_name}")
-                result[service_name] = self.get_service(env, service_name)
-                print(f"[DEBUG] get_services: {service_name} OK")
+                logger.debug("get_services: fetching service %s", service_name)
+                result[service_name] = self.get_service(env, service_name, fields)
+                logger.debug("get_services: %s OK", service_name)
             except Exception as e:
-                print(f"[DEBUG] get_services: ERROR for {service_name}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("get_services: error for %s: %s", service_name, e)
                 result[service_name] = Service(
                     name=service_name,
                     service=service_name,
@@ -265,9 +129,9 @@ class EKSProvider(OrchestratorProvider):
 
         return result
 
-    def get_service(self, env: str, service: str) -> Service:
-        """Get service (deployment) information"""
-        print(f"[DEBUG] get_service: env={env}, service={service}")
+    def get_service(self, env: str, service: str, fields: Optional[Tuple[str, ...]] = None) -> Service:
+        """Get service (deployment) information (`fields`: see OrchestratorProvider.get_service)"""
+        logger.debug("get_service: env=%s, service=%s", env, service)
         env_config = self.config.get_environment(self.project, env)
         if not env_config:
             raise ValueError(f"Unknown environment: {env}")
@@ -278,12 +142,12 @@ class EKSProvider(OrchestratorProvider):
             core_api = k8s['core']
             namespace = k8s['namespace']
             cluster_name = k8s['cluster_name']
-            print(f"[DEBUG] get_service: namespace={namespace}, cluster_name={cluster_name}")
+            logger.debug("get_service: namespace=%s, cluster_name=%s", namespace, cluster_name)
 
             # Get workload (Deployment or StatefulSet)
             from kubernetes.client.rest import ApiException
             workload_name = self.config.get_service_name(self.project, env, service)
-            print(f"[DEBUG] get_service: fetching workload {workload_name} in namespace {namespace}")
+            logger.debug("get_service: fetching workload %s in namespace %s", workload_name, namespace)
 
             workload = None
             workload_type = None
@@ -292,14 +156,14 @@ class EKSProvider(OrchestratorProvider):
             try:
                 workload = apps_api.read_namespaced_deployment(workload_name, namespace)
                 workload_type = 'deployment'
-                print(f"[DEBUG] get_service: found Deployment {workload_name}")
+                logger.debug("get_service: found Deployment %s", workload_name)
             except ApiException as e:
                 if e.status == 404:
                     # Try StatefulSet if Deployment not found
                     try:
                         workload = apps_api.read_namespaced_stateful_set(workload_name, namespace)
                         workload_type = 'statefulset'
-                        print(f"[DEBUG] get_service: found StatefulSet {workload_name}")
+                        logger.debug("get_service: found StatefulSet %s", workload_name)
                     except ApiException as e2:
                         if e2.status == 404:
                             raise ValueError(f"Workload {workload_name} not found (tried Deployment and StatefulSet)")
@@ -309,10 +173,12 @@ class EKSProvider(OrchestratorProvider):
 
             # Get pods for this deployment
             label_selector = f"app={service}"
-            pods = core_api.list_namespaced_pod(namespace, label_selector=label_selector)
+            pods = []
+            if wants(fields, 'tasks'):
+                pods = core_api.list_namespaced_pod(namespace, label_selector=label_selector).items
 
             tasks = []
-            for pod in pods.items:
+            for pod in pods:
                 # Determine pod status
                 phase = pod.status.phase.lower()
                 status = 'running' if phase == 'running' else 'pending' if phase == 'pending' else 'stopped'
@@ -795,8 +661,12 @@ class EKSProvider(OrchestratorProvider):
             k8s = self._get_k8s_client(env)
             core_api = k8s['core']
 
-            # Get nodes
-            nodes_response = core_api.list_node()
+            # Get nodes (from the informer cache when available). The pods
+            # informer starts alongside so both initial LISTs overlap.
+            if include_pods:
+                start_informers(k8s.get('connection'), ('pods',))
+            node_informer = get_informer(k8s.get('connection'), 'nodes')
+            node_items = node_informer.list() if node_informer else core_api.list_node().items
 
             # Get metrics if requested
             metrics_by_node = {}
@@ -839,29 +709,11 @@ class EKSProvider(OrchestratorProvider):
                                 total_memory = 0
                                 for container in item.get('containers', []):
                                     usage = container.get('usage', {})
-                                    if usage.get('cpu'):
-                                        # Parse cpu (e.g., "100m" or "1")
-                                        cpu_str = usage['cpu']
-                                        if cpu_str.endswith('n'):
-                                            total_cpu += int(cpu_str[:-1]) / 1000000
-                                        elif cpu_str.endswith('m'):
-                                            total_cpu += int(cpu_str[:-1])
-                                        else:
-                                            total_cpu += int(cpu_str) * 1000
-                                    if usage.get('memory'):
-                                        # Parse memory (e.g., "128Mi" or "1Gi")
-                                        mem_str = usage['memory']
-                                        if mem_str.endswith('Ki'):
-                                            total_memory += int(mem_str[:-2]) * 1024
-                                        elif mem_str.endswith('Mi'):
-                                            total_memory += int(mem_str[:-2]) * 1024 * 1024
-                                        elif mem_str.endswith('Gi'):
-                                            total_memory += int(mem_str[:-2]) * 1024 * 1024 * 1024
-                                        else:
-                                            total_memory += int(mem_str)
+                                    total_cpu += cpu_millicores(usage.get('cpu'))
+                                    total_memory += memory_bytes(usage.get('memory'))
                                 pod_metrics_by_name[f"{pod_ns}/{pod_name}"] = {
                                     'cpu': f"{int(total_cpu)}m",
-                                    'memory': f"{total_memory // (1024*1024)}Mi"
+                                    'memory': f"{int(total_memory) // (1024*1024)}Mi"
                                 }
                         except Exception as e:
                             print(f"Warning: Could not fetch pod metrics: {e}")
@@ -872,12 +724,15 @@ class EKSProvider(OrchestratorProvider):
             pods_by_node = {}
             if include_pods:
                 try:
-                    if namespace:
-                        pods_response = core_api.list_namespaced_pod(namespace)
+                    pod_informer = get_informer(k8s.get('connection'), 'pods')
+                    if pod_informer:
+                        pod_items = pod_informer.list(namespace)
+                    elif namespace:
+                        pod_items = core_api.list_namespaced_pod(namespace).items
                     else:
-                        pods_response = core_api.list_pod_for_all_namespaces()
+                        pod_items = core_api.list_pod_for_all_namespaces().items
 
-                    for pod in pods_response.items:
+                    for pod in pod_items:
                         node_name = pod.spec.node_name
                         if not node_name:
                             continue
@@ -934,7 +789,7 @@ class EKSProvider(OrchestratorProvider):
             )
 
             nodes = []
-            for node in nodes_response.items:
+            for node in node_items:
                 labels = node.metadata.labels or {}
                 instance_type = labels.get('node.kubernetes.io/instance-type', 'unknown')
                 zone = labels.get('topology.kubernetes.io/zone')
@@ -1032,10 +887,11 @@ class EKSProvider(OrchestratorProvider):
             core_api = k8s['core']
             ns = namespace or k8s['namespace']
 
-            services_response = core_api.list_namespaced_service(ns)
+            informer = get_informer(k8s.get('connection'), 'services')
+            service_items = informer.list(ns) if informer else core_api.list_namespaced_service(ns).items
 
             services = []
-            for svc in services_response.items:
+            for svc in service_items:
                 svc_name = svc.metadata.name
 
                 # Filter by components if specified
@@ -1096,14 +952,17 @@ class EKSProvider(OrchestratorProvider):
             k8s = self._get_k8s_client(env)
             ns = namespace or k8s['namespace']
 
-            # Get NetworkingV1Api for ingresses
-            from kubernetes import client as k8s_client
-            networking_api = k8s_client.NetworkingV1Api(k8s['core'].api_client)
-
-            ingresses_response = networking_api.list_namespaced_ingress(ns)
+            informer = get_informer(k8s.get('connection'), 'ingresses')
+            if informer:
+                ingress_items = informer.list(ns)
+            else:
+                # Get NetworkingV1Api for ingresses
+                from kubernetes import client as k8s_client
+                networking_api = k8s_client.NetworkingV1Api(k8s['core'].api_client)
+                ingress_items = networking_api.list_namespaced_ingress(ns).items
 
             ingresses = []
-            for ing in ingresses_response.items:
+            for ing in ingress_items:
                 # Parse rules
                 rules = []
                 if ing.spec.rules:
@@ -1212,19 +1071,22 @@ class EKSProvider(OrchestratorProvider):
             core_api = k8s['core']
             ns = namespace or k8s['namespace']
 
-            # List pods
-            if ns:
-                pods_response = core_api.list_namespaced_pod(
+            # List pods (from the informer cache when available)
+            informer = get_informer(k8s.get('connection'), 'pods')
+            if informer:
+                pod_items = informer.list(ns, selector)
+            elif ns:
+                pod_items = core_api.list_namespaced_pod(
                     ns,
                     label_selector=selector
-                )
+                ).items
             else:
-                pods_response = core_api.list_pod_for_all_namespaces(
+                pod_items = core_api.list_pod_for_all_namespaces(
                     label_selector=selector
-                )
+                ).items
 
             pods = []
-            for pod in pods_response.items:
+            for pod in pod_items:
                 # Calculate age
                 age = None
                 if pod.metadata.creation_timestamp:
@@ -1296,14 +1158,17 @@ class EKSProvider(OrchestratorProvider):
             apps_api = k8s['apps']
             ns = namespace or k8s['namespace']
 
-            # List deployments
-            if ns:
-                deployments_response = apps_api.list_namespaced_deployment(ns)
+            # List deployments (from the informer cache when available)
+            informer = get_informer(k8s.get('connection'), 'deployments')
+            if informer:
+                deployment_items = informer.list(ns)
+            elif ns:
+                deployment_items = apps_api.list_namespaced_deployment(ns).items
             else:
-                deployments_response = apps_api.list_deployment_for_all_namespaces()
+                deployment_items = apps_api.list_deployment_for_all_namespaces().items
 
             deployments = []
-            for deploy in deployments_response.items:
+            for deploy in deployment_items:
                 # Calculate age
                 age = None
                 if deploy.metadata.creation_timestamp:
@@ -10,6 +10,7 @@ Data format in DynamoDB:
 - pk: {project}#{env} (e.g., 'mro-mi2#nh-staging')
 - sk: check:k8s:{type}:current (e.g., 'check:k8s:pods:current')
 - Cluster-wide: pk: _cluster#{cluster_name}, sk: check:k8s:nodes:current
+- payload: map, or compressed / chunked per cache.codec (large clusters)
 """
 
 import os
@@ -38,6 +39,10 @@ from providers.base import (
     ProviderFactory,
 )
 from app_config import DashboardConfig
+from cache.codec import is_encoded, read_item
+from shared.log import get_logger
+
+logger = get_logger(__name__)
 
 
 # DynamoDB table name
@@ -257,12 +262,18 @@ class EKSDynamoProvider(OrchestratorProvider):
     # =========================================================================
 
     def _get_item(self, pk: str, sk: str) -> Optional[Dict[str, Any]]:
-        """Get item from DynamoDB and convert decimals"""
+        """Get item from DynamoDB (payload decoded, see cache.codec) and convert decimals"""
         try:
-            response = self.table.get_item(Key={'pk': pk, 'sk': sk})
-            if 'Item' in response:
-                return _convert_decimals(response['Item'])
-            return None
+            item = read_item(self.table, pk, sk)
+            if item is None:
+                return None
+            if is_encoded(item):
+                # Encoded payloads are decoded from JSON: no Decimals to convert
+                payload = item.pop('payload')
+                item = _convert_decimals(item)
+                item['payload'] = payload
+                return item
+            return _convert_decimals(item)
         except Exception as e:
             print(f"[EKSDynamoProvider] Error fetching {pk}/{sk}: {e}")
             return None
@@ -438,16 +449,16 @@ class EKSDynamoProvider(OrchestratorProvider):
             pk = self._build_pk(env)
         sk = self._build_sk(check_type)
 
-        print(f"[EKSDynamoProvider] Fetching {check_type}: pk={pk}, sk={sk}")
+        logger.debug("Fetching %s: pk=%s, sk=%s", check_type, pk, sk)
 
         # Fetch from DynamoDB
         item = self._get_item(pk, sk)
 
         # Check if we have data
         if item is None:
-            print(f"[EKSDynamoProvider] No data found for {pk}/{sk}")
+            logger.debug("No data found for %s/%s", pk, sk)
             if self.auto_refresh and not force_refresh:
-                print(f"[EKSDynamoProvider] Auto-refreshing...")
+                logger.debug("Auto-refreshing...")
                 return self._trigger_refresh(check_type, env, cluster_name, namespace, wait=True)
             return DataResult(
                 status=DataStatus.NO_DATA,
@@ -462,11 +473,11 @@ class EKSDynamoProvider(OrchestratorProvider):
         # Check if data has error status
         if item_status == 'error':
             error_msg = payload.get('error') or payload.get('message') or 'Unknown error'
-            print(f"[EKSDynamoProvider] Data has error status: {error_msg}")
+            logger.warning("Data has error status: %s", error_msg)
 
             # If auto_refresh enabled, try to refresh
             if self.auto_refresh:
-                print(f"[EKSDynamoProvider] Auto-refreshing due to error status...")
+                logger.debug("Auto-refreshing due to error status...")
                 refresh_result = self._trigger_refresh(check_type, env, cluster_name, namespace, wait=True)
 
                 # If refresh succeeded, return fresh data
@@ -474,7 +485,7 @@ class EKSDynamoProvider(OrchestratorProvider):
                     return refresh_result
 
                 # If refresh failed, return original error data (don't lose context)
-                print(f"[EKSDynamoProvider] Refresh failed: {refresh_result.error}")
+                logger.warning("Refresh failed: %s", refresh_result.error)
                 return DataResult(
                     status=DataStatus.ERROR,
                     data=payload,  # Return whatever data we have
@@ -495,7 +506,7 @@ class EKSDynamoProvider(OrchestratorProvider):
 
         if force_refresh or (is_stale and self.auto_refresh):
             reason = "force_refresh" if force_refresh else "stale data"
-            print(f"[EKSDynamoProvider] Refreshing due to {reason} (age > {self.cache_ttl_seconds}s)")
+            logger.debug("Refreshing due to %s (age > %ss)", reason, self.cache_ttl_seconds)
             refresh_result = self._trigger_refresh(check_type, env, cluster_name, namespace, wait=True)
 
             # If refresh succeeded, return fresh data
@@ -504,7 +515,7 @@ class EKSDynamoProvider(OrchestratorProvider):
 
             # If refresh failed but we have stale data, return stale data with warning
             if payload:
-                print(f"[EKSDynamoProvider] Refresh failed, returning stale data")
+                logger.warning("Refresh failed, returning stale data")
                 return DataResult(
                     status=DataStatus.STALE,
                     data=payload,
@@ -528,10 +539,12 @@ class EKSDynamoProvider(OrchestratorProvider):
     # OrchestratorProvider Interface Implementation
     # =========================================================================
 
-    def get_services(self, env: str) -> Dict[str, Service]:
+    def get_services(self, env: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Service]:
         """
         Get all services for an environment.
         Returns Dict[str, Service] where key is service name.
+        `fields` is accepted for interface compatibility: everything comes
+        from the same two cached items, there is no call to skip.
 
         Uses K8s Services data (check:k8s:services:current) for service names,
         and pods data for detailed task information.
@@ -706,7 +719,7 @@ class EKSDynamoProvider(OrchestratorProvider):
 
         return services
 
-    def get_service(self, env: str, service: str) -> Service:
+    def get_service(self, env: str, service: str, fields: Optional[Tuple[str, ...]] = None) -> Service:
         """Get service information for a specific service"""
         services = self.get_services(env)
         if service in services:
@@ -0,0 +1,440 @@
+"""
+Watch-based Kubernetes informer cache.
+
+An informer keeps a local copy of one resource kind (pods, services,
+ingresses, deployments, nodes) for a whole cluster: an initial chunked LIST,
+then a WATCH from the returned resourceVersion applying ADDED / MODIFIED /
+DELETED events. When the server answers 410 Gone (resourceVersion too old)
+the informer relists. Reads are served from in-memory indexes:
+
+- namespace -> objects
+- label key=value -> objects (label selectors)
+- node -> pods
+- owner (kind, name) -> objects (e.g. pods of a ReplicaSet)
+
+so API-server load is proportional to churn instead of to request rate.
+
+Informers run in daemon threads and suit long-lived processes: the dev
+server, a refresher, Step Function checkers. They are enabled outside Lambda
+by default (K8S_INFORMERS=true|false overrides): a frozen Lambda can't keep a
+watch open. A reader only uses an informer that is synced and whose watch
+was alive recently; otherwise it falls back to a direct LIST.
+
+Readers wait for the initial LIST only during the first SYNC_WAIT_SECONDS
+after an informer starts; past that, an informer that isn't synced (still
+retrying with backoff) is skipped without waiting. Informers LIST and WATCH
+cluster-wide: when the LIST or WATCH is forbidden (403, namespace-scoped or
+revoked RBAC), the informer is disabled for that cluster and retried after
+FORBIDDEN_RETRY_SECONDS.
+
+Liveness (`alive_at`) only advances on a successful LIST and on received
+events and bookmarks, so a watch that keeps failing ages the informer out
+of service; after WATCH_FAILURES_BEFORE_RELIST failures in a row it relists.
+
+Usage:
+    informer = get_informer(connection, 'pods')
+    if informer:
+        pods = informer.list(namespace='web', selector='app=api')
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from shared.log import get_logger
+
+logger = get_logger(__name__)
+
+
+# Resource kind -> (API group attribute on the connection, cluster-wide list method)
+KINDS = {
+    'pods': ('core', 'list_pod_for_all_namespaces'),
+    'services': ('core', 'list_service_for_all_namespaces'),
+    'nodes': ('core', 'list_node'),
+    'deployments': ('apps', 'list_deployment_for_all_namespaces'),
+    'ingresses': ('networking', 'list_ingress_for_all_namespaces'),
+}
+
+LIST_PAGE_SIZE = 500
+# Server-side watch timeout: the stream is reopened (from the last
+# resourceVersion) at least this often, which doubles as a liveness signal
+WATCH_TIMEOUT_SECONDS = 240
+# Readers ignore an informer whose watch hasn't been alive for this long
+MAX_LAG_SECONDS = 2 * WATCH_TIMEOUT_SECONDS
+# Readers wait for the initial LIST at most this long after an informer starts
+SYNC_WAIT_SECONDS = 15
+RETRY_BACKOFF_SECONDS = (1, 2, 5, 10, 30)
+# A cluster whose LIST / WATCH was forbidden gets a new informer after this long
+FORBIDDEN_RETRY_SECONDS = 600
+# Failed watches in a row before the informer relists from scratch
+WATCH_FAILURES_BEFORE_RELIST = 3
+
+HTTP_FORBIDDEN = 403
+HTTP_GONE = 410
+
+
+def informers_enabled() -> bool:
+    value = os.environ.get('K8S_INFORMERS')
+    if value is not None:
+        return value.lower() in ('1', 'true', 'yes')
+    return not os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
+
+
+# -----------------------------------------------------------------------------
+# Label selectors
+# -----------------------------------------------------------------------------
+
+def _split_terms(selector: str) -> List[str]:
+    """Split a selector on commas outside parentheses."""
+    terms, depth, current = [], 0, ''
+    for char in selector:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == ',' and depth == 0:
+            terms.append(current)
+            current = ''
+        else:
+            current += char
+    terms.append(current)
+    return [term.strip() for term in terms if term.strip()]
+
+
+def parse_selector(selector: Optional[str]) -> List[Tuple[str, str, Tuple[str, ...]]]:
+    """
+    Parse a label selector into (operator, key, values) terms.
+
+    Operators: '=' (also '=='), '!=', 'in', 'notin', 'exists', '!exists'.
+    """
+    requirements = []
+    for term in _split_terms(selector or ''):
+        lowered = f" {term} "
+        if ' notin ' in lowered or ' in ' in lowered:
+            op = 'notin' if ' notin ' in lowered else 'in'
+            key, _, rest = term.partition(f' {op} ')
+            values = tuple(v.strip() for v in rest.strip().strip('()').split(',') if v.strip())
+            requirements.append((op, key.strip(), values))
+        elif '!=' in term:
+            key, _, value = term.partition('!=')
+            requirements.append(('!=', key.strip(), (value.strip(),)))
+        elif '=' in term:
+            key, _, value = term.partition('==' if '==' in term else '=')
+            requirements.append(('=', key.strip(), (value.strip(),)))
+        elif term.startswith('!'):
+            requirements.append(('!exists', term[1:].strip(), ()))
+        else:
+            requirements.append(('exists', term, ()))
+    return requirements
+
+
+def labels_match(labels: Dict[str, str], requirements: Iterable[Tuple[str, str, Tuple[str, ...]]]) -> bool:
+    for op, key, values in requirements:
+        value = labels.get(key)
+        if op == '=' and value != values[0]:
+            return False
+        if op == '!=' and value == values[0]:
+            return False
+        if op == 'in' and value not in values:
+            return False
+        if op == 'notin' and value in values:
+            return False
+        if op == 'exists' and key not in labels:
+            return False
+        if op == '!exists' and key in labels:
+            return False
+    return True
+
+
+# -----------------------------------------------------------------------------
+# Informer
+# -----------------------------------------------------------------------------
+
+def _meta(obj):
+    return obj.metadata
+
+
+def _object_key(obj) -> Tuple[str, str]:
+    meta = _meta(obj)
+    return meta.namespace or '', meta.name
+
+
+def _index_entries(obj) -> List[Tuple[str, Any]]:
+    """Index entries of an object: namespace, labels, node, owners."""
+    meta = _meta(obj)
+    entries = [('namespace', meta.namespace or '')]
+    entries.extend(('label', (key, value)) for key, value in (meta.labels or {}).items())
+    spec = getattr(obj, 'spec', None)
+    node_name = getattr(spec, 'node_name', None) if spec is not None else None
+    if node_name:
+        entries.append(('node', node_name))
+    entries.extend(('owner', (ref.kind, ref.name)) for ref in (meta.owner_references or []))
+    return entries
+
+
+class Informer:
+    """Local, watch-maintained copy of one resource kind across the cluster."""
+
+    def __init__(self, kind: str, list_fn: Callable[..., Any]):
+        self.kind = kind
+        self._list_fn = list_fn
+        self._lock = threading.RLock()
+        self._objects: Dict[Tuple[str, str], Any] = {}
+        self._entries: Dict[Tuple[str, str], List[Tuple[str, Any]]] = {}
+        self._index: Dict[Tuple[str, Any], Set[Tuple[str, str]]] = {}
+        self.resource_version: Optional[str] = None
+        self.synced = threading.Event()
+        # Set once synced, or once disabled (LIST / WATCH forbidden)
+        self.settled = threading.Event()
+        self.forbidden = False
+        self.forbidden_at = 0.0
+        self.started_at = 0.0
+        self.alive_at = 0.0
+        self.relists = 0
+        self.events = 0
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> 'Informer':
+        if self._thread is None:
+            self.started_at = time.time()
+            self._thread = threading.Thread(target=self._run, name=f'k8s-informer-{self.kind}', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def healthy(self, max_lag: float = MAX_LAG_SECONDS) -> bool:
+        """Synced, and the watch was alive within max_lag seconds."""
+        return self.synced.is_set() and time.time() - self.alive_at < max_lag
+
+    def _run(self) -> None:
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch()
+                failures = 0
+            except Exception as e:
+                status = getattr(e, 'status', None)
+                if status == HTTP_GONE:
+                    logger.debug("Informer %s: resourceVersion expired, relisting", self.kind)
+                    self.resource_version = None
+                    continue
+                if status == HTTP_FORBIDDEN:
+                    logger.warning("Informer %s: cluster-wide list/watch forbidden, using direct reads", self.kind)
+                    self.forbidden_at = time.time()
+                    self.forbidden = True
+                    self.synced.clear()
+                    self.settled.set()
+                    return
+                delay = RETRY_BACKOFF_SECONDS[min(failures, len(RETRY_BACKOFF_SECONDS) - 1)]
+                failures += 1
+                if failures % WATCH_FAILURES_BEFORE_RELIST == 0:
+                    self.resource_version = None
+                logger.warning("Informer %s failed (%s), retrying in %ss", self.kind, e, delay)
+                self._stopped.wait(delay)
+
+    def _relist(self) -> None:
+        """Chunked LIST of the whole kind, replacing the store."""
+        objects = []
+        resource_version = None
+        continue_token = None
+        while True:
+            kwargs = {'limit': LIST_PAGE_SIZE}
+            if continue_token:
+                kwargs['_continue'] = continue_token
+            page = self._list_fn(**kwargs)
+            objects.extend(page.items)
+            if resource_version is None:
+                resource_version = page.metadata.resource_version
+            continue_token = page.metadata._continue
+            if not continue_token:
+                break
+
+        with self._lock:
+            self._objects.clear()
+            self._entries.clear()
+            self._index.clear()
+            for obj in objects:
+                self._upsert(obj)
+            self.resource_version = resource_version
+        self.relists += 1
+        self.alive_at = time.time()
+        self.synced.set()
+        self.settled.set()
+        logger.debug("Informer %s: listed %s objects at %s", self.kind, len(objects), resource_version)
+
+    def _watch(self) -> None:
+        from kubernetes import watch
+
+        watcher = watch.Watch()
+        try:
+            for event in watcher.stream(
+                self._list_fn,
+                resource_version=self.resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            ):
+                if self._stopped.is_set():
+                    return
+                event_type = event['type']
+                obj = event['object']
+
+                if event_type == 'ERROR':
+                    raw = event.get('raw_object') or {}
+                    if raw.get('code') == HTTP_GONE:
+                        self.resource_version = None
+                        return
+                    error = RuntimeError(f"watch error: {raw.get('message') or raw}")
+                    error.status = raw.get('code')
+                    raise error
+
+                self.alive_at = time.time()
+
+                resource_version = _meta(obj).resource_version
+                with self._lock:
+                    if event_type == 'DELETED':
+                        self._remove(_object_key(obj))
+                    elif event_type in ('ADDED', 'MODIFIED'):
+                        self._upsert(obj)
+                    if resource_version:
+                        self.resource_version = resource_version
+                if event_type != 'BOOKMARK':
+                    self.events += 1
+        finally:
+            watcher.stop()
+
+    # -------------------------------------------------------------------------
+    # Store (callers hold the lock)
+    # -------------------------------------------------------------------------
+
+    def _upsert(self, obj) -> None:
+        key = _object_key(obj)
+        self._remove(key)
+        entries = _index_entries(obj)
+        self._objects[key] = obj
+        self._entries[key] = entries
+        for entry in entries:
+            self._index.setdefault(entry, set()).add(key)
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        if key not in self._objects:
+            return
+        del self._objects[key]
+        for entry in self._entries.pop(key, []):
+            keys = self._index.get(entry)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[entry]
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def _select(self, candidates: Optional[Set[Tuple[str, str]]], selector: Optional[str]) -> List[Any]:
+        requirements = parse_selector(selector)
+        with self._lock:
+            # Narrow with the equality terms through the label index
+            for op, key, values in requirements:
+                if op == '=':
+                    keys = self._index.get(('label', (key, values[0])), set())
+                    candidates = keys if candidates is None else candidates & keys
+            if candidates is None:
+                candidates = set(self._objects)
+            objects = [self._objects[key] for key in sorted(candidates) if key in self._objects]
+        return [obj for obj in objects if labels_match(_meta(obj).labels or {}, requirements)]
+
+    def list(self, namespace: Optional[str] = None, selector: Optional[str] = None) -> List[Any]:
+        """Objects of a namespace (all when None) matching a label selector."""
+        candidates = None
+        if namespace:
+            with self._lock:
+                candidates = set(self._index.get(('namespace', namespace), set()))
+        return self._select(candidates, selector)
+
+    def by_node(self, node_name: str, namespace: Optional[str] = None) -> List[Any]:
+        with self._lock:
+            candidates = set(self._index.get(('node', node_name), set()))
+            if namespace:
+                candidates &= self._index.get(('namespace', namespace), set())
+        return self._select(candidates, None)
+
+    def by_owner(self, kind: str, name: str, namespace: Optional[str] = None) -> List[Any]:
+        with self._lock:
+            candidates = set(self._index.get(('owner', (kind, name)), set()))
+            if namespace:
+                candidates &= self._index.get(('namespace', namespace), set())
+        return self._select(candidates, None)
+
+    def get(self, name: str, namespace: Optional[str] = None) -> Optional[Any]:
+        with self._lock:
+            return self._objects.get((namespace or '', name))
+
+
+# -----------------------------------------------------------------------------
+# Registry
+# -----------------------------------------------------------------------------
+
+# (cluster endpoint, kind) -> informer
+_informers: Dict[Tuple[str, str], Informer] = {}
+_informers_lock = threading.Lock()
+
+
+def _list_function(connection, kind: str) -> Callable[..., Any]:
+    group, method = KINDS[kind]
+    if group == 'networking':
+        from kubernetes import client as k8s_client
+        api = k8s_client.NetworkingV1Api(connection.api_client)
+    else:
+        api = getattr(connection, group)
+    return getattr(api, method)
+
+
+def _ensure_informer(connection, kind: str) -> Informer:
+    key = (connection.endpoint, kind)
+    with _informers_lock:
+        informer = _informers.get(key)
+        if informer is not None and informer.forbidden and \
+                time.time() - informer.forbidden_at >= FORBIDDEN_RETRY_SECONDS:
+            informer = None
+        if informer is None:
+            informer = _informers[key] = Informer(kind, _list_function(connection, kind)).start()
+        return informer
+
+
+def get_informer(connection, kind: str, wait: float = SYNC_WAIT_SECONDS) -> Optional[Informer]:
+    """
+    Informer for a kind on the connection's cluster, started on first use.
+
+    Returns None when informers are disabled, when the informer's LIST is
+    forbidden, when it isn't synced `wait` seconds after it started (readers
+    past that point don't wait at all), or when its watch has gone quiet;
+    callers then LIST directly.
+    """
+    if not informers_enabled() or connection is None:
+        return None
+
+    informer = _ensure_informer(connection, kind)
+    if not informer.synced.is_set():
+        remaining = informer.started_at + wait - time.time()
+        if remaining <= 0 or not informer.settled.wait(remaining):
+            return None
+    if informer.forbidden:
+        return None
+    return informer if informer.healthy() else None
+
+
+def start_informers(connection, kinds: Iterable[str] = tuple(KINDS)) -> List[Informer]:
+    """Start the informers of a cluster without waiting for them (refreshers, checkers)."""
+    if not informers_enabled() or connection is None:
+        return []
+    return [_ensure_informer(connection, kind) for kind in kinds]
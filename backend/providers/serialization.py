@@ -0,0 +1,88 @@
+"""
+Sparse fieldsets for API responses.
+
+Providers and handlers use the same field vocabulary (response JSON keys):
+`parse_fields` reads the `fields=` query parameter, `wants` tells a provider
+whether a key (and the API calls behind it) is needed, and `select_keys`
+projects a formatted result on the selection. `Serializer` generates, per
+result type and selection, a function that builds only the selected keys
+in a single pass.
+
+Usage:
+    fields = parse_fields(get_query_param(event, 'fields'))
+    if wants(fields, 'tasks'):
+        tasks = self._get_tasks(...)
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+# Generated serializers kept per result type (distinct `fields=` selections)
+SERIALIZER_CACHE_SIZE = 128
+
+
+def parse_fields(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """`fields=` query parameter ("a,b,c") to a field selection; None when absent."""
+    if not value:
+        return None
+    fields = tuple(sorted({name.strip() for name in value.split(',') if name.strip()}))
+    return fields or None
+
+
+def wants(fields: Optional[Iterable[str]], *keys: str) -> bool:
+    """Whether a field selection (None: everything) includes any of `keys`."""
+    return fields is None or any(key in fields for key in keys)
+
+
+def select_keys(data: Dict[str, Any], fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Keys of `data` in the field selection (sparse output of dict results)."""
+    if fields is None or not isinstance(data, dict):
+        return data
+    return {key: data[key] for key in fields if key in data}
+
+
+class Serializer:
+    """
+    Single-pass JSON serializer of one result type.
+
+    `columns` maps each JSON key to a Python expression over `obj`. For a
+    field selection, the serializer compiles a function returning a dict
+    literal of the selected keys only, so unselected values (and the loops
+    or calls behind them) are never computed. Expressions run in the
+    `namespace` given (usually the formatting module's globals). Only keys
+    of `columns` reach the generated source, never the requested names.
+    """
+
+    def __init__(self, name: str, columns: Mapping[str, str], namespace: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.columns = dict(columns)
+        self.namespace = namespace if namespace is not None else {}
+        self.full = self._compile(None)
+        self._selected = lru_cache(maxsize=SERIALIZER_CACHE_SIZE)(self._compile)
+
+    def __call__(self, obj: Any, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        if fields is None:
+            return self.full(obj)
+        return self._selected(_selection_key(fields))(obj)
+
+    def for_fields(self, fields: Optional[Iterable[str]]) -> Callable[[Any], Dict[str, Any]]:
+        """Serializer function for a selection, to hoist out of a loop over results."""
+        if fields is None:
+            return self.full
+        return self._selected(_selection_key(fields))
+
+    def _compile(self, fields: Optional[Tuple[str, ...]]) -> Callable[[Any], Dict[str, Any]]:
+        keys = [key for key in self.columns if fields is None or key in fields]
+        items = ''.join(f"\n        {key!r}: {self.columns[key]}," for key in keys)
+        source = f"def serialize_{self.name}(obj):\n    return {{{items}\n    }}\n"
+        code = compile(source, f"<serializer {self.name}>", 'exec')
+        scope: Dict[str, Any] = {}
+        exec(code, self.namespace, scope)
+        return scope[f"serialize_{self.name}"]
+
+
+def _selection_key(fields: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """Hashable form of a field selection (parse_fields already returns one)."""
+    if fields is None or isinstance(fields, tuple):
+        return fields
+    return tuple(sorted(fields))
@@ -12,11 +12,13 @@ Handles all service-related endpoints:
 - GET /api/{project}/metrics/{env}/{service} - Service metrics
 - POST /api/{project}/actions/deploy/{env}/{service}/{action} - Deploy actions
 
+Service lists are versioned (ETag, If-None-Match, ?since=<version> deltas;
+see cache.delta).
+
 All endpoints require authentication and appropriate permissions.
 RBAC checks are performed per-action via decorators.
 """
 
-import json
 from datetime import datetime
 from typing import Dict, Any
 
@@ -35,28 +37,40 @@ from shared.response import (
     get_method,
     get_path,
     get_body,
+    get_query_params,
+)
+from shared.formatting import (
+    format_service,
+    format_service_details,
+    format_service_summary,
+    service_summary_fields,
 )
+from providers.serialization import parse_fields
 from app_config import get_config
+from cache.delta import versioned_response
+from cache.policies import SERVICES_TAG
+from cache.shared import invalidate_tags
 from providers import ProviderFactory
 from auth.user_management import _audit_log
+from auth.audit import flush_audit_on_exit
+from shared.log import get_logger, log_requests
 
+logger = get_logger(__name__)
 
+
+@flush_audit_on_exit
+@log_requests
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for services endpoints.
 
     Routes requests based on path structure.
     """
-    # DEBUG: Log incoming event
-    print(f"[DEBUG] Event: {json.dumps(event, default=str)}")
-
     method = get_method(event)
     path = get_path(event)
     auth = get_auth_context(event)
 
-    # DEBUG: Log auth context
-    print(f"[DEBUG] Method: {method}, Path: {path}")
-    print(f"[DEBUG] Auth context: {auth}")
+    logger.debug("Method: %s, Path: %s, Auth context: %s", method, path, auth)
 
     # Handle CORS preflight
     if method == 'OPTIONS':
@@ -160,29 +174,29 @@ def handle_services(event, auth, project: str, parts: list, config) -> Dict[str,
     """
     # Check read permission
     env = parts[3] if len(parts) > 3 else '*'
-    print(f"[DEBUG] handle_services: project={project}, env={env}, parts={parts}")
-    print(f"[DEBUG] Checking permission: action=READ, project={project}, env={env}")
     has_permission = check_permission(auth, Action.READ, project, env)
-    print(f"[DEBUG] Permission result: {has_permission}")
+    logger.debug("handle_services: project=%s, env=%s, read permission=%s", project, env, has_permission)
     if not has_permission:
         return error_response('forbidden', f'Permission denied: read on {project}/{env}', 403)
 
     orchestrator = ProviderFactory.get_orchestrator_provider(config, project)
+    # ?fields=status,runningCount: only these keys, only the calls behind them
+    fields = parse_fields(get_query_params(event).get('fields'))
 
     if len(parts) == 3:
         # /api/{project}/services - list all environments
-        return list_all_environments(project, config, orchestrator)
+        return list_all_environments(event, project, config, orchestrator, fields)
 
     elif len(parts) == 4:
         # /api/{project}/services/{env} - list services in env
         env = parts[3]
-        return list_services(project, env, config, orchestrator)
+        return list_services(event, project, env, config, orchestrator, fields)
 
     elif len(parts) >= 5:
         # /api/{project}/services/{env}/{service} - service details
         env = parts[3]
         service = parts[4]
-        return get_service(project, env, service, orchestrator)
+        return get_service(project, env, service, orchestrator, fields)
 
     return error_response('invalid_path', 'Invalid services path', 400)
 
@@ -355,6 +369,9 @@ def handle_deploy_actions(event, auth, project: str, parts: list, config) -> Dic
             'service': service,
         }, 'success')
 
+        # Cached workloads, target health and nodes show the change on the next read
+        invalidate_tags(project, env, [SERVICES_TAG])
+
         return json_response(200, result)
 
     except Exception as e:
@@ -373,7 +390,7 @@ def handle_deploy_actions(event, auth, project: str, parts: list, config) -> Dic
 # Helper Functions
 # =============================================================================
 
-def list_all_environments(project: str, config, orchestrator) -> Dict[str, Any]:
+def list_all_environments(event, project: str, config, orchestrator, fields=None) -> Dict[str, Any]:
     """List services across all environments"""
     project_config = config.get_project(project)
     result = {
@@ -384,11 +401,11 @@ def list_all_environments(project: str, config, orchestrator) -> Dict[str, Any]:
 
     for env_name, env_config in project_config.environments.items():
         try:
-            services = orchestrator.get_services(env_name)
+            services = orchestrator.get_services(env_name, fields=service_summary_fields(fields))
             result['environments'][env_name] = {
                 'accountId': env_config.account_id,
                 'services': {
-                    svc_name: format_service_summary(svc)
+                    svc_name: format_service_summary(svc, fields)
                     for svc_name, svc in services.items()
                     if not isinstance(svc, dict) or 'error' not in svc
                 }
@@ -396,23 +413,23 @@ def list_all_environments(project: str, config, orchestrator) -> Dict[str, Any]:
         except Exception as e:
             result['environments'][env_name] = {'error': str(e)}
 
-    return json_response(200, result)
+    return versioned_response(event, project, '*', 'services', {'fields': fields}, result)
 
 
-def list_services(project: str, env: str, config, orchestrator) -> Dict[str, Any]:
+def list_services(event, project: str, env: str, config, orchestrator, fields=None) -> Dict[str, Any]:
     """List services in a specific environment"""
     env_config = config.get_environment(project, env)
     if not env_config:
         return error_response('not_found', f'Unknown environment: {env} for project {project}', 404)
 
-    services = orchestrator.get_services(env)
+    services = orchestrator.get_services(env, fields=service_summary_fields(fields))
 
-    return json_response(200, {
+    return versioned_response(event, project, env, 'services', {'fields': fields}, {
         'project': project,
         'environment': env,
         'accountId': env_config.account_id,
         'services': {
-            svc_name: format_service_summary(svc)
+            svc_name: format_service_summary(svc, fields)
             for svc_name, svc in services.items()
             if not isinstance(svc, dict) or 'error' not in svc
         },
@@ -420,96 +437,7 @@ def list_services(project: str, env: str, config, orchestrator) -> Dict[str, Any
     })
 
 
-def get_service(project: str, env: str, service: str, orchestrator) -> Dict[str, Any]:
+def get_service(project: str, env: str, service: str, orchestrator, fields=None) -> Dict[str, Any]:
     """Get details for a specific service"""
-    svc = orchestrator.get_service(env, service)
-    return json_response(200, format_service(svc))
-
-
-# =============================================================================
-# Formatting Functions
-# =============================================================================
-
-def format_service_summary(svc) -> Dict[str, Any]:
-    """Format service for summary list"""
-    if hasattr(svc, 'status'):
-        return {
-            'status': svc.status,
-            'health': 'HEALTHY' if svc.running_count == svc.desired_count else 'UNHEALTHY',
-            'runningCount': svc.running_count,
-            'desiredCount': svc.desired_count,
-            'taskDefinition': svc.task_definition.get('revision') if svc.task_definition else None,
-            'image': svc.task_definition.get('image', '').split(':')[-1] if svc.task_definition else None
-        }
-    return svc
-
-
-def format_service(svc) -> Dict[str, Any]:
-    """Format service for detailed view"""
-    if hasattr(svc, 'status'):
-        return {
-            'environment': svc.environment,
-            'service': svc.service,
-            'serviceName': svc.name,
-            'clusterName': svc.cluster_name,
-            'status': svc.status,
-            'desiredCount': svc.desired_count,
-            'runningCount': svc.running_count,
-            'pendingCount': svc.pending_count,
-            'taskDefinition': svc.task_definition,
-            'tasks': [format_task(t) for t in svc.tasks],
-            'deployments': [format_deployment(d) for d in svc.deployments],
-            'consoleUrl': svc.console_url,
-            'accountId': svc.account_id
-        }
-    return svc
-
-
-def format_service_details(details) -> Dict[str, Any]:
-    """Format service details"""
-    base = format_service(details)
-    if hasattr(details, 'environment_variables'):
-        base.update({
-            'currentTaskDefinition': details.task_definition,
-            'latestTaskDefinition': details.latest_task_definition,
-            'environmentVariables': details.environment_variables,
-            'secrets': details.secrets,
-            'recentLogs': details.recent_logs,
-            'ecsEvents': details.ecs_events,
-            'deploymentState': details.deployment_state,
-            'isRollingBack': details.is_rolling_back,
-            'consoleUrls': details.console_urls
-        })
-    return base
-
-
-def format_task(task) -> Dict[str, Any]:
-    """Format task/pod"""
-    return {
-        'taskId': task.task_id,
-        'status': task.status,
-        'desiredStatus': task.desired_status,
-        'health': task.health,
-        'revision': task.revision,
-        'isLatest': task.is_latest,
-        'az': task.az,
-        'subnetId': task.subnet_id,
-        'cpu': task.cpu,
-        'memory': task.memory,
-        'startedAt': task.started_at.isoformat() if task.started_at else None
-    }
-
-
-def format_deployment(dep) -> Dict[str, Any]:
-    """Format deployment"""
-    return {
-        'status': dep.status,
-        'taskDefinition': dep.task_definition,
-        'revision': dep.revision,
-        'desiredCount': dep.desired_count,
-        'runningCount': dep.running_count,
-        'pendingCount': dep.pending_count,
-        'rolloutState': dep.rollout_state,
-        'createdAt': dep.created_at.isoformat() if dep.created_at else None,
-        'updatedAt': dep.updated_at.isoformat() if dep.updated_at else None
-    }
+    svc = orchestrator.get_service(env, service, fields=fields)
+    return json_response(200, format_service(svc, fields))
@@ -0,0 +1,317 @@
+"""
+API formatting of provider result types.
+
+Shared by the main handler and the split Lambda handlers. `fields` narrows
+the output to the requested JSON keys (sparse fieldsets). Result types with
+a field selection are serialized by generated single-pass functions (see
+providers.serialization.Serializer): only the requested keys are computed,
+so nested lists (tasks, deployments, executions, rules) cost nothing when
+left out.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from providers.serialization import Serializer
+
+Fields = Optional[Iterable[str]]
+
+SERVICE_SUMMARY_FIELDS = ('status', 'health', 'runningCount', 'desiredCount', 'taskDefinition', 'image')
+# Summary key -> Service fields it is computed from
+_SUMMARY_SOURCES = {
+    'status': ('status',),
+    'health': ('runningCount', 'desiredCount'),
+    'runningCount': ('runningCount',),
+    'desiredCount': ('desiredCount',),
+    'taskDefinition': ('taskDefinition',),
+    'image': ('taskDefinition',),
+}
+
+
+def service_summary_fields(fields: Fields = None) -> tuple:
+    """
+    Service fields a provider must fill for the summary view (or the
+    requested part of it). The summary never shows tasks, deployments or
+    the latest task definition diff, so providers skip those calls.
+    """
+    needed = set()
+    for key in (SERVICE_SUMMARY_FIELDS if fields is None else fields):
+        needed.update(_SUMMARY_SOURCES.get(key, ()))
+    return tuple(sorted(needed))
+
+
+_SERVICE_SUMMARY = Serializer('service_summary', {
+    'status': 'obj.status',
+    'health': "'HEALTHY' if obj.running_count == obj.desired_count else 'UNHEALTHY'",
+    'runningCount': 'obj.running_count',
+    'desiredCount': 'obj.desired_count',
+    'taskDefinition': "obj.task_definition.get('revision') if obj.task_definition else None",
+    'image': "obj.task_definition.get('image', '').split(':')[-1] if obj.task_definition else None",
+}, globals())
+
+_SERVICE_COLUMNS = {
+    'environment': 'obj.environment',
+    'service': 'obj.service',
+    'serviceName': 'obj.name',
+    'clusterName': 'obj.cluster_name',
+    'status': 'obj.status',
+    'desiredCount': 'obj.desired_count',
+    'runningCount': 'obj.running_count',
+    'pendingCount': 'obj.pending_count',
+    'taskDefinition': 'obj.task_definition',
+    'tasks': '[format_task(t) for t in obj.tasks]',
+    'deployments': '[format_deployment(d) for d in obj.deployments]',
+    'consoleUrl': 'obj.console_url',
+    'accountId': 'obj.account_id',
+}
+_SERVICE = Serializer('service', _SERVICE_COLUMNS, globals())
+
+_SERVICE_DETAILS = Serializer('service_details', {
+    **_SERVICE_COLUMNS,
+    'currentTaskDefinition': 'obj.task_definition',
+    'latestTaskDefinition': 'obj.latest_task_definition',
+    'environmentVariables': 'obj.environment_variables',
+    'secrets': 'obj.secrets',
+    'recentLogs': 'obj.recent_logs',
+    'ecsEvents': 'obj.ecs_events',
+    'deploymentState': 'obj.deployment_state',
+    'isRollingBack': 'obj.is_rolling_back',
+    'consoleUrls': 'obj.console_urls',
+}, globals())
+
+
+def format_service_summary(svc, fields: Fields = None) -> Dict[str, Any]:
+    """Format service for summary list"""
+    if hasattr(svc, 'status'):
+        return _SERVICE_SUMMARY(svc, fields)
+    return svc
+
+
+def format_service(svc, fields: Fields = None) -> Dict[str, Any]:
+    """Format service for detailed view"""
+    if not hasattr(svc, 'status'):
+        return svc
+    return _SERVICE(svc, fields)
+
+
+def format_service_details(details, fields: Fields = None) -> Dict[str, Any]:
+    """Format service details"""
+    if hasattr(details, 'environment_variables'):
+        return _SERVICE_DETAILS(details, fields)
+    return format_service(details, fields)
+
+
+def format_task(task) -> Dict[str, Any]:
+    """Format task/pod"""
+    return {
+        'taskId': task.task_id,
+        'status': task.status,
+        'desiredStatus': task.desired_status,
+        'health': task.health,
+        'revision': task.revision,
+        'isLatest': task.is_latest,
+        'az': task.az,
+        'subnetId': task.subnet_id,
+        'cpu': task.cpu,
+        'memory': task.memory,
+        'startedAt': task.started_at.isoformat() if task.started_at else None
+    }
+
+
+def format_deployment(dep) -> Dict[str, Any]:
+    """Format deployment"""
+    return {
+        'status': dep.status,
+        'taskDefinition': dep.task_definition,
+        'revision': dep.revision,
+        'desiredCount': dep.desired_count,
+        'runningCount': dep.running_count,
+        'pendingCount': dep.pending_count,
+        'rolloutState': dep.rollout_state,
+        'createdAt': dep.created_at.isoformat() if dep.created_at else None,
+        'updatedAt': dep.updated_at.isoformat() if dep.updated_at else None
+    }
+
+
+_PIPELINE = Serializer('pipeline', {
+    'pipelineName': 'obj.name',
+    'pipelineType': 'obj.pipeline_type',
+    'service': 'obj.service',
+    'environment': 'obj.environment',
+    'version': 'obj.version',
+    'stages': "[{'name': s.name, 'status': s.status} for s in obj.stages]",
+    'lastExecution': 'format_execution(obj.last_execution) if obj.last_execution else None',
+    'executions': '[format_execution(e) for e in obj.executions]',
+    'buildLogs': 'obj.build_logs',
+    'consoleUrl': 'obj.console_url',
+}, globals())
+
+
+def format_pipeline(pipeline, fields: Fields = None) -> Dict[str, Any]:
+    """Format pipeline"""
+    if isinstance(pipeline, dict) and 'error' in pipeline:
+        return pipeline
+    return _PIPELINE(pipeline, fields)
+
+
+def format_execution(exec) -> Dict[str, Any]:
+    """Format pipeline execution"""
+    return {
+        'executionId': exec.execution_id,
+        'status': exec.status,
+        'startTime': exec.started_at.isoformat() if exec.started_at else None,
+        'lastUpdateTime': exec.finished_at.isoformat() if exec.finished_at else None,
+        'duration': exec.duration_seconds,
+        'commit': exec.commit_sha,
+        'commitMessage': exec.commit_message,
+        'commitAuthor': exec.commit_author,
+        'commitUrl': exec.commit_url,
+        'consoleUrl': exec.console_url,
+        'trigger': exec.trigger_type
+    }
+
+
+def format_image(img) -> Dict[str, Any]:
+    """Format container image"""
+    return {
+        'digest': img.digest,
+        'tags': img.tags,
+        'pushedAt': img.pushed_at.isoformat() if img.pushed_at else None,
+        'sizeBytes': img.size_bytes,
+        'sizeMB': img.size_mb
+    }
+
+
+def format_pipeline_summary(pipeline) -> Dict[str, Any]:
+    """Format pipeline for list view"""
+    if isinstance(pipeline, dict):
+        return pipeline
+    return {
+        'name': pipeline.name,
+        'type': pipeline.pipeline_type,
+        'service': pipeline.service,
+        'status': pipeline.last_execution.status if pipeline.last_execution else 'unknown',
+        'lastRun': pipeline.last_execution.started_at.isoformat() if pipeline.last_execution and pipeline.last_execution.started_at else None
+    }
+
+
+# =============================================================================
+# Kubernetes
+# =============================================================================
+
+_K8S_POD = Serializer('k8s_pod', {
+    'name': 'obj.name',
+    'namespace': 'obj.namespace',
+    'status': 'obj.status',
+    'ready': 'obj.ready',
+    'restarts': 'obj.restarts',
+    'age': 'obj.age',
+    'ip': 'obj.ip',
+    'node': 'obj.node',
+    'containers': 'obj.containers',
+}, globals())
+
+_K8S_SERVICE = Serializer('k8s_service', {
+    'name': 'obj.name',
+    'namespace': 'obj.namespace',
+    'type': 'obj.service_type',
+    'clusterIP': 'obj.cluster_ip',
+    'externalIP': 'obj.external_ip',
+    'ports': 'obj.ports',
+    'selector': 'obj.selector',
+    'labels': 'obj.labels',
+}, globals())
+
+_K8S_DEPLOYMENT = Serializer('k8s_deployment', {
+    'name': 'obj.name',
+    'namespace': 'obj.namespace',
+    'ready': 'obj.ready',
+    'available': 'obj.available',
+    'upToDate': 'obj.up_to_date',
+    'age': 'obj.age',
+    'image': 'obj.image',
+}, globals())
+
+_K8S_INGRESS = Serializer('k8s_ingress', {
+    'name': 'obj.name',
+    'namespace': 'obj.namespace',
+    'ingressClass': 'obj.ingress_class',
+    'hosts': '[r.host for r in obj.rules]',
+    'address': 'obj.load_balancer_hostname or obj.load_balancer_ip',
+    'rules': """[
+            {
+                'host': r.host,
+                'path': r.path,
+                'pathType': r.path_type,
+                'serviceName': r.service_name,
+                'servicePort': r.service_port
+            }
+            for r in obj.rules
+        ]""",
+    'tls': 'obj.tls',
+    'annotations': 'obj.annotations',
+}, globals())
+
+_K8S_NODE = Serializer('k8s_node', {
+    'name': 'obj.name',
+    'status': 'obj.status',
+    'instanceType': 'obj.instance_type',
+    'instanceTypeDisplay': 'obj.instance_type_display',
+    'zone': 'obj.zone',
+    'region': 'obj.region',
+    'nodegroup': 'obj.nodegroup',
+    'capacity': "{'cpu': obj.capacity_cpu, 'memory': obj.capacity_memory}",
+    'allocatable': "{'cpu': obj.allocatable_cpu, 'memory': obj.allocatable_memory}",
+    'usage': "{'cpu': obj.usage_cpu, 'memory': obj.usage_memory} if obj.usage_cpu or obj.usage_memory else None",
+    'subnetId': 'obj.subnet_id',
+    'instanceId': 'obj.instance_id',
+}, globals())
+
+
+def format_k8s_pod(pod, fields: Fields = None) -> Dict[str, Any]:
+    """Format K8s pod for API response"""
+    if isinstance(pod, dict):
+        return pod
+    return _K8S_POD(pod, fields)
+
+
+def format_k8s_service(svc, fields: Fields = None) -> Dict[str, Any]:
+    """Format K8s service for API response"""
+    if isinstance(svc, dict):
+        return svc
+    return _K8S_SERVICE(svc, fields)
+
+
+def format_k8s_deployment(deploy, fields: Fields = None) -> Dict[str, Any]:
+    """Format K8s deployment for API response"""
+    if isinstance(deploy, dict):
+        return deploy
+    return _K8S_DEPLOYMENT(deploy, fields)
+
+
+def format_k8s_ingress(ing, fields: Fields = None) -> Dict[str, Any]:
+    """Format K8s ingress for API response"""
+    if isinstance(ing, dict):
+        return ing
+    return _K8S_INGRESS(ing, fields)
+
+
+def format_k8s_node(node, fields: Fields = None) -> Dict[str, Any]:
+    """Format K8s node for API response"""
+    if isinstance(node, dict):
+        return node
+    return _K8S_NODE(node, fields)
+
+
+_K8S_SERIALIZERS = {
+    'pods': _K8S_POD,
+    'services': _K8S_SERVICE,
+    'deployments': _K8S_DEPLOYMENT,
+    'ingresses': _K8S_INGRESS,
+    'nodes': _K8S_NODE,
+}
+
+
+def format_k8s_list(kind: str, items: list, fields: Fields = None) -> List[Dict[str, Any]]:
+    """Format a K8s list response (pods, services, ...), selecting the serializer once for the list"""
+    serialize = _K8S_SERIALIZERS[kind].for_fields(fields)
+    return [item if isinstance(item, dict) else serialize(item) for item in items]
@@ -0,0 +1,303 @@
+"""
+Request-scoped instrumentation of outbound calls.
+
+Records per-operation latency, call count, retries and throttles for:
+- AWS API calls, via botocore `before-call` / `after-call` / `needs-retry` events
+- HTTP calls made through `requests` sessions (CI providers, see utils.http), via response hooks
+
+Totals are exposed as a `Server-Timing` response header (see
+shared.response.json_response) and emitted as CloudWatch Embedded Metric
+Format lines at the end of each request (ENABLE_EMF_METRICS, METRICS_NAMESPACE).
+
+Usage:
+    client = instrument_client(boto3.client('ecs'))
+    session = instrument_session(requests.Session())
+
+    with collect_timings(route='services'):
+        ...
+        headers['Server-Timing'] = server_timing_header()
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+
+# Error codes AWS services use to signal throttling
+THROTTLE_ERROR_CODES = {
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    'RequestLimitExceeded',
+    'SlowDown',
+    'BandwidthLimitExceeded',
+    'EC2ThrottledException',
+}
+
+# Keep the Server-Timing header small: only the slowest operations are listed
+SERVER_TIMING_MAX_ENTRIES = 10
+
+_START_KEY = 'dashborion_call_started'
+_OPERATION_KEY = 'dashborion_operation'
+
+
+class TimingCollector:
+    """Accumulates per-operation timings for one request (thread-safe)."""
+
+    def __init__(self, route: Optional[str] = None):
+        self.route = route
+        self.started = time.perf_counter()
+        self.operations: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, operation: str) -> Dict[str, float]:
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = {
+                'count': 0, 'totalMs': 0.0, 'maxMs': 0.0, 'retries': 0, 'throttles': 0, 'errors': 0,
+            }
+        return stats
+
+    def record(self, operation: str, duration_ms: float, retries: int = 0, throttled: bool = False, error: bool = False):
+        with self._lock:
+            stats = self._stats(operation)
+            stats['count'] += 1
+            stats['totalMs'] += duration_ms
+            stats['maxMs'] = max(stats['maxMs'], duration_ms)
+            stats['retries'] += retries
+            stats['throttles'] += 1 if throttled else 0
+            stats['errors'] += 1 if error else 0
+
+    def record_throttle(self, operation: str):
+        with self._lock:
+            self._stats(operation)['throttles'] += 1
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {op: dict(stats) for op, stats in self.operations.items()}
+
+
+_collector: contextvars.ContextVar[Optional[TimingCollector]] = contextvars.ContextVar(
+    'dashborion_timing_collector', default=None
+)
+
+
+def current_collector() -> Optional[TimingCollector]:
+    """The collector of the request being handled, if any."""
+    return _collector.get()
+
+
+@contextlib.contextmanager
+def collect_timings(route: Optional[str] = None, emit_metrics: bool = True) -> Iterator[TimingCollector]:
+    """Collect outbound call timings for the duration of the block."""
+    _ensure_default_session_hooks()
+    collector = TimingCollector(route)
+    token = _collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _collector.reset(token)
+        if emit_metrics:
+            emit_emf_metrics(collector)
+
+
+# =============================================================================
+# botocore hooks
+# =============================================================================
+
+def _operation_name(model) -> str:
+    return f"{model.service_model.service_id.hyphenize()}.{model.name}"
+
+
+def _before_call(model=None, context=None, **kwargs):
+    if context is not None and model is not None and current_collector() is not None:
+        context[_START_KEY] = time.perf_counter()
+        context[_OPERATION_KEY] = _operation_name(model)
+
+
+def _after_call(http_response=None, parsed=None, context=None, **kwargs):
+    collector = current_collector()
+    if collector is None or context is None:
+        return
+    started = context.pop(_START_KEY, None)
+    if started is None:
+        return
+    parsed = parsed or {}
+    metadata = parsed.get('ResponseMetadata', {})
+    status = getattr(http_response, 'status_code', 200) or 200
+    # Throttles are counted per attempt in _needs_retry
+    collector.record(
+        context.get(_OPERATION_KEY, 'unknown'),
+        (time.perf_counter() - started) * 1000,
+        retries=metadata.get('RetryAttempts', 0),
+        error=status >= 400,
+    )
+
+
+def _after_call_error(context=None, **kwargs):
+    # Raised before a response was parsed (connection errors, timeouts)
+    collector = current_collector()
+    if collector is None or context is None:
+        return
+    started = context.pop(_START_KEY, None)
+    if started is not None:
+        collector.record(context.get(_OPERATION_KEY, 'unknown'), (time.perf_counter() - started) * 1000, error=True)
+
+
+def _needs_retry(response=None, operation=None, attempts=None, **kwargs):
+    # Only observes: returning None leaves the retry decision to botocore
+    collector = current_collector()
+    if collector is None or not response or operation is None:
+        return None
+    parsed = response[1] if len(response) > 1 else {}
+    error_code = (parsed or {}).get('Error', {}).get('Code')
+    if error_code in THROTTLE_ERROR_CODES:
+        collector.record_throttle(_operation_name(operation))
+    return None
+
+
+def register_boto_hooks(events) -> None:
+    """Register instrumentation handlers on a botocore event emitter."""
+    events.register('before-call.*.*', _before_call, unique_id='dashborion-timing-before')
+    events.register('after-call.*.*', _after_call, unique_id='dashborion-timing-after')
+    events.register('after-call-error.*.*', _after_call_error, unique_id='dashborion-timing-error')
+    events.register('needs-retry.*.*', _needs_retry, unique_id='dashborion-timing-retry')
+
+
+def instrument_client(client):
+    """Attach timing hooks to a boto3 client (idempotent). Returns the client."""
+    register_boto_hooks(client.meta.events)
+    return client
+
+
+def install_default_session_hooks() -> None:
+    """Instrument every client created from the default boto3 session."""
+    import boto3
+    session = boto3._get_default_session()
+    register_boto_hooks(session.events)
+
+
+_default_hooks_installed = False
+
+
+def _ensure_default_session_hooks() -> None:
+    # Clients copy the session's event hooks when created, so this covers every
+    # boto3.client(...) created after the first instrumented request
+    global _default_hooks_installed
+    if _default_hooks_installed:
+        return
+    _default_hooks_installed = True
+    try:
+        install_default_session_hooks()
+    except ImportError:
+        pass
+
+
+# =============================================================================
+# requests hooks
+# =============================================================================
+
+def _requests_response_hook(response, *args, **kwargs):
+    collector = current_collector()
+    if collector is None:
+        return response
+    host = urlparse(response.url).hostname or 'unknown'
+    method = response.request.method if response.request is not None else 'GET'
+    collector.record(
+        f"http.{host}.{method}",
+        response.elapsed.total_seconds() * 1000,
+        throttled=response.status_code == 429,
+        error=response.status_code >= 400,
+    )
+    return response
+
+
+def instrument_session(session):
+    """Attach timing hooks to a requests.Session (idempotent). Returns the session."""
+    hooks = session.hooks.setdefault('response', [])
+    if _requests_response_hook not in hooks:
+        hooks.append(_requests_response_hook)
+    return session
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+_TOKEN_INVALID = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+def server_timing_header(collector: Optional[TimingCollector] = None) -> Optional[str]:
+    """
+    Build a Server-Timing header value for the current request.
+
+    Example: `ecs.DescribeServices;dur=84.2;desc="3 calls", total;dur=212.0`
+    """
+    collector = collector or current_collector()
+    if collector is None:
+        return None
+    operations = sorted(collector.snapshot().items(), key=lambda item: item[1]['totalMs'], reverse=True)
+
+    entries = []
+    for operation, stats in operations[:SERVER_TIMING_MAX_ENTRIES]:
+        desc = f"{stats['count']} calls"
+        if stats['retries']:
+            desc += f", {stats['retries']} retries"
+        if stats['throttles']:
+            desc += f", {stats['throttles']} throttles"
+        entries.append(f'{_TOKEN_INVALID.sub("_", operation)};dur={stats["totalMs"]:.1f};desc="{desc}"')
+    if operations:
+        aws_total = sum(stats['totalMs'] for _, stats in operations)
+        entries.append(f'outbound;dur={aws_total:.1f}')
+    entries.append(f'total;dur={collector.elapsed_ms():.1f}')
+    return ', '.join(entries)
+
+
+def emit_emf_metrics(collector: TimingCollector) -> None:
+    """Print one CloudWatch Embedded Metric Format line per operation."""
+    if os.environ.get('ENABLE_EMF_METRICS', 'true').lower() != 'true':
+        return
+    operations = collector.snapshot()
+    if not operations:
+        return
+
+    namespace = os.environ.get('METRICS_NAMESPACE', 'Dashborion')
+    timestamp = int(time.time() * 1000)
+    route = collector.route or 'unknown'
+    for operation, stats in operations.items():
+        print(json.dumps({
+            '_aws': {
+                'Timestamp': timestamp,
+                'CloudWatchMetrics': [{
+                    'Namespace': namespace,
+                    'Dimensions': [['Route', 'Operation'], ['Operation']],
+                    'Metrics': [
+                        {'Name': 'CallLatency', 'Unit': 'Milliseconds'},
+                        {'Name': 'CallCount', 'Unit': 'Count'},
+                        {'Name': 'Retries', 'Unit': 'Count'},
+                        {'Name': 'Throttles', 'Unit': 'Count'},
+                        {'Name': 'Errors', 'Unit': 'Count'},
+                    ],
+                }],
+            },
+            'Route': route,
+            'Operation': operation,
+            'CallLatency': round(stats['totalMs'], 1),
+            'CallCount': stats['count'],
+            'Retries': stats['retries'],
+            'Throttles': stats['throttles'],
+            'Errors': stats['errors'],
+        }))
@@ -0,0 +1,231 @@
+"""
+Structured logging for Lambda handlers and providers.
+
+- JSON lines on stdout (CloudWatch), one object per record
+- Log level from LOG_LEVEL (default INFO); debug output is skipped entirely
+  unless enabled, and arguments are formatted lazily (only when emitted)
+- Request-scoped context (request id, project, env, route) attached to every
+  record emitted while handling a request
+- Per-route sampling of verbose request logs (e.g. the incoming event):
+  LOG_SAMPLE_RATE (default 0.0) and LOG_SAMPLE_RATES (JSON, route -> rate)
+- Outbound call timings per request (see shared.instrumentation)
+- ETags, 304s and compression of every handler response
+  (see shared.response.finalize_response)
+
+Usage:
+    from shared.log import get_logger, log_requests, bind
+
+    logger = get_logger(__name__)
+
+    @log_requests
+    def handler(event, context):
+        bind(project=project, env=env)
+        logger.debug("cluster endpoint=%s", endpoint)
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import logging
+import os
+import random
+import sys
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from shared.instrumentation import collect_timings, server_timing_header
+from shared.response import finalize_response
+
+
+ROOT_LOGGER_NAME = 'dashborion'
+
+# Fields bound for the duration of a request
+_request_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+    'dashborion_request_context', default={}
+)
+
+
+class Lazy:
+    """Defer an expensive computation until the log record is formatted."""
+
+    __slots__ = ('_fn', '_args', '_kwargs')
+
+    def __init__(self, fn: Callable, *args, **kwargs):
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self._fn(*self._args, **self._kwargs))
+
+
+def lazy_json(value: Any) -> Lazy:
+    """Serialize a value to JSON only if the record is actually emitted."""
+    return Lazy(json.dumps, value, default=str)
+
+
+class JsonFormatter(logging.Formatter):
+    """Render records as single-line JSON with the request context."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        payload.update(_request_context.get())
+        extra = getattr(record, 'fields', None)
+        if extra:
+            payload.update(extra)
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+def _configure_root() -> logging.Logger:
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    if not root.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(JsonFormatter())
+        root.addHandler(handler)
+        # Lambda installs its own handler on the root logger; don't emit twice
+        root.propagate = False
+        root.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a logger under the dashborion hierarchy."""
+    _configure_root()
+    if name == ROOT_LOGGER_NAME or name.startswith(f'{ROOT_LOGGER_NAME}.'):
+        return logging.getLogger(name)
+    return logging.getLogger(f'{ROOT_LOGGER_NAME}.{name}')
+
+
+# =============================================================================
+# Sampling
+# =============================================================================
+
+def _load_sample_rates() -> Dict[str, float]:
+    raw = os.environ.get('LOG_SAMPLE_RATES', '')
+    if not raw:
+        return {}
+    try:
+        return {str(k): float(v) for k, v in json.loads(raw).items()}
+    except (ValueError, AttributeError):
+        return {}
+
+
+_DEFAULT_SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE', '0') or 0)
+_SAMPLE_RATES = _load_sample_rates()
+
+
+def sample_rate(route: Optional[str]) -> float:
+    """Sampling rate for verbose request logs on a route."""
+    if route and route in _SAMPLE_RATES:
+        return _SAMPLE_RATES[route]
+    return _DEFAULT_SAMPLE_RATE
+
+
+def is_sampled() -> bool:
+    """Whether verbose logging is enabled for the current request."""
+    return bool(_request_context.get().get('sampled'))
+
+
+# =============================================================================
+# Request context
+# =============================================================================
+
+GLOBAL_ROUTES = ('auth', 'admin', 'config', 'projects', 'health', 'discovery')
+
+
+def parse_request_path(path: str) -> Dict[str, Optional[str]]:
+    """
+    Derive a low-cardinality route name, project and env from a request path.
+
+    /api/{project}/{resource}/{env}/{sub_resource}
+    /api/{project}/actions/{kind}/{env}/{action}
+    """
+    parts = [p for p in (path or '').strip('/').split('/') if p]
+    if len(parts) < 2:
+        return {'route': parts[0] if parts else '/', 'project': None, 'env': None}
+    if parts[1] in GLOBAL_ROUTES:
+        return {'route': parts[1], 'project': None, 'env': None}
+
+    project = parts[1]
+    route = parts[2] if len(parts) > 2 else 'project'
+    env = parts[3] if len(parts) > 3 else None
+    if route == 'actions' and len(parts) > 3:
+        route = f'actions/{parts[3]}'
+        env = parts[4] if len(parts) > 4 else None
+    elif route == 'infrastructure' and len(parts) > 4:
+        route = f'infrastructure/{parts[4]}'
+    return {'route': route, 'project': project, 'env': env}
+
+
+@contextlib.contextmanager
+def request_scope(event: Dict[str, Any], context: Any = None, **fields) -> Iterator[Dict[str, Any]]:
+    """
+    Bind request fields to every log record emitted within the block.
+
+    The sampling decision for verbose logs is taken once, on entry.
+    """
+    request_context = (event or {}).get('requestContext', {}) or {}
+    path = (event or {}).get('rawPath') or (event or {}).get('path') or ''
+
+    bound = {
+        'requestId': getattr(context, 'aws_request_id', None) or request_context.get('requestId'),
+        **{k: v for k, v in parse_request_path(path).items() if v is not None},
+    }
+    bound.update({k: v for k, v in fields.items() if v is not None})
+    rate = sample_rate(bound.get('route'))
+    bound['sampled'] = rate > 0 and random.random() < rate
+
+    token = _request_context.set(bound)
+    try:
+        yield bound
+    finally:
+        _request_context.reset(token)
+
+
+def bind(**fields) -> None:
+    """Add fields (e.g. project, env once parsed) to the current request context."""
+    current = _request_context.get()
+    if current:
+        current.update({k: v for k, v in fields.items() if v is not None})
+
+
+def current_context() -> Dict[str, Any]:
+    """Fields bound to the current request (empty outside a request)."""
+    return dict(_request_context.get())
+
+
+def log_event(logger: logging.Logger, event: Dict[str, Any]) -> None:
+    """Log the incoming event when the request is sampled or debug is enabled."""
+    if is_sampled():
+        logger.info("Event: %s", lazy_json(event))
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", lazy_json(event))
+
+
+def log_requests(func: Callable) -> Callable:
+    """
+    Decorator for Lambda handlers: open a request scope, log the event
+    (sampled per route, always at DEBUG level) and collect outbound call
+    timings, returned as a Server-Timing header (refreshed with the final totals).
+    The response is then finalized: ETag / 304 and compression.
+    """
+    logger = get_logger(func.__module__)
+
+    @functools.wraps(func)
+    def wrapper(event, context=None, *args, **kwargs):
+        with request_scope(event, context) as scope:
+            with collect_timings(route=scope.get('route')) as collector:
+                log_event(logger, event)
+                response = func(event, context, *args, **kwargs)
+                headers = response.get('headers') if isinstance(response, dict) else None
+                if isinstance(headers, dict):
+                    headers['Server-Timing'] = server_timing_header(collector)
+                    headers.setdefault('Timing-Allow-Origin', '*')
+                return finalize_response(event, response)
+    return wrapper
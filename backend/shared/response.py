@@ -2,17 +2,34 @@
 API response helpers for Lambda handlers.
 
 Provides consistent response formatting across all endpoints.
+
+Every handler response also goes through finalize_response (applied by
+shared.log.log_requests): strong ETags and 304s for GET requests, and
+gzip / brotli compression negotiated on Accept-Encoding
+(RESPONSE_COMPRESSION_MIN_BYTES, default 1024).
 """
 
+import base64
+import gzip
+import hashlib
 import json
+import os
 from typing import Any, Dict, Optional
 
+from shared.instrumentation import server_timing_header
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
 
 # Default CORS headers
 CORS_HEADERS = {
     'Access-Control-Allow-Origin': '*',
-    'Access-Control-Allow-Headers': 'Content-Type,Authorization,X-Auth-User-Email',
+    'Access-Control-Allow-Headers': 'Content-Type,Authorization,X-Auth-User-Email,If-None-Match',
     'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS',
+    'Access-Control-Expose-Headers': 'ETag,X-Cache,X-Delta',
 }
 
 
@@ -36,6 +53,10 @@ def json_response(
         'Content-Type': 'application/json',
         **CORS_HEADERS,
     }
+    server_timing = server_timing_header()
+    if server_timing:
+        response_headers['Server-Timing'] = server_timing
+        response_headers['Timing-Allow-Origin'] = '*'
     if headers:
         response_headers.update(headers)
 
@@ -46,6 +67,18 @@ def json_response(
     }
 
 
+def not_modified_response(headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Create a 304 Not Modified response (no body)."""
+    response_headers = {**CORS_HEADERS}
+    if headers:
+        response_headers.update(headers)
+    return {
+        'statusCode': 304,
+        'headers': response_headers,
+        'body': '',
+    }
+
+
 def success_response(
     data: Any = None,
     message: Optional[str] = None,
@@ -168,6 +201,16 @@ def get_query_param(event: Dict[str, Any], name: str, default: str = '') -> str:
     return params.get(name, default)
 
 
+def get_header(event: Dict[str, Any], name: str, default: str = '') -> str:
+    """Get a request header from the event (case-insensitive)."""
+    headers = event.get('headers', {}) or {}
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return default
+
+
 def get_query_params(event: Dict[str, Any]) -> Dict[str, str]:
     """Get all query string parameters from the event."""
     return event.get('queryStringParameters', {}) or {}
@@ -202,3 +245,126 @@ def get_path(event: Dict[str, Any]) -> str:
         return raw_path
     # API Gateway v1 format
     return event.get('path', '/')
+
+
+# =============================================================================
+# Conditional requests and compression
+# =============================================================================
+
+# Bodies at least this large are compressed when the client accepts it
+COMPRESSION_MIN_BYTES = int(os.environ.get('RESPONSE_COMPRESSION_MIN_BYTES', '1024'))
+# gzip level / brotli quality: most of the size reduction at a fraction of the CPU
+COMPRESSION_LEVEL = 5
+_COMPRESSIBLE_TYPES = ('application/json', 'text/')
+_ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+
+
+def _header_key(headers: Dict[str, str], name: str) -> Optional[str]:
+    name = name.lower()
+    for key in headers:
+        if key.lower() == name:
+            return key
+    return None
+
+
+def _etag_base(tag: str) -> str:
+    """ETag without weak prefix and content-coding suffix ("v-gzip" -> "v")."""
+    tag = tag.strip().removeprefix('W/')
+    for encoding in ('br', 'gzip'):
+        suffix = f'-{encoding}"'
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)] + '"'
+    return tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header value matches an ETag (any content-coding)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    base = _etag_base(etag)
+    return any(_etag_base(tag) == base for tag in if_none_match.split(','))
+
+
+def _negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Preferred supported content-coding from an Accept-Encoding value (q=0 excluded)."""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+    for encoding in _ENCODINGS:
+        if accepted.get(encoding, accepted.get('*', 0.0)) > 0:
+            return encoding
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=COMPRESSION_LEVEL)
+    return gzip.compress(body, compresslevel=COMPRESSION_LEVEL, mtime=0)
+
+
+def finalize_response(event: Dict[str, Any], response: Any) -> Any:
+    """
+    Add validators and compression to a handler response.
+
+    - 200 responses to GET / HEAD get a strong ETag computed from the
+      serialized body (kept if the handler set one, e.g. cache.delta
+      versions); a matching If-None-Match turns them into a 304
+    - JSON / text bodies of at least COMPRESSION_MIN_BYTES are compressed
+      per Accept-Encoding and returned base64 encoded (isBase64Encoded),
+      which API Gateway decodes; the ETag gets a content-coding suffix
+    """
+    if not isinstance(response, dict) or response.get('isBase64Encoded'):
+        return response
+    body = response.get('body')
+    headers = response.get('headers')
+    if not isinstance(body, str) or not isinstance(headers, dict):
+        return response
+    status_code = response.get('statusCode', 200)
+
+    content_type_key = _header_key(headers, 'Content-Type')
+    compressible = (
+        status_code != 304
+        and len(body) >= COMPRESSION_MIN_BYTES
+        and content_type_key is not None
+        and headers[content_type_key].startswith(_COMPRESSIBLE_TYPES)
+    )
+    encoding = None
+    if compressible:
+        encoding = _negotiate_encoding(get_header(event, 'accept-encoding'))
+        vary_key = _header_key(headers, 'Vary')
+        if vary_key is None:
+            headers['Vary'] = 'Accept-Encoding'
+        elif 'accept-encoding' not in headers[vary_key].lower():
+            headers[vary_key] += ', Accept-Encoding'
+
+    etag_key = _header_key(headers, 'ETag')
+    if status_code == 200 and get_method(event) in ('GET', 'HEAD'):
+        if etag_key is None:
+            etag_key = 'ETag'
+            headers[etag_key] = '"' + hashlib.sha256(body.encode('utf-8')).hexdigest()[:32] + '"'
+        if encoding and headers[etag_key].endswith('"'):
+            # Strong ETags differ per content-coding
+            headers[etag_key] = headers[etag_key][:-1] + f'-{encoding}"'
+        if etag_matches(get_header(event, 'if-none-match'), headers[etag_key]):
+            return not_modified_response(headers)
+
+    if encoding is None:
+        return response
+
+    response['body'] = base64.b64encode(_compress(body.encode('utf-8'), encoding)).decode('ascii')
+    response['isBase64Encoded'] = True
+    headers['Content-Encoding'] = encoding
+    return response
@@ -9,6 +9,7 @@ from urllib.parse import quote
 from typing import Optional
 
 from app_config import get_config
+from shared.instrumentation import instrument_client
 
 
 # Cache for cross-account clients with TTL (50 minutes, credentials expire after 1 hour)
@@ -19,13 +20,13 @@ _CACHE_TTL_SECONDS = 50 * 60  # 50 minutes
 def _get_localstack_client(service: str, region: str):
     """Get boto3 client configured for LocalStack."""
     endpoint_url = os.environ.get('LOCALSTACK_ENDPOINT')
-    return boto3.client(
+    return instrument_client(boto3.client(
         service,
         endpoint_url=endpoint_url,
         region_name=region,
         aws_access_key_id='test',
         aws_secret_access_key='test'
-    )
+    ))
 
 
 def get_cross_account_client(
@@ -60,7 +61,7 @@ def get_cross_account_client(
 
     # If same account as shared-services, use direct client (no caching needed)
     if account_id == shared_account:
-        return boto3.client(service, region_name=region)
+        return instrument_client(boto3.client(service, region_name=region))
 
     # Check cache - include project/env in cache key if provided
     cache_key = (service, account_id, region, project, env)
@@ -92,13 +93,13 @@ def get_cross_account_client(
     )
 
     credentials = assumed['Credentials']
-    client = boto3.client(
+    client = instrument_client(boto3.client(
         service,
         region_name=region,
         aws_access_key_id=credentials['AccessKeyId'],
         aws_secret_access_key=credentials['SecretAccessKey'],
         aws_session_token=credentials['SessionToken']
-    )
+    ))
 
     # Cache the client with timestamp
     _client_cache[cache_key] = (client, now)
@@ -157,13 +158,13 @@ def get_action_client(
     )
 
     credentials = assumed['Credentials']
-    return boto3.client(
+    return instrument_client(boto3.client(
         service,
         region_name=region,
         aws_access_key_id=credentials['AccessKeyId'],
         aws_secret_access_key=credentials['SecretAccessKey'],
         aws_session_token=credentials['SessionToken']
-    )
+    ))
 
 
 def build_sso_console_url(sso_portal_url: str, account_id: str, destination_url: str) -> str:
@@ -0,0 +1,127 @@
+"""
+Bounded concurrency helpers for fanning out AWS API calls.
+
+Calls are spread over a short-lived thread pool, and every call made against
+an account also holds a slot of that account's process-wide semaphore, so
+concurrent requests (or nested fan-outs) can't exceed the per-account cap and
+trip API throttling (AWS_ACCOUNT_MAX_CONCURRENCY, default 8).
+
+Each task runs in a copy of the caller's context, so request-scoped state
+(log fields, call timings) follows the work into the pool threads. A task
+that fans out again against the account whose slot it holds runs its
+sub-tasks on that slot plus whatever slots are free right now (never
+waiting for more), so nested fan-outs stay under the cap without
+deadlocking on it.
+
+Usage:
+    from utils.concurrency import map_concurrent
+
+    healths = map_concurrent(
+        lambda arn: elbv2.describe_target_health(TargetGroupArn=arn),
+        target_group_arns,
+        account_id=account_id,
+    )
+"""
+
+import contextlib
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+DEFAULT_MAX_WORKERS = 8
+ACCOUNT_MAX_CONCURRENCY = int(os.environ.get('AWS_ACCOUNT_MAX_CONCURRENCY', '8') or 8)
+
+_account_limiters: Dict[str, threading.BoundedSemaphore] = {}
+_limiters_lock = threading.Lock()
+
+# Account whose slot the current task holds
+_held_account: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    'dashborion_held_account', default=None
+)
+
+
+def account_limiter(account_id: str) -> threading.BoundedSemaphore:
+    """Process-wide semaphore capping concurrent API calls to one account."""
+    with _limiters_lock:
+        limiter = _account_limiters.get(account_id)
+        if limiter is None:
+            limiter = _account_limiters[account_id] = threading.BoundedSemaphore(ACCOUNT_MAX_CONCURRENCY)
+        return limiter
+
+
+@contextlib.contextmanager
+def account_slot(account_id: Optional[str]) -> Iterator[None]:
+    """Hold one of the account's concurrency slots (no-op without an account)."""
+    if not account_id or _held_account.get() == account_id:
+        yield
+        return
+    with account_limiter(account_id):
+        token = _held_account.set(account_id)
+        try:
+            yield
+        finally:
+            _held_account.reset(token)
+
+
+def map_concurrent(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    account_id: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[R]:
+    """
+    Apply fn to every item concurrently and return the results in input order.
+
+    Args:
+        fn: Function called once per item
+        items: Inputs
+        account_id: AWS account the calls target (applies the per-account cap)
+        max_workers: Upper bound on threads for this fan-out
+
+    The first exception raised by fn is re-raised once all calls finished.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def run(item: T) -> R:
+        with account_slot(account_id):
+            return fn(item)
+
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        return [run(item) for item in items]
+
+    if not account_id or _held_account.get() != account_id:
+        return _run_pool(run, items, workers)
+
+    # Nested fan-out: the held slot covers one worker, each extra worker
+    # needs a slot that is free now
+    limiter = account_limiter(account_id)
+    extra = 0
+    while extra < workers - 1 and limiter.acquire(blocking=False):
+        extra += 1
+    try:
+        if not extra:
+            return [run(item) for item in items]
+        return _run_pool(run, items, 1 + extra)
+    finally:
+        for _ in range(extra):
+            limiter.release()
+
+
+def _run_pool(run: Callable[[T], R], items: List[T], workers: int) -> List[R]:
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, run, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def run_concurrent(*calls: Callable[[], R], account_id: Optional[str] = None) -> List[R]:
+    """Run independent zero-argument calls concurrently, results in call order."""
+    return map_concurrent(lambda call: call(), calls, account_id=account_id, max_workers=len(calls))
@@ -0,0 +1,253 @@
+"""
+Shared EKS (Kubernetes API) connections.
+
+One connection per (role, region, cluster), kept for the life of the process
+and shared by the orchestrator provider, the infrastructure endpoints and
+discovery:
+
+- the cluster endpoint and CA certificate are described once (CA written to
+  a per-cluster file under /tmp) and re-described only after CLUSTER_INFO_TTL;
+- the bearer token (valid 15 minutes) is regenerated before it expires,
+  through the client's refresh hook, so a warm Lambda keeps its ApiClient and
+  its urllib3 pool instead of failing or reconnecting;
+- the pool is sized for concurrent calls (EKS_CONNECTION_POOL_SIZE, default
+  matches the per-account concurrency cap).
+
+Usage:
+    from utils.eks import get_k8s_connection
+
+    conn = get_k8s_connection(role_arn, region, cluster_name)
+    conn.core.list_namespace()
+"""
+
+import base64
+import datetime
+import hashlib
+import hmac
+import os
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import boto3
+
+from shared.instrumentation import instrument_client
+from shared.log import get_logger
+from utils.concurrency import ACCOUNT_MAX_CONCURRENCY
+
+logger = get_logger(__name__)
+
+
+# EKS accepts a token for 15 minutes after signing; refresh well before that
+TOKEN_REFRESH_SECONDS = 10 * 60
+# Endpoint and CA only change if the cluster is recreated
+CLUSTER_INFO_TTL_SECONDS = 6 * 3600
+POOL_SIZE = int(os.environ.get('EKS_CONNECTION_POOL_SIZE', '0') or 0) or max(ACCOUNT_MAX_CONCURRENCY, 8)
+
+_CREDENTIALS_MARGIN_SECONDS = 5 * 60
+
+_credentials_cache: Dict[str, Dict[str, Any]] = {}
+_credentials_lock = threading.Lock()
+
+
+def assume_role_credentials(role_arn: str) -> Dict[str, Any]:
+    """Assumed-role credentials (EKS tokens, discovery clients), reused until shortly before expiry."""
+    with _credentials_lock:
+        credentials = _credentials_cache.get(role_arn)
+        if credentials and credentials['Expiration'].timestamp() - time.time() > _CREDENTIALS_MARGIN_SECONDS:
+            return credentials
+        assumed = boto3.client('sts').assume_role(RoleArn=role_arn, RoleSessionName='dashborion-eks-token')
+        credentials = _credentials_cache[role_arn] = assumed['Credentials']
+        return credentials
+
+
+def generate_token(cluster_name: str, region: str, credentials: Dict[str, Any]) -> str:
+    """Generate EKS auth token using STS GetCallerIdentity presigned URL
+
+    This implements the same token generation as aws-iam-authenticator.
+    Uses STS presigned URL with x-k8s-aws-id header for cluster identification.
+    """
+    access_key = credentials['AccessKeyId']
+    secret_key = credentials['SecretAccessKey']
+    session_token = credentials['SessionToken']
+
+    # SigV4 signing for presigned URL
+    method = 'GET'
+    service = 'sts'
+    host = f'sts.{region}.amazonaws.com'
+    endpoint = f'https://{host}/'
+
+    t = datetime.datetime.utcnow()
+    amz_date = t.strftime('%Y%m%dT%H%M%SZ')
+    date_stamp = t.strftime('%Y%m%d')
+
+    canonical_uri = '/'
+    algorithm = 'AWS4-HMAC-SHA256'
+    credential_scope = f'{date_stamp}/{region}/{service}/aws4_request'
+
+    # Headers to sign - must include x-k8s-aws-id for EKS
+    headers_to_sign = {
+        'host': host,
+        'x-k8s-aws-id': cluster_name
+    }
+    signed_headers = ';'.join(sorted(headers_to_sign.keys()))
+    canonical_headers = ''.join(f'{k}:{v}\n' for k, v in sorted(headers_to_sign.items()))
+
+    # Canonical querystring (alphabetically sorted, includes auth params except signature)
+    query_params = {
+        'Action': 'GetCallerIdentity',
+        'Version': '2011-06-15',
+        'X-Amz-Algorithm': algorithm,
+        'X-Amz-Credential': f'{access_key}/{credential_scope}',
+        'X-Amz-Date': amz_date,
+        'X-Amz-Expires': '60',
+        'X-Amz-Security-Token': session_token,
+        'X-Amz-SignedHeaders': signed_headers,
+    }
+    canonical_querystring = '&'.join(
+        f'{urllib.parse.quote(k, safe="")}={urllib.parse.quote(v, safe="")}'
+        for k, v in sorted(query_params.items())
+    )
+
+    # Payload hash must be SHA256 of empty string for EKS token generation
+    payload_hash = hashlib.sha256(b'').hexdigest()
+
+    canonical_request = f'{method}\n{canonical_uri}\n{canonical_querystring}\n{canonical_headers}\n{signed_headers}\n{payload_hash}'
+    canonical_request_hash = hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+    string_to_sign = f'{algorithm}\n{amz_date}\n{credential_scope}\n{canonical_request_hash}'
+
+    def sign(key, msg):
+        return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
+
+    k_date = sign(('AWS4' + secret_key).encode('utf-8'), date_stamp)
+    k_region = sign(k_date, region)
+    k_service = sign(k_region, service)
+    k_signing = sign(k_service, 'aws4_request')
+    signature = hmac.new(k_signing, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    presigned_url = f'{endpoint}?{canonical_querystring}&X-Amz-Signature={signature}'
+
+    # Encode as k8s-aws token format
+    return 'k8s-aws-v1.' + base64.urlsafe_b64encode(
+        presigned_url.encode('utf-8')
+    ).decode('utf-8').rstrip('=')
+
+
+def _write_ca_cert(cluster_key: str, ca_data: str) -> str:
+    """Write the cluster CA to /tmp (Lambda writable directory) once, return its path."""
+    digest = hashlib.sha256(f"{cluster_key}\n{ca_data}".encode('utf-8')).hexdigest()[:16]
+    cert_path = f'/tmp/eks-ca-{digest}.crt'
+    if not os.path.exists(cert_path):
+        tmp_path = f'{cert_path}.{os.getpid()}.{threading.get_ident()}'
+        with open(tmp_path, 'wb') as f:
+            f.write(base64.b64decode(ca_data))
+        os.replace(tmp_path, cert_path)
+    return cert_path
+
+
+class K8sConnection:
+    """Kubernetes API clients of one EKS cluster, with a self-refreshing token."""
+
+    def __init__(self, cluster_name: str, region: str, endpoint: str, ca_cert_path: str,
+                 credentials_fn: Callable[[], Dict[str, Any]]):
+        from kubernetes import client as k8s_client
+        from kubernetes.client import Configuration
+
+        self.cluster_name = cluster_name
+        self.region = region
+        self.endpoint = endpoint
+        self._credentials_fn = credentials_fn
+        self._token_lock = threading.Lock()
+        self._token_at = 0.0
+
+        configuration = Configuration()
+        configuration.host = endpoint
+        configuration.verify_ssl = True
+        configuration.ssl_ca_cert = ca_cert_path
+        configuration.connection_pool_maxsize = POOL_SIZE
+        configuration.api_key = {}
+        # Called before every request: regenerate the token when it gets old
+        configuration.refresh_api_key_hook = self._refresh_token
+        self._refresh_token(configuration)
+
+        self.configuration = configuration
+        self.api_client = k8s_client.ApiClient(configuration)
+        self.core = k8s_client.CoreV1Api(self.api_client)
+        self.apps = k8s_client.AppsV1Api(self.api_client)
+
+    def _refresh_token(self, configuration) -> None:
+        if time.time() - self._token_at < TOKEN_REFRESH_SECONDS:
+            return
+        with self._token_lock:
+            if time.time() - self._token_at < TOKEN_REFRESH_SECONDS:
+                return
+            token = generate_token(self.cluster_name, self.region, self._credentials_fn())
+            configuration.api_key['authorization'] = f"Bearer {token}"
+            self._token_at = time.time()
+            logger.debug("EKS token refreshed for cluster %s", self.cluster_name)
+
+
+# (role ARN, region, cluster) -> connection, and -> (expires_at, endpoint, CA path)
+_connections: Dict[Tuple[str, str, str], K8sConnection] = {}
+_cluster_info: Dict[Tuple[str, str, str], Tuple[float, str, str]] = {}
+_connections_lock = threading.Lock()
+
+
+def _describe_cluster(key: Tuple[str, str, str], credentials: Dict[str, Any]) -> Tuple[str, str]:
+    role_arn, region, cluster_name = key
+    eks = instrument_client(boto3.client(
+        'eks',
+        region_name=region,
+        aws_access_key_id=credentials['AccessKeyId'],
+        aws_secret_access_key=credentials['SecretAccessKey'],
+        aws_session_token=credentials['SessionToken'],
+    ))
+    cluster = eks.describe_cluster(name=cluster_name)['cluster']
+    ca_path = _write_ca_cert(f"{role_arn}|{region}|{cluster_name}", cluster['certificateAuthority']['data'])
+    return cluster['endpoint'], ca_path
+
+
+def get_k8s_connection(
+    role_arn: str,
+    region: str,
+    cluster_name: str,
+    credentials_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+) -> K8sConnection:
+    """
+    Get the shared connection to an EKS cluster, creating it on first use.
+
+    Args:
+        role_arn: Role whose credentials sign the EKS token (must be mapped in the cluster)
+        region: Cluster region
+        cluster_name: EKS cluster name
+        credentials_fn: Returns STS credentials for role_arn (default: cached assume_role)
+    """
+    credentials_fn = credentials_fn or (lambda: assume_role_credentials(role_arn))
+    key = (role_arn, region, cluster_name)
+    now = time.time()
+
+    with _connections_lock:
+        connection = _connections.get(key)
+        info = _cluster_info.get(key)
+        if connection and info and info[0] > now:
+            return connection
+
+        if not info or info[0] <= now:
+            endpoint, ca_path = _describe_cluster(key, credentials_fn())
+            info = _cluster_info[key] = (now + CLUSTER_INFO_TTL_SECONDS, endpoint, ca_path)
+
+        if connection and (connection.endpoint, connection.configuration.ssl_ca_cert) == info[1:]:
+            return connection
+
+        connection = K8sConnection(cluster_name, region, info[1], info[2], credentials_fn)
+        _connections[key] = connection
+        logger.debug("EKS connection created for cluster %s (%s)", cluster_name, info[1])
+        return connection
+
+
+def clear_connections() -> None:
+    """Drop every cached connection (e.g. after the cluster was recreated)."""
+    with _connections_lock:
+        _connections.clear()
+        _cluster_info.clear()
@@ -0,0 +1,288 @@
+"""
+Shared HTTP client for CI provider APIs (GitHub, Jenkins, ArgoCD).
+
+One client per host (scheme://host:port), shared by every provider instance
+of the process:
+
+- keep-alive connection pool sized to the host's concurrency cap
+  (HTTP_HOST_MAX_CONCURRENCY, default 8); callers beyond the cap wait
+- retries on connection errors, 429 and 5xx with exponential backoff,
+  honoring `Retry-After` (up to HTTP_RETRY_MAX_WAIT_SECONDS); GET and HEAD
+  only, so actions (workflow dispatch, job builds) are never sent twice
+- conditional requests: GET responses carrying an ETag / Last-Modified are
+  kept in a per-host LRU cache and revalidated with If-None-Match /
+  If-Modified-Since (a 304 costs no GitHub rate limit)
+- optional freshness: `cache_ttl` seconds during which a cached GET is
+  served without any request
+
+Cache entries are keyed by method, URL and credentials (a digest of the
+Authorization header / auth), so callers with different tokens never
+share responses. For the same reason the shared session stores no cookies:
+a `Set-Cookie` answering one caller's credentials would otherwise be sent
+with every other caller's requests.
+
+Calls are timed per attempt through shared.instrumentation (Server-Timing).
+
+Usage:
+    client = get_http_client('https://api.github.com')
+    response = client.get('/repos/org/repo/actions/runs', headers={...}, cache_ttl=30)
+    response.raise_for_status()
+    runs = response.json()
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from email.utils import parsedate_to_datetime
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from shared.instrumentation import instrument_session
+
+HOST_MAX_CONCURRENCY = int(os.environ.get('HTTP_HOST_MAX_CONCURRENCY', '8') or 8)
+MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', '3') or 3)
+RETRY_MAX_WAIT_SECONDS = float(os.environ.get('HTTP_RETRY_MAX_WAIT_SECONDS', '10') or 10)
+DEFAULT_TIMEOUT = 30
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD'})
+_BACKOFF_BASE_SECONDS = 0.5
+_MAX_CACHE_ENTRIES = 512
+
+
+class HttpError(Exception):
+    """HTTP error status (>= 400) of a response."""
+
+    def __init__(self, response: 'HttpResponse'):
+        self.response = response
+        self.status_code = response.status_code
+        super().__init__(f"HTTP {response.status_code} for {response.url}")
+
+
+@dataclass
+class HttpResponse:
+    """Response of the shared client (live or served from the cache)."""
+    status_code: int
+    url: str
+    headers: Mapping[str, str] = field(default_factory=CaseInsensitiveDict)
+    content: bytes = b''
+    # 'hit' (fresh, no request), 'revalidated' (304), None (live response)
+    cache: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content) if self.content else None
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HttpError(self)
+
+
+@dataclass
+class _CacheEntry:
+    response: HttpResponse
+    validators: Dict[str, str]
+    fresh_until: float = 0.0
+
+
+def _retry_delay(response: Optional[requests.Response], attempt: int) -> float:
+    """Seconds to wait before the next attempt: Retry-After, else exponential backoff with jitter."""
+    if response is not None:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                try:
+                    return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+                except (TypeError, ValueError):
+                    pass
+        # GitHub primary rate limit: reset time of the exhausted quota
+        if response.headers.get('X-RateLimit-Remaining') == '0' and response.headers.get('X-RateLimit-Reset'):
+            try:
+                return max(float(response.headers['X-RateLimit-Reset']) - time.time(), 0.0)
+            except ValueError:
+                pass
+    return _BACKOFF_BASE_SECONDS * (2 ** attempt) * (0.5 + random.random() / 2)
+
+
+def _credentials_digest(headers: Dict[str, str], auth: Any) -> str:
+    secret = headers.get('Authorization', '')
+    if auth:
+        secret += repr(auth)
+    return hashlib.sha256(secret.encode('utf-8')).hexdigest()[:16] if secret else ''
+
+
+class _Host:
+    """Connection pool, concurrency slots and response cache of one host."""
+
+    def __init__(self, max_concurrency: int):
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.session = instrument_session(requests.Session())
+        # Shared by every caller and credential: never keep cookies
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.cache: "OrderedDict[Tuple[str, str, str], _CacheEntry]" = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+
+_hosts: Dict[str, _Host] = {}
+_hosts_lock = threading.Lock()
+
+
+def _host(url: str) -> _Host:
+    parsed = urlparse(url)
+    host_key = f"{parsed.scheme}://{parsed.netloc}"
+    with _hosts_lock:
+        host = _hosts.get(host_key)
+        if host is None:
+            host = _hosts[host_key] = _Host(HOST_MAX_CONCURRENCY)
+        return host
+
+
+class HttpClient:
+    """
+    Client for a base URL (see module docstring). Clients of the same host
+    share one pool, concurrency cap and response cache.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip('/')
+        self._host = _host(self.base_url)
+
+    def _url(self, path: str, params: Optional[Dict[str, Any]]) -> str:
+        url = path if path.startswith(('http://', 'https://')) else f"{self.base_url}/{path.lstrip('/')}"
+        if params:
+            query = urlencode({k: v for k, v in params.items() if v is not None}, doseq=True)
+            if query:
+                url += ('&' if '?' in url else '?') + query
+        return url
+
+    def _cached(self, key) -> Optional[_CacheEntry]:
+        with self._host.cache_lock:
+            entry = self._host.cache.get(key)
+            if entry is not None:
+                self._host.cache.move_to_end(key)
+            return entry
+
+    def _store(self, key, response: HttpResponse, cache_ttl: float) -> None:
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if not validators and not cache_ttl:
+            return
+        entry = _CacheEntry(response, validators, time.monotonic() + cache_ttl if cache_ttl else 0.0)
+        with self._host.cache_lock:
+            self._host.cache[key] = entry
+            self._host.cache.move_to_end(key)
+            while len(self._host.cache) > _MAX_CACHE_ENTRIES:
+                self._host.cache.popitem(last=False)
+
+    def _send(self, method: str, url: str, headers: Dict[str, str], **kwargs) -> requests.Response:
+        retry = method in _IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            response = None
+            try:
+                with self._host.slots:
+                    response = self._host.session.request(method, url, headers=headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not retry or attempt >= MAX_RETRIES:
+                    raise
+            else:
+                if not retry or response.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+                    return response
+            delay = _retry_delay(response, attempt)
+            if delay > RETRY_MAX_WAIT_SECONDS:
+                if response is None:
+                    raise requests.ConnectionError(f"Giving up on {url}")
+                return response
+            time.sleep(delay)
+            attempt += 1
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Any = None,
+        json_body: Any = None,
+        data: Any = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = 0,
+    ) -> HttpResponse:
+        """
+        Send a request (path relative to the base URL, or an absolute URL).
+
+        GET responses are cached and revalidated; `cache_ttl` > 0 serves them
+        without a request for that many seconds. Error statuses are returned,
+        not raised (see HttpResponse.raise_for_status).
+        """
+        method = method.upper()
+        url = self._url(path, params)
+        headers = dict(headers or {})
+
+        key = None
+        entry = None
+        if method == 'GET':
+            key = (method, url, _credentials_digest(headers, auth))
+            entry = self._cached(key)
+            if entry is not None:
+                if entry.fresh_until > time.monotonic():
+                    return replace(entry.response, cache='hit')
+                headers.update(entry.validators)
+
+        response = self._send(method, url, headers, auth=auth, json=json_body, data=data, timeout=timeout)
+
+        if entry is not None and response.status_code == 304:
+            if cache_ttl:
+                entry.fresh_until = time.monotonic() + cache_ttl
+            return replace(entry.response, cache='revalidated')
+
+        result = HttpResponse(
+            status_code=response.status_code,
+            url=response.url or url,
+            headers=CaseInsensitiveDict(response.headers),
+            content=response.content,
+        )
+        if key is not None and response.status_code == 200:
+            self._store(key, result, cache_ttl)
+        return result
+
+    def get(self, path: str, **kwargs) -> HttpResponse:
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> HttpResponse:
+        return self.request('POST', path, **kwargs)
+
+    def clear_cache(self) -> None:
+        """Drop the cached responses of this client's host."""
+        with self._host.cache_lock:
+            self._host.cache.clear()
+
+
+def get_http_client(base_url: str) -> HttpClient:
+    """Client for `base_url`, sharing its host's pool and cache."""
+    return HttpClient(base_url)
@@ -1,16 +1,68 @@
 """
-AWS Instance Specs Fetcher via Pricing API.
-
-Fetches EC2 and RDS instance specifications (vCPU, memory, network performance)
-using the AWS Pricing API (only available in us-east-1).
-
-Results are cached to avoid redundant API calls.
+AWS Instance Specs catalog.
+
+EC2 and RDS instance specifications (vCPU, memory, network performance,
+architecture) served from a catalog of every instance type, loaded in bulk
+once and looked up in O(1):
+
+1. in process memory
+2. the cache table (`CATALOG#instance-specs` / `v{CATALOG_VERSION}`, shared by
+   all Lambdas), refreshed after SPECS_TTL_SECONDS (INSTANCE_SPECS_TTL_SECONDS)
+3. a bulk load with paginated ec2:DescribeInstanceTypes and Pricing
+   GetProducts (about ten calls each for the whole catalog), written back to
+   the cache table
+4. the bundled snapshot (instance_specs_snapshot.json) when AWS can't be reached
+
+RDS classes resolve to their EC2 counterpart (db.r5.large -> r5.large).
+Types missing from the catalog fall back to a per-type Pricing API lookup
+(only available in us-east-1), memoized.
+
+`architecture` and `processorFeatures` keep the Pricing API values
+("64-bit", "Intel AVX; Intel AVX2; ..."); the EC2 values are in
+`cpuArchitecture` (x86_64, arm64) and `cpuManufacturer` (Intel, AMD, AWS).
+
+Catalog format (compact, one row per type):
+    {"version": 2, "generatedAt": "...", "source": "ec2:DescribeInstanceTypes",
+     "columns": ["vcpu", "memoryGib", "networkPerformance", "architecture", "processorFeatures",
+                 "cpuArchitecture", "cpuManufacturer"],
+     "types": {"m5.xlarge": [4, 16.0, "Up to 10 Gigabit", "64-bit", "Intel AVX; ...", "x86_64", "Intel"], ...}}
 """
 
 import json
-import boto3
-from typing import Dict, Optional
+import os
+import threading
+import time
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import boto3
+
+CATALOG_VERSION = 2
+CATALOG_PK = "CATALOG#instance-specs"
+COLUMNS = (
+    "vcpu", "memoryGib", "networkPerformance", "architecture", "processorFeatures",
+    "cpuArchitecture", "cpuManufacturer",
+)
+
+# One Pricing product per instance type (Linux, shared tenancy, on demand)
+_PRICING_FILTERS = (
+    ('productFamily', 'Compute Instance'),
+    ('operatingSystem', 'Linux'),
+    ('tenancy', 'Shared'),
+    ('preInstalledSw', 'NA'),
+    ('capacitystatus', 'Used'),
+)
+
+# Age after which the catalog is reloaded from EC2 (specs rarely change)
+SPECS_TTL_SECONDS = int(os.environ.get('INSTANCE_SPECS_TTL_SECONDS', str(7 * 86400)))
+# Cache table item lifetime: a stale catalog still beats the snapshot
+_TABLE_TTL_SECONDS = 30 * 86400
+# Delay before retrying a failed refresh
+_RETRY_SECONDS = 600
+
+SNAPSHOT_PATH = Path(__file__).with_name('instance_specs_snapshot.json')
 
 
 @dataclass
@@ -21,14 +73,97 @@ class InstanceSpecs:
     network_performance: str
     architecture: str
     processor_features: str = ""
+    cpu_architecture: str = ""
+    cpu_manufacturer: str = ""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _age_seconds(catalog: Dict[str, Any]) -> float:
+    try:
+        generated_at = datetime.fromisoformat(catalog["generatedAt"])
+    except (KeyError, TypeError, ValueError):
+        return float("inf")
+    return (datetime.now(timezone.utc) - generated_at).total_seconds()
+
+
+def _row(instance_type: Dict[str, Any], priced: Dict[str, str]) -> list:
+    """Catalog row of a DescribeInstanceTypes entry and its Pricing attributes."""
+    processor = instance_type.get('ProcessorInfo', {})
+    architectures = processor.get('SupportedArchitectures') or ['Unknown']
+    return [
+        instance_type.get('VCpuInfo', {}).get('DefaultVCpus', 0),
+        round(instance_type.get('MemoryInfo', {}).get('SizeInMiB', 0) / 1024, 3),
+        instance_type.get('NetworkInfo', {}).get('NetworkPerformance', 'Unknown'),
+        # Pricing's wording, derived from the supported architectures when missing
+        priced.get('processorArchitecture') or ('32-bit or 64-bit' if 'i386' in architectures else '64-bit'),
+        priced.get('processorFeatures', ''),
+        # i386 / x86_64_mac types also support the plain 64-bit architecture
+        next((a for a in architectures if a not in ('i386', 'x86_64_mac')), architectures[0]),
+        processor.get('Manufacturer', ''),
+    ]
+
+
+def _pricing_attributes(session: boto3.Session, region: str) -> Dict[str, Dict[str, str]]:
+    """Pricing product attributes of every EC2 instance type in `region` (paginated GetProducts)."""
+    # Pricing API is only available in us-east-1
+    pricing = session.client('pricing', region_name='us-east-1')
+    filters = [{'Type': 'TERM_MATCH', 'Field': field, 'Value': value} for field, value in _PRICING_FILTERS]
+    filters.append({'Type': 'TERM_MATCH', 'Field': 'regionCode', 'Value': region})
+    attributes = {}
+    for page in pricing.get_paginator('get_products').paginate(
+        ServiceCode='AmazonEC2', Filters=filters, PaginationConfig={'PageSize': 100}
+    ):
+        for item in page.get('PriceList', []):
+            product = json.loads(item).get('product', {}).get('attributes', {})
+            if product.get('instanceType'):
+                attributes.setdefault(product['instanceType'], product)
+    return attributes
+
+
+def build_catalog(session: boto3.Session = None, region: str = None) -> Dict[str, Any]:
+    """
+    Catalog of every instance type offered in `region` (paginated
+    DescribeInstanceTypes, plus Pricing GetProducts for the Pricing-worded
+    columns; without Pricing access processorFeatures stays empty).
+    """
+    session = session or boto3.Session()
+    region = region or os.environ.get('AWS_REGION_DEFAULT', 'eu-west-3')
+    try:
+        priced = _pricing_attributes(session, region)
+    except Exception as e:
+        print(f"Warning: Could not load instance types pricing attributes: {e}")
+        priced = {}
+    ec2 = session.client('ec2', region_name=region)
+    types = {}
+    for page in ec2.get_paginator('describe_instance_types').paginate(PaginationConfig={'PageSize': 100}):
+        for instance_type in page.get('InstanceTypes', []):
+            name = instance_type['InstanceType']
+            types[name] = _row(instance_type, priced.get(name, {}))
+    return {
+        "version": CATALOG_VERSION,
+        "generatedAt": _now(),
+        "source": "ec2:DescribeInstanceTypes",
+        "columns": list(COLUMNS),
+        "types": types,
+    }
+
+
+def _load_snapshot() -> Optional[Dict[str, Any]]:
+    try:
+        with open(SNAPSHOT_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read instance specs snapshot: {e}")
+        return None
 
 
 class InstanceSpecsFetcher:
     """
-    Fetches instance specifications from AWS Pricing API.
-
-    The Pricing API is only available in us-east-1, so we use a dedicated
-    client for that region regardless of the target region.
+    Instance specifications from the specs catalog, with a per-type Pricing
+    API fallback for types the catalog doesn't know.
     """
 
     def __init__(self, session: boto3.Session = None):
@@ -39,14 +174,97 @@ class InstanceSpecsFetcher:
             session: Optional boto3 session (uses default credentials if not provided)
         """
         self._session = session or boto3.Session()
-        # Pricing API is only available in us-east-1
-        self._pricing_client = self._session.client('pricing', region_name='us-east-1')
-        self._cache: Dict[str, InstanceSpecs] = {}
+        self._pricing_client = None
+        self._lock = threading.Lock()
+        self._catalog: Optional[Dict[str, Any]] = None
+        self._specs: Dict[str, InstanceSpecs] = {}
+        # Monotonic times: catalog expiry, next refresh attempt after a failure
+        self._expires_at = 0.0
+        self._retry_after = 0.0
+        # Pricing API lookups of types missing from the catalog (None: not found)
+        self._cache: Dict[str, Optional[InstanceSpecs]] = {}
 
     def _normalize_instance_type(self, instance_type: str) -> str:
         """Remove db. prefix for RDS instance types."""
         return instance_type.replace('db.', '')
 
+    # -------------------------------------------------------------------------
+    # Catalog
+    # -------------------------------------------------------------------------
+
+    def _use(self, catalog: Dict[str, Any]) -> None:
+        columns = catalog.get("columns") or list(COLUMNS)
+        specs = {}
+        for instance_type, row in (catalog.get("types") or {}).items():
+            values = dict(zip(columns, row))
+            specs[instance_type] = InstanceSpecs(
+                vcpu=int(values.get("vcpu") or 0),
+                memory_gib=float(values.get("memoryGib") or 0.0),
+                network_performance=values.get("networkPerformance") or 'Unknown',
+                architecture=values.get("architecture") or 'Unknown',
+                processor_features=values.get("processorFeatures") or '',
+                cpu_architecture=values.get("cpuArchitecture") or '',
+                cpu_manufacturer=values.get("cpuManufacturer") or '',
+            )
+        self._catalog = catalog
+        self._specs = specs
+        self._expires_at = time.monotonic() + max(SPECS_TTL_SECONDS - _age_seconds(catalog), 0)
+
+    def _read_table(self) -> Optional[Dict[str, Any]]:
+        from cache.shared import get_cache_backend
+
+        cache = get_cache_backend()
+        if cache is None:
+            return None
+        try:
+            catalog = cache.get(CATALOG_PK, f"v{CATALOG_VERSION}")
+        except Exception as e:
+            print(f"Warning: Could not read instance specs catalog: {e}")
+            return None
+        return catalog if isinstance(catalog, dict) and catalog.get("version") == CATALOG_VERSION else None
+
+    def _write_table(self, catalog: Dict[str, Any]) -> None:
+        from cache.shared import get_cache_backend
+
+        cache = get_cache_backend()
+        if cache is None:
+            return
+        try:
+            cache.set(CATALOG_PK, f"v{CATALOG_VERSION}", catalog, _TABLE_TTL_SECONDS)
+        except Exception as e:
+            print(f"Warning: Could not store instance specs catalog: {e}")
+
+    def _ensure_catalog(self) -> None:
+        if time.monotonic() < max(self._expires_at, self._retry_after):
+            return
+
+        with self._lock:
+            if time.monotonic() < max(self._expires_at, self._retry_after):
+                return
+            catalog = self._catalog
+
+            stored = self._read_table()
+            if stored is not None and _age_seconds(stored) < SPECS_TTL_SECONDS:
+                self._use(stored)
+                return
+
+            try:
+                fresh = build_catalog(self._session)
+            except Exception as e:
+                print(f"Warning: Could not load instance types catalog: {e}")
+                self._retry_after = time.monotonic() + _RETRY_SECONDS
+                fallback = stored or catalog or _load_snapshot()
+                if fallback is not None and fallback is not catalog:
+                    self._use(fallback)
+                return
+
+            self._write_table(fresh)
+            self._use(fresh)
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
     def get_instance_specs(
         self,
         instance_type: str,
@@ -58,28 +276,30 @@ class InstanceSpecsFetcher:
 
         Args:
             instance_type: Instance type (e.g., 'm5.xlarge', 'db.r5.large')
-            region: AWS region code (e.g., 'eu-central-1')
+            region: AWS region code (e.g., 'eu-central-1'), used by the Pricing fallback
             for_rds: True if this is an RDS instance type
 
         Returns:
             InstanceSpecs or None if not found
         """
-        # Normalize instance type for caching
         normalized = self._normalize_instance_type(instance_type)
-        cache_key = f"{normalized}:{region}"
 
+        self._ensure_catalog()
+        specs = self._specs.get(normalized)
+        if specs is not None:
+            return specs
+
+        cache_key = f"{normalized}:{region}"
         if cache_key in self._cache:
             return self._cache[cache_key]
 
         try:
             specs = self._fetch_specs(instance_type, region, for_rds)
-            if specs:
-                # Cache with normalized key
-                self._cache[cache_key] = specs
-            return specs
         except Exception as e:
             print(f"Warning: Could not fetch specs for {instance_type}: {e}")
             return None
+        self._cache[cache_key] = specs
+        return specs
 
     def _fetch_specs(
         self,
@@ -88,6 +308,10 @@ class InstanceSpecsFetcher:
         for_rds: bool
     ) -> Optional[InstanceSpecs]:
         """Fetch specs from Pricing API."""
+        if self._pricing_client is None:
+            # Pricing API is only available in us-east-1
+            self._pricing_client = self._session.client('pricing', region_name='us-east-1')
+
         service_code = 'AmazonRDS' if for_rds else 'AmazonEC2'
         product_family = 'Database Instance' if for_rds else 'Compute Instance'
 
@@ -157,8 +381,13 @@ class InstanceSpecsFetcher:
             return f"{instance_type} ({specs.vcpu} vCPU, {specs.memory_gib:.1f} GB, {specs.architecture})"
 
     def clear_cache(self):
-        """Clear the specs cache."""
-        self._cache = {}
+        """Clear the specs cache (the catalog is reloaded on next lookup)."""
+        with self._lock:
+            self._catalog = None
+            self._specs = {}
+            self._cache = {}
+            self._expires_at = 0.0
+            self._retry_after = 0.0
 
 
 # Global singleton instance
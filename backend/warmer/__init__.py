@@ -0,0 +1 @@
+"""Cache warmer module (scheduled Lambda / CLI)."""
@@ -0,0 +1,256 @@
+"""
+Cache warmer: refreshes the cached views of every project environment ahead
+of user requests.
+
+Runs as a scheduled Lambda (`handler`) or from the command line:
+
+    cd backend && python -m warmer.handler --project mro --resources workloads,nodes --json
+
+Targets (project, environment, resource) go through the same fetch paths as
+the API, forced to refresh:
+
+- workloads, alb, cloudfront, rds: infrastructure views (fetch_with_cache)
+- nodes: EKS nodes view (fetch_with_cache)
+- pods: EKS state table (refreshed by its provider when stale)
+- comparison: comparison summaries (orchestrator triggered when due)
+
+Targets are refreshed most-read first (access counts of the last days, see
+cache.stats) by WARMER_CONCURRENCY workers. Targets not started before the
+time budget runs out are reported as skipped.
+
+Lambda event (all optional):
+    {"projects": ["mro"], "environments": ["staging"], "resources": ["workloads"]}
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app_config import get_config
+from cache.stats import access_counts, flush_access_counts
+from shared.log import log_requests
+from utils.concurrency import map_concurrent
+
+INFRASTRUCTURE_RESOURCES = ('workloads', 'alb', 'cloudfront', 'rds')
+RESOURCES = INFRASTRUCTURE_RESOURCES + ('nodes', 'pods', 'comparison')
+
+WARMER_CONCURRENCY = int(os.environ.get('WARMER_CONCURRENCY', '4') or 4)
+# Time kept free at the end of a Lambda invocation
+_LAMBDA_MARGIN_SECONDS = 10
+
+
+def _infrastructure_target(config, project: str, env: str, resource: str) -> Callable[[], Dict[str, Any]]:
+    from infrastructure.handler import _parse_infra_params, handle_infrastructure_resource
+    from providers.aggregators.infrastructure import InfrastructureAggregator
+
+    def warm():
+        infra_params = _parse_infra_params(config.get_environment(project, env), config.get_project(project))
+        response = handle_infrastructure_resource(
+            {}, InfrastructureAggregator(config, project), project, env, resource, infra_params, True
+        )
+        return {'cache': (response.get('headers') or {}).get('X-Cache')}
+    return warm
+
+
+def _nodes_target(config, project: str, env: str) -> Callable[[], Dict[str, Any]]:
+    from infrastructure.handler import handle_eks_nodes
+
+    def warm():
+        response = handle_eks_nodes({}, config, project, env, {}, True)
+        if response.get('statusCode') != 200:
+            raise RuntimeError(json.loads(response.get('body') or '{}').get('message', 'nodes refresh failed'))
+        return {'cache': (response.get('headers') or {}).get('X-Cache')}
+    return warm
+
+
+def _pods_target(orchestrator, env: str) -> Callable[[], Dict[str, Any]]:
+    def warm():
+        pods, result = orchestrator.get_pods(env)
+        return {'state': result.status.value, 'count': len(pods)}
+    return warm
+
+
+def _comparison_target(config, project: str, pair: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+    from comparison.handler import _get_comparison_keys
+    from providers.comparison import ComparisonOrchestratorProvider, DynamoDBComparisonProvider
+
+    def warm():
+        source_env, dest_env = pair['source']['env'], pair['destination']['env']
+        pk, source_label, dest_label = _get_comparison_keys(project, source_env, dest_env, config)
+        summary = DynamoDBComparisonProvider().get_comparison_summary(
+            pk=pk, source_label=source_label, destination_label=dest_label
+        )
+        comparison_config = getattr(config, 'comparison', None) or {}
+        orch_provider = ComparisonOrchestratorProvider(
+            refresh_threshold_seconds=comparison_config.get('refreshThresholdSeconds', 3600)
+        )
+        last_updated = summary.last_updated.isoformat() if summary.last_updated else None
+        if not orch_provider.should_auto_refresh(project, source_env, dest_env, last_updated, summary.pending_checks):
+            return {'state': 'fresh'}
+        orch_provider.trigger_orchestrator(project=project, source_env=source_env, dest_env=dest_env, wait=False)
+        return {'state': 'triggered'}
+    return warm
+
+
+def collect_targets(
+    config,
+    projects: Optional[List[str]] = None,
+    environments: Optional[List[str]] = None,
+    resources: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Warm-up targets, most accessed first.
+
+    Each target is {project, env, resource, priority, warm}, `warm` being
+    the zero-argument call that refreshes it.
+    """
+    from comparison.handler import _get_available_pairs
+    from providers import ProviderFactory
+
+    resources = resources or list(RESOURCES)
+    targets = []
+    for project, project_config in config.projects.items():
+        if projects and project not in projects:
+            continue
+        for env, env_config in (project_config.environments or {}).items():
+            if (environments and env not in environments) or env_config.status == 'planned':
+                continue
+            counts = access_counts(project, env)
+
+            def add(resource: str, warm: Callable[[], Dict[str, Any]]) -> None:
+                targets.append({
+                    'project': project,
+                    'env': env,
+                    'resource': resource,
+                    'priority': counts.get(resource, 0),
+                    'warm': warm,
+                })
+
+            for resource in INFRASTRUCTURE_RESOURCES:
+                if resource in resources:
+                    add(resource, _infrastructure_target(config, project, env, resource))
+            if config.get_orchestrator_type(project, env) == 'eks':
+                if 'nodes' in resources:
+                    add('nodes', _nodes_target(config, project, env))
+                if 'pods' in resources:
+                    orchestrator = ProviderFactory.get_orchestrator_provider(config, project, env)
+                    # Only the state-table provider has something to warm
+                    if hasattr(orchestrator, 'refresh_all'):
+                        add('pods', _pods_target(orchestrator, env))
+
+        if 'comparison' in resources:
+            for pair in _get_available_pairs(project, config):
+                source_env, dest_env = pair['source']['env'], pair['destination']['env']
+                if environments and source_env not in environments and dest_env not in environments:
+                    continue
+                targets.append({
+                    'project': project,
+                    'env': f"{source_env}..{dest_env}",
+                    'resource': 'comparison',
+                    'priority': 0,
+                    'warm': _comparison_target(config, project, pair),
+                })
+
+    # Stable sort: configuration order among equally accessed targets
+    targets.sort(key=lambda target: target['priority'], reverse=True)
+    return targets
+
+
+def warm(
+    targets: List[Dict[str, Any]],
+    concurrency: int = WARMER_CONCURRENCY,
+    budget_seconds: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Refresh targets in order with `concurrency` workers and report the
+    outcome and duration of each. Targets not started within
+    `budget_seconds` are skipped.
+    """
+    started = time.monotonic()
+    deadline = started + budget_seconds if budget_seconds else None
+
+    def run(target: Dict[str, Any]) -> Dict[str, Any]:
+        result = {key: target[key] for key in ('project', 'env', 'resource', 'priority')}
+        if deadline is not None and time.monotonic() >= deadline:
+            return {**result, 'status': 'skipped'}
+        begin = time.perf_counter()
+        try:
+            result.update(target['warm']())
+            result['status'] = 'warmed'
+        except Exception as e:
+            result.update({'status': 'failed', 'error': str(e)})
+        result['durationMs'] = round((time.perf_counter() - begin) * 1000, 1)
+        print(f"[warmer] {result['project']}/{result['env']}/{result['resource']}: "
+              f"{result['status']} in {result.get('durationMs', 0)}ms")
+        return result
+
+    results = map_concurrent(run, targets, max_workers=concurrency)
+    flush_access_counts()
+
+    summary = {status: sum(1 for r in results if r['status'] == status) for status in ('warmed', 'failed', 'skipped')}
+    return {
+        'targets': len(results),
+        **summary,
+        'durationMs': round((time.monotonic() - started) * 1000, 1),
+        'results': results,
+    }
+
+
+@log_requests
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Scheduled Lambda handler: warm every project environment (or the
+    projects / environments / resources listed in the event).
+    """
+    event = event or {}
+    budget_seconds = None
+    if context is not None and hasattr(context, 'get_remaining_time_in_millis'):
+        budget_seconds = max(context.get_remaining_time_in_millis() / 1000 - _LAMBDA_MARGIN_SECONDS, 1)
+
+    targets = collect_targets(
+        get_config(),
+        projects=event.get('projects'),
+        environments=event.get('environments'),
+        resources=event.get('resources'),
+    )
+    report = warm(targets, concurrency=int(event.get('concurrency') or WARMER_CONCURRENCY), budget_seconds=budget_seconds)
+    print(f"[warmer] {report['warmed']} warmed, {report['failed']} failed, "
+          f"{report['skipped']} skipped in {report['durationMs']}ms")
+    return report
+
+
+def _split(value: Optional[str]) -> Optional[List[str]]:
+    return [item.strip() for item in value.split(',') if item.strip()] if value else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Warm the dashboard cache')
+    parser.add_argument('--project', help='Comma-separated projects (default: all)')
+    parser.add_argument('--env', help='Comma-separated environments (default: all)')
+    parser.add_argument('--resources', help=f"Comma-separated resources (default: {','.join(RESOURCES)})")
+    parser.add_argument('--concurrency', type=int, default=WARMER_CONCURRENCY)
+    parser.add_argument('--budget-seconds', type=float, help='Stop starting new refreshes after this long')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    targets = collect_targets(
+        get_config(),
+        projects=_split(args.project),
+        environments=_split(args.env),
+        resources=_split(args.resources),
+    )
+    report = warm(targets, concurrency=args.concurrency, budget_seconds=args.budget_seconds)
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+        return
+    for result in report['results']:
+        print(f"{result['project']:<20} {result['env']:<30} {result['resource']:<12} "
+              f"{result['status']:<8} {result.get('durationMs', '-'):>10} ms  {result.get('error', '')}")
+    print(f"{report['warmed']} warmed, {report['failed']} failed, {report['skipped']} skipped "
+          f"in {report['durationMs']} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -492,6 +492,43 @@ class APICollector:
         data = self._handle_response(response, f"get ENIs for {env}")
         return data.get('enis', [])
 
+    def get_reachability(self, env: str, source: Optional[str] = None,
+                         target: Optional[str] = None,
+                         protocol: Optional[str] = None,
+                         port: Optional[int] = None,
+                         vpc_id: Optional[str] = None) -> dict:
+        """
+        Get security group reachability.
+
+        Args:
+            env: Environment name
+            source: Optional source (SG ID, ENI ID or IP), default: all workloads
+            target: Optional target (SG ID, ENI ID or IP), default: all datastores
+            protocol: Optional protocol (default: tcp)
+            port: Optional port
+            vpc_id: Optional VPC ID
+
+        Returns:
+            Verdict dict (source and target) or pairs dict
+        """
+        params = {}
+        if source:
+            params['source'] = source
+        if target:
+            params['target'] = target
+        if protocol:
+            params['protocol'] = protocol
+        if port is not None:
+            params['port'] = str(port)
+        if vpc_id:
+            params['vpcId'] = vpc_id
+
+        response = self.client.get(
+            f'/api/{self.project}/infrastructure/{env}/reachability',
+            params=params
+        )
+        return self._handle_response(response, f"get reachability for {env}")
+
     def get_namespaces(self, env: str) -> List[str]:
         """
         Get Kubernetes namespaces via infrastructure endpoint.
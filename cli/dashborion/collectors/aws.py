@@ -6,6 +6,7 @@ import json
 import boto3
 from typing import Dict, List, Optional
 from rubix_diagram.config.settings import AWS_DEFAULT_REGION
+from dashborion.utils.instance_specs import InstanceSpecsCatalog
 
 class AWSSpecsFetcher:
     """Classe de base pour récupérer les spécifications des instances via l'API Pricing."""
@@ -22,6 +23,8 @@ class AWSSpecsFetcher:
         # L'API pricing n'est disponible qu'en us-east-1
         self.pricing_client = self._session.client('pricing', region_name='us-east-1')
         self._specs_cache = {}
+        # Catalogue de tous les types (cache disque, DescribeInstanceTypes, snapshot)
+        self._catalog = InstanceSpecsCatalog(self._session, self._session.region_name or AWS_DEFAULT_REGION)
 
     def _normalize_instance_type(self, instance_type: str) -> str:
         """
@@ -44,6 +47,12 @@ class AWSSpecsFetcher:
         if normalized_type in self._specs_cache:
             return self._specs_cache[normalized_type]
 
+        # Puis dans le catalogue ; l'API Pricing seulement pour les types inconnus
+        specs = self._catalog.get(normalized_type)
+        if specs is not None:
+            self._specs_cache[normalized_type] = specs
+            return specs
+
         # Déterminer le type à utiliser pour la requête API
         query_type = instance_type if service_code == 'AmazonRDS' else normalized_type
 
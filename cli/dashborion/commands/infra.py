@@ -319,7 +319,7 @@ def show_vpcs(ctx, env: Optional[str]):
 @click.option('--env', '-e', help='Environment name (default: from context)')
 @click.option('--vpc', help='Filter by VPC ID')
 @click.option('--subnet', help='Filter by subnet ID')
-@click.option('--ip', help='Search by IP address')
+@click.option('--ip', help='Search by IP address, prefix or CIDR')
 @click.pass_obj
 def show_enis(ctx, env: Optional[str], vpc: Optional[str], subnet: Optional[str], ip: Optional[str]):
     """Show ENI details"""
@@ -351,6 +351,71 @@ def show_enis(ctx, env: Optional[str], vpc: Optional[str], subnet: Optional[str]
         sys.exit(1)
 
 
+@infra.command('reachability')
+@click.option('--env', '-e', help='Environment name (default: from context)')
+@click.option('--source', '-s', help='Source: security group, ENI or IP (default: all workloads)')
+@click.option('--target', '-t', help='Target: security group, ENI or IP (default: all datastores)')
+@click.option('--port', '-p', type=int, help='Port to evaluate')
+@click.option('--protocol', default='tcp', help='Protocol (default: tcp)')
+@click.option('--vpc', help='VPC ID (default: environment VPC)')
+@click.option('--reachable-only', is_flag=True, help='Only list reachable pairs')
+@click.pass_obj
+def show_reachability(ctx, env: Optional[str], source: Optional[str], target: Optional[str],
+                      port: Optional[int], protocol: str, vpc: Optional[str], reachable_only: bool):
+    """Check security group reachability (e.g. can a service reach RDS on 5432?)"""
+    formatter = OutputFormatter(ctx.output_format)
+
+    try:
+        collector, env_config, effective_env = _get_collector(ctx, env)
+        result = collector.get_reachability(effective_env, source=source, target=target,
+                                            protocol=protocol, port=port, vpc_id=vpc)
+        if result.get('error'):
+            click.echo(f"Error: {result['error']}", err=True)
+            sys.exit(1)
+
+        def format_allowed(allowed):
+            return ', '.join(f"{a['protocol']}:{'/'.join(a['ports'])}" for a in allowed) or '-'
+
+        if ctx.output_format != 'table':
+            formatter.output(result, title=f"Reachability - {effective_env}")
+        elif 'pairs' not in result:
+            verdict = 'REACHABLE' if result.get('reachable') else 'NOT REACHABLE'
+            port_label = f" {result['protocol']}/{result['port']}" if result.get('port') is not None else ''
+            click.echo(f"\n{result['source']['name']} -> {result['target']['name']}{port_label}: {verdict}")
+            click.echo(f"Allowed: {format_allowed(result.get('allowed', []))}")
+            rules = []
+            for side in ('egress', 'ingress'):
+                for rule in result.get(side, {}).get('rules', []):
+                    rules.append({
+                        'side': side,
+                        'security_group': rule['securityGroupId'],
+                        'peer': rule['value'],
+                        'allowed': format_allowed(rule['allowed']),
+                        'description': (rule.get('description') or '-')[:30],
+                    })
+            formatter.output(rules, title="Matching rules")
+        else:
+            names = {e['id']: e['name'] for e in result.get('sources', []) + result.get('targets', [])}
+            table_data = []
+            for pair in result['pairs']:
+                if reachable_only and not pair['reachable']:
+                    continue
+                table_data.append({
+                    'source': names.get(pair['source'], pair['source'])[:40],
+                    'target': names.get(pair['target'], pair['target'])[:40],
+                    'reachable': 'yes' if pair['reachable'] else 'no',
+                    'allowed': format_allowed(pair['allowed'])[:40],
+                })
+            formatter.output(table_data, title=f"Reachability - {effective_env}")
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        if ctx.verbose:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+
 @infra.command('invalidate')
 @click.option('--env', '-e', help='Environment name (default: from context)')
 @click.option('--id', '-i', 'distribution_id', required=True, help='CloudFront distribution ID')
@@ -0,0 +1,167 @@
+"""
+Instance specs catalog for the CLI.
+
+Specs (vCPU, memory, network performance, architecture) of every EC2
+instance type, bulk-loaded once with paginated ec2:DescribeInstanceTypes and
+Pricing GetProducts, and kept on disk (~/.dashborion/cache/instance-specs.json) for CACHE_TTL_SECONDS,
+so runs look types up in memory instead of calling the Pricing API per type.
+Without AWS access the bundled snapshot (dashborion/data) is used.
+
+Same compact format as the backend catalog (backend/utils/instance_specs.py):
+    {"version": 2, "generatedAt": "...", "columns": [...], "types": {"m5.xlarge": [4, 16.0, ...]}}
+
+`architecture` and `processor_features` keep the Pricing API values
+("64-bit", "Intel AVX; ..."); `cpu_architecture` / `cpu_manufacturer` are
+the EC2 ones (x86_64, Intel).
+
+Usage:
+    catalog = InstanceSpecsCatalog(session)
+    specs = catalog.get('db.r5.large')   # {'vcpu': 2, 'memory_gib': 16.0, ...} or None
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CATALOG_VERSION = 2
+COLUMNS = (
+    "vcpu", "memoryGib", "networkPerformance", "architecture", "processorFeatures",
+    "cpuArchitecture", "cpuManufacturer",
+)
+# One Pricing product per instance type (Linux, shared tenancy, on demand)
+PRICING_FILTERS = (
+    ('productFamily', 'Compute Instance'),
+    ('operatingSystem', 'Linux'),
+    ('tenancy', 'Shared'),
+    ('preInstalledSw', 'NA'),
+    ('capacitystatus', 'Used'),
+)
+CACHE_TTL_SECONDS = 7 * 86400
+
+CACHE_PATH = Path.home() / '.dashborion' / 'cache' / 'instance-specs.json'
+SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / 'data' / 'instance_specs_snapshot.json'
+
+
+def _age_seconds(catalog: Dict[str, Any]) -> float:
+    try:
+        generated_at = datetime.fromisoformat(catalog["generatedAt"])
+    except (KeyError, TypeError, ValueError):
+        return float("inf")
+    return (datetime.now(timezone.utc) - generated_at).total_seconds()
+
+
+def _read(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            catalog = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return catalog if catalog.get("version") == CATALOG_VERSION else None
+
+
+def _pricing_attributes(session, region: str) -> Dict[str, Dict[str, str]]:
+    """Pricing product attributes of every EC2 instance type in `region` (paginated GetProducts)."""
+    # Pricing API is only available in us-east-1
+    pricing = session.client('pricing', region_name='us-east-1')
+    filters = [{'Type': 'TERM_MATCH', 'Field': field, 'Value': value} for field, value in PRICING_FILTERS]
+    filters.append({'Type': 'TERM_MATCH', 'Field': 'regionCode', 'Value': region})
+    attributes = {}
+    for page in pricing.get_paginator('get_products').paginate(
+        ServiceCode='AmazonEC2', Filters=filters, PaginationConfig={'PageSize': 100}
+    ):
+        for item in page.get('PriceList', []):
+            product = json.loads(item).get('product', {}).get('attributes', {})
+            if product.get('instanceType'):
+                attributes.setdefault(product['instanceType'], product)
+    return attributes
+
+
+def build_catalog(session, region: str) -> Dict[str, Any]:
+    """Catalog of every instance type offered in `region` (DescribeInstanceTypes + Pricing)."""
+    try:
+        priced = _pricing_attributes(session, region)
+    except Exception as e:
+        print(f"Warning: Could not load instance types pricing attributes: {e}")
+        priced = {}
+    ec2 = session.client('ec2', region_name=region)
+    types = {}
+    for page in ec2.get_paginator('describe_instance_types').paginate(PaginationConfig={'PageSize': 100}):
+        for item in page.get('InstanceTypes', []):
+            processor = item.get('ProcessorInfo', {})
+            architectures = processor.get('SupportedArchitectures') or ['']
+            attributes = priced.get(item['InstanceType'], {})
+            types[item['InstanceType']] = [
+                item.get('VCpuInfo', {}).get('DefaultVCpus', 0),
+                round(item.get('MemoryInfo', {}).get('SizeInMiB', 0) / 1024, 3),
+                item.get('NetworkInfo', {}).get('NetworkPerformance', ''),
+                attributes.get('processorArchitecture') or ('32-bit or 64-bit' if 'i386' in architectures else '64-bit'),
+                attributes.get('processorFeatures', ''),
+                next((a for a in architectures if a not in ('i386', 'x86_64_mac')), architectures[0]),
+                processor.get('Manufacturer', ''),
+            ]
+    return {
+        "version": CATALOG_VERSION,
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "source": "ec2:DescribeInstanceTypes",
+        "columns": list(COLUMNS),
+        "types": types,
+    }
+
+
+class InstanceSpecsCatalog:
+    """Instance type specs, loaded on first lookup (disk cache, EC2, snapshot)."""
+
+    def __init__(self, session=None, region: Optional[str] = None, cache_path: Path = CACHE_PATH):
+        self._session = session
+        self._region = region or os.environ.get('AWS_DEFAULT_REGION') or 'eu-west-3'
+        self._cache_path = Path(cache_path)
+        self._types: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        cached = _read(self._cache_path)
+        if cached is not None and _age_seconds(cached) < CACHE_TTL_SECONDS:
+            return cached
+
+        if self._session is not None:
+            try:
+                catalog = build_catalog(self._session, self._region)
+                self._save(catalog)
+                return catalog
+            except Exception as e:
+                print(f"Warning: Could not load instance types catalog: {e}")
+
+        return cached or _read(SNAPSHOT_PATH) or {"columns": list(COLUMNS), "types": {}}
+
+    def _save(self, catalog: Dict[str, Any]) -> None:
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(catalog, f, separators=(',', ':'))
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write {self._cache_path}: {e}")
+
+    def get(self, instance_type: str) -> Optional[Dict[str, Any]]:
+        """Specs of an EC2 type or RDS class (db. prefix ignored), None when unknown."""
+        if self._types is None:
+            catalog = self._load()
+            columns = catalog.get("columns") or list(COLUMNS)
+            self._types = {
+                name: dict(zip(columns, row))
+                for name, row in (catalog.get("types") or {}).items()
+            }
+        values = self._types.get(instance_type.replace('db.', ''))
+        if values is None:
+            return None
+        return {
+            'vcpu': int(values.get('vcpu') or 0),
+            'memory_gib': float(values.get('memoryGib') or 0.0),
+            'network_performance': values.get('networkPerformance') or '',
+            'architecture': values.get('architecture') or '',
+            'processor_features': values.get('processorFeatures') or '',
+            'cpu_architecture': values.get('cpuArchitecture') or '',
+            'cpu_manufacturer': values.get('cpuManufacturer') or '',
+        }
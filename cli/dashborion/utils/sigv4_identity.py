@@ -16,10 +16,19 @@ References:
 
 import base64
 import json
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timezone
 
 
+# Reuse a signed proof for this long (the server caches verified proofs for
+# up to 5 minutes and STS rejects signatures older than 15 minutes)
+PROOF_REUSE_SECONDS = 240
+
+# (aws_profile, server_id) -> (proof, generated_at)
+_proof_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[Dict[str, str], float]] = {}
+
+
 def generate_sts_identity_proof(
     aws_profile: Optional[str] = None,
     server_id: Optional[str] = None,
@@ -108,6 +117,9 @@ def add_identity_proof_headers(
     """
     Add STS identity proof headers to an existing headers dict.
 
+    The signed proof is reused for PROOF_REUSE_SECONDS so that the server can
+    answer repeated calls from its verified-identity cache.
+
     Args:
         headers: Existing headers dict to modify
         aws_profile: AWS profile to use
@@ -116,7 +128,13 @@ def add_identity_proof_headers(
     Returns:
         Modified headers dict with identity proof headers added
     """
-    proof = generate_sts_identity_proof(aws_profile, server_id)
+    cache_key = (aws_profile, server_id)
+    cached = _proof_cache.get(cache_key)
+    if cached and time.time() - cached[1] < PROOF_REUSE_SECONDS:
+        proof = cached[0]
+    else:
+        proof = generate_sts_identity_proof(aws_profile, server_id)
+        _proof_cache[cache_key] = (proof, time.time())
 
     headers['X-Amz-Iam-Request-Method'] = proof['iam_request_method']
     headers['X-Amz-Iam-Request-Url'] = proof['iam_request_url']
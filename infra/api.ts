@@ -245,6 +245,7 @@ export function setupRoutes(
   api.route("POST /api/{project}/actions/cloudfront/{env}/invalidate", lambdas.infrastructure.arn, authOptions);
 
   // Pipelines routes
+  api.route("GET /api/{project}/pipelines/{type}", lambdas.pipelines.arn, authOptions);
   api.route("GET /api/{project}/pipelines/build/{service}", lambdas.pipelines.arn, authOptions);
   api.route("GET /api/{project}/pipelines/deploy/{service}/{env}", lambdas.pipelines.arn, authOptions);
   api.route("GET /api/{project}/images/{service}", lambdas.pipelines.arn, authOptions);
@@ -360,6 +361,10 @@ export function setupRoutes(
   // Test connection using saved config (legacy)
   api.route("GET /api/config/discovery/{accountId}/test", lambdas.discovery.arn, authOptions);
 
+  // Bulk discovery job (all types concurrently) and its progress
+  api.route("POST /api/config/discovery/{accountId}/bulk", lambdas.discovery.arn, authOptions);
+  api.route("GET /api/config/discovery/jobs/{jobId}", lambdas.discovery.arn, authOptions);
+
   // Resource discovery by type
   api.route("GET /api/config/discovery/{accountId}/{resourceType}", lambdas.discovery.arn, authOptions);
 }
@@ -365,6 +365,15 @@ export interface InfraConfig {
     /** Enable auto-refresh via Step Functions (default true) */
     autoRefresh?: boolean;
   };
+  /** Scheduled cache warmer (backend/warmer) */
+  cacheWarmer?: {
+    /** Enable the scheduled warmer (default false) */
+    enabled?: boolean;
+    /** EventBridge schedule expression (default "rate(5 minutes)") */
+    schedule?: string;
+    /** Concurrent refreshes (default 4) */
+    concurrency?: number;
+  };
   /** Config Registry settings */
   configRegistry?: {
     /** Override table name (default: derived from naming convention) */
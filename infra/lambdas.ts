@@ -26,6 +26,7 @@ export interface LambdaFunctions {
   comparison: sst.aws.Function;
   configRegistry: sst.aws.Function;
   discovery: sst.aws.Function;
+  warmer?: sst.aws.Cron;
 }
 
 /**
@@ -205,7 +206,7 @@ export function createLambdaFunctions(
 
   // DynamoDB full permissions
   const dynamoFullPermissions = useExistingRole ? [] : [{
-    actions: ["dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:Query", "dynamodb:UpdateItem", "dynamodb:DeleteItem"],
+    actions: ["dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:Query", "dynamodb:UpdateItem", "dynamodb:DeleteItem", "dynamodb:BatchWriteItem"],
     resources: tableArns,
   }];
 
@@ -218,6 +219,12 @@ export function createLambdaFunctions(
   // KMS permissions for auth encryption
   const kmsPermissions = useExistingRole || !kmsKey ? [] : getKmsPermissions(kmsKey);
 
+  // Instance specs catalog (bulk load of instance types, Pricing fallback)
+  const instanceSpecsPermissions = useExistingRole ? [] : [{
+    actions: ["ec2:DescribeInstanceTypes", "pricing:GetProducts"],
+    resources: ["*"],
+  }];
+
   // Step Functions permissions for ops dashboard integration (EKS provider refresh)
   const sfnPermissions = useExistingRole || !config.opsIntegration?.accountId ? [] : [{
     actions: ["states:StartExecution", "states:DescribeExecution"],
@@ -376,6 +383,7 @@ export function createLambdaFunctions(
       ...dynamoFullPermissions,
       ...assumeRolePermission,
       ...sfnPermissions,
+      ...instanceSpecsPermissions,
     ],
     transform: {
       function: {
@@ -578,8 +586,14 @@ export function createLambdaFunctions(
     environment: env as any,
     ...(linkableResources.length > 0 ? { link: linkableResources } : {}),
     permissions: [
-      ...dynamoReadPermissions,
+      // Write access: bulk discovery job state lives in the cache table
+      ...dynamoFullPermissions,
       ...assumeRolePermission,
+      // Bulk discovery jobs run in an asynchronous self-invocation
+      ...(useExistingRole ? [] : [{
+        actions: ["lambda:InvokeFunction"],
+        resources: [`arn:aws:lambda:*:*:function:${naming.lambda("discovery")}`],
+      }]),
     ],
     transform: {
       function: {
@@ -589,6 +603,36 @@ export function createLambdaFunctions(
     },
   });
 
+  // --------------------------------------------------------------------------
+  // Cache warmer (scheduled refresh of cached views, most accessed first)
+  // --------------------------------------------------------------------------
+  const warmer = config.cacheWarmer?.enabled ? new sst.aws.Cron("CacheWarmer", {
+    schedule: (config.cacheWarmer.schedule || "rate(5 minutes)") as any,
+    job: {
+      ...baseFunctionConfig,
+      handler: "backend/warmer/handler.handler",
+      memory: "512 MB",
+      timeout: "300 seconds",
+      environment: {
+        ...env,
+        WARMER_CONCURRENCY: String(config.cacheWarmer.concurrency || 4),
+      } as any,
+      ...(linkableResources.length > 0 ? { link: linkableResources } : {}),
+      permissions: [
+        ...dynamoFullPermissions,
+        ...assumeRolePermission,
+        ...sfnPermissions,
+        ...instanceSpecsPermissions,
+      ],
+      transform: {
+        function: {
+          name: naming.lambda("warmer"),
+          tags: tags.component("lambda"),
+        },
+      },
+    },
+  }) : undefined;
+
   return {
     authorizer,
     health,
@@ -602,5 +646,6 @@ export function createLambdaFunctions(
     comparison,
     configRegistry,
     discovery,
+    warmer,
   };
 }
@@ -90,6 +90,105 @@ export function useDiscovery(accountId, resourceType, options = {}) {
   };
 }
 
+const BULK_POLL_INTERVAL_MS = 1500;
+
+/**
+ * Hook for discovering several resource types at once (bulk discovery job)
+ *
+ * Starts a job that discovers every requested type concurrently, then polls
+ * its progress; each type's resources are added as soon as that type completes.
+ *
+ * @param {string} accountId - AWS account ID
+ * @param {object} options - Options (region, types: subset of resource types, default all)
+ * @returns {object} { results, types, progress, loading, error, discover, cancel }
+ */
+export function useBulkDiscovery(accountId, options = {}) {
+  const [results, setResults] = useState({});
+  const [types, setTypes] = useState({});
+  const [progress, setProgress] = useState({ completed: 0, total: 0 });
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState(null);
+  const runRef = useRef(0);
+
+  const cancel = useCallback(() => {
+    runRef.current += 1;
+    setLoading(false);
+  }, []);
+
+  const typesKey = (options.types || []).join(',');
+
+  const discover = useCallback(async () => {
+    if (!accountId) {
+      return {};
+    }
+
+    const run = ++runRef.current;
+    setLoading(true);
+    setError(null);
+    setResults({});
+    setTypes({});
+    setProgress({ completed: 0, total: 0 });
+
+    try {
+      const body = {};
+      if (options.region) body.region = options.region;
+      if (typesKey) body.types = typesKey.split(',');
+
+      const response = await fetchWithRetry(`/api/config/discovery/${accountId}/bulk`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(body),
+      });
+      if (!response.ok) {
+        const errorData = await response.json().catch(() => ({}));
+        throw new Error(errorData.message || `Bulk discovery failed: ${response.status}`);
+      }
+      const { statusUrl } = await response.json();
+
+      // Poll, asking only for the results not received yet
+      const received = {};
+      while (run === runRef.current) {
+        const exclude = Object.keys(received).join(',');
+        const statusResponse = await fetchWithRetry(`${statusUrl}${exclude ? `?exclude=${exclude}` : ''}`);
+        if (!statusResponse.ok) {
+          const errorData = await statusResponse.json().catch(() => ({}));
+          throw new Error(errorData.message || `Bulk discovery failed: ${statusResponse.status}`);
+        }
+        const job = await statusResponse.json();
+        if (run !== runRef.current) break;
+
+        Object.assign(received, job.results || {});
+        setResults({ ...received });
+        setTypes(job.types || {});
+        setProgress(job.progress || { completed: 0, total: 0 });
+
+        if (job.status === 'complete') break;
+        await new Promise((resolve) => setTimeout(resolve, BULK_POLL_INTERVAL_MS));
+      }
+      return received;
+    } catch (err) {
+      console.error('Bulk discovery error:', err);
+      if (run === runRef.current) setError(err.message);
+      return {};
+    } finally {
+      if (run === runRef.current) setLoading(false);
+    }
+  }, [accountId, options.region, typesKey]);
+
+  // Stop polling on unmount
+  useEffect(() => () => { runRef.current += 1; }, []);
+
+  return {
+    results,
+    types,
+    progress,
+    loading,
+    error,
+    discover,
+    cancel,
+  };
+}
+
 /**
  * Hook for testing connection to an AWS account
  *
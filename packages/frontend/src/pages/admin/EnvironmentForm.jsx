@@ -28,6 +28,7 @@ import {
   GitBranch,
 } from 'lucide-react';
 import { fetchWithRetry } from '../../utils/fetch';
+import { useBulkDiscovery } from '../../hooks/useDiscovery';
 import { useConfig } from '../../ConfigContext';
 import ResourcePicker from '../../components/admin/ResourcePicker';
 import { stripServiceName } from '../../utils/serviceNaming';
@@ -153,7 +154,6 @@ export default function EnvironmentForm() {
   const [discoveryError, setDiscoveryError] = useState(null);
 
   const [tagSuggestions, setTagSuggestions] = useState([]);
-  const [tagDiscoveryLoading, setTagDiscoveryLoading] = useState(false);
   const [tagDiscoveryError, setTagDiscoveryError] = useState(null);
 
   const [testingRead, setTestingRead] = useState(false);
@@ -549,62 +549,48 @@ export default function EnvironmentForm() {
     });
   };
 
+  const tagDiscoveryTypes = ['vpc', 'alb', 'efs'];
+  if (project?.orchestratorType === 'ecs') {
+    tagDiscoveryTypes.push('ecs');
+  } else if (project?.orchestratorType === 'eks') {
+    tagDiscoveryTypes.push('eks');
+  }
+  const tagDiscovery = useBulkDiscovery(form.accountId, { region: form.region, types: tagDiscoveryTypes });
+  const tagDiscoveryLoading = tagDiscovery.loading;
+
   const discoverTags = async () => {
     if (!form.accountId) {
       setTagDiscoveryError('Select an AWS account first');
       return;
     }
 
-    setTagDiscoveryLoading(true);
     setTagDiscoveryError(null);
     setTagSuggestions([]);
 
-    const resourceTypes = ['vpc', 'alb', 'efs'];
-    if (project?.orchestratorType === 'ecs') {
-      resourceTypes.push('ecs');
-    } else if (project?.orchestratorType === 'eks') {
-      resourceTypes.push('eks');
-    }
-
-    try {
-      const requests = resourceTypes.map((resourceType) => {
-        const params = new URLSearchParams();
-        if (form.region) params.set('region', form.region);
-        const url = `/api/config/discovery/${form.accountId}/${resourceType}?${params.toString()}`;
-        return fetchWithRetry(url)
-          .then((res) => res.json())
-          .then((data) => data.resources || []);
-      });
-
-      const results = await Promise.allSettled(requests);
-      const counts = new Map();
-
-      results.forEach((result) => {
-        if (result.status !== 'fulfilled') return;
-        result.value.forEach((resource) => {
-          const tags = resource.tags || {};
-          Object.entries(tags).forEach(([key, value]) => {
-            const normalizedValue = String(value);
-            const signature = `${key}:${normalizedValue}`;
-            counts.set(signature, {
-              key,
-              value: normalizedValue,
-              count: (counts.get(signature)?.count || 0) + 1,
-            });
+    // One bulk job for every type (single role assumption, types discovered concurrently)
+    const results = await tagDiscovery.discover();
+    const counts = new Map();
+
+    Object.values(results).forEach((resources) => {
+      (resources || []).forEach((resource) => {
+        const tags = resource.tags || {};
+        Object.entries(tags).forEach(([key, value]) => {
+          const normalizedValue = String(value);
+          const signature = `${key}:${normalizedValue}`;
+          counts.set(signature, {
+            key,
+            value: normalizedValue,
+            count: (counts.get(signature)?.count || 0) + 1,
           });
         });
       });
+    });
 
-      const suggestions = Array.from(counts.values())
-        .sort((a, b) => b.count - a.count)
-        .slice(0, 16);
+    const suggestions = Array.from(counts.values())
+      .sort((a, b) => b.count - a.count)
+      .slice(0, 16);
 
-      setTagSuggestions(suggestions);
-    } catch (err) {
-      setTagDiscoveryError(err.message || 'Tag discovery failed');
-    } finally {
-      setTagDiscoveryLoading(false);
-    }
+    setTagSuggestions(suggestions);
   };
 
   const testRole = async (roleArn, setTesting, setResult) => {
@@ -1293,8 +1279,8 @@ export default function EnvironmentForm() {
                 ))}
               </div>
             )}
-            {tagDiscoveryError && (
-              <p className="text-xs text-red-400 mt-2">{tagDiscoveryError}</p>
+            {(tagDiscoveryError || tagDiscovery.error) && (
+              <p className="text-xs text-red-400 mt-2">{tagDiscoveryError || tagDiscovery.error}</p>
             )}
             {tagSuggestions.length > 0 && (
               <div className="mt-4">
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Cache payload codec benchmark.
+
+Builds a pods payload shaped like the k8s pods endpoint response (30,000
+pods by default) and compares the plain JSON string attribute the cache
+used to write with the codec (zlib JSON, chunked above one item):
+
+- stored size and number of items (plain: one item, rejected by DynamoDB
+  above 400 KB)
+- encode and decode time
+- write / read capacity units (1 KB per WCU, 4 KB per eventually
+  consistent half RCU)
+
+Usage:
+    python scripts/benchmarks/cache-codec.py
+    python scripts/benchmarks/cache-codec.py --pods 100000
+    python scripts/benchmarks/cache-codec.py --json
+
+Runs without AWS access or backend dependencies.
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from cache.codec import decode_payload, encode_items  # noqa: E402
+
+DYNAMODB_ITEM_LIMIT = 400 * 1024
+
+
+def build_payload(count: int) -> Dict[str, Any]:
+    return {
+        'project': 'demo',
+        'environment': 'production',
+        'pods': [
+            {
+                'name': f"app-{i % 400}-7d9f8c6b5-{i:05d}",
+                'namespace': f"ns-{i % 40}",
+                'status': 'Running' if i % 50 else 'Pending',
+                'ready': '1/1',
+                'restarts': i % 3,
+                'age': f"{i % 90}d",
+                'ip': f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+                'node': f"ip-10-0-{i % 1000 // 256}-{i % 256}.eu-west-3.compute.internal",
+                'containers': [{'name': 'app', 'image': f"registry/app:{i % 20}", 'ready': True}],
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def _item_size(item: Dict[str, Any]) -> int:
+    size = 0
+    for key, value in item.items():
+        size += len(key)
+        size += len(value) if isinstance(value, (bytes, str)) else len(str(value))
+    return size
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {'median_ms': round(statistics.median(samples), 3), 'max_ms': round(max(samples), 3)}
+
+
+def _capacity(items: List[Dict[str, Any]]) -> Dict:
+    sizes = [_item_size(item) for item in items]
+    return {
+        'items': len(items),
+        'bytes': sum(sizes),
+        'fitsItemLimit': max(sizes) <= DYNAMODB_ITEM_LIMIT,
+        'wcu': sum(math.ceil(size / 1024) for size in sizes),
+        'rcu': math.ceil(sum(sizes) / 4096) / 2,
+    }
+
+
+def run(count: int, repeat: int) -> Dict:
+    payload = build_payload(count)
+    head = {'pk': 'CACHE#demo#production', 'sk': 'k8s-pods#0123456789ab', 'ttl': 0}
+
+    plain_items = [{**head, 'payload': json.dumps(payload, default=str)}]
+    items = encode_items(head, payload)
+    chunks, item = items[:-1], items[-1]
+    assert decode_payload(item, chunks) == payload
+
+    return {
+        'pods': count,
+        'plain': {
+            **_capacity(plain_items),
+            'encode': _time(lambda: json.dumps(payload, default=str), repeat),
+            'decode': _time(lambda: json.loads(plain_items[0]['payload']), repeat),
+        },
+        'codec': {
+            **_capacity(items),
+            'encode': _time(lambda: encode_items(head, payload), repeat),
+            'decode': _time(lambda: decode_payload(item, chunks), repeat),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the cache payload codec')
+    parser.add_argument('--pods', type=int, default=30000)
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (median reported)')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    result = run(args.pods, args.repeat)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{result['pods']} pods")
+    for name in ('plain', 'codec'):
+        stats = result[name]
+        print(f"  {name:6s} {stats['bytes'] / 1024:9.1f} KB in {stats['items']} item(s)"
+              f"{'' if stats['fitsItemLimit'] else ' (over the item limit)'}, "
+              f"{stats['wcu']} WCU / {stats['rcu']} RCU, "
+              f"encode {stats['encode']['median_ms']:.1f} ms, decode {stats['decode']['median_ms']:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Cluster capacity engine benchmark.
+
+Builds a synthetic EKS cluster (1,000 nodes across zones and nodegroups,
+30,000 pods across namespaces and components, with realistic quantity
+strings), then times:
+
+- legacy: the per-node summary loop the nodes endpoint used to run
+  (string parsing on every access, node totals only)
+- legacy-full: the engine's report (pod requests, zone / nodegroup /
+  namespace / component rollups) computed the same per-access way
+- engine: parsing into columns plus the full summary (totals, zone and
+  nodegroup rollups, namespace and component rollups) and per-node
+  utilization
+
+Usage:
+    python scripts/benchmarks/capacity-engine.py
+    python scripts/benchmarks/capacity-engine.py --nodes 3000 --pods 90000
+    python scripts/benchmarks/capacity-engine.py --json
+
+Runs without AWS access or backend dependencies.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from providers.base import K8sNode, K8sNodePod  # noqa: E402
+from providers.orchestrator.capacity import CapacityFrame  # noqa: E402
+
+ZONES = ['eu-west-3a', 'eu-west-3b', 'eu-west-3c']
+NODEGROUPS = ['system', 'apps-m5', 'apps-c6i', 'batch-spot', 'memory-r6i']
+INSTANCE_SHAPES = [  # capacity cpu, allocatable cpu, capacity memory, allocatable memory
+    ('4', '3920m', '16073012Ki', '15056180Ki'),
+    ('8', '7910m', '32395516Ki', '31378684Ki'),
+    ('16', '15890m', '64829928Ki', '63813096Ki'),
+]
+CPU_REQUESTS = ['50m', '100m', '250m', '500m', '1', '2']
+MEMORY_REQUESTS = ['64Mi', '128Mi', '256Mi', '512Mi', '1Gi', '2Gi']
+
+
+def build_cluster(nodes: int, pods: int, namespaces: int, components: int, seed: int) -> List[K8sNode]:
+    rng = random.Random(seed)
+    cluster = []
+    for i in range(nodes):
+        cpu, alloc_cpu, memory, alloc_memory = rng.choice(INSTANCE_SHAPES)
+        cluster.append(K8sNode(
+            name=f"ip-10-0-{i // 256}-{i % 256}.eu-west-3.compute.internal",
+            instance_type='m5.xlarge',
+            zone=ZONES[i % len(ZONES)],
+            nodegroup=rng.choice(NODEGROUPS),
+            status='Ready' if rng.random() > 0.01 else 'NotReady',
+            capacity_cpu=cpu,
+            capacity_memory=memory,
+            capacity_pods=110,
+            allocatable_cpu=alloc_cpu,
+            allocatable_memory=alloc_memory,
+            allocatable_pods=110,
+            usage_cpu=f"{rng.randint(100, 3500)}m",
+            usage_memory=f"{rng.randint(1000000, 14000000)}Ki",
+        ))
+
+    for i in range(pods):
+        node = cluster[rng.randrange(nodes)]
+        node.pods.append(K8sNodePod(
+            name=f"pod-{i}",
+            namespace=f"ns-{rng.randrange(namespaces)}",
+            component=f"component-{rng.randrange(components)}",
+            requests_cpu=rng.choice(CPU_REQUESTS),
+            requests_memory=rng.choice(MEMORY_REQUESTS),
+            usage_cpu=f"{rng.randint(1, 900)}m",
+            usage_memory=f"{rng.randint(10, 900)}Mi",
+        ))
+    for node in cluster:
+        node.pod_count = len(node.pods)
+    return cluster
+
+
+def parse_cpu(cpu_str):
+    """The nodes endpoint's previous CPU parser (millicores)."""
+    if not cpu_str:
+        return 0
+    if cpu_str.endswith('n'):
+        return int(cpu_str[:-1]) // 1000000
+    elif cpu_str.endswith('m'):
+        return int(cpu_str[:-1])
+    else:
+        return int(cpu_str) * 1000
+
+
+def parse_memory(mem_str):
+    """The nodes endpoint's previous memory parser (bytes)."""
+    if not mem_str:
+        return 0
+    if mem_str.endswith('Ki'):
+        return int(mem_str[:-2]) * 1024
+    elif mem_str.endswith('Mi'):
+        return int(mem_str[:-2]) * 1024 * 1024
+    elif mem_str.endswith('Gi'):
+        return int(mem_str[:-2]) * 1024 * 1024 * 1024
+    else:
+        return int(mem_str)
+
+
+def legacy_summary(nodes: List[K8sNode]) -> Dict:
+    """The nodes endpoint's previous summary loop (node totals only)."""
+    totals = {'capacity_cpu': 0, 'capacity_memory': 0, 'allocatable_cpu': 0, 'allocatable_memory': 0,
+              'usage_cpu': 0, 'usage_memory': 0}
+    by_zone, by_nodegroup, utilization = {}, {}, []
+    for node in nodes:
+        by_zone[node.zone] = by_zone.get(node.zone, 0) + 1
+        by_nodegroup[node.nodegroup] = by_nodegroup.get(node.nodegroup, 0) + 1
+        totals['capacity_cpu'] += parse_cpu(node.capacity_cpu)
+        totals['capacity_memory'] += parse_memory(node.capacity_memory)
+        totals['allocatable_cpu'] += parse_cpu(node.allocatable_cpu)
+        totals['allocatable_memory'] += parse_memory(node.allocatable_memory)
+        totals['usage_cpu'] += parse_cpu(node.usage_cpu)
+        totals['usage_memory'] += parse_memory(node.usage_memory)
+    for node in nodes:
+        alloc_cpu = parse_cpu(node.allocatable_cpu)
+        alloc_mem = parse_memory(node.allocatable_memory)
+        utilization.append({
+            'cpu': round(parse_cpu(node.usage_cpu) / alloc_cpu * 100, 1) if alloc_cpu else 0,
+            'memory': round(parse_memory(node.usage_memory) / alloc_mem * 100, 1) if alloc_mem else 0,
+        })
+    return {'totals': totals, 'byZone': by_zone, 'byNodegroup': by_nodegroup, 'utilization': utilization}
+
+
+def legacy_full(nodes: List[K8sNode]) -> Dict:
+    """
+    The same report as the engine with per-access parsing: the legacy
+    summary plus requests per node, zone and nodegroup capacity rollups and
+    namespace and component pod rollups, written as straightforward loops.
+    """
+    result = legacy_summary(nodes)
+    by_zone, by_nodegroup, by_namespace, by_component = {}, {}, {}, {}
+    for node in nodes:
+        node_requests = [0, 0]
+        for pod in node.pods:
+            cpu, memory = parse_cpu(pod.requests_cpu), parse_memory(pod.requests_memory)
+            node_requests[0] += cpu
+            node_requests[1] += memory
+            for groups, key in ((by_namespace, pod.namespace), (by_component, pod.component)):
+                group = groups.setdefault(key, [0, 0, 0, 0, 0])
+                group[0] += 1
+                group[1] += cpu
+                group[2] += memory
+                group[3] += parse_cpu(pod.usage_cpu)
+                group[4] += parse_memory(pod.usage_memory)
+        for groups, key in ((by_zone, node.zone), (by_nodegroup, node.nodegroup)):
+            group = groups.setdefault(key, [0] * 7)
+            group[0] += 1
+            group[1] += parse_cpu(node.allocatable_cpu)
+            group[2] += parse_memory(node.allocatable_memory)
+            group[3] += parse_cpu(node.usage_cpu)
+            group[4] += parse_memory(node.usage_memory)
+            group[5] += node_requests[0]
+            group[6] += node_requests[1]
+    result.update({'zones': by_zone, 'nodegroups': by_nodegroup,
+                   'namespaces': by_namespace, 'components': by_component})
+    return result
+
+
+def engine_summary(nodes: List[K8sNode]) -> Dict:
+    frame = CapacityFrame.from_nodes(nodes)
+    return {'summary': frame.summary(), 'utilization': frame.node_utilization()}
+
+
+def _time(fn, repeat: int) -> Dict:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'result': result,
+    }
+
+
+def run(nodes: int, pods: int, namespaces: int, components: int, seed: int, repeat: int) -> Dict:
+    cluster = build_cluster(nodes, pods, namespaces, components, seed)
+
+    legacy = _time(lambda: legacy_summary(cluster), repeat)
+    legacy.pop('result')
+
+    legacy_all = _time(lambda: legacy_full(cluster), repeat)
+    legacy_all.pop('result')
+
+    engine = _time(lambda: engine_summary(cluster), repeat)
+    summary = engine.pop('result')['summary']
+
+    frame = CapacityFrame.from_nodes(cluster)
+    rollups = _time(lambda: [frame.rollup(dim) for dim in ('zone', 'nodegroup', 'namespace', 'component')], repeat)
+    rollups.pop('result')
+
+    return {
+        'cluster': {'nodes': nodes, 'pods': pods, 'namespaces': namespaces, 'components': components},
+        'legacy': legacy,
+        'legacyFull': legacy_all,
+        'engine': engine,
+        'rollupsOnly': rollups,
+        'summary': {
+            'totalAllocatable': summary['totalAllocatable'],
+            'totalRequests': summary.get('totalRequests'),
+            'utilizationPercent': summary['utilizationPercent'],
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the cluster capacity engine')
+    parser.add_argument('--nodes', type=int, default=1000)
+    parser.add_argument('--pods', type=int, default=30000)
+    parser.add_argument('--namespaces', type=int, default=40)
+    parser.add_argument('--components', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (median reported)')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    result = run(args.nodes, args.pods, args.namespaces, args.components, args.seed, args.repeat)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    cluster = result['cluster']
+    print(f"Cluster: {cluster['nodes']} nodes, {cluster['pods']} pods, "
+          f"{cluster['namespaces']} namespaces, {cluster['components']} components")
+    print(f"  legacy        {result['legacy']['median_ms']:9.2f} ms (node totals and utilization only)")
+    print(f"  legacy-full   {result['legacyFull']['median_ms']:9.2f} ms (same report as the engine, per-access parsing)")
+    print(f"  engine        {result['engine']['median_ms']:9.2f} ms (parse into columns, totals, "
+          f"zone/nodegroup/namespace/component rollups, utilization)")
+    print(f"  rollups only  {result['rollupsOnly']['median_ms']:9.2f} ms (4 group-bys over built columns)")
+    print(f"  allocatable   {result['summary']['totalAllocatable']}, requests {result['summary']['totalRequests']}")
+
+
+if __name__ == '__main__':
+    main()
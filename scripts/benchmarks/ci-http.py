@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+CI provider HTTP layer benchmark, against a local stub of the GitHub API.
+
+The stub serves `/repos/{owner}/{repo}/actions/workflows` and
+`.../workflows/{id}/runs` with a fixed latency, ETags (304 on
+If-None-Match) and a 429 + Retry-After on the first call of every runs
+endpoint. For SERVICES repositories (build pipeline: workflows, then runs)
+it compares:
+
+- urlopen: one connection per call, services looked up one after another
+  (the previous GitHub provider)
+- pooled: the shared client (utils.http) with keep-alive, services looked
+  up concurrently, retries on 429; cold, then warm (workflows from memory,
+  runs revalidated with ETags)
+
+Usage:
+    python scripts/benchmarks/ci-http.py
+    python scripts/benchmarks/ci-http.py --services 40 --latency-ms 80
+    python scripts/benchmarks/ci-http.py --json
+
+Runs without network or AWS access (needs the backend dependencies installed).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from utils.http import HttpClient  # noqa: E402
+
+_RUNS = re.compile(r'^/repos/[^/]+/([^/]+)/actions/workflows/\d+/runs')
+_WORKFLOWS = re.compile(r'^/repos/[^/]+/([^/]+)/actions/workflows$')
+
+
+class StubStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.not_modified = 0
+        self.throttled = 0
+        self.connections = 0
+        self.throttled_paths = set()
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'notModified': self.not_modified,
+                'throttled': self.throttled,
+                'connections': self.connections,
+            }
+
+    def reset(self) -> None:
+        with self.lock:
+            self.requests = self.not_modified = self.throttled = self.connections = 0
+
+
+def make_handler(stats: StubStats, latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            with stats.lock:
+                stats.connections += 1
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: bytes = b'', headers: Dict[str, str] = None):
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def do_GET(self):
+            time.sleep(latency)
+            path = self.path.split('?')[0]
+            with stats.lock:
+                stats.requests += 1
+            runs = _RUNS.match(path)
+            workflows = _WORKFLOWS.match(path)
+            if runs:
+                with stats.lock:
+                    first = path not in stats.throttled_paths
+                    stats.throttled_paths.add(path)
+                    stats.throttled += first
+                if first:
+                    self._send(429, b'{"message": "slow down"}', {'Retry-After': '0'})
+                    return
+                payload = {'workflow_runs': [
+                    {'id': i, 'status': 'completed', 'conclusion': 'success', 'head_sha': f"{i:040x}",
+                     'created_at': '2026-01-01T00:00:00Z', 'updated_at': '2026-01-01T00:05:00Z'}
+                    for i in range(5)
+                ]}
+            elif workflows:
+                payload = {'workflows': [{'id': 1, 'name': 'build', 'path': '.github/workflows/build.yml'}]}
+            else:
+                self._send(404)
+                return
+            body = json.dumps(payload).encode()
+            etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+            if self.headers.get('If-None-Match') == etag:
+                with stats.lock:
+                    stats.not_modified += 1
+                self._send(304, headers={'ETag': etag})
+                return
+            self._send(200, body, {'Content-Type': 'application/json', 'ETag': etag})
+
+    return Handler
+
+
+def lookup_urlopen(base_url: str, repo: str) -> Any:
+    def get(path: str) -> Any:
+        for _ in range(4):
+            try:
+                with urllib.request.urlopen(f"{base_url}{path}", timeout=10) as response:
+                    return json.loads(response.read())
+            except urllib.error.HTTPError as e:
+                if e.code != 429:
+                    raise
+        raise RuntimeError('throttled')
+
+    workflows = get(f"/repos/demo/{repo}/actions/workflows")
+    return get(f"/repos/demo/{repo}/actions/workflows/{workflows['workflows'][0]['id']}/runs?per_page=5")
+
+
+def lookup_pooled(client: HttpClient, repo: str) -> Any:
+    workflows = client.get(f"/repos/demo/{repo}/actions/workflows", cache_ttl=300).json()
+    response = client.get(f"/repos/demo/{repo}/actions/workflows/{workflows['workflows'][0]['id']}/runs?per_page=5")
+    response.raise_for_status()
+    return response.json()
+
+
+def run(services: int, latency_ms: float, concurrency: int) -> Dict[str, Any]:
+    stats = StubStats()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(stats, latency_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    repos = [f"service-{i}" for i in range(services)]
+    result: Dict[str, Any] = {'services': services, 'latencyMs': latency_ms}
+
+    try:
+        started = time.perf_counter()
+        for repo in repos:
+            lookup_urlopen(base_url, repo)
+        result['urlopen'] = {'ms': round((time.perf_counter() - started) * 1000, 1), **stats.snapshot()}
+
+        # Fresh throttling state for the pooled runs
+        stats.reset()
+        stats.throttled_paths.clear()
+        client = HttpClient(base_url)
+        for phase in ('pooledCold', 'pooledWarm'):
+            stats.reset()
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                list(pool.map(lambda repo: lookup_pooled(client, repo), repos))
+            result[phase] = {'ms': round((time.perf_counter() - started) * 1000, 1), **stats.snapshot()}
+    finally:
+        server.shutdown()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the CI provider HTTP layer')
+    parser.add_argument('--services', type=int, default=20)
+    parser.add_argument('--latency-ms', type=float, default=50)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    result = run(args.services, args.latency_ms, args.concurrency)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{result['services']} services, {result['latencyMs']:.0f} ms per request")
+    for name in ('urlopen', 'pooledCold', 'pooledWarm'):
+        stats = result[name]
+        print(f"  {name:11s} {stats['ms']:8.1f} ms  {stats['requests']:4d} requests "
+              f"({stats['notModified']} not modified, {stats['throttled']} throttled) "
+              f"over {stats['connections']} connection(s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Cold-start import profile for the backend Lambda handlers.
+
+Runs each handler module import in a fresh interpreter with `-X importtime`
+and reports the total import time plus the slowest modules, so regressions in
+cold-start time (e.g. a handler eagerly importing every provider) show up
+before deployment.
+
+Usage:
+    python scripts/benchmarks/cold-start-imports.py
+    python scripts/benchmarks/cold-start-imports.py --entry infrastructure.handler --top 30
+    python scripts/benchmarks/cold-start-imports.py --all-providers   # eager baseline
+    python scripts/benchmarks/cold-start-imports.py --json > profile.json
+
+Requires the backend dependencies (boto3, kubernetes) to be installed.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend')
+
+# Lambda entry points (see infra/lambdas.ts)
+DEFAULT_ENTRIES = [
+    'handler',
+    'authorizer',
+    'health.handler',
+    'services.handler',
+    'infrastructure.handler',
+    'pipelines.handler',
+    'events.handler',
+    'admin.handler',
+    'comparison.handler',
+    'config.handler',
+    'discovery.handler',
+]
+
+# Every provider module, for an eager-import baseline
+ALL_PROVIDER_MODULES = [
+    'providers.ci.codepipeline',
+    'providers.ci.github_actions',
+    'providers.ci.jenkins',
+    'providers.ci.argocd',
+    'providers.orchestrator.ecs',
+    'providers.orchestrator.eks',
+    'providers.orchestrator.eks_dynamo',
+    'providers.events.combined',
+    'providers.infrastructure.rds',
+    'providers.infrastructure.cloudfront',
+    'providers.infrastructure.network',
+    'providers.infrastructure.alb',
+    'providers.infrastructure.elasticache',
+]
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def profile_imports(modules: List[str]) -> Dict:
+    """Import modules in a fresh interpreter and parse the -X importtime report."""
+    code = '; '.join(f'import {m}' for m in modules)
+    env = dict(os.environ)
+    env.setdefault('AWS_DEFAULT_REGION', 'eu-west-3')
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = [l for l in proc.stderr.splitlines() if not l.startswith('import time:')]
+        raise RuntimeError('\n'.join(tail[-10:]))
+
+    entries = []
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = (len(indent) - 1) // 2
+        if depth == 0:
+            total_us += int(cumulative_us)
+        entries.append({
+            'module': name,
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            'depth': depth,
+        })
+
+    return {
+        'modules': modules,
+        'total_ms': round(total_us / 1000, 1),
+        'imported': len(entries),
+        'providers_loaded': sorted(e['module'] for e in entries if e['module'] in ALL_PROVIDER_MODULES),
+        'entries': entries,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile backend cold-start imports')
+    parser.add_argument('--entry', action='append', help='Module to profile (repeatable), default: all Lambda entries')
+    parser.add_argument('--all-providers', action='store_true', help='Also profile importing every provider (eager baseline)')
+    parser.add_argument('--top', type=int, default=15, help='Slowest modules to list per entry')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    targets = [[e] for e in (args.entry or DEFAULT_ENTRIES)]
+    if args.all_providers:
+        targets.append(ALL_PROVIDER_MODULES)
+
+    results = []
+    for modules in targets:
+        try:
+            results.append(profile_imports(modules))
+        except RuntimeError as e:
+            results.append({'modules': modules, 'error': str(e)})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        label = result['modules'][0] if len(result['modules']) == 1 else f"{len(result['modules'])} provider modules"
+        print('=' * 72)
+        if 'error' in result:
+            print(f"{label}: import failed\n{result['error']}")
+            continue
+        print(f"{label}: {result['total_ms']} ms, {result['imported']} modules")
+        print(f"  providers loaded: {', '.join(result['providers_loaded']) or 'none'}")
+        slowest = sorted(result['entries'], key=lambda e: e['self_us'], reverse=True)[:args.top]
+        for entry in slowest:
+            print(f"  {entry['self_us'] / 1000:8.1f} ms self  {entry['cumulative_us'] / 1000:8.1f} ms cum  {entry['module']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Provider data model benchmark.
+
+Builds 50,000 K8sPod objects (slotted dataclass) and the same objects as
+plain dataclasses (the previous declaration), then measures:
+
+- memory: bytes per object (tracemalloc), slotted vs plain
+- serialization: dataclasses.asdict, the previous hand-written formatter
+  (dict literal, then select_keys) and the generated serializer the list
+  endpoints use (shared.formatting.format_k8s_list), each on the full
+  output and on a sparse selection (name, status, node)
+
+Usage:
+    python scripts/benchmarks/model-serialization.py
+    python scripts/benchmarks/model-serialization.py --pods 200000
+    python scripts/benchmarks/model-serialization.py --json
+
+Runs without AWS access or backend dependencies.
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from providers.base import K8sPod  # noqa: E402
+from providers.serialization import select_keys  # noqa: E402
+from shared.formatting import format_k8s_list  # noqa: E402
+
+# The previous declaration: same fields, plain (dict-backed) dataclass
+PlainK8sPod = dataclasses.make_dataclass(
+    'PlainK8sPod',
+    [(f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+     for f in dataclasses.fields(K8sPod)],
+)
+
+SPARSE_FIELDS = ('name', 'status', 'node')
+
+
+def handwritten_format_k8s_pod(pod, fields=None) -> Dict[str, Any]:
+    """The previous formatter: every key built, then projected on `fields`."""
+    return select_keys({
+        'name': pod.name,
+        'namespace': pod.namespace,
+        'status': pod.status,
+        'ready': pod.ready,
+        'restarts': pod.restarts,
+        'age': pod.age,
+        'ip': pod.ip,
+        'node': pod.node,
+        'containers': pod.containers
+    }, fields)
+
+
+def build_pods(cls, count: int) -> List[Any]:
+    return [
+        cls(
+            name=f"app-{i % 400}-7d9f8c6b5-{i:05d}",
+            namespace=f"ns-{i % 40}",
+            status='Running' if i % 50 else 'Pending',
+            ready='1/1',
+            restarts=i % 3,
+            age=f"{i % 90}d",
+            ip=f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            node=f"ip-10-0-{i % 1000 // 256}-{i % 256}.eu-west-3.compute.internal",
+            containers=[{'name': 'app', 'image': f"registry/app:{i % 20}", 'ready': True}],
+            labels={'app': f"app-{i % 400}", 'tier': 'web'},
+            annotations={},
+        )
+        for i in range(count)
+    ]
+
+
+def measure_memory(cls, count: int) -> float:
+    """Bytes per object, excluding the (identical) field values."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    pods = [cls.__new__(cls) for _ in range(count)]
+    for pod in pods:
+        for f in dataclasses.fields(cls):
+            object.__setattr__(pod, f.name, None)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return round(used / count, 1)
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Dict:
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'max_ms': round(max(samples), 3),
+    }
+
+
+def run(count: int, repeat: int) -> Dict:
+    slotted = build_pods(K8sPod, count)
+    plain = build_pods(PlainK8sPod, count)
+
+    return {
+        'pods': count,
+        'bytesPerObject': {
+            'plain': measure_memory(PlainK8sPod, count),
+            'slotted': measure_memory(K8sPod, count),
+        },
+        'serialize': {
+            'asdict': _time(lambda: [dataclasses.asdict(p) for p in plain], repeat),
+            'handwritten': _time(lambda: [handwritten_format_k8s_pod(p) for p in slotted], repeat),
+            'handwrittenSparse': _time(
+                lambda: [handwritten_format_k8s_pod(p, SPARSE_FIELDS) for p in slotted], repeat),
+            'generatedPlain': _time(lambda: format_k8s_list('pods', plain), repeat),
+            'generated': _time(lambda: format_k8s_list('pods', slotted), repeat),
+            'generatedSparse': _time(lambda: format_k8s_list('pods', slotted, SPARSE_FIELDS), repeat),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the provider data model')
+    parser.add_argument('--pods', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (median reported)')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    result = run(args.pods, args.repeat)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    memory = result['bytesPerObject']
+    print(f"{result['pods']} pods")
+    print(f"  bytes/object     plain {memory['plain']:.0f}, slotted {memory['slotted']:.0f}")
+    for name, stats in result['serialize'].items():
+        print(f"  {name:18s} {stats['median_ms']:9.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Security group reachability engine benchmark.
+
+Builds a synthetic VPC (security groups totalling ~2,000 rule sources mixing
+group references, CIDR blocks and port ranges, plus ENIs of workload services
+and datastores), then times compiling the engine, pairwise checks, and the default
+all-pairs workload -> datastore evaluation the reachability endpoint runs.
+
+Usage:
+    python scripts/benchmarks/sg-reachability.py
+    python scripts/benchmarks/sg-reachability.py --rules 5000 --services 400 --enis 8000
+    python scripts/benchmarks/sg-reachability.py --json
+
+Runs without AWS access or backend dependencies.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from providers.infrastructure.reachability import (  # noqa: E402
+    DATASTORE_TYPES,
+    WORKLOAD_TYPES,
+    ReachabilityEngine,
+)
+
+PORTS = [22, 80, 443, 2049, 3306, 5432, 6379, 8080, 9090, 11211]
+WORKLOAD_KINDS = ['ecs-task', 'ec2-instance', 'lambda']
+DATASTORE_KINDS = ['rds', 'elasticache', 'efs']
+
+
+def _permission(rng: random.Random) -> Dict:
+    roll = rng.random()
+    if roll < 0.05:
+        return {'IpProtocol': '-1'}
+    if roll < 0.25:
+        low = rng.choice(PORTS)
+        return {'IpProtocol': 'tcp', 'FromPort': low, 'ToPort': low + rng.randint(1, 1000)}
+    port = rng.choice(PORTS)
+    return {'IpProtocol': rng.choice(['tcp', 'tcp', 'tcp', 'udp']), 'FromPort': port, 'ToPort': port}
+
+
+def build_vpc(rules: int, groups: int, services: int, datastores: int, enis: int, seed: int):
+    """
+    Synthetic security groups (EC2 shape) and ENI summaries (ENI index shape).
+
+    Every workload service and datastore owns a security group (plus, for some,
+    a shared one); the remaining groups only carry rules. Most groups keep the
+    default allow-all egress rule.
+    """
+    rng = random.Random(seed)
+    group_ids = [f"sg-{i:08x}" for i in range(groups)]
+    security_groups = {
+        gid: {'GroupId': gid, 'GroupName': f"group-{i}", 'IpPermissions': [], 'IpPermissionsEgress': []}
+        for i, gid in enumerate(group_ids)
+    }
+    default_egress = 0
+    for sg in security_groups.values():
+        if rng.random() < 0.8:
+            sg['IpPermissionsEgress'].append({'IpProtocol': '-1', 'IpRanges': [{'CidrIp': '0.0.0.0/0'}]})
+            default_egress += 1
+
+    for _ in range(rules - default_egress):
+        sg = security_groups[rng.choice(group_ids)]
+        permission = _permission(rng)
+        roll = rng.random()
+        if roll < 0.6:
+            permission['UserIdGroupPairs'] = [{'GroupId': rng.choice(group_ids)}]
+        elif roll < 0.97:
+            prefix = rng.choice([16, 20, 24, 28, 32])
+            permission['IpRanges'] = [{'CidrIp': f"10.{rng.randint(0, 15)}.{rng.randint(0, 255)}.0/{prefix}"}]
+        else:
+            permission['PrefixListIds'] = [{'PrefixListId': f"pl-{rng.randint(0, 99):04x}"}]
+        key = 'IpPermissions' if rng.random() < 0.8 else 'IpPermissionsEgress'
+        sg[key].append(permission)
+
+    # Services: (attachment type, security groups), sharing a few common groups
+    shared = group_ids[:5]
+    owners = group_ids[5:]
+    service_defs = []
+    for i in range(services + datastores):
+        kind = rng.choice(WORKLOAD_KINDS) if i < services else rng.choice(DATASTORE_KINDS)
+        members = [owners[i % len(owners)]]
+        if rng.random() < 0.5:
+            members.append(rng.choice(shared))
+        service_defs.append((kind, members))
+
+    eni_summaries = {}
+    for i in range(enis):
+        kind, members = service_defs[i % len(service_defs)]
+        eni_id = f"eni-{i:08x}"
+        eni_summaries[eni_id] = {
+            'id': eni_id,
+            'name': '',
+            'description': '',
+            'privateIps': [f"10.{i // 65536 % 16}.{i // 256 % 256}.{i % 256}"],
+            'attachment': {'type': kind},
+            'securityGroups': [{'id': gid, 'name': gid} for gid in members],
+        }
+    return security_groups, eni_summaries
+
+
+def _time(fn, repeat: int) -> Dict:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'result': result,
+    }
+
+
+def run(rules: int, groups: int, services: int, datastores: int, enis: int, seed: int, repeat: int) -> Dict:
+    security_groups, eni_summaries = build_vpc(rules, groups, services, datastores, enis, seed)
+
+    compile_stats = _time(lambda: ReachabilityEngine(security_groups, eni_summaries), repeat)
+    engine: ReachabilityEngine = compile_stats.pop('result')
+
+    rng = random.Random(seed + 1)
+    group_ids: List[str] = list(security_groups)
+    eni_ids: List[str] = list(eni_summaries)
+    queries = [
+        (rng.choice(group_ids + eni_ids), rng.choice(group_ids + eni_ids), rng.choice(PORTS))
+        for _ in range(200)
+    ]
+
+    def pairwise():
+        reachable = 0
+        for source, target, port in queries:
+            if engine.check(engine.endpoint(source), engine.endpoint(target), 'tcp', port)['reachable']:
+                reachable += 1
+        return reachable
+
+    pairwise_stats = _time(pairwise, repeat)
+    pairwise_stats['per_query_ms'] = round(pairwise_stats['median_ms'] / len(queries), 4)
+    pairwise_stats['reachable'] = pairwise_stats.pop('result')
+
+    def all_pairs():
+        # Fresh engine: no CIDR memo carried over from a previous run
+        fresh = ReachabilityEngine(security_groups, eni_summaries)
+        sources = fresh.endpoints_of_types(WORKLOAD_TYPES)
+        targets = fresh.endpoints_of_types(DATASTORE_TYPES)
+        pairs = fresh.all_pairs(sources, targets)
+        return len(sources), len(targets), sum(1 for p in pairs if p['reachable'])
+
+    all_pairs_stats = _time(all_pairs, repeat)
+    sources, targets, reachable = all_pairs_stats.pop('result')
+
+    return {
+        'vpc': {
+            'securityGroups': len(security_groups),
+            'rules': engine.rule_count,
+            'enis': len(eni_summaries),
+        },
+        'compile': compile_stats,
+        'pairwise': pairwise_stats,
+        'allPairs': {
+            **all_pairs_stats,
+            'sources': sources,
+            'targets': targets,
+            'pairs': sources * targets,
+            'reachable': reachable,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the security group reachability engine')
+    parser.add_argument('--rules', type=int, default=2000, help='Rule sources across all groups')
+    parser.add_argument('--groups', type=int, default=200, help='Security groups')
+    parser.add_argument('--services', type=int, default=120, help='Workload services (ECS/EC2/Lambda)')
+    parser.add_argument('--datastores', type=int, default=40, help='Datastores (RDS/ElastiCache/EFS)')
+    parser.add_argument('--enis', type=int, default=3000, help='Network interfaces')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement (median reported)')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    result = run(args.rules, args.groups, args.services, args.datastores, args.enis, args.seed, args.repeat)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    vpc = result['vpc']
+    print(f"VPC: {vpc['securityGroups']} security groups, {vpc['rules']} rules, {vpc['enis']} ENIs")
+    print(f"  compile     {result['compile']['median_ms']:9.2f} ms")
+    pairwise = result['pairwise']
+    print(f"  pairwise    {pairwise['median_ms']:9.2f} ms for 200 checks ({pairwise['per_query_ms']} ms each, "
+          f"{pairwise['reachable']} reachable)")
+    pairs = result['allPairs']
+    print(f"  all pairs   {pairs['median_ms']:9.2f} ms for {pairs['sources']} x {pairs['targets']} endpoints "
+          f"({pairs['pairs']} pairs, {pairs['reachable']} reachable, compile included)")
+
+
+if __name__ == '__main__':
+    main()
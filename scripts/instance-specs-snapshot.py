@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Regenerate the bundled instance specs snapshots.
+
+Loads every instance type with paginated ec2:DescribeInstanceTypes and
+Pricing GetProducts, and writes the catalog (one row per type) to the
+offline fallbacks of the backend and the CLI:
+
+- backend/utils/instance_specs_snapshot.json
+- cli/dashborion/data/instance_specs_snapshot.json
+
+Usage:
+    AWS_PROFILE=... python scripts/instance-specs-snapshot.py --region eu-west-3
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import boto3
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "backend"))
+
+from utils.instance_specs import build_catalog  # noqa: E402
+
+SNAPSHOT_PATHS = (
+    os.path.join(ROOT_DIR, "backend", "utils", "instance_specs_snapshot.json"),
+    os.path.join(ROOT_DIR, "cli", "dashborion", "data", "instance_specs_snapshot.json"),
+)
+
+
+def dump(catalog) -> str:
+    """Catalog JSON with one type per line (readable diffs)."""
+    lines = ["{"]
+    for key, value in catalog.items():
+        if key != "types":
+            lines.append(f"  {json.dumps(key)}: {json.dumps(value)},")
+    lines.append('  "types": {')
+    rows = [f"    {json.dumps(name)}: {json.dumps(row)}" for name, row in sorted(catalog["types"].items())]
+    lines.append(",\n".join(rows))
+    lines.append("  }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate the bundled instance specs snapshots")
+    parser.add_argument("--region", default=os.environ.get("AWS_REGION_DEFAULT", "eu-west-3"))
+    parser.add_argument("--profile", help="AWS profile")
+    args = parser.parse_args()
+
+    session = boto3.Session(profile_name=args.profile) if args.profile else boto3.Session()
+    catalog = build_catalog(session, args.region)
+    content = dump(catalog)
+    for path in SNAPSHOT_PATHS:
+        with open(path, "w") as f:
+            f.write(content)
+        print(f"{path}: {len(catalog['types'])} instance types")
+
+
+if __name__ == "__main__":
+    main()